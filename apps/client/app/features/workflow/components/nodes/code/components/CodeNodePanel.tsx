@@ -239,6 +239,25 @@ export function CodeNodePanel({ nodeId, data }: CodeNodePanelProps) {
               className="w-20 h-8 px-2 text-sm text-right border border-gray-300 rounded focus:outline-none focus:border-blue-500"
             />
           </div>
+
+          {/* 결과 캐시 */}
+          <div className="flex items-center gap-2 mt-2">
+            <input
+              type="checkbox"
+              id={`code-cacheable-${nodeId}`}
+              className="h-4 w-4 rounded border-gray-300"
+              checked={data.cacheable || false}
+              onChange={(e) =>
+                updateNodeData(nodeId, { cacheable: e.target.checked })
+              }
+            />
+            <label
+              htmlFor={`code-cacheable-${nodeId}`}
+              className="text-xs text-gray-700"
+            >
+              같은 입력이면 이전 결과 재사용 (결정적 코드만)
+            </label>
+          </div>
         </div>
       </CollapsibleSection>
 
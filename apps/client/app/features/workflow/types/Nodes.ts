@@ -167,6 +167,7 @@ export interface CodeNodeData extends BaseNodeData {
   code: string; // 실행할 Python 코드
   inputs: CodeNodeInput[]; // 입력 변수 매핑
   timeout: number; // 타임아웃 (초)
+  cacheable?: boolean; // 동일 코드/입력 결과 재사용 (결정적 코드만)
 }
 // ============================================================================
 
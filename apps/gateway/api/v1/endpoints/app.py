@@ -1,10 +1,11 @@
-from typing import List
+import uuid
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
-from apps.gateway.auth.dependencies import get_current_user
-from apps.shared.db.models.user import User
+from apps.gateway.auth.dependencies import get_current_user, get_current_user_id
+from apps.gateway.services.principal_cache import UserPrincipal
 from apps.shared.db.session import get_db
 from apps.shared.schemas.app import AppCreateRequest, AppResponse, AppUpdateRequest
 from apps.gateway.services.app_service import AppService
@@ -12,12 +13,24 @@ from apps.gateway.services.app_service import AppService
 router = APIRouter()
 
 
+def _set_next_cursor(response: Response, items: list, limit: Optional[int]):
+    """페이지가 가득 찼으면 다음 페이지 커서를 X-Next-Cursor 헤더로 전달"""
+    if not limit or len(items) < limit:
+        return
+    last = items[-1]
+    if isinstance(last, dict):
+        cursor = AppService.encode_cursor(last["created_at"], last["id"])
+    else:
+        cursor = AppService.encode_cursor(last.created_at, last.id)
+    response.headers["X-Next-Cursor"] = cursor
+
+
 @router.patch("/{app_id}", response_model=AppResponse)
 def update_app(
     app_id: str,
     request: AppUpdateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     앱 정보를 수정합니다. (본인 앱만)
@@ -37,7 +50,7 @@ def update_app(
 def create_app(
     request: AppCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     새로운 앱을 생성합니다. (인증 필요)
@@ -50,27 +63,49 @@ def create_app(
 
 @router.get("/explore", response_model=List[AppResponse])
 def list_explore_apps(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     # 탐색 페이지는 공개 접근을 의미하지만, 보통 사용자는 여전히 로그인 상태입니다.
     # 로그인 없이 공개 접근을 원한다면 current_user 의존성을 제거하면 됩니다.
     # 현재 시스템 설계상 복제/조회를 위해 로그인이 필요하다고 가정합니다.
-    current_user: User = Depends(get_current_user),
+    current_user_id: uuid.UUID = Depends(get_current_user_id),
 ):
     """
     공개된 앱 목록 조회 (커뮤니티 탐색)
+
+    limit을 지정하면 페이지 단위로 반환하며, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달합니다.
     """
-    return AppService.list_explore_apps(db, user_id=current_user.id)
+    try:
+        # 카탈로그는 사용자와 무관하게 공유 (current_user_id는 로그인 확인용)
+        apps = AppService.list_explore_apps(db, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    _set_next_cursor(response, apps, limit)
+    return apps
 
 
 @router.get("", response_model=List[AppResponse])
 def list_apps(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user_id: uuid.UUID = Depends(get_current_user_id),
 ):
     """
     현재 유저의 앱 목록 조회
+
+    limit을 지정하면 페이지 단위로 반환하며, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달합니다.
     """
-    apps = AppService.get_user_apps(db, user_id=current_user.id)
+    try:
+        apps = AppService.get_user_apps(
+            db, user_id=current_user_id, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    _set_next_cursor(response, apps, limit)
     return apps
 
 
@@ -78,7 +113,7 @@ def list_apps(
 def get_app(
     app_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     특정 앱 정보 조회
@@ -93,7 +128,7 @@ def get_app(
 def clone_app(
     app_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     앱을 복제합니다. (내 스튜디오로 복사)
@@ -111,7 +146,7 @@ def clone_app(
 def delete_app(
     app_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     앱을 삭제합니다. (본인 앱만)
@@ -125,7 +125,9 @@ def login(
 
 @router.post("/logout")
 def logout(request_obj: Request, response: Response):
-    """로그아웃 - 쿠키 삭제"""
+    """로그아웃 - 토큰 폐기 및 쿠키 삭제"""
+    AuthService.revoke_token(request_obj.cookies.get("auth_token"))
+
     # 환경 감지 및 쿠키 도메인 설정
     _, cookie_domain = _get_cookie_config(request_obj)
 
@@ -7,10 +7,10 @@ from sqlalchemy.orm import Session
 
 from apps.gateway.api.deps import get_db
 from apps.gateway.auth.dependencies import get_current_user
+from apps.gateway.services.principal_cache import UserPrincipal
 from apps.gateway.utils.encryption import encryption_manager
 from apps.shared.connectors.postgres import PostgresConnector
 from apps.shared.db.models.connection import Connection
-from apps.shared.db.models.user import User
 from apps.shared.schemas.connector import (
     DBConnectionTestRequest,
     DBConnectionTestResponse,
@@ -88,7 +88,7 @@ async def test_db_connection(request: DBConnectionTestRequest) -> Any:
 async def create_connection(
     request: DBConnectionTestRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> Any:
     """
     **DB 연결 정보 저장 API**
@@ -186,7 +186,7 @@ async def create_connection(
 async def get_connection_details(
     connection_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> Any:
     """
     **DB 연결 상세 정보 조회 API**
@@ -226,7 +226,7 @@ async def get_connection_details(
 async def get_connection_schema(
     connection_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> Any:
     """
     **DB 스키마 조회 API**
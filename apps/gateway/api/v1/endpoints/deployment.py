@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 
 from apps.gateway.auth.dependencies import get_current_user
 from apps.gateway.services.deployment_service import DeploymentService
-from apps.shared.db.models.user import User
+from apps.gateway.services.principal_cache import UserPrincipal
 from apps.shared.db.session import get_db
 from apps.shared.schemas.deployment import DeploymentCreate, DeploymentResponse
 
@@ -16,7 +16,7 @@ router = APIRouter()
 def create_deployment(
     deployment_in: DeploymentCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     워크플로우를 배포합니다.
@@ -32,7 +32,7 @@ def get_deployments(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     특정 앱의 배포 이력을 조회합니다.
@@ -51,7 +51,7 @@ def get_deployments(
 def list_workflow_nodes(
     excluded_app_id: str = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     배포된 워크플로우 노드 목록을 조회합니다. (재사용 가능한 모듈)
@@ -65,7 +65,7 @@ def list_workflow_nodes(
 def get_deployment(
     deployment_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     특정 배포 ID의 상세 정보를 조회합니다.
@@ -134,7 +134,7 @@ def get_deployment_info_public(
 def toggle_deployment(
     deployment_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     배포의 is_active 상태를 토글합니다.
@@ -149,7 +149,7 @@ def toggle_deployment(
 def delete_deployment(
     deployment_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     배포를 삭제합니다.
@@ -29,8 +29,8 @@ from apps.gateway.auth.dependencies import get_current_user
 from apps.gateway.services.ingestion.service import (
     IngestionOrchestrator as IngestionService,
 )
-from apps.shared.db.models.knowledge import Document, KnowledgeBase
-from apps.shared.db.models.user import User
+from apps.gateway.services.principal_cache import UserPrincipal
+from apps.shared.db.models.knowledge import Document, DocumentChunk, KnowledgeBase
 from apps.shared.schemas.rag import (
     DocumentPreviewRequest,
     DocumentPreviewResponse,
@@ -40,6 +40,7 @@ from apps.shared.schemas.rag import (
     KnowledgeBaseResponse,
     KnowledgeUpdate,
 )
+from apps.shared.services.keyword_search import SUPPORTED_TEXT_SEARCH_CONFIGS
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -51,16 +52,18 @@ router = APIRouter()
 def create_knowledge_base(
     kb_in: KnowledgeBaseCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     빈 지식 베이스를 생성합니다. (소스 없음)
     """
     # 임베딩 모델 유효성 검사 등은 생략하거나 추후 추가
+    _validate_text_search_config(kb_in.text_search_config)
     kb = KnowledgeBase(
         name=kb_in.name,
         description=kb_in.description,
         embedding_model=kb_in.embedding_model,
+        text_search_config=kb_in.text_search_config,
         user_id=current_user.id,
     )
     db.add(kb)
@@ -76,13 +79,23 @@ def create_knowledge_base(
         updated_at=kb.updated_at,
         source_types=[],
         embedding_model=kb.embedding_model,
+        text_search_config=kb.text_search_config,
     )
 
 
+def _validate_text_search_config(config: str):
+    if config not in SUPPORTED_TEXT_SEARCH_CONFIGS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported text_search_config '{config}' "
+            f"(supported: {', '.join(SUPPORTED_TEXT_SEARCH_CONFIGS)})",
+        )
+
+
 @router.get("", response_model=List[KnowledgeBaseResponse])
 def list_knowledge_bases(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     사용자의 자료 목록을 조회합니다.
@@ -133,7 +146,7 @@ def list_knowledge_bases(
 def get_knowledge_base(
     kb_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     지식 베이스의 상세 정보를 조회합니다.
@@ -183,10 +196,10 @@ def update_knowledge_base(
     kb_id: UUID,
     update_data: KnowledgeUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
-    지식 베이스의 설정을 수정합니다. (이름, 설명, 즐겨찾기 임베딩 모델)
+    지식 베이스의 설정을 수정합니다. (이름, 설명, 즐겨찾기 임베딩 모델, 키워드 검색 설정)
     """
 
     kb = (
@@ -215,6 +228,18 @@ def update_knowledge_base(
         # 추후 'ingestion.reindex_knowledge_base' 태스크 구현 후 연결 필요.
         pass
 
+    # 키워드 검색 설정 변경: 청크 설정을 바꾸면 search_vector(생성 컬럼)가 다시 계산됨
+    if (
+        update_data.text_search_config is not None
+        and update_data.text_search_config != kb.text_search_config
+    ):
+        _validate_text_search_config(update_data.text_search_config)
+        kb.text_search_config = update_data.text_search_config
+        db.query(DocumentChunk).filter(DocumentChunk.knowledge_base_id == kb.id).update(
+            {DocumentChunk.text_search_config: update_data.text_search_config},
+            synchronize_session=False,
+        )
+
     db.commit()
     db.refresh(kb)
 
@@ -225,7 +250,7 @@ def update_knowledge_base(
 def delete_knowledge_base(
     kb_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     지식 베이스를 삭제합니다.
@@ -269,7 +294,7 @@ def get_document(
     kb_id: UUID,
     document_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     특정 문서를 조회합니다.
@@ -308,7 +333,7 @@ def get_document_content(
     kb_id: UUID,
     document_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     문서의 원본 파일을 반환합니다. (브라우저 표시용)
@@ -487,7 +512,7 @@ async def process_document(
     document_id: UUID,
     request: DocumentPreviewRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     문서 설정(청킹 등)을 저장하고 백그라운드 처리를 시작합니다.
@@ -565,7 +590,7 @@ def preview_document_chunking(
     document_id: UUID,
     request: DocumentPreviewRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     문서 청킹 설정을 미리보기 합니다. DB를 업데이트하지 않고 결과만 반환합니다.
@@ -629,7 +654,7 @@ async def sync_document(
     kb_id: UUID,
     document_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     문서를 동기화합니다. (API 소스 등 재위)
@@ -6,10 +6,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import desc, func
 from sqlalchemy.orm import Session
 
-from apps.gateway.auth.dependencies import get_current_user
+from apps.gateway.auth.dependencies import get_current_user, get_current_user_id
 from apps.gateway.services.llm_service import LLMService
+from apps.gateway.services.principal_cache import UserPrincipal
 from apps.shared.db.models.llm import LLMModel, LLMProvider, LLMUsageLog
-from apps.shared.db.models.user import User
 from apps.shared.db.session import get_db
 from apps.shared.schemas.llm import (
     LLMCredentialCreate,
@@ -40,7 +40,7 @@ def get_system_providers(db: Session = Depends(get_db)):
 
 @router.get("/my-models", response_model=List[LLMModelResponse])
 def get_my_models(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_db), current_user: UserPrincipal = Depends(get_current_user)
 ):
     """
     List all models available to the current user.
@@ -53,7 +53,7 @@ def get_my_models(
 
 @router.get("/my-embedding-models", response_model=List[LLMModelResponse])
 def get_my_embedding_models(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_db), current_user: UserPrincipal = Depends(get_current_user)
 ):
     """
     현재 사용자가 사용 가능한 임베딩 모델 목록 조회.
@@ -66,7 +66,7 @@ def get_my_embedding_models(
 
 @router.get("/credentials", response_model=List[LLMCredentialResponse])
 def get_my_credentials(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_db), current_user: UserPrincipal = Depends(get_current_user)
 ):
     """
     List all credentials for the current user.
@@ -81,7 +81,7 @@ def get_my_credentials(
 def register_credential(
     request: LLMCredentialCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Register a new API Key for a specific provider.
@@ -98,7 +98,7 @@ def register_credential(
 def delete_credential(
     credential_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Delete a user credential.
@@ -117,7 +117,7 @@ def sync_credential_models(
     credential_id: UUID,
     purge_unverified: bool = False,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     해당 크리덴셜 기준으로 모델 매핑을 재동기화합니다.
@@ -138,7 +138,7 @@ def sync_credential_models(
 @router.get("/stats/top-models")
 def get_top_expensive_models(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user_id: UUID = Depends(get_current_user_id),
 ):
     """
     Get Top 3 expensive models for the current month (user-scoped).
@@ -164,7 +164,7 @@ def get_top_expensive_models(
             .join(LLMModel, LLMUsageLog.model_id == LLMModel.id)
             .join(LLMProvider, LLMModel.provider_id == LLMProvider.id)
             .filter(LLMUsageLog.created_at >= start_of_month)
-            .filter(LLMUsageLog.user_id == current_user.id)  # 사용자별 필터링
+            .filter(LLMUsageLog.user_id == current_user_id)  # 사용자별 필터링
             .group_by(LLMModel.id, LLMModel.name, LLMProvider.id, LLMProvider.name)
             .order_by(desc("total_cost"))
             .limit(3)
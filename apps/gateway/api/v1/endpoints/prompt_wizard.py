@@ -11,8 +11,8 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from apps.gateway.auth.dependencies import get_current_user
+from apps.gateway.services.principal_cache import UserPrincipal
 from apps.shared.db.models.llm import LLMCredential, LLMProvider
-from apps.shared.db.models.user import User
 from apps.shared.db.session import get_db
 from apps.gateway.services.llm_service import LLMService
 
@@ -98,7 +98,7 @@ Assistant Prompt의 목적:
 @router.get("/check-credentials", response_model=CredentialCheckResponse)
 def check_credentials(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     현재 사용자가 유효한 LLM credential을 가지고 있는지 확인합니다.
@@ -118,7 +118,7 @@ def check_credentials(
 async def improve_prompt(
     request: PromptImproveRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     AI를 사용하여 프롬프트를 개선합니다.
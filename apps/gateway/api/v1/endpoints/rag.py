@@ -22,11 +22,11 @@ from apps.gateway.core.config import settings
 from apps.gateway.services.ingestion.service import (
     IngestionOrchestrator as IngestionService,
 )
+from apps.gateway.services.principal_cache import UserPrincipal
 from apps.gateway.services.retrieval import RetrievalService
 from apps.gateway.services.storage import get_storage_service
 from apps.shared.db.models.connection import Connection
 from apps.shared.db.models.knowledge import Document, KnowledgeBase, SourceType
-from apps.shared.db.models.user import User
 from apps.shared.schemas.rag import (
     ApiPreviewRequest,
     ChunkPreview,
@@ -44,7 +44,7 @@ router = APIRouter()
 async def generate_presigned_url(
     filename: str = Body(..., embed=True),
     content_type: str = Body(..., embed=True),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     S3 Presigned URL 생성 (프론트엔드 직접 업로드용)
@@ -126,7 +126,7 @@ async def upload_document(
     # 문서별 청킹 설정
     chunk_size: int = Form(1000, alias="chunkSize"),
     chunk_overlap: int = Form(200, alias="chunkOverlap"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -216,7 +216,7 @@ async def upload_document(
     )
 
 
-def _prepare_db_source(db: Session, user: User, connection_id: Optional[UUID]):
+def _prepare_db_source(db: Session, user: UserPrincipal, connection_id: Optional[UUID]):
     """DB 소스처리를 위한 데이터 준비"""
     if not connection_id:
         raise HTTPException(
@@ -246,7 +246,7 @@ async def analyze_document(
     document_id: UUID,
     strategy: str = "llamaparse",  # UI에서 선택한 파싱 전략
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     문서 분석 API: 페이지 수 및 LlamaParse 비용 예측 반환
@@ -265,7 +265,7 @@ async def confirm_document_parsing(
     document_id: UUID,
     strategy: str = "llamaparse",  # "llamaparse" or "general"
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     비용 승인 대기 중인 문서의 파싱을 재개합니다. (비동기 처리)
@@ -300,7 +300,7 @@ async def confirm_document_parsing(
 def delete_document(
     document_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     문서를 삭제합니다. (연관된 청크도 자동 삭제됨)
@@ -336,7 +336,7 @@ def delete_document(
 async def search_test_chat(
     query: SearchQuery,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     [Search Test] RAG Chat Mode
@@ -356,7 +356,7 @@ async def search_test_chat(
 async def search_test_pure(
     query: SearchQuery,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     [Search Test] Pure Retrieval Mode
@@ -376,7 +376,7 @@ async def search_test_pure(
 async def get_document_progress(
     document_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     [SSE] 문서 처리 진행 상황을 실시간 스트리밍으로 반환합니다.
@@ -454,7 +454,7 @@ async def get_document_progress(
 @router.post("/proxy/preview")
 async def proxy_api_preview(
     request: ApiPreviewRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     프론트엔드 CORS 문제 해결을 위한 API 프록시 엔드포인트
@@ -519,7 +519,7 @@ async def proxy_api_preview(
 
 def _get_or_create_knowledge_base(
     db: Session,
-    user: User,
+    user: UserPrincipal,
     kb_id: Optional[UUID],
     name: Optional[str],
     description: Optional[str],
@@ -13,8 +13,8 @@ from sqlalchemy.orm import Session
 
 from apps.gateway.auth.dependencies import get_current_user
 from apps.gateway.services.llm_service import LLMService
+from apps.gateway.services.principal_cache import UserPrincipal
 from apps.shared.db.models.llm import LLMCredential, LLMProvider
-from apps.shared.db.models.user import User
 from apps.shared.db.session import get_db
 
 router = APIRouter()
@@ -103,7 +103,7 @@ PROVIDER_EFFICIENT_MODELS = {
 @router.get("/check-credentials", response_model=CredentialCheckResponse)
 def check_credentials(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     현재 사용자가 유효한 LLM credential을 가지고 있는지 확인합니다.
@@ -123,7 +123,7 @@ def check_credentials(
 async def improve_template(
     request: TemplateImproveRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     AI를 사용하여 Jinja2 템플릿을 개선합니다.
@@ -6,9 +6,9 @@ from typing import Any, Dict
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
+from apps.gateway.services.app_route_cache import AppRoute, resolve_app_route
 from apps.shared.celery_app import celery_app
 from apps.shared.db.models.app import App
-from apps.shared.db.models.workflow_deployment import WorkflowDeployment
 from apps.shared.db.session import get_db
 
 logger = logging.getLogger(__name__)
@@ -18,7 +18,7 @@ router = APIRouter()
 CAPTURE_SESSIONS: Dict[str, Dict[str, Any]] = {}
 
 
-def verify_webhook_auth(request: Request, app: App) -> bool:
+def verify_webhook_auth(request: Request, route: AppRoute) -> bool:
     """
     다양한 Webhook 인증 방식을 순차적으로 검증
 
@@ -29,26 +29,26 @@ def verify_webhook_auth(request: Request, app: App) -> bool:
 
     Args:
         request: FastAPI Request 객체
-        app: App 모델 객체 (auth_secret 포함)
+        route: 캐시된 앱 라우팅 정보 (auth_secret 해시 포함)
 
     Returns:
         True if authenticated, False otherwise
     """
     # 1. Query Parameter
     token = request.query_params.get("token")
-    if token and token == app.auth_secret:
+    if token and route.verify_secret(token):
         return True
 
     # 2. Authorization Header (Bearer)
     auth_header = request.headers.get("Authorization")
     if auth_header and auth_header.startswith("Bearer "):
         token = auth_header[7:]  # "Bearer " 제거
-        if token == app.auth_secret:
+        if route.verify_secret(token):
             return True
 
     # 3. Custom Header (X-Webhook-Secret)
     webhook_secret = request.headers.get("X-Webhook-Secret")
-    if webhook_secret and webhook_secret == app.auth_secret:
+    if webhook_secret and route.verify_secret(webhook_secret):
         return True
 
     return False
@@ -105,13 +105,13 @@ async def receive_webhook(
     - Authorization Header: Bearer xxx
     - Custom Header: X-Webhook-Secret: xxx
     """
-    # 1. App 조회 (url_slug로)
-    app = db.query(App).filter(App.url_slug == url_slug).first()
-    if not app:
+    # 1. App 조회 (url_slug로, [PERF] 캐시 우선 - 히트 시 DB 미사용)
+    route = resolve_app_route(db, url_slug)
+    if not route:
         raise HTTPException(status_code=404, detail="App not found")
 
     # 2. 인증 검증
-    if not verify_webhook_auth(request, app):
+    if not verify_webhook_auth(request, route):
         raise HTTPException(
             status_code=403,
             detail="Authentication failed. Provide token via query param (?token=xxx), Bearer header, or X-Webhook-Secret header.",
@@ -130,28 +130,23 @@ async def receive_webhook(
         CAPTURE_SESSIONS[url_slug]["status"] = "captured"
         return {"status": "captured", "message": "Payload captured successfully"}
 
-    # 5. Active Deployment 조회
-    if not app.active_deployment_id:
+    # 5. Active Deployment 확인
+    if not route.active_deployment_id:
         raise HTTPException(
             status_code=400,
             detail="No active deployment. Please deploy the workflow first.",
         )
 
-    deployment = (
-        db.query(WorkflowDeployment)
-        .filter(WorkflowDeployment.id == app.active_deployment_id)
-        .first()
-    )
-    if not deployment:
+    if route.deployment_is_active is None:
         raise HTTPException(status_code=404, detail="Active deployment not found")
 
     # 6. 실행 모드: Celery 태스크로 워크플로우 실행 위임
     background_tasks.add_task(
         run_webhook_workflow,
-        str(deployment.id),
+        route.active_deployment_id,
         payload,
-        str(app.created_by),
-        str(app.workflow_id) if app.workflow_id else None,
+        route.created_by,
+        route.workflow_id,
     )
 
     return {
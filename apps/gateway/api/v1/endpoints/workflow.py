@@ -1,5 +1,6 @@
 import json
 import logging
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import List
 
@@ -11,11 +12,11 @@ from sqlalchemy.orm import Session, noload, selectinload
 # from sqlalchemy.orm import Session, noload, selectinload
 from starlette.requests import Request
 
-from apps.gateway.auth.dependencies import get_current_user
+from apps.gateway.auth.dependencies import get_current_user, get_current_user_id
+from apps.gateway.services.principal_cache import UserPrincipal
 from apps.gateway.services.workflow_service import WorkflowService
 from apps.shared.celery_app import celery_app
 from apps.shared.db.models.app import App
-from apps.shared.db.models.user import User
 from apps.shared.db.models.workflow import Workflow
 
 # [NEW] 로깅 모델 및 스키마
@@ -43,7 +44,7 @@ def get_workflow_runs(
     page: int = 1,
     limit: int = 20,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user_id: uuid.UUID = Depends(get_current_user_id),
 ):
     """
     특정 워크플로우의 실행 이력 조회
@@ -56,7 +57,7 @@ def get_workflow_runs(
         raise HTTPException(status_code=404, detail="Workflow not found")
 
     # TODO: 권한 체크 로직 강화 필요 (협업 기능 등)
-    # if workflow.created_by != str(current_user.id):
+    # if workflow.created_by != current_user_id:
     #     raise HTTPException(status_code=403, detail="Not authorized")
 
     # total = (
@@ -86,7 +87,7 @@ def get_workflow_run_detail(
     workflow_id: str,
     run_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user_id: uuid.UUID = Depends(get_current_user_id),
 ):
     """
     특정 워크플로우 실행 이력 상세 조회
@@ -147,7 +148,7 @@ def get_workflow_stats(
     workflow_id: str,
     days: int = 30,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user_id: uuid.UUID = Depends(get_current_user_id),
 ):
     import traceback
 
@@ -373,7 +374,7 @@ def get_workflow_stats(
 def create_workflow(
     request: WorkflowCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     새 워크플로우 생성 (인증 필요)
@@ -392,7 +393,7 @@ def create_workflow(
 def get_workflow(
     workflow_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     워크플로우 메타데이터 조회 (app_id 포함)
@@ -417,7 +418,7 @@ def get_workflow(
 def list_workflows_by_app(
     app_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     특정 App의 모든 워크플로우 조회
@@ -449,7 +450,7 @@ def sync_draft_workflow(
     workflow_id: str,
     request: WorkflowDraftRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     프론트엔드로부터 워크플로우 초안 데이터를 받아 PostgreSQL에 저장합니다. (인증 필요)
@@ -475,7 +476,7 @@ def sync_draft_workflow(
 def get_draft_workflow(
     workflow_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     PostgreSQL에서 워크플로우 초안 데이터를 조회합니다. (인증 필요)
@@ -497,7 +498,7 @@ async def execute_workflow(
     workflow_id: str,
     user_input: dict = {},
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     PostgreSQL에서 워크플로우 초안 데이터를 조회하고, Celery 태스크로 실행합니다. (인증 필요)
@@ -564,7 +565,7 @@ async def stream_workflow(
     workflow_id: str,
     request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     워크플로우를 실행하고 실행 과정을 SSE(Server-Sent Events)로 스트리밍합니다.
@@ -633,47 +634,35 @@ async def stream_workflow(
         "trigger_mode": "manual",  # 테스트 실행
     }
 
-    # 6. Redis Pub/Sub 구독 및 SSE 스트리밍
+    # 6. Redis Pub/Sub(또는 Stream) 구독 및 SSE 스트리밍
     # Race Condition 방지: 구독 완료 후 Celery 태스크 시작
     def event_generator():
-        """Redis Pub/Sub을 구독하여 SSE 이벤트로 변환"""
-        from apps.shared.pubsub import get_redis_client
+        """워크플로우 이벤트를 구독하여 SSE 이벤트로 변환"""
+        from apps.shared.pubsub import subscribe_workflow_events
 
-        client = get_redis_client()
-        pubsub = client.pubsub()
-        channel = f"workflow:{external_run_id}"
-
-        try:
-            # 1. 먼저 Redis 채널 구독
-            pubsub.subscribe(channel)
-
-            # 2. 구독 완료 후 Celery 태스크 시작 (중요!)
+        def start_task():
+            # 구독 완료 후 Celery 태스크 시작 (중요!)
             celery_app.send_task(
                 "workflow.stream",
                 args=[graph, user_input, execution_context, external_run_id],
             )
             logger.info("[Gateway] Celery 태스크 시작됨")
 
-            # 3. 이벤트 수신 및 SSE 전송
-            for message in pubsub.listen():
-                if message["type"] == "message":
-                    event = json.loads(message["data"])
-                    # SSE 포맷: "data: {json_content}\n\n"
-                    yield f"data: {json.dumps(event)}\n\n"
-
-                    # workflow_finish 또는 error 시 종료
-                    if event.get("type") in ("workflow_finish", "error"):
-                        logger.info(
-                            f"[Gateway] 스트리밍 종료 - type: {event.get('type')}"
-                        )
-                        break
+        try:
+            # 이벤트 수신 및 SSE 전송 (workflow_finish 또는 error 시 종료)
+            for event in subscribe_workflow_events(
+                external_run_id, on_subscribed=start_task
+            ):
+                # SSE 포맷: "data: {json_content}\n\n"
+                yield f"data: {json.dumps(event)}\n\n"
+                if event.get("type") in ("workflow_finish", "error"):
+                    logger.info(
+                        f"[Gateway] 스트리밍 종료 - type: {event.get('type')}"
+                    )
         except Exception as e:
             # 구독 중 에러 발생 시 에러 이벤트 전송
             error_event = {"type": "error", "data": {"message": str(e)}}
             yield f"data: {json.dumps(error_event)}\n\n"
-        finally:
-            pubsub.unsubscribe(channel)
-            pubsub.close()
 
     # 7. StreamingResponse 반환
     return StreamingResponse(event_generator(), media_type="text/event-stream")
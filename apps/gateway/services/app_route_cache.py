@@ -0,0 +1,263 @@
+"""
+앱 라우팅 캐시 (url_slug → 앱/활성 배포 메타데이터)
+
+Webhook/앱 실행 엔드포인트가 요청마다 App, WorkflowDeployment를 조회하지 않도록
+L1(프로세스 메모리, 짧은 TTL) + L2(Redis) 2단 캐시로 보관합니다.
+
+- 인증 비밀값은 원문 대신 SHA-256 해시만 캐시합니다.
+- 배포/토글/삭제 시 invalidate_app_route()가 slug별 버전을 올리고 Redis 채널로 알려
+  모든 게이트웨이 프로세스의 L1 항목을 지웁니다. 버전이 다른 L2 항목은 사용하지 않습니다.
+- Redis 장애 시에는 L1 + DB 조회로 동작합니다.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from apps.shared.db.models.app import App
+from apps.shared.db.models.workflow_deployment import WorkflowDeployment
+
+logger = logging.getLogger(__name__)
+
+APP_ROUTE_LOCAL_TTL = float(os.getenv("APP_ROUTE_LOCAL_TTL", 30))
+APP_ROUTE_LOCAL_MAX = int(os.getenv("APP_ROUTE_LOCAL_MAX", 10000))
+APP_ROUTE_REDIS_TTL = int(os.getenv("APP_ROUTE_REDIS_TTL", 600))
+
+KEY_PREFIX = "app_route"
+VERSION_KEY_PREFIX = "app_route_version"
+INVALIDATE_CHANNEL = "app_route:invalidate"
+
+
+def hash_secret(secret: str) -> str:
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class AppRoute:
+    """url_slug로 해석한 앱 실행 정보"""
+
+    app_id: str
+    url_slug: str
+    auth_secret_hash: Optional[str]
+    created_by: str
+    workflow_id: Optional[str]
+    active_deployment_id: Optional[str]
+    deployment_version: Optional[int] = None
+    # None: active_deployment_id가 가리키는 배포 레코드가 없음
+    deployment_is_active: Optional[bool] = None
+    input_schema: Optional[Dict[str, Any]] = None
+    version: int = 0
+
+    @property
+    def has_auth_secret(self) -> bool:
+        return bool(self.auth_secret_hash)
+
+    def verify_secret(self, token: Optional[str]) -> bool:
+        """토큰이 앱의 auth_secret과 일치하는지 확인 (상수 시간 비교)"""
+        if not token or not self.auth_secret_hash:
+            return False
+        return hmac.compare_digest(hash_secret(token), self.auth_secret_hash)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: Any) -> "AppRoute":
+        return cls(**json.loads(raw))
+
+
+# L1: slug → (만료 시각(monotonic), AppRoute)
+_local: "OrderedDict[str, Tuple[float, AppRoute]]" = OrderedDict()
+_lock = threading.Lock()
+_listener_started = False
+
+
+def _route_key(url_slug: str) -> str:
+    return f"{KEY_PREFIX}:{url_slug}"
+
+
+def _version_key(url_slug: str) -> str:
+    return f"{VERSION_KEY_PREFIX}:{url_slug}"
+
+
+def _get_redis():
+    from apps.shared.pubsub import get_redis_client
+
+    return get_redis_client()
+
+
+def _get_local(url_slug: str) -> Optional[AppRoute]:
+    with _lock:
+        item = _local.get(url_slug)
+        if item is None:
+            return None
+        expires_at, route = item
+        if expires_at <= time.monotonic():
+            del _local[url_slug]
+            return None
+        _local.move_to_end(url_slug)
+        return route
+
+
+def _set_local(url_slug: str, route: AppRoute) -> None:
+    with _lock:
+        _local[url_slug] = (time.monotonic() + APP_ROUTE_LOCAL_TTL, route)
+        _local.move_to_end(url_slug)
+        while len(_local) > APP_ROUTE_LOCAL_MAX:
+            _local.popitem(last=False)
+
+
+def _drop_local(url_slug: str) -> None:
+    with _lock:
+        _local.pop(url_slug, None)
+
+
+def _listen_invalidations() -> None:
+    """다른 프로세스의 무효화 이벤트를 받아 L1 항목 제거"""
+    while True:
+        pubsub = None
+        try:
+            pubsub = _get_redis().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATE_CHANNEL)
+            for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                slug = message["data"]
+                if isinstance(slug, bytes):
+                    slug = slug.decode("utf-8")
+                _drop_local(slug)
+        except Exception as e:
+            logger.warning(f"[AppRouteCache] Invalidation listener error: {e}")
+        finally:
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+        # Redis 재연결 대기 동안 stale 항목이 남지 않도록 L1 비움
+        clear_app_route_cache()
+        time.sleep(5)
+
+
+def _ensure_listener() -> None:
+    global _listener_started
+    if _listener_started:
+        return
+    with _lock:
+        if _listener_started:
+            return
+        _listener_started = True
+    threading.Thread(
+        target=_listen_invalidations, name="app-route-invalidation", daemon=True
+    ).start()
+
+
+def _load_from_db(db: Session, url_slug: str, version: int) -> Optional[AppRoute]:
+    app = db.query(App).filter(App.url_slug == url_slug).first()
+    if not app:
+        return None
+
+    deployment = None
+    if app.active_deployment_id:
+        deployment = (
+            db.query(WorkflowDeployment)
+            .filter(WorkflowDeployment.id == app.active_deployment_id)
+            .first()
+        )
+
+    return AppRoute(
+        app_id=str(app.id),
+        url_slug=url_slug,
+        auth_secret_hash=hash_secret(app.auth_secret) if app.auth_secret else None,
+        created_by=str(app.created_by),
+        workflow_id=str(app.workflow_id) if app.workflow_id else None,
+        active_deployment_id=str(app.active_deployment_id)
+        if app.active_deployment_id
+        else None,
+        deployment_version=deployment.version if deployment else None,
+        deployment_is_active=bool(deployment.is_active) if deployment else None,
+        input_schema=deployment.input_schema if deployment else None,
+        version=version,
+    )
+
+
+def resolve_app_route(db: Session, url_slug: str) -> Optional[AppRoute]:
+    """
+    url_slug에 해당하는 앱 실행 정보 반환 (L1 → Redis → DB 순서)
+
+    Returns:
+        AppRoute 또는 앱이 없으면 None
+    """
+    _ensure_listener()
+
+    route = _get_local(url_slug)
+    if route is not None:
+        return route
+
+    redis_client = None
+    version = 0
+    try:
+        redis_client = _get_redis()
+        raw, raw_version = redis_client.mget(
+            _route_key(url_slug), _version_key(url_slug)
+        )
+        version = int(raw_version or 0)
+        if raw:
+            route = AppRoute.from_json(raw)
+            if route.version == version:
+                _set_local(url_slug, route)
+                return route
+    except Exception as e:
+        logger.debug(f"[AppRouteCache] Redis lookup skipped: {e}")
+        redis_client = None
+
+    route = _load_from_db(db, url_slug, version)
+    if route is None:
+        return None
+
+    if redis_client is not None:
+        try:
+            # DB 조회 중 무효화되었으면 오래된 값을 저장하지 않음
+            if int(redis_client.get(_version_key(url_slug)) or 0) == version:
+                redis_client.set(
+                    _route_key(url_slug), route.to_json(), ex=APP_ROUTE_REDIS_TTL
+                )
+        except Exception as e:
+            logger.debug(f"[AppRouteCache] Redis store skipped: {e}")
+
+    _set_local(url_slug, route)
+    return route
+
+
+def invalidate_app_route(url_slug: Optional[str]) -> None:
+    """
+    앱/배포 변경 후 호출 (커밋 이후)
+    slug 버전을 올려 모든 프로세스가 다음 요청에서 DB 값을 다시 읽도록 합니다.
+    """
+    if not url_slug:
+        return
+    _drop_local(url_slug)
+    try:
+        redis_client = _get_redis()
+        pipe = redis_client.pipeline()
+        pipe.incr(_version_key(url_slug))
+        pipe.delete(_route_key(url_slug))
+        pipe.publish(INVALIDATE_CHANNEL, url_slug)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"[AppRouteCache] Invalidation failed for {url_slug}: {e}")
+
+
+def clear_app_route_cache() -> None:
+    """L1 캐시 비우기 (테스트/재연결용)"""
+    with _lock:
+        _local.clear()
@@ -1,11 +1,20 @@
+import base64
 import copy
 import secrets
+import uuid
+from datetime import datetime
 
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session, joinedload
 
+from apps.gateway.services.app_route_cache import invalidate_app_route
+from apps.gateway.services.explore_catalog import (
+    get_explore_catalog,
+    invalidate_explore_catalog,
+)
 from apps.shared.db.models.app import App
 from apps.shared.db.models.workflow import Workflow
-from apps.shared.schemas.app import AppCreateRequest, AppUpdateRequest
+from apps.shared.schemas.app import AppCreateRequest, AppResponse, AppUpdateRequest
 
 
 class AppService:
@@ -73,37 +82,88 @@ class AppService:
         db.commit()
         db.refresh(app)
 
+        if app.is_market:
+            invalidate_explore_catalog()
+
         AppService._populate_owner_name(db, app)
         return app
 
     @staticmethod
     def _populate_owner_name(db: Session, app: App):
         """App 객체에 owner_name 속성을 채웁니다."""
+        AppService._populate_owner_names(db, [app])
+
+    @staticmethod
+    def _populate_owner_names(db: Session, apps: list):
+        """
+        App 목록에 owner_name 속성을 채웁니다.
+        [PERF] 앱마다 조회하지 않고 소유자 ID를 모아 IN 조회 1회로 처리
+        """
         from apps.shared.db.models.user import User
 
-        if app.created_by:
-            user = db.query(User).filter(User.id == app.created_by).first()
-            if user:
+        owner_ids = {app.created_by for app in apps if app.created_by}
+        if not owner_ids:
+            return
+
+        names = dict(
+            db.query(User.id, User.name).filter(User.id.in_(owner_ids)).all()
+        )
+        for app in apps:
+            if app.created_by in names:
                 # Pydantic 모델 변환 시 사용될 속성 할당
-                setattr(app, "owner_name", user.name)
+                setattr(app, "owner_name", names[app.created_by])
 
     @staticmethod
     def _populate_deployment_status(db: Session, app: App):
-        """App 객체에 active_deployment_is_active 속성을 채웁니다."""
-        from apps.shared.db.models.workflow_deployment import WorkflowDeployment
+        """
+        App 객체에 active_deployment_is_active 속성을 채웁니다.
+        [PERF] active_deployment 관계를 사용 (목록 조회는 joinedload로 추가 쿼리 없음)
+        """
+        deployment = app.active_deployment if app.active_deployment_id else None
+        setattr(
+            app,
+            "active_deployment_is_active",
+            deployment.is_active if deployment else None,
+        )
 
-        if app.active_deployment_id:
-            deployment = (
-                db.query(WorkflowDeployment)
-                .filter(WorkflowDeployment.id == app.active_deployment_id)
-                .first()
+    @staticmethod
+    def encode_cursor(created_at, app_id) -> str:
+        """목록 페이지네이션 커서 생성 (created_at, id 기준)"""
+        if isinstance(created_at, datetime):
+            created_at = created_at.isoformat()
+        raw = f"{created_at}|{app_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+        """
+        커서 해석
+
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            created_at, app_id = raw.split("|", 1)
+            return datetime.fromisoformat(created_at), uuid.UUID(app_id)
+        except Exception:
+            raise ValueError("Invalid cursor")
+
+    @staticmethod
+    def _apply_cursor(query, limit: int | None, cursor: str | None):
+        """created_at, id 내림차순 keyset 페이지네이션 적용"""
+        query = query.order_by(App.created_at.desc(), App.id.desc())
+        if cursor:
+            created_at, app_id = AppService.decode_cursor(cursor)
+            query = query.filter(
+                or_(
+                    App.created_at < created_at,
+                    and_(App.created_at == created_at, App.id < app_id),
+                )
             )
-            if deployment:
-                setattr(app, "active_deployment_is_active", deployment.is_active)
-            else:
-                setattr(app, "active_deployment_is_active", None)
-        else:
-            setattr(app, "active_deployment_is_active", None)
+        if limit:
+            query = query.limit(limit)
+        return query
 
     @staticmethod
     def get_app(db: Session, app_id: str, user_id=None):
@@ -132,24 +192,26 @@ class AppService:
         return app
 
     @staticmethod
-    def get_user_apps(db: Session, user_id):
+    def get_user_apps(db: Session, user_id, limit: int = None, cursor: str = None):
         """
-        특정 유저의 모든 앱을 조회합니다.
+        특정 유저의 앱을 조회합니다.
 
         Args:
             db: 데이터베이스 세션
             user_id: 유저 ID
+            limit: 페이지 크기 (없으면 전체)
+            cursor: 이전 페이지 마지막 항목의 커서
 
         Returns:
-            App 객체 리스트
+            App 객체 리스트 (created_at, id 내림차순)
         """
-        apps = (
+        query = (
             db.query(App)
             # N+1 문제 방지를 위해 active_deployment 관계를 즉시 로딩 (Joined Load)
             .options(joinedload(App.active_deployment))
             .filter(App.created_by == user_id)
-            .all()
         )
+        apps = AppService._apply_cursor(query, limit, cursor).all()
 
         # owner_name 채우기 (모두 동일한 소유자)
         from apps.shared.db.models.user import User
@@ -166,30 +228,55 @@ class AppService:
         return apps
 
     @staticmethod
-    def list_explore_apps(db: Session, user_id):
+    def list_explore_apps(db: Session, limit: int = None, cursor: str = None):
         """
         마켓플레이스에 공개된 앱 목록을 조회합니다.
+        [PERF] 캐시된 카탈로그에서 페이지를 잘라 반환 (미스 시 쿼리 1회로 재생성)
 
         Args:
             db: 데이터베이스 세션
-            user_id: 현재 유저 ID
+            limit: 페이지 크기 (없으면 전체)
+            cursor: 이전 페이지 마지막 항목의 커서
 
         Returns:
-            공개된 App 객체 리스트
+            공개 앱 dict 리스트 (AppResponse 형태, auth_secret 제외)
         """
-        apps = (
-            db.query(App)
+        catalog = get_explore_catalog(lambda: AppService._build_explore_catalog(db))
+
+        if cursor:
+            created_at, app_id = AppService.decode_cursor(cursor)
+            position = (created_at, str(app_id))
+            catalog = [
+                item
+                for item in catalog
+                if (datetime.fromisoformat(item["created_at"]), item["id"]) < position
+            ]
+        return catalog[:limit] if limit else catalog
+
+    @staticmethod
+    def _build_explore_catalog(db: Session) -> list[dict]:
+        """공개 앱 카탈로그 생성 (소유자 이름/활성 배포를 조인한 단일 쿼리)"""
+        from apps.shared.db.models.user import User
+
+        rows = (
+            db.query(App, User.name)
+            .outerjoin(User, User.id == App.created_by)
             .options(joinedload(App.active_deployment))
             .filter(App.is_market == True)
+            .order_by(App.created_at.desc(), App.id.desc())
             .all()
         )
 
-        # owner_name 및 배포 상태 정보 추가
-        for app in apps:
-            AppService._populate_owner_name(db, app)
+        catalog = []
+        for app, owner_name in rows:
+            setattr(app, "owner_name", owner_name)
             AppService._populate_deployment_status(db, app)
-
-        return apps
+            catalog.append(
+                AppResponse.model_validate(app).model_dump(
+                    mode="json", exclude={"auth_secret"}
+                )
+            )
+        return catalog
 
     @staticmethod
     def update_app(db: Session, app_id: str, request: AppUpdateRequest, user_id):
@@ -213,6 +300,8 @@ class AppService:
         if app.created_by != user_id:
             return None
 
+        was_market = app.is_market
+
         # 필드 업데이트
         if request.name is not None:
             # 이름 중복 체크
@@ -240,6 +329,9 @@ class AppService:
         db.commit()
         db.refresh(app)
 
+        if was_market or app.is_market:
+            invalidate_explore_catalog()
+
         AppService._populate_owner_name(db, app)
         return app
 
@@ -350,8 +442,13 @@ class AppService:
 
         # 3. 앱 삭제
         # WorkflowDeployment는 ON DELETE CASCADE로 설정되어 있어 자동 삭제됨
+        url_slug = app.url_slug
+        is_market = app.is_market
         db.delete(app)
         db.commit()
+        invalidate_app_route(url_slug)
+        if is_market:
+            invalidate_explore_catalog()
 
         return True
 
@@ -3,11 +3,14 @@
 import hashlib
 import os
 import secrets
+import uuid
 from datetime import datetime, timedelta, timezone
 
 from jose import jwt
 from sqlalchemy.orm import Session
 
+from apps.gateway.services import principal_cache
+from apps.gateway.services.principal_cache import UserPrincipal
 from apps.shared.db.models.user import User
 from apps.shared.schemas.auth import (
     LoginRequest,
@@ -59,6 +62,7 @@ class AuthService:
             if is_updated:
                 db.commit()
                 db.refresh(user)
+                principal_cache.invalidate_user(user.id)
 
             return user
 
@@ -96,12 +100,13 @@ class AuthService:
     @staticmethod
     def create_jwt_token(user_id: str) -> str:
         """JWT 토큰 생성"""
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            hours=ACCESS_TOKEN_EXPIRE_HOURS
-        )
+        issued_at = datetime.now(timezone.utc)
+        expires_at = issued_at + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
         payload = {
             "user_id": user_id,
             "exp": expires_at,
+            "iat": issued_at,
+            "jti": uuid.uuid4().hex,  # Principal 캐시/폐기 키
         }
         token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
         return token
@@ -122,24 +127,33 @@ class AuthService:
         Returns:
             str | None: 유효한 경우 user_id, 그렇지 않으면 None
         """
+        payload = AuthService.decode_jwt_token(token)
+        return payload.get("user_id") if payload else None
+
+    @staticmethod
+    def decode_jwt_token(token: str) -> dict | None:
+        """JWT 토큰 검증 후 payload 반환 (유효하지 않으면 None)"""
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            user_id: str = payload.get("user_id")
-            return user_id
+            return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         except jwt.JWTError:
             return None
 
     @staticmethod
-    def get_user_from_token(db: Session, token: str | None) -> User:
-        """
-        JWT 토큰으로 사용자 조회 (재사용 가능한 헬퍼 메서드)
+    def _token_key(token: str, payload: dict) -> str:
+        """Principal 캐시 키 (jti → user_id + 발급 시각 → 토큰 해시 순)"""
+        if payload.get("jti"):
+            return payload["jti"]
+        if payload.get("iat"):
+            return f"{payload.get('user_id')}:{payload['iat']}"
+        return hashlib.sha256(token.encode()).hexdigest()
 
-        Args:
-            db: 데이터베이스 세션
-            token: JWT 토큰
+    @staticmethod
+    def get_principal_from_token(db: Session, token: str | None) -> UserPrincipal:
+        """
+        JWT 토큰으로 인증 사용자 정보 조회 ([PERF] 토큰별 단기 캐시)
 
-        Returns:
-            User: 사용자 객체
+        캐시 히트 시 DB를 조회하지 않습니다. user_id만 필요한 엔드포인트는
+        get_current_user_id 의존성을 통해 이 값을 사용합니다.
 
         Raises:
             HTTPException: 인증 실패 시 401 에러
@@ -150,19 +164,65 @@ class AuthService:
         if not token:
             raise HTTPException(status_code=401, detail="로그인이 필요합니다")
 
-        # 토큰 검증
-        user_id = AuthService.verify_jwt_token(token)
+        # 토큰 검증 (만료 확인은 캐시 여부와 관계없이 매번 수행)
+        payload = AuthService.decode_jwt_token(token)
+        user_id = payload.get("user_id") if payload else None
         if not user_id:
             raise HTTPException(
                 status_code=401, detail="유효하지 않거나 만료된 토큰입니다"
             )
 
-        # 사용자 조회
+        principal_cache.ensure_listener()
+        token_key = AuthService._token_key(token, payload)
+        principal = principal_cache.get_cached_principal(token_key)
+        if principal is not None:
+            return principal
+
+        # 캐시 미스: 폐기 여부 확인 후 사용자 조회
+        if principal_cache.is_revoked(token_key, user_id, payload.get("iat")):
+            raise HTTPException(
+                status_code=401, detail="유효하지 않거나 만료된 토큰입니다"
+            )
+
         user = db.query(User).filter(User.id == user_id).first()
         if not user:
             raise HTTPException(status_code=401, detail="유저를 찾을 수 없습니다")
 
-        return user
+        principal = UserPrincipal.from_user(user)
+        principal_cache.cache_principal(token_key, principal, payload.get("exp"))
+        return principal
+
+    @staticmethod
+    def get_user_from_token(db: Session, token: str | None) -> UserPrincipal:
+        """
+        JWT 토큰으로 사용자 조회 (재사용 가능한 헬퍼 메서드)
+
+        [PERF] 캐시된 Principal을 그대로 반환하므로 SELECT가 발생하지 않습니다.
+        세션에 연결된 User가 아니므로 수정/관계 로딩이 필요하면 id로 직접 조회하세요.
+
+        Args:
+            db: 데이터베이스 세션
+            token: JWT 토큰
+
+        Returns:
+            UserPrincipal: 사용자 정보 (비밀번호 제외)
+
+        Raises:
+            HTTPException: 인증 실패 시 401 에러
+        """
+        return AuthService.get_principal_from_token(db, token)
+
+    @staticmethod
+    def revoke_token(token: str | None) -> None:
+        """로그아웃 시 토큰 폐기 (유효하지 않은 토큰은 무시)"""
+        if not token:
+            return
+        payload = AuthService.decode_jwt_token(token)
+        if not payload:
+            return
+        principal_cache.revoke_token(
+            AuthService._token_key(token, payload), payload.get("exp")
+        )
 
     @staticmethod
     def signup(db: Session, request: SignupRequest) -> LoginResponse:
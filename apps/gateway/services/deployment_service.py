@@ -9,6 +9,11 @@ from fastapi import HTTPException
 from sqlalchemy import desc, func
 from sqlalchemy.orm import Session
 
+from apps.gateway.services.app_route_cache import (
+    invalidate_app_route,
+    resolve_app_route,
+)
+from apps.gateway.services.explore_catalog import invalidate_explore_catalog
 from apps.gateway.services.workflow_service import WorkflowService
 from apps.shared.celery_app import celery_app
 from apps.shared.db.models.app import App
@@ -155,6 +160,9 @@ class DeploymentService:
 
             db.commit()
             db.refresh(db_obj)
+            invalidate_app_route(app.url_slug)
+            if app.is_market:
+                invalidate_explore_catalog()
 
             # 응답 객체에 App의 url_slug와 auth_secret 주입 (프론트엔드 표시용)
             # 모델에는 없지만 Pydantic response schema에는 존재함
@@ -320,48 +328,40 @@ class DeploymentService:
         Raises:
             HTTPException: 배포를 찾을 수 없거나 권한이 없거나 실행 실패 시
         """
-        # 1. url_slug와 일치하는 App 찾기 (App 중심 구조)
-        app = db.query(App).filter(App.url_slug == url_slug).first()
-        if not app:
+        # 1. url_slug와 일치하는 App 찾기 (App 중심 구조, [PERF] 라우팅 캐시 우선)
+        route = resolve_app_route(db, url_slug)
+        if not route:
             raise HTTPException(status_code=404, detail="App not found.")
 
-        # 2. 활성 배포(Active Deployment) 조회
-        if not app.active_deployment_id:
+        # 2. 활성 배포(Active Deployment) 확인
+        if not route.active_deployment_id:
             raise HTTPException(
                 status_code=404, detail="No active deployment found for this app."
             )
 
-        deployment = (
-            db.query(WorkflowDeployment)
-            .filter(WorkflowDeployment.id == app.active_deployment_id)
-            .first()
-        )
-
-        if not deployment:
+        if route.deployment_is_active is None:
             raise HTTPException(status_code=404, detail="Deployment data not found.")
 
         # 3. 활성상태 체크
-        if not deployment.is_active:
+        if not route.deployment_is_active:
             raise HTTPException(status_code=404, detail="Deployment is inactive")
 
         # 4. 인증 검증 (App의 auth_secret 사용)
         if require_auth:
             # 인증이 필요한 경우 (REST API 등)
-            if not app.auth_secret:
+            if not route.has_auth_secret:
                 raise HTTPException(
                     status_code=500,
                     detail="App has no auth_secret but requires authentication",
                 )
-            if not auth_token or auth_token != app.auth_secret:
+            if not route.verify_secret(auth_token):
                 raise HTTPException(
                     status_code=401, detail="Invalid authentication secret"
                 )
         # require_auth가 False면 인증 스킵 (웹 앱/위젯)
 
-        # 5. 그래프 데이터 준비
-        graph_data = deployment.graph_snapshot
-
-        # 6. 워크플로우 실행 (Celery 태스크로 위임)
+        # 5. 워크플로우 실행 (Celery 태스크로 위임)
+        # 그래프는 워커가 deployment_id로 조회/캐시하므로 게이트웨이에서 로드하지 않음
         try:
             # 로깅을 위한 컨텍스트 주입
             # memory_mode 추가 (챗봇 기억 모드 지원)
@@ -370,19 +370,18 @@ class DeploymentService:
                 memory_mode_enabled = memory_mode_enabled.lower() == "true"
             
             execution_context = {
-                "user_id": str(app.created_by),  # UUID를 문자열로 변환 (JSON 직렬화)
-                "workflow_id": str(app.workflow_id) if app.workflow_id else None,
+                "user_id": route.created_by,  # UUID 문자열 (JSON 직렬화)
+                "workflow_id": route.workflow_id,
                 "trigger_mode": "app",  # 실행 모드 (앱 배포 실행)
-                "deployment_id": str(deployment.id),
-                "workflow_version": deployment.version,
+                "deployment_id": route.active_deployment_id,
+                "workflow_version": route.deployment_version,
                 "memory_mode": memory_mode_enabled,  # 기억 모드 추가
             }
 
-            # Celery 태스크 호출 (workflow.execute)
+            # Celery 태스크 호출 (workflow.execute_by_deployment)
             task = celery_app.send_task(
-                "workflow.execute",
-                args=[graph_data, user_inputs, execution_context],
-                kwargs={"is_deployed": True},
+                "workflow.execute_by_deployment",
+                args=[route.active_deployment_id, user_inputs, execution_context],
             )
 
             # 비동기 폴링 패턴으로 결과 대기 (스레드 풀 고갈 방지)
@@ -639,6 +638,10 @@ class DeploymentService:
 
         db.commit()
         db.refresh(deployment)
+        if app:
+            invalidate_app_route(app.url_slug)
+            if app.is_market:
+                invalidate_explore_catalog()
 
         return deployment
 
@@ -698,5 +701,9 @@ class DeploymentService:
         # 4. 배포 레코드 삭제
         db.delete(deployment)
         db.commit()
+        if app:
+            invalidate_app_route(app.url_slug)
+            if app.is_market:
+                invalidate_explore_catalog()
 
         return {"message": f"Deployment {deployment_id} deleted successfully"}
@@ -0,0 +1,114 @@
+"""
+탐색(마켓플레이스) 카탈로그 캐시
+
+공개 앱 목록을 한 번의 쿼리로 만들어 직렬화된 형태로 보관합니다.
+L1(프로세스 메모리, 짧은 TTL) + L2(Redis) 2단 캐시이며,
+앱 공개 상태 변경/배포 이벤트 시 invalidate_explore_catalog()로 무효화합니다.
+무효화는 Redis 버전 키를 올리므로, 각 레플리카는 L1을 쓰기 전에 버전을 한 번 조회(GET)해
+다른 레플리카에서 일어난 무효화도 즉시 반영합니다.
+
+- 캐시 항목에는 auth_secret을 포함하지 않습니다.
+- Redis 장애 시에는 L1(EXPLORE_CATALOG_LOCAL_TTL 동안) + DB 조회로 동작합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EXPLORE_CATALOG_TTL = int(os.getenv("EXPLORE_CATALOG_TTL", 300))
+EXPLORE_CATALOG_LOCAL_TTL = float(os.getenv("EXPLORE_CATALOG_LOCAL_TTL", 10))
+
+CATALOG_KEY = "explore_catalog"
+VERSION_KEY = "explore_catalog_version"
+
+# (만료 시각(monotonic), 생성 시점의 Redis 버전, 카탈로그)
+_local: Optional[Tuple[float, Optional[str], List[Dict[str, Any]]]] = None
+_lock = threading.Lock()
+
+
+def _get_redis():
+    from apps.shared.pubsub import get_redis_client
+
+    return get_redis_client()
+
+
+def get_explore_catalog(
+    builder: Callable[[], List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """
+    카탈로그 조회 (L1 → Redis → builder 순서)
+
+    Args:
+        builder: 캐시 미스 시 카탈로그를 생성하는 함수 (DB 조회)
+
+    Returns:
+        공개 앱 dict 리스트 (created_at, id 내림차순)
+    """
+    global _local
+
+    with _lock:
+        local = _local
+    if local is not None and local[0] <= time.monotonic():
+        local = None
+
+    catalog = None
+    redis_client = None
+    version = None
+    try:
+        redis_client = _get_redis()
+        if local is not None:
+            # 다른 레플리카의 무효화 여부 확인 (버전이 같으면 L1 사용)
+            version = redis_client.get(VERSION_KEY)
+            if version == local[1]:
+                return local[2]
+        raw, version = redis_client.mget(CATALOG_KEY, VERSION_KEY)
+        if raw:
+            catalog = json.loads(raw)
+    except Exception as e:
+        logger.debug(f"[ExploreCatalog] Redis lookup skipped: {e}")
+        redis_client = None
+        # Redis 장애 시에는 로컬 TTL 안의 L1을 그대로 사용
+        if local is not None:
+            return local[2]
+
+    if catalog is None:
+        catalog = builder()
+        if redis_client is not None:
+            try:
+                # 생성 중 무효화되었으면 오래된 카탈로그를 저장하지 않음
+                if redis_client.get(VERSION_KEY) == version:
+                    redis_client.set(
+                        CATALOG_KEY,
+                        json.dumps(catalog, ensure_ascii=False),
+                        ex=EXPLORE_CATALOG_TTL,
+                    )
+            except Exception as e:
+                logger.debug(f"[ExploreCatalog] Redis store skipped: {e}")
+
+    with _lock:
+        _local = (time.monotonic() + EXPLORE_CATALOG_LOCAL_TTL, version, catalog)
+    return catalog
+
+
+def invalidate_explore_catalog() -> None:
+    """
+    앱 공개 상태/배포 변경 후 호출 (커밋 이후)
+
+    이 프로세스의 L1은 바로 비우고, 다른 레플리카는 올라간 버전을 보고 L1을 버립니다.
+    """
+    global _local
+
+    with _lock:
+        _local = None
+    try:
+        pipe = _get_redis().pipeline()
+        pipe.incr(VERSION_KEY)
+        pipe.delete(CATALOG_KEY)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"[ExploreCatalog] Invalidation failed: {e}")
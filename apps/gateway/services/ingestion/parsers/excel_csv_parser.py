@@ -1,52 +1,169 @@
+import codecs
+import csv
+import logging
 import os
-from typing import Any, Dict, List
-
-import pandas as pd
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
 from apps.gateway.services.ingestion.parsers.base import BaseParser
 
+logger = logging.getLogger(__name__)
+
+# 청크당 데이터 행 수 (헤더는 청크마다 반복)
+CHUNK_ROWS = int(os.getenv("EXCEL_CSV_CHUNK_ROWS", "500"))
+
+# CSV 인코딩 판별용으로 읽는 앞부분 크기
+_ENCODING_SNIFF_BYTES = 64 * 1024
+
 
 class ExcelCsvParser(BaseParser):
     """
     [ExcelCsvParser]
-    Excel(.xlsx) 및 CSV(.csv) 파일을 Pandas를 이용해 마크다운 형태로 변환합니다.
+    Excel(.xlsx) 및 CSV(.csv) 파일을 마크다운 표 청크로 변환합니다.
+
+    [PERF] 파일 전체를 DataFrame으로 올리지 않고 행 단위로 스트리밍합니다.
+    - xlsx: openpyxl read-only 모드로 시트별 행 순회
+    - csv: csv 모듈로 행 순회 (utf-8, 실패 시 cp949)
+    CHUNK_ROWS행마다 헤더를 반복한 표 청크를 만들므로
+    최대 메모리는 파일 크기가 아니라 청크 크기에 비례합니다.
     """
 
     def parse(self, source_path: str, **kwargs) -> List[Dict[str, Any]]:
+        try:
+            return list(self.iter_parse(source_path, **kwargs))
+        except Exception as e:
+            logger.error(f"[ExcelCsvParser] Parse failed: {e}")
+            return []
+
+    def iter_parse(self, source_path: str, **kwargs) -> Iterator[Dict[str, Any]]:
+        """parse와 같은 블록을 하나씩 생성 (호출자가 바로 소비하면 결과 전체를 들고 있지 않음)"""
         ext = os.path.splitext(source_path)[1].lower()
-        chunks = []
+        chunk_rows = kwargs.get("chunk_rows", CHUNK_ROWS)
+
+        if ext == ".csv":
+            yield from self._iter_csv(source_path, chunk_rows)
+        elif ext == ".xlsx":
+            yield from self._iter_xlsx(source_path, chunk_rows)
+        elif ext == ".xls":
+            # 구형 xls는 openpyxl이 읽지 못하므로 시트 단위로 pandas 사용 (포맷상 시트당 65,536행 제한)
+            yield from self._iter_xls(source_path, chunk_rows)
 
+    def _iter_csv(self, source_path: str, chunk_rows: int) -> Iterator[Dict[str, Any]]:
+        encoding = _detect_csv_encoding(source_path)
+        title = f"# CSV Content: {os.path.basename(source_path)}\n\n"
+
+        with open(source_path, "r", encoding=encoding, newline="") as f:
+            for i, table in enumerate(_iter_markdown_tables(csv.reader(f), chunk_rows)):
+                # 파일 제목은 첫 청크에만 (기존 출력과 동일)
+                yield {"text": (title if i == 0 else "") + table, "page": i + 1}
+
+    def _iter_xlsx(self, source_path: str, chunk_rows: int) -> Iterator[Dict[str, Any]]:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(source_path, read_only=True, data_only=True)
         try:
-            if ext == ".csv":
-                # CSV Chunk processing to avoid OOM
-                # 50MB CSV could be huge in markdown
-                chunk_size = 500  # Adjust chunk size (rows)
-                for i, df_chunk in enumerate(
-                    pd.read_csv(source_path, chunksize=chunk_size)
-                ):
-                    chunk_text = ""
-                    if i == 0:
-                        chunk_text += (
-                            f"# CSV Content: {os.path.basename(source_path)}\n\n"
-                        )
-                    chunk_text += df_chunk.to_markdown(index=False)
-                    chunks.append({"text": chunk_text, "page": i + 1})
-
-            elif ext in [".xlsx", ".xls"]:
-                # Sheet-wise processing
-                xls = pd.read_excel(source_path, sheet_name=None)
-                page_num = 1
-                for sheet_name, df in xls.items():
-                    # Handle large sheets optimization could be added here
-                    sheet_text = f"\n# Sheet: {sheet_name}\n\n"
-                    sheet_text += df.to_markdown(index=False)
-                    chunks.append({"text": sheet_text, "page": page_num})
+            page_num = 1
+            for sheet in workbook.worksheets:
+                heading = f"\n# Sheet: {sheet.title}\n\n"
+                rows = sheet.iter_rows(values_only=True)
+                for table in _iter_markdown_tables(rows, chunk_rows):
+                    yield {"text": heading + table, "page": page_num}
+                    page_num += 1
+        finally:
+            # read-only 워크북은 파일 핸들을 열어둔 채로 행을 읽음
+            workbook.close()
+
+    def _iter_xls(self, source_path: str, chunk_rows: int) -> Iterator[Dict[str, Any]]:
+        import pandas as pd
+
+        page_num = 1
+        with pd.ExcelFile(source_path) as xls:
+            for sheet_name in xls.sheet_names:
+                df = xls.parse(sheet_name, header=None, dtype=object)
+                heading = f"\n# Sheet: {sheet_name}\n\n"
+                rows = (
+                    [None if pd.isna(v) else v for v in row]
+                    for row in df.itertuples(index=False, name=None)
+                )
+                for table in _iter_markdown_tables(rows, chunk_rows):
+                    yield {"text": heading + table, "page": page_num}
                     page_num += 1
+                del df
 
-            else:
-                return []
 
-            return chunks
+def _detect_csv_encoding(source_path: str) -> str:
+    """앞부분을 utf-8로 디코딩해보고 실패하면 cp949 (한국어 윈도우 Excel 저장 CSV)"""
+    with open(source_path, "rb") as f:
+        head = f.read(_ENCODING_SNIFF_BYTES)
+    try:
+        # 잘린 멀티바이트 문자는 final=False로 허용
+        codecs.getincrementaldecoder("utf-8-sig")().decode(head, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp949"
 
-        except Exception:
-            return []
+
+def _is_empty(row: Sequence[Any]) -> bool:
+    return all(value is None or value == "" for value in row)
+
+
+def _format_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    elif isinstance(value, (datetime, date, time)):
+        value = value.isoformat(sep=" ") if isinstance(value, datetime) else value.isoformat()
+    # 셀 안의 파이프/줄바꿈은 표 구조를 깨므로 이스케이프
+    return str(value).replace("|", "\\|").replace("\r\n", " ").replace("\n", " ")
+
+
+def _trim(row: Sequence[Any]) -> List[Any]:
+    """read-only 시트가 돌려주는 뒤쪽 빈 셀 제거"""
+    row = list(row)
+    while row and (row[-1] is None or row[-1] == ""):
+        row.pop()
+    return row
+
+
+def _markdown_row(cells: Iterable[str]) -> str:
+    return "| " + " | ".join(cells) + " |"
+
+
+def _iter_markdown_tables(
+    rows: Iterable[Sequence[Any]], chunk_rows: int
+) -> Iterator[str]:
+    """
+    첫 번째 비어있지 않은 행을 헤더로 사용해 chunk_rows행씩 마크다운 표를 생성
+
+    청크마다 헤더 + 구분선을 반복하므로 각 청크가 단독으로도 읽힙니다.
+    """
+    header: Optional[str] = None
+    width = 0
+    lines: List[str] = []
+    emitted = False
+
+    for row in rows:
+        if _is_empty(row):
+            continue
+        cells = [_format_cell(value) for value in _trim(row)]
+
+        if header is None:
+            width = len(cells)
+            header = _markdown_row(cells) + "\n" + _markdown_row(["---"] * width)
+            continue
+
+        if len(cells) < width:
+            cells.extend([""] * (width - len(cells)))
+        lines.append(_markdown_row(cells))
+
+        if len(lines) >= chunk_rows:
+            yield header + "\n" + "\n".join(lines)
+            lines = []
+            emitted = True
+
+    if lines:
+        yield header + "\n" + "\n".join(lines)
+    elif header is not None and not emitted:
+        # 헤더만 있는 시트/파일도 표 구조는 남김
+        yield header
@@ -69,21 +69,26 @@ class FileProcessor(BaseProcessor):
                 if "target_pages" in source_config:
                     parse_kwargs["target_pages"] = source_config["target_pages"]
 
+            # [PERF] 스트리밍 파서(iter_parse)는 블록을 하나씩 받아 바로 청크로 변환
+            # (파싱 결과 전체 리스트를 청크 리스트와 함께 들고 있지 않음)
+            iter_parse = getattr(parser, "iter_parse", None)
+            chunks = []
             try:
-                parsed_blocks = parser.parse(target_path, **parse_kwargs)
+                if iter_parse is not None:
+                    parsed_blocks = iter_parse(target_path, **parse_kwargs)
+                else:
+                    parsed_blocks = parser.parse(target_path, **parse_kwargs)
+                for block in parsed_blocks:
+                    chunks.append(
+                        {
+                            "content": block["text"],
+                            "metadata": {"page": block["page"], "source": file_path},
+                        }
+                    )
             except Exception as e:
                 logger.error(f"[FileProcessor] Parsing error: {e}")
                 return ProcessingResult(chunks=[], metadata={"error": str(e)})
 
-            chunks = []
-            for block in parsed_blocks:
-                chunks.append(
-                    {
-                        "content": block["text"],
-                        "metadata": {"page": block["page"], "source": file_path},
-                    }
-                )
-
             return ProcessingResult(
                 chunks=chunks,
                 metadata={
@@ -803,6 +803,8 @@ class IngestionOrchestrator:
         from utils.template_utils import count_tokens
 
         new_chunks = []
+        # 키워드 검색 토큰화 설정은 지식 베이스 설정을 따름
+        text_search_config = doc.knowledge_base.text_search_config
 
         # LLM 클라이언트 초기화 (임베딩 생성용)
         # API Key 오류 등 발생 시 즉시 실패 처리 (상위에서 catch)
@@ -954,6 +956,7 @@ class IngestionOrchestrator:
                 token_count=chunk.get("token_count", 0),
                 metadata_=chunk_metadata,
                 embedding=embedding,
+                text_search_config=text_search_config,
             )
             new_chunks.append(new_chunk)
 
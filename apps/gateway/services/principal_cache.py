@@ -0,0 +1,229 @@
+"""
+인증 사용자(Principal) 캐시
+
+get_current_user가 요청마다 User를 조회하지 않도록, 토큰별로 사용자 정보를
+프로세스 메모리에 짧은 TTL로 보관합니다. (키: jti 또는 user_id + 발급 시각)
+
+- 로그아웃 시 토큰을 Redis에 폐기 등록합니다.
+- invalidate_user(revoke_tokens=True)는 사용자별 기준 시각을 올려 그 이전에 발급된 토큰을
+  모두 거부합니다. (현재 비밀번호 변경 API가 없으므로, 추가 시 변경 직후 호출해야 함)
+- 무효화는 Redis 채널로 전파되어 모든 게이트웨이 프로세스의 캐시 항목을 지웁니다.
+- Redis 장애 시에는 폐기 확인 없이 기존과 동일하게 JWT 검증 + DB 조회로 동작합니다.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+AUTH_PRINCIPAL_CACHE_TTL = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL", 60))
+AUTH_PRINCIPAL_CACHE_MAX = int(os.getenv("AUTH_PRINCIPAL_CACHE_MAX", 10000))
+
+REVOKED_KEY_PREFIX = "auth:revoked"
+VALID_AFTER_KEY_PREFIX = "auth:valid_after"
+INVALIDATE_CHANNEL = "auth:invalidate"
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """인증된 사용자 정보 (ORM 객체 없이 사용 가능한 스냅샷, 비밀번호 제외)"""
+
+    id: uuid.UUID
+    email: str
+    name: str
+    social_provider: str
+    social_id: Optional[str] = None
+    avatar_url: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user) -> "UserPrincipal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            social_provider=user.social_provider,
+            social_id=user.social_id,
+            avatar_url=user.avatar_url,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+# token_key → (만료 시각(monotonic), UserPrincipal)
+_local: "OrderedDict[str, Tuple[float, UserPrincipal]]" = OrderedDict()
+_lock = threading.Lock()
+_listener_started = False
+
+
+def _get_redis():
+    from apps.shared.pubsub import get_redis_client
+
+    return get_redis_client()
+
+
+def get_cached_principal(token_key: str) -> Optional[UserPrincipal]:
+    with _lock:
+        item = _local.get(token_key)
+        if item is None:
+            return None
+        expires_at, principal = item
+        if expires_at <= time.monotonic():
+            del _local[token_key]
+            return None
+        _local.move_to_end(token_key)
+        return principal
+
+
+def cache_principal(
+    token_key: str, principal: UserPrincipal, token_exp: Optional[float] = None
+) -> None:
+    """
+    Principal 저장 (토큰 만료 시각을 넘기지 않도록 TTL 조정)
+
+    Args:
+        token_exp: 토큰 만료 시각 (epoch seconds)
+    """
+    ttl = AUTH_PRINCIPAL_CACHE_TTL
+    if token_exp is not None:
+        ttl = min(ttl, token_exp - time.time())
+    if ttl <= 0:
+        return
+    with _lock:
+        _local[token_key] = (time.monotonic() + ttl, principal)
+        _local.move_to_end(token_key)
+        while len(_local) > AUTH_PRINCIPAL_CACHE_MAX:
+            _local.popitem(last=False)
+
+
+def _drop(kind: str, value: str) -> None:
+    with _lock:
+        if kind == "token":
+            _local.pop(value, None)
+        elif kind == "user":
+            stale = [k for k, (_, p) in _local.items() if str(p.id) == value]
+            for key in stale:
+                del _local[key]
+
+
+def _publish(kind: str, value: str, redis_client) -> None:
+    redis_client.publish(INVALIDATE_CHANNEL, f"{kind}:{value}")
+
+
+def _listen_invalidations() -> None:
+    """다른 프로세스의 무효화 이벤트를 받아 캐시 항목 제거"""
+    while True:
+        pubsub = None
+        try:
+            pubsub = _get_redis().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATE_CHANNEL)
+            for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode("utf-8")
+                kind, _, value = data.partition(":")
+                _drop(kind, value)
+        except Exception as e:
+            logger.warning(f"[PrincipalCache] Invalidation listener error: {e}")
+        finally:
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+        # 재연결 대기 동안 무효화를 놓치지 않도록 캐시 비움
+        clear_principal_cache()
+        time.sleep(5)
+
+
+def ensure_listener() -> None:
+    global _listener_started
+    if _listener_started:
+        return
+    with _lock:
+        if _listener_started:
+            return
+        _listener_started = True
+    threading.Thread(
+        target=_listen_invalidations, name="principal-invalidation", daemon=True
+    ).start()
+
+
+def is_revoked(token_key: str, user_id: str, issued_at: Optional[float]) -> bool:
+    """
+    토큰 폐기 여부 확인 (캐시 미스 시에만 호출)
+
+    - 로그아웃으로 폐기된 토큰
+    - 비밀번호 변경 이전에 발급된 토큰 (발급 시각 없는 토큰 포함)
+    """
+    try:
+        revoked, valid_after = _get_redis().mget(
+            f"{REVOKED_KEY_PREFIX}:{token_key}", f"{VALID_AFTER_KEY_PREFIX}:{user_id}"
+        )
+    except Exception as e:
+        logger.debug(f"[PrincipalCache] Revocation check skipped: {e}")
+        return False
+    if revoked:
+        return True
+    if valid_after:
+        return issued_at is None or issued_at < float(valid_after)
+    return False
+
+
+def revoke_token(token_key: str, token_exp: Optional[float]) -> None:
+    """로그아웃: 토큰을 만료 시각까지 폐기 목록에 등록"""
+    _drop("token", token_key)
+    ttl = int(token_exp - time.time()) + 1 if token_exp else None
+    if ttl is not None and ttl <= 0:
+        return
+    try:
+        redis_client = _get_redis()
+        redis_client.set(f"{REVOKED_KEY_PREFIX}:{token_key}", "1", ex=ttl)
+        _publish("token", token_key, redis_client)
+    except Exception as e:
+        logger.warning(f"[PrincipalCache] Token revocation failed: {e}")
+
+
+def invalidate_user(
+    user_id, revoke_tokens: bool = False, token_lifetime: Optional[int] = None
+) -> None:
+    """
+    사용자 정보 변경 후 캐시 무효화
+
+    Args:
+        user_id: 사용자 ID
+        revoke_tokens: True면 지금까지 발급된 토큰을 모두 거부 (비밀번호 변경 등,
+            변경 시각과 같은 초에 발급된 토큰까지 거부)
+        token_lifetime: 토큰 최대 수명(초) - 기준 시각 키의 TTL
+    """
+    user_id = str(user_id)
+    _drop("user", user_id)
+    try:
+        redis_client = _get_redis()
+        if revoke_tokens:
+            # iat는 초 단위라 같은 초에 발급된 기존 토큰도 거부하도록 다음 초부터 유효
+            # (변경 직후 1초 이내에 새로 발급된 토큰도 거부되므로 최대 1초간 재로그인 불가)
+            redis_client.set(
+                f"{VALID_AFTER_KEY_PREFIX}:{user_id}",
+                str(int(time.time()) + 1),
+                ex=token_lifetime,
+            )
+        _publish("user", user_id, redis_client)
+    except Exception as e:
+        logger.warning(f"[PrincipalCache] User invalidation failed: {e}")
+
+
+def clear_principal_cache() -> None:
+    """캐시 비우기 (테스트/재연결용)"""
+    with _lock:
+        _local.clear()
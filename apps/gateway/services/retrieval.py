@@ -1,14 +1,20 @@
 import logging
 import re
+from typing import Optional
 
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from apps.gateway.services.llm_service import LLMService
 from apps.gateway.utils.encryption import encryption_manager
-from apps.shared.db.models.knowledge import Document, DocumentChunk, KnowledgeBase
+from apps.shared.db.models.knowledge import KnowledgeBase
 from apps.shared.db.models.llm import LLMCredential, LLMModel, LLMProvider
 from apps.shared.schemas.rag import ChunkPreview, RAGResponse
+from apps.shared.services.keyword_search import (
+    get_text_search_config,
+    keyword_search,
+)
+from apps.shared.services.query_embedding_cache import embed_query
+from apps.shared.services.vector_search import vector_search
 
 logger = logging.getLogger(__name__)
 
@@ -154,38 +160,22 @@ class RetrievalService:
             )
             return [await self._rewrite_query(query)]
 
-    def _vector_search(self, query_vector: list, knowledge_base_id: str, top_k: int):
-        distance_col = DocumentChunk.embedding.cosine_distance(query_vector).label(
-            "distance"
-        )
-        stmt = (
-            select(DocumentChunk, Document, distance_col)
-            .join(Document)
-            .where(Document.knowledge_base_id == knowledge_base_id)
-            .order_by(distance_col)
-            .limit(top_k)
+    def _vector_search(
+        self,
+        query_vector: list,
+        knowledge_base_id: str,
+        top_k: int,
+        ef_search: Optional[int] = None,
+    ):
+        # [PERF] 차원별 HNSW 부분 인덱스 사용 (쿼리별 ef_search 조정 가능)
+        return vector_search(
+            self.db, query_vector, knowledge_base_id, top_k, ef_search
         )
-        return self.db.execute(stmt).all()
 
     def _keyword_search(self, query: str, knowledge_base_id: str, top_k: int):
-        from sqlalchemy import text
-
-        stmt = text("""
-            SELECT dc.id, dc.content, dc.metadata, dc.document_id, d.filename,
-                   ts_rank(
-                       to_tsvector('english', dc.content || ' ' || COALESCE(CAST(dc.metadata->'keywords' AS TEXT), '')),
-                       websearch_to_tsquery('english', :query)
-                   ) as rank
-            FROM document_chunks dc
-            JOIN documents d ON dc.document_id = d.id
-            WHERE dc.knowledge_base_id = :kb_id
-              AND to_tsvector('english', dc.content || ' ' || COALESCE(CAST(dc.metadata->'keywords' AS TEXT), '')) @@ websearch_to_tsquery('english', :query)
-            ORDER BY rank DESC
-            LIMIT :top_k
-        """)
-        return self.db.execute(
-            stmt, {"query": query, "kb_id": knowledge_base_id, "top_k": top_k}
-        ).fetchall()
+        # [PERF] 저장형 search_vector + GIN 인덱스 사용 (지식 베이스별 텍스트 검색 설정)
+        ts_config = get_text_search_config(self.db, knowledge_base_id)
+        return keyword_search(self.db, query, knowledge_base_id, top_k, ts_config)
 
     def _rrf_fusion(self, vector_results, keyword_results, k=60):
         """
@@ -274,9 +264,12 @@ class RetrievalService:
         hybrid_search: bool = True,
         use_rerank: bool = True,
         use_multi_query: bool = False,
+        ef_search: Optional[int] = None,
     ) -> list[ChunkPreview]:
         """
         [Public API] Hybrid Search (Vector + Keyword) with optional Multi-Query and Reranking (비동기)
+
+        ef_search: HNSW 후보 수 (None이면 VECTOR_EF_SEARCH, 클수록 recall↑ 지연↑)
         """
         if not knowledge_base_id:
             logger.warning("Search called without knowledge_base_id")
@@ -314,9 +307,10 @@ class RetrievalService:
             )
 
             for i, q in enumerate(queries):
-                query_vector = await embed_client.embed(q)
+                # [PERF] 반복 쿼리는 L1/Redis 캐시, 동시 동일 쿼리는 호출 하나로 합침
+                query_vector = await embed_query(embed_client, q)
                 vector_results = self._vector_search(
-                    query_vector, knowledge_base_id, top_k * 10
+                    query_vector, knowledge_base_id, top_k * 10, ef_search
                 )
 
                 if hybrid_search:
@@ -1,11 +1,19 @@
-"""Scheduler Service - APScheduler를 사용한 워크플로우 스케줄 관리"""
+"""Scheduler Service - Redis 리더 선출 기반 워크플로우 스케줄 트리거"""
 
+import functools
+import heapq
+import itertools
+import json
 import logging
+import os
+import socket
+import threading
+import time
 import uuid
-from datetime import datetime, timezone
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
 
@@ -15,99 +23,228 @@ from apps.shared.db.models.workflow_deployment import WorkflowDeployment
 
 logger = logging.getLogger(__name__)
 
+# 리더 선출 (게이트웨이 레플리카 중 하나만 스케줄을 발화)
+SCHEDULER_LEADER_KEY = "scheduler:leader"
+SCHEDULER_EVENTS_CHANNEL = "scheduler:events"
+SCHEDULER_FIRED_KEY_PREFIX = "scheduler:fired"
+SCHEDULER_LEADER_TTL = float(os.getenv("SCHEDULER_LEADER_TTL", 15))
+SCHEDULER_RENEW_INTERVAL = SCHEDULER_LEADER_TTL / 3
+
+# 미발화(misfire) 정책: 리더 부재 등으로 놓친 실행 처리 방식
+# - fire_once: 유예 시간 내에 놓친 실행은 한 번만 발화 (여러 번 놓쳐도 1회로 병합)
+# - skip: 놓친 실행은 버리고 다음 예정 시간부터 실행
+SCHEDULER_MISFIRE_POLICY = os.getenv("SCHEDULER_MISFIRE_POLICY", "fire_once")
+SCHEDULER_MISFIRE_GRACE_SECONDS = int(os.getenv("SCHEDULER_MISFIRE_GRACE_SECONDS", 300))
+
+# last_run_at/next_run_at DB 반영 주기 (발화마다 커밋하지 않고 모아서 갱신)
+SCHEDULER_FLUSH_INTERVAL = float(os.getenv("SCHEDULER_FLUSH_INTERVAL", 5.0))
+
+# 리더 교체 시점의 중복 발화 방지용 키 TTL
+SCHEDULER_FIRED_TTL = 24 * 3600
+
+# 소유자일 때만 TTL 연장/삭제 (다른 인스턴스의 락을 건드리지 않도록)
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_trigger(cron_expression: str, tz: str) -> CronTrigger:
+    """같은 Cron/타임존 조합은 트리거 객체를 공유 (스케줄 수가 많아도 메모리 절약)"""
+    return CronTrigger.from_crontab(cron_expression, timezone=tz)
+
+
+@dataclass
+class _ScheduleEntry:
+    """디스패처가 메모리에 보관하는 스케줄 정보 (발화 시 DB 조회 불필요)"""
+
+    schedule_id: uuid.UUID
+    deployment_id: uuid.UUID
+    cron_expression: str
+    timezone: str
+    user_id: Optional[str]
+    workflow_id: Optional[str]
+    next_run_at: Optional[datetime] = None
+    version: int = 0
+
 
 class SchedulerService:
     """
     워크플로우 스케줄을 관리하는 서비스
 
     동작 방식:
-    1. 서버 시작 시: load_schedules_from_db() 호출 → DB에서 활성 스케줄 로드
-    2. 배포 생성 시: add_schedule() 호출 → 새 스케줄 등록
-    3. APScheduler가 지정된 시간에 _run_workflow() 자동 호출
-    4. 서버 재시작해도 DB에서 스케줄 복구
+    1. 모든 게이트웨이 레플리카에서 실행되지만 Redis 락을 잡은 리더만 스케줄을 발화
+    2. 리더가 되면 DB에서 활성 스케줄을 한 번의 조인 쿼리로 로드하고 misfire 정책 적용
+    3. 다음 실행 시간 기준 최소 힙에서 도래한 스케줄만 꺼내 Celery로 위임 (deployment_id만 전달)
+    4. 배포 생성/변경 시 add/remove_schedule → Redis 채널로 리더에게 전파
+    5. last_run_at/next_run_at은 SCHEDULER_FLUSH_INTERVAL마다 일괄 갱신
     """
 
-    def __init__(self):
-        """BackgroundScheduler 초기화"""
-        self.scheduler = BackgroundScheduler(timezone="UTC")
-        self.scheduler.start()
-        logger.info("APScheduler 시작됨")
+    def __init__(
+        self,
+        redis_client: Any = None,
+        instance_id: Optional[str] = None,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
+        if redis_client is None:
+            from apps.shared.pubsub import get_redis_client
 
-    def load_schedules_from_db(self, db: Session):
+            redis_client = get_redis_client()
+        self._redis = redis_client
+        self.instance_id = (
+            instance_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+
+        self._entries: Dict[uuid.UUID, _ScheduleEntry] = {}
+        # (next_run_at, version, schedule_id) - 변경/삭제된 항목은 version 불일치로 지연 삭제
+        self._heap: List[Tuple[datetime, int, uuid.UUID]] = []
+        self._versions = itertools.count(1)
+        self._pending_updates: Dict[uuid.UUID, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+        self._is_leader = False
+        self._last_renew = 0.0
+        self._last_flush = time.monotonic()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+
+    def start(self, db: Optional[Session] = None):
         """
-        서버 시작 시 DB에서 모든 스케줄을 로드하여 메모리에 등록
-        활성 배포(is_active=True)의 스케줄만 로드합니다.
-
-        Args:
-            db: 데이터베이스 세션
+        리더 선출을 시도하고 디스패처/이벤트 수신 스레드를 시작합니다.
+        리더가 되면 전달받은 세션으로 스케줄을 바로 로드합니다.
         """
-        # 활성 배포만 필터링
-        schedules = (
-            db.query(Schedule)
-            .join(WorkflowDeployment, Schedule.deployment_id == WorkflowDeployment.id)
-            .filter(WorkflowDeployment.is_active.is_(True))
-            .all()
+        if self._acquire_leadership() and db is not None:
+            self.load_schedules_from_db(db)
+
+        for target, name in (
+            (self._dispatch_loop, "scheduler-dispatcher"),
+            (self._listen_events, "scheduler-events"),
+        ):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(
+            f"SchedulerService 시작됨 (instance={self.instance_id}, leader={self._is_leader})"
         )
 
-        for schedule in schedules:
+    def shutdown(self):
+        """Scheduler 종료 (서버 종료 시 호출)"""
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads.clear()
+
+        if self._is_leader:
+            self._flush_updates(force=True)
             try:
-                self.add_schedule(schedule, db)
+                self._redis.eval(
+                    _RELEASE_SCRIPT, 1, SCHEDULER_LEADER_KEY, self.instance_id
+                )
             except Exception as e:
-                logger.error(f"스케줄 로드 실패 ({schedule.id}): {e}")
+                logger.warning(f"리더 락 해제 실패: {e}")
+            self._is_leader = False
+        logger.info("SchedulerService 종료됨")
 
-        logger.info("스케줄 로드 완료")
+    # ------------------------------------------------------------------
+    # 스케줄 등록/제거 (API 경로에서 호출)
+    # ------------------------------------------------------------------
 
-    def add_schedule(self, schedule: Schedule, db: Session):
+    def load_schedules_from_db(self, db: Session):
         """
-        새 스케줄을 APScheduler에 등록
+        DB에서 활성 배포(is_active=True)의 스케줄을 모두 로드하여 힙을 재구성합니다.
+        저장된 next_run_at이 지났으면 misfire 정책을 적용합니다.
 
         Args:
-            schedule: Schedule 모델 인스턴스
-            db: 데이터베이스 세션 (next_run_at 업데이트용, job 실행에는 사용되지 않음)
+            db: 데이터베이스 세션
+        """
+        entries = self._query_entries(db)
+        now = self._clock()
+
+        with self._lock:
+            self._entries.clear()
+            self._heap = []
+            for entry, stored_next_run_at in entries:
+                try:
+                    entry.next_run_at = self._initial_run_at(
+                        entry, stored_next_run_at, now
+                    )
+                except Exception as e:
+                    logger.error(f"스케줄 로드 실패 ({entry.schedule_id}): {e}")
+                    continue
+                if entry.next_run_at != stored_next_run_at:
+                    self._queue_update(entry.schedule_id, next_run_at=entry.next_run_at)
+                self._push_locked(entry)
+            heapq.heapify(self._heap)
+
+        self._wakeup.set()
+        logger.info(f"스케줄 로드 완료: {len(self._entries)}건")
 
-        Note:
-            APScheduler job은 별도 스레드에서 실행되므로, job 실행 시에는
-            _run_workflow 내부에서 새 DB 세션을 생성합니다.
+    def add_schedule(self, schedule: Schedule, db: Session):
         """
-        job_id = str(schedule.id)
+        새 스케줄을 등록하고 리더에게 전파
 
-        # Cron 트리거 생성
-        trigger = CronTrigger.from_crontab(
-            schedule.cron_expression, timezone=schedule.timezone
+        Args:
+            schedule: Schedule 모델 인스턴스
+            db: 데이터베이스 세션 (next_run_at 업데이트용)
+        """
+        row = (
+            db.query(WorkflowDeployment.created_by, App.workflow_id)
+            .outerjoin(App, App.id == WorkflowDeployment.app_id)
+            .filter(WorkflowDeployment.id == schedule.deployment_id)
+            .first()
         )
-
-        # Job 등록 (db 세션은 전달하지 않음 - 스레드 안전성 문제)
-        self.scheduler.add_job(
-            func=self._run_workflow,
-            trigger=trigger,
-            id=job_id,
-            name=f"Schedule: {schedule.cron_expression}",
-            args=[schedule.deployment_id, schedule.id],  # db 제거
-            replace_existing=True,  # 같은 ID면 교체
+        entry = _ScheduleEntry(
+            schedule_id=schedule.id,
+            deployment_id=schedule.deployment_id,
+            cron_expression=schedule.cron_expression,
+            timezone=schedule.timezone,
+            user_id=str(row[0]) if row and row[0] else None,
+            workflow_id=str(row[1]) if row and row[1] else None,
         )
+        entry.next_run_at = self._next_fire_time(entry, self._clock())
 
-        # 다음 실행 시간 계산 및 DB 업데이트
-        job = self.scheduler.get_job(job_id)
-        if job and job.next_run_time:
-            schedule.next_run_at = job.next_run_time
-            db.commit()
+        with self._lock:
+            self._entries[entry.schedule_id] = entry
+            self._push_locked(entry, heap_push=True)
+        self._wakeup.set()
+
+        # 다음 실행 시간 DB 업데이트
+        schedule.next_run_at = entry.next_run_at
+        db.commit()
 
-        logger.info(f"Job 등록: {job_id} | 다음 실행: {schedule.next_run_at}")
+        self._publish_event("upsert", schedule.id)
+        logger.info(f"스케줄 등록: {schedule.id} | 다음 실행: {schedule.next_run_at}")
 
     def remove_schedule(self, schedule_id: uuid.UUID):
         """
-        스케줄을 APScheduler에서 제거
+        스케줄 제거 (모든 레플리카에 전파)
 
         Args:
             schedule_id: Schedule ID
         """
-        job_id = str(schedule_id)
-
-        try:
-            self.scheduler.remove_job(job_id)
-            logger.info(f"Job 제거: {job_id}")
-        except Exception as e:
-            logger.error(f"Job 제거 실패 ({job_id}): {e}")
+        self._remove_local(schedule_id)
+        self._publish_event("remove", schedule_id)
+        logger.info(f"스케줄 제거: {schedule_id}")
 
     def update_schedule(
         self,
@@ -121,105 +258,338 @@ class SchedulerService:
             schedule: 업데이트된 Schedule 모델
             db: 데이터베이스 세션
         """
-        # 기존 Job 제거 후 다시 등록
-        self.remove_schedule(schedule.id)
+        # 같은 ID로 다시 등록하면 기존 힙 항목은 version 불일치로 무시됨
         self.add_schedule(schedule, db)
 
-    def _run_workflow(
-        self,
-        deployment_id: uuid.UUID,
-        schedule_id: uuid.UUID,
-    ):
-        """
-        스케줄된 시간에 워크플로우를 실행하는 실제 함수
-
-        Args:
-            deployment_id: 배포 ID
-            schedule_id: 스케줄 ID
+    # ------------------------------------------------------------------
+    # 리더 선출
+    # ------------------------------------------------------------------
 
-        Note:
-            이 함수는 APScheduler가 별도 스레드에서 호출합니다.
-            Celery 태스크로 워크플로우 실행을 위임합니다.
+    def _acquire_leadership(self) -> bool:
+        """리더 락 획득 시도 (이미 리더면 TTL 연장)"""
+        ttl_ms = int(SCHEDULER_LEADER_TTL * 1000)
+        was_leader = self._is_leader
+        try:
+            if was_leader:
+                self._is_leader = bool(
+                    self._redis.eval(
+                        _RENEW_SCRIPT,
+                        1,
+                        SCHEDULER_LEADER_KEY,
+                        self.instance_id,
+                        ttl_ms,
+                    )
+                )
+            else:
+                self._is_leader = bool(
+                    self._redis.set(
+                        SCHEDULER_LEADER_KEY, self.instance_id, nx=True, px=ttl_ms
+                    )
+                )
+        except Exception as e:
+            # 락 상태를 확인할 수 없으면 중복 발화를 막기 위해 발화 중단
+            logger.warning(f"리더 락 확인 실패: {e}")
+            self._is_leader = False
+
+        self._last_renew = time.monotonic()
+        if was_leader and not self._is_leader:
+            logger.warning(f"스케줄러 리더 지위 상실: {self.instance_id}")
+        elif not was_leader and self._is_leader:
+            logger.info(f"스케줄러 리더 선출: {self.instance_id}")
+        return self._is_leader
+
+    def _maintain_leadership(self):
+        """TTL 갱신 주기마다 리더 락을 연장/획득하고, 새로 리더가 되면 스케줄을 다시 로드"""
+        if time.monotonic() - self._last_renew < SCHEDULER_RENEW_INTERVAL:
+            return
+        was_leader = self._is_leader
+        if self._acquire_leadership() and not was_leader:
+            # 리더 부재 동안의 변경/미발화를 반영하기 위해 DB에서 재구성
+            self._reload_from_db()
+
+    # ------------------------------------------------------------------
+    # 디스패처
+    # ------------------------------------------------------------------
+
+    def _dispatch_loop(self):
+        while not self._stop.is_set():
+            try:
+                self._maintain_leadership()
+                if self._is_leader:
+                    self._dispatch_due()
+                    self._flush_updates()
+            except Exception:
+                logger.exception("스케줄 디스패치 실패")
+
+            self._wakeup.wait(self._wait_timeout())
+            self._wakeup.clear()
+
+    def _wait_timeout(self) -> float:
+        """다음 발화 시각, 리더 락 갱신, DB 반영 중 가장 이른 시점까지 대기"""
+        timeout = min(SCHEDULER_RENEW_INTERVAL, SCHEDULER_FLUSH_INTERVAL)
+        with self._lock:
+            if self._is_leader and self._heap:
+                until_next = (self._heap[0][0] - self._clock()).total_seconds()
+                timeout = min(timeout, until_next)
+        return max(timeout, 0.0)
+
+    def _dispatch_due(self) -> int:
+        """도래한 스케줄을 발화하고 다음 실행 시간으로 다시 넣습니다. (발화 건수 반환)"""
+        now = self._clock()
+        due: List[Tuple[_ScheduleEntry, datetime]] = []
+
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                run_at, version, schedule_id = heapq.heappop(self._heap)
+                entry = self._entries.get(schedule_id)
+                if entry is None or entry.version != version:
+                    continue  # 제거되었거나 재등록된 항목
+                # 현재 시각 이후의 다음 실행 시간 (여러 번 놓쳤어도 한 번만 발화)
+                entry.next_run_at = self._next_fire_time(entry, max(now, run_at))
+                self._push_locked(entry, heap_push=True)
+                due.append((entry, run_at))
+
+        for entry, run_at in due:
+            if self._fire(entry, run_at):
+                self._queue_update(
+                    entry.schedule_id, last_run_at=now, next_run_at=entry.next_run_at
+                )
+            else:
+                self._queue_update(entry.schedule_id, next_run_at=entry.next_run_at)
+        return len(due)
+
+    def _fire(self, entry: _ScheduleEntry, run_at: datetime) -> bool:
+        """
+        스케줄된 워크플로우 실행을 Celery로 위임합니다.
+        그래프 조회와 배포 활성 여부 확인은 워커(execute_by_deployment)가 실행 시점에 수행하므로
+        게이트웨이에서는 DB를 조회하지 않습니다.
         """
-        # 각 job 실행마다 새로운 DB 세션 생성 (스레드 안전성 보장)
         from apps.shared.celery_app import celery_app
-        from apps.shared.db.session import SessionLocal
-
-        db = SessionLocal()
-        triggered_at = datetime.now(timezone.utc).isoformat()
 
-        logger.info(f"워크플로우 실행 시작: {deployment_id} (스케줄: {schedule_id})")
+        # 리더 교체 직후 두 인스턴스가 같은 회차를 발화하지 않도록 회차별 키 선점
+        fired_key = (
+            f"{SCHEDULER_FIRED_KEY_PREFIX}:{entry.schedule_id}:{int(run_at.timestamp())}"
+        )
+        try:
+            if not self._redis.set(fired_key, self.instance_id, nx=True, ex=SCHEDULER_FIRED_TTL):
+                logger.info(f"이미 발화된 회차 건너뜀: {entry.schedule_id} @ {run_at}")
+                return False
+        except Exception as e:
+            logger.warning(f"발화 중복 체크 실패 (계속 진행): {e}")
+
+        # user_input에 스케줄 메타데이터 포함
+        user_input = {
+            "triggered_at": self._clock().isoformat(),
+            "schedule_id": str(entry.schedule_id),
+        }
+
+        # execution_context 구성
+        execution_context = {
+            "user_id": entry.user_id,
+            "workflow_id": entry.workflow_id,
+            "trigger_mode": "schedule",
+            "deployment_id": str(entry.deployment_id),
+        }
 
         try:
-            # Deployment 조회
-            deployment = (
-                db.query(WorkflowDeployment)
-                .filter(WorkflowDeployment.id == deployment_id)
-                .first()
+            celery_app.send_task(
+                "workflow.execute_by_deployment",
+                args=[str(entry.deployment_id), user_input, execution_context],
             )
+        except Exception as e:
+            logger.error(f"워크플로우 실행 위임 실패 ({entry.schedule_id}): {e}")
+            return False
 
-            if not deployment:
-                logger.error(f"Deployment 없음: {deployment_id}")
-                return
+        logger.info(f"Celery 태스크 전송 완료: {entry.deployment_id} (스케줄: {entry.schedule_id})")
+        return True
+
+    def _flush_updates(self, force: bool = False):
+        """모아둔 last_run_at/next_run_at 변경을 한 번의 bulk update로 반영"""
+        if not force and time.monotonic() - self._last_flush < SCHEDULER_FLUSH_INTERVAL:
+            return
+        self._last_flush = time.monotonic()
 
-            if not deployment.is_active:
-                logger.error(f"Deployment 비활성화됨: {deployment_id}")
+        with self._lock:
+            if not self._pending_updates:
                 return
+            updates = list(self._pending_updates.values())
+            self._pending_updates.clear()
 
-            # App 조회하여 workflow_id 가져오기
-            app = db.query(App).filter(App.id == deployment.app_id).first()
-
-            # user_input에 스케줄 메타데이터 포함
-            user_input = {
-                "triggered_at": triggered_at,
-                "schedule_id": str(schedule_id),
-            }
-
-            # execution_context 구성
-            execution_context = {
-                "user_id": str(deployment.created_by),  # UUID를 문자열로 변환
-                "workflow_id": str(app.workflow_id)
-                if app and app.workflow_id
-                else None,
-                "trigger_mode": "schedule",
-                "deployment_id": str(deployment_id),
-            }
-
-            # Celery 태스크로 워크플로우 실행 위임 (비동기, 결과 대기 안 함)
-            celery_app.send_task(
-                "workflow.execute",
-                args=[deployment.graph_snapshot, user_input, execution_context],
-                kwargs={"is_deployed": True},
+        from apps.shared.db.session import SessionLocal
+
+        db = SessionLocal()
+        try:
+            db.bulk_update_mappings(Schedule, updates)
+            db.commit()
+        except Exception as e:
+            logger.error(f"스케줄 실행 시간 업데이트 실패 ({len(updates)}건): {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # 레플리카 간 변경 전파
+    # ------------------------------------------------------------------
+
+    def _publish_event(self, op: str, schedule_id: uuid.UUID):
+        try:
+            self._redis.publish(
+                SCHEDULER_EVENTS_CHANNEL,
+                json.dumps(
+                    {
+                        "op": op,
+                        "schedule_id": str(schedule_id),
+                        "source": self.instance_id,
+                    }
+                ),
             )
+        except Exception as e:
+            # 전파 실패 시에도 리더 재선출 시점에 DB에서 복구됨
+            logger.warning(f"스케줄 변경 전파 실패 ({schedule_id}): {e}")
 
-            logger.info(f"Celery 태스크 전송 완료: {deployment_id}")
+    def _listen_events(self):
+        """다른 레플리카의 스케줄 변경 이벤트를 받아 리더의 힙에 반영"""
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(SCHEDULER_EVENTS_CHANNEL)
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle_event(json.loads(message["data"]))
+            except Exception as e:
+                logger.warning(f"스케줄 이벤트 수신 오류: {e}")
+                self._stop.wait(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _handle_event(self, event: Dict[str, Any]):
+        if event.get("source") == self.instance_id:
+            return
+        schedule_id = uuid.UUID(event["schedule_id"])
+        if event.get("op") == "remove":
+            self._remove_local(schedule_id)
+            return
+        if not self._is_leader:
+            # 리더가 아니면 보관할 필요 없음 (리더가 되면 DB에서 전체 로드)
+            return
 
-            # Schedule 업데이트: last_run_at, next_run_at
-            schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
-            if schedule:
-                schedule.last_run_at = datetime.now(timezone.utc)
+        from apps.shared.db.session import SessionLocal
 
-                # 다음 실행 시간 계산
-                job = self.scheduler.get_job(str(schedule_id))
-                if job and job.next_run_time:
-                    schedule.next_run_at = job.next_run_time
+        db = SessionLocal()
+        try:
+            entries = self._query_entries(db, schedule_ids=[schedule_id])
+        finally:
+            db.close()
 
-                db.commit()
+        if not entries:
+            self._remove_local(schedule_id)
+            return
+        entry, _ = entries[0]
+        entry.next_run_at = self._next_fire_time(entry, self._clock())
+        with self._lock:
+            self._entries[schedule_id] = entry
+            self._push_locked(entry, heap_push=True)
+        self._wakeup.set()
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+
+    def _reload_from_db(self):
+        from apps.shared.db.session import SessionLocal
 
+        db = SessionLocal()
+        try:
+            self.load_schedules_from_db(db)
         except Exception as e:
-            logger.error(f"워크플로우 실행 실패: {e}")
-            logger.exception("워크플로우 실행 실패")
-            # 예외 발생 시 rollback
-            db.rollback()
-
+            logger.error(f"스케줄 재로드 실패: {e}")
         finally:
-            # 세션 반드시 닫기 (커넥션 풀 반환)
             db.close()
 
-    def shutdown(self):
-        """Scheduler 종료 (서버 종료 시 호출)"""
-        self.scheduler.shutdown()
-        logger.info("APScheduler 종료됨")
+    def _query_entries(
+        self, db: Session, schedule_ids: Optional[Iterable[uuid.UUID]] = None
+    ) -> List[Tuple[_ScheduleEntry, Optional[datetime]]]:
+        """활성 배포의 스케줄과 실행 컨텍스트 정보를 한 번에 조회 (N+1 없이)"""
+        query = (
+            db.query(Schedule, WorkflowDeployment.created_by, App.workflow_id)
+            .join(WorkflowDeployment, Schedule.deployment_id == WorkflowDeployment.id)
+            .outerjoin(App, App.id == WorkflowDeployment.app_id)
+            .filter(WorkflowDeployment.is_active.is_(True))
+        )
+        if schedule_ids is not None:
+            query = query.filter(Schedule.id.in_(list(schedule_ids)))
+
+        return [
+            (
+                _ScheduleEntry(
+                    schedule_id=schedule.id,
+                    deployment_id=schedule.deployment_id,
+                    cron_expression=schedule.cron_expression,
+                    timezone=schedule.timezone,
+                    user_id=str(created_by) if created_by else None,
+                    workflow_id=str(workflow_id) if workflow_id else None,
+                ),
+                schedule.next_run_at,
+            )
+            for schedule, created_by, workflow_id in query.all()
+        ]
+
+    def _initial_run_at(
+        self,
+        entry: _ScheduleEntry,
+        stored_next_run_at: Optional[datetime],
+        now: datetime,
+    ) -> Optional[datetime]:
+        """저장된 다음 실행 시간이 지났으면 misfire 정책에 따라 즉시 발화 여부 결정"""
+        if stored_next_run_at is not None and stored_next_run_at <= now:
+            overdue = (now - stored_next_run_at).total_seconds()
+            if (
+                SCHEDULER_MISFIRE_POLICY == "fire_once"
+                and overdue <= SCHEDULER_MISFIRE_GRACE_SECONDS
+            ):
+                return stored_next_run_at
+            logger.info(
+                f"미발화 스케줄 건너뜀: {entry.schedule_id} ({int(overdue)}초 지연)"
+            )
+        return self._next_fire_time(entry, now)
+
+    @staticmethod
+    def _next_fire_time(entry: _ScheduleEntry, after: datetime) -> Optional[datetime]:
+        """after 이후(초과)의 다음 실행 시간"""
+        trigger = _get_trigger(entry.cron_expression, entry.timezone)
+        return trigger.get_next_fire_time(None, after + timedelta(microseconds=1))
+
+    def _push_locked(self, entry: _ScheduleEntry, heap_push: bool = False):
+        """새 version으로 힙에 추가 (_lock 보유 상태에서 호출)"""
+        self._entries[entry.schedule_id] = entry
+        if entry.next_run_at is None:
+            return
+        entry.version = next(self._versions)
+        item = (entry.next_run_at, entry.version, entry.schedule_id)
+        if heap_push:
+            heapq.heappush(self._heap, item)
+        else:
+            self._heap.append(item)
+
+    def _remove_local(self, schedule_id: uuid.UUID):
+        with self._lock:
+            # 힙 항목은 남겨두고 entry만 제거 (꺼낼 때 무시됨)
+            self._entries.pop(schedule_id, None)
+            self._pending_updates.pop(schedule_id, None)
+
+    def _queue_update(self, schedule_id: uuid.UUID, **values: Any):
+        """DB 반영 대기열에 추가 (같은 스케줄은 마지막 값만 유지)"""
+        with self._lock:
+            pending = self._pending_updates.setdefault(
+                schedule_id, {"id": schedule_id}
+            )
+            pending.update(values)
 
 
 # 글로벌 SchedulerService 인스턴스 (서버 시작 시 초기화)
@@ -250,12 +620,12 @@ def init_scheduler_service(db: Session) -> SchedulerService:
     서버 시작 시 SchedulerService 초기화 (main.py에서 호출)
 
     Args:
-        db: 데이터베이스 세션
+        db: 데이터베이스 세션 (리더로 선출되면 스케줄 로드에 사용)
 
     Returns:
         초기화된 SchedulerService 인스턴스
     """
     global scheduler_service
     scheduler_service = SchedulerService()
-    scheduler_service.load_schedules_from_db(db)
+    scheduler_service.start(db)
     return scheduler_service
@@ -5,6 +5,7 @@ from fastapi.testclient import TestClient
 
 from apps.gateway.api.v1.endpoints.webhook import CAPTURE_SESSIONS
 from apps.gateway.main import app
+from apps.gateway.services.app_route_cache import clear_app_route_cache
 from apps.shared.db.session import get_db
 
 
@@ -14,8 +15,9 @@ class TestWebhookApi(unittest.TestCase):
         self.url_slug = "test-slug"
         self.auth_secret = "secret123"
 
-        # 캡처 세션 초기화
+        # 캡처 세션 / 앱 라우팅 캐시 초기화
         CAPTURE_SESSIONS.clear()
+        clear_app_route_cache()
 
     def test_capture_lifecycle(self):
         """캡처 시작 -> 웹훅 수신 -> 상태 조회 시나리오 테스트"""
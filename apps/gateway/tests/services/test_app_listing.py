@@ -0,0 +1,158 @@
+"""
+앱 목록 조회 테스트
+
+테스트 대상:
+1. 소유자 이름 일괄 조회 (앱 수와 무관하게 쿼리 1회)
+2. 탐색 카탈로그 캐시 / 무효화
+3. 커서 페이지네이션
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from apps.gateway.services import explore_catalog
+from apps.gateway.services.app_service import AppService
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, *keys):
+        return [self.store.get(key) for key in keys]
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+    def pipeline(self):
+        redis = self
+        ops = []
+
+        class Pipeline:
+            def incr(self, key):
+                ops.append(lambda: redis.incr(key))
+
+            def delete(self, key):
+                ops.append(lambda: redis.store.pop(key, None))
+
+            def execute(self):
+                return [op() for op in ops]
+
+        return Pipeline()
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key) or 0) + 1)
+        return int(self.store[key])
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(explore_catalog, "_get_redis", lambda: redis)
+    explore_catalog.invalidate_explore_catalog()
+    yield redis
+    explore_catalog.invalidate_explore_catalog()
+
+
+def _app(created_at, owner_id=None, deployment=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name="app",
+        description=None,
+        icon={"type": "emoji", "content": "🤖", "background_color": "#fff"},
+        workflow_id=None,
+        url_slug="app-slug",
+        auth_secret="sk-secret",
+        is_market=True,
+        forked_from=None,
+        active_deployment_id=deployment.id if deployment else None,
+        active_deployment=deployment,
+        active_deployment_type=deployment.type if deployment else None,
+        created_by=owner_id or uuid.uuid4(),
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+def _catalog_db(rows):
+    db = MagicMock()
+    query = db.query.return_value.outerjoin.return_value.options.return_value
+    query.filter.return_value.order_by.return_value.all.return_value = rows
+    return db
+
+
+def test_owner_names_are_loaded_in_one_query():
+    owner_a, owner_b = uuid.uuid4(), uuid.uuid4()
+    now = datetime.now(timezone.utc)
+    apps = [_app(now, owner_a), _app(now, owner_a), _app(now, owner_b)]
+
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = [
+        (owner_a, "alice"),
+        (owner_b, "bob"),
+    ]
+    AppService._populate_owner_names(db, apps)
+
+    assert db.query.call_count == 1
+    assert [app.owner_name for app in apps] == ["alice", "alice", "bob"]
+
+
+def test_explore_catalog_is_cached_and_invalidated(fake_redis):
+    now = datetime.now(timezone.utc)
+    deployment = SimpleNamespace(id=uuid.uuid4(), is_active=True, type="api")
+    db = _catalog_db([(_app(now, deployment=deployment), "alice")])
+
+    first = AppService.list_explore_apps(db)
+    second = AppService.list_explore_apps(db)
+
+    assert first == second
+    assert first[0]["owner_name"] == "alice"
+    assert first[0]["active_deployment_is_active"] is True
+    assert "auth_secret" not in first[0]
+    assert db.query.call_count == 1
+
+    explore_catalog.invalidate_explore_catalog()
+    AppService.list_explore_apps(db)
+    assert db.query.call_count == 2
+
+
+def test_explore_catalog_local_cache_follows_other_replica_invalidation(fake_redis):
+    now = datetime.now(timezone.utc)
+    db = _catalog_db([(_app(now), "alice")])
+
+    AppService.list_explore_apps(db)
+    AppService.list_explore_apps(db)
+    assert db.query.call_count == 1
+
+    # 다른 레플리카의 무효화: 이 프로세스의 L1은 그대로지만 Redis 버전이 올라감
+    fake_redis.incr(explore_catalog.VERSION_KEY)
+    fake_redis.store.pop(explore_catalog.CATALOG_KEY, None)
+
+    AppService.list_explore_apps(db)
+    assert db.query.call_count == 2
+
+
+def test_explore_cursor_pagination(fake_redis):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    apps = [_app(base - timedelta(minutes=i)) for i in range(5)]
+    db = _catalog_db([(app, "owner") for app in apps])
+
+    page = AppService.list_explore_apps(db, limit=2)
+    seen = [item["id"] for item in page]
+    while len(page) == 2:
+        cursor = AppService.encode_cursor(page[-1]["created_at"], page[-1]["id"])
+        page = AppService.list_explore_apps(db, limit=2, cursor=cursor)
+        seen.extend(item["id"] for item in page)
+
+    assert seen == [str(app.id) for app in apps]
+
+    with pytest.raises(ValueError):
+        AppService.list_explore_apps(db, cursor="not-a-cursor")
@@ -0,0 +1,151 @@
+"""
+앱 라우팅 캐시 테스트
+
+테스트 대상:
+1. 두 번째 조회부터 DB를 사용하지 않음 (L1/L2)
+2. 무효화 후 DB 값을 다시 읽음
+3. 인증 비밀값 해시 비교
+"""
+
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from apps.gateway.services import app_route_cache as cache_module
+from apps.gateway.services.app_route_cache import (
+    AppRoute,
+    clear_app_route_cache,
+    hash_secret,
+    invalidate_app_route,
+    resolve_app_route,
+)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def incr(self, key):
+        self.ops.append(lambda: self.redis.incr(key))
+
+    def delete(self, key):
+        self.ops.append(lambda: self.redis.store.pop(key, None))
+
+    def publish(self, channel, message):
+        self.ops.append(lambda: self.redis.published.append((channel, message)))
+
+    def execute(self):
+        return [op() for op in self.ops]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.published = []
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, *keys):
+        return [self.store.get(key) for key in keys]
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key) or 0) + 1)
+        return int(self.store[key])
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(cache_module, "_get_redis", lambda: redis)
+    monkeypatch.setattr(cache_module, "_listener_started", True)
+    clear_app_route_cache()
+    yield redis
+    clear_app_route_cache()
+
+
+def _mock_db(auth_secret="secret123", is_active=True):
+    app = MagicMock()
+    app.id = uuid.uuid4()
+    app.auth_secret = auth_secret
+    app.created_by = uuid.uuid4()
+    app.workflow_id = uuid.uuid4()
+    app.active_deployment_id = uuid.uuid4()
+
+    deployment = MagicMock()
+    deployment.version = 3
+    deployment.is_active = is_active
+    deployment.input_schema = {"variables": []}
+
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.side_effect = [app, deployment]
+    return db, app
+
+
+def test_second_lookup_skips_db(fake_redis):
+    """첫 조회만 DB를 사용하고 이후는 L1, 다른 프로세스는 Redis에서 조회"""
+    db, app = _mock_db()
+
+    route = resolve_app_route(db, "my-app")
+    assert route.active_deployment_id == str(app.active_deployment_id)
+    assert route.deployment_version == 3
+    assert route.deployment_is_active is True
+    assert db.query.call_count == 2
+
+    assert resolve_app_route(db, "my-app") == route
+    assert db.query.call_count == 2
+
+    # L1이 비어도 Redis(L2)에서 복원
+    clear_app_route_cache()
+    other_db = MagicMock()
+    assert resolve_app_route(other_db, "my-app") == route
+    other_db.query.assert_not_called()
+
+
+def test_invalidate_reloads_from_db(fake_redis):
+    """무효화하면 버전이 올라가 다음 조회에서 DB 값을 다시 읽음"""
+    db, _ = _mock_db(is_active=True)
+    assert resolve_app_route(db, "my-app").deployment_is_active is True
+
+    invalidate_app_route("my-app")
+    assert ("app_route:invalidate", "my-app") in fake_redis.published
+
+    db, _ = _mock_db(is_active=False)
+    route = resolve_app_route(db, "my-app")
+    assert route.deployment_is_active is False
+    assert route.version == 1
+    assert db.query.call_count == 2
+
+
+def test_missing_app_is_not_cached(fake_redis):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = None
+
+    assert resolve_app_route(db, "missing") is None
+    assert resolve_app_route(db, "missing") is None
+    assert db.query.call_count == 2
+
+
+def test_verify_secret_compares_hashes():
+    route = AppRoute(
+        app_id="a",
+        url_slug="s",
+        auth_secret_hash=hash_secret("secret123"),
+        created_by="u",
+        workflow_id=None,
+        active_deployment_id=None,
+    )
+    assert route.verify_secret("secret123") is True
+    assert route.verify_secret("wrong") is False
+    assert route.verify_secret(None) is False
+    assert "secret123" not in route.to_json()
+    assert AppRoute.from_json(route.to_json()) == route
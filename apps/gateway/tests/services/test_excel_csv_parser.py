@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from openpyxl import Workbook
+
+from apps.gateway.services.ingestion.parsers.excel_csv_parser import ExcelCsvParser
+
+
+def test_csv_chunks_repeat_header(tmp_path):
+    path = tmp_path / "items.csv"
+    path.write_text("name,memo\na,x|y\nb,\"line1\nline2\"\nc,\n", encoding="utf-8")
+
+    blocks = ExcelCsvParser().parse(str(path), chunk_rows=2)
+
+    assert [b["page"] for b in blocks] == [1, 2]
+    assert blocks[0]["text"] == (
+        "# CSV Content: items.csv\n\n"
+        "| name | memo |\n| --- | --- |\n| a | x\\|y |\n| b | line1 line2 |"
+    )
+    assert blocks[1]["text"] == "| name | memo |\n| --- | --- |\n| c |  |"
+
+
+def test_csv_cp949_fallback(tmp_path):
+    path = tmp_path / "kr.csv"
+    path.write_bytes("이름,수량\n사과,3\n".encode("cp949"))
+
+    blocks = ExcelCsvParser().parse(str(path))
+
+    assert "| 이름 | 수량 |" in blocks[0]["text"]
+    assert "| 사과 | 3 |" in blocks[0]["text"]
+
+
+def test_xlsx_streams_each_sheet(tmp_path):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "재고"
+    sheet.append(["sku", "qty", "updated"])
+    for i in range(3):
+        sheet.append([f"S{i}", float(i), datetime(2024, 1, 1)])
+    workbook.create_sheet("빈 시트")
+    path = tmp_path / "stock.xlsx"
+    workbook.save(path)
+
+    parser = ExcelCsvParser()
+    blocks = list(parser.iter_parse(str(path), chunk_rows=2))
+
+    assert [b["page"] for b in blocks] == [1, 2]
+    assert blocks[0]["text"].startswith("\n# Sheet: 재고\n\n| sku | qty | updated |")
+    assert "| S1 | 1 | 2024-01-01 00:00:00 |" in blocks[0]["text"]
+    assert blocks[1]["text"].endswith("| S2 | 2 | 2024-01-01 00:00:00 |")
+    assert parser.parse(str(tmp_path / "missing.xlsx")) == []
+
+
+def test_file_processor_consumes_blocks_incrementally(tmp_path, monkeypatch):
+    from apps.gateway.services.ingestion.processors.file_processor import FileProcessor
+
+    path = tmp_path / "items.csv"
+    path.write_text("name\na\nb\nc\n", encoding="utf-8")
+
+    def fail_parse(self, source_path, **kwargs):
+        raise AssertionError("parse should not be called")
+
+    monkeypatch.setattr(ExcelCsvParser, "parse", fail_parse)
+    monkeypatch.setattr(
+        "apps.gateway.services.ingestion.parsers.excel_csv_parser.CHUNK_ROWS", 2
+    )
+
+    result = FileProcessor().process({"file_path": str(path)})
+
+    assert [c["metadata"]["page"] for c in result.chunks] == [1, 2]
+    assert result.chunks[1]["content"] == "| name |\n| --- |\n| c |"
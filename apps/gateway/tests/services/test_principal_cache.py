@@ -0,0 +1,142 @@
+"""
+인증 사용자(Principal) 캐시 테스트
+
+테스트 대상:
+1. 같은 토큰의 두 번째 요청부터 User 조회 생략
+2. 로그아웃/사용자 토큰 일괄 폐기 시 무효화
+3. 캐시된 Principal을 DB 조회 없이 반환
+"""
+
+import time
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from apps.gateway.services import principal_cache
+from apps.gateway.services.auth_service import AuthService
+from apps.shared.db.models.user import User
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.published = []
+
+    def mget(self, *keys):
+        return [self.store.get(key) for key in keys]
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 0
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(principal_cache, "_get_redis", lambda: redis)
+    monkeypatch.setattr(principal_cache, "_listener_started", True)
+    principal_cache.clear_principal_cache()
+    yield redis
+    principal_cache.clear_principal_cache()
+
+
+def _user():
+    now = datetime.now(timezone.utc)
+    return User(
+        id=uuid.uuid4(),
+        email="user@moduly.ai",
+        name="user",
+        password="salt$hash",
+        social_provider="none",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _mock_db(user):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = user
+    return db
+
+
+def test_principal_is_cached_per_token(fake_redis):
+    user = _user()
+    db = _mock_db(user)
+    token = AuthService.create_jwt_token(str(user.id))
+
+    first = AuthService.get_principal_from_token(db, token)
+    second = AuthService.get_principal_from_token(db, token)
+
+    assert first == second
+    assert first.id == user.id
+    assert db.query.call_count == 1
+
+    # 다른 토큰(재로그인)은 별도 키
+    AuthService.get_principal_from_token(db, AuthService.create_jwt_token(str(user.id)))
+    assert db.query.call_count == 2
+
+
+def test_logout_revokes_token(fake_redis):
+    user = _user()
+    db = _mock_db(user)
+    token = AuthService.create_jwt_token(str(user.id))
+    AuthService.get_principal_from_token(db, token)
+
+    AuthService.revoke_token(token)
+    assert fake_redis.published
+
+    with pytest.raises(HTTPException) as exc:
+        AuthService.get_principal_from_token(db, token)
+    assert exc.value.status_code == 401
+
+
+def test_revoke_user_tokens_rejects_older_tokens(fake_redis):
+    user = _user()
+    db = _mock_db(user)
+    old_token = AuthService.create_jwt_token(str(user.id))
+    AuthService.get_principal_from_token(db, old_token)
+
+    # 기준 시각이 기존 토큰 발급 이후가 되도록 조정
+    principal_cache.invalidate_user(user.id, revoke_tokens=True)
+    fake_redis.store[f"auth:valid_after:{user.id}"] = str(int(time.time()) + 1)
+
+    with pytest.raises(HTTPException):
+        AuthService.get_principal_from_token(db, old_token)
+
+
+def test_revoke_user_tokens_rejects_token_issued_in_same_second(fake_redis, monkeypatch):
+    user = _user()
+    db = _mock_db(user)
+    same_second = AuthService.create_jwt_token(str(user.id))
+    issued_at = AuthService.decode_jwt_token(same_second)["iat"]
+
+    # 토큰 폐기가 토큰 발급과 같은 초(iat는 초 단위)에 일어난 경우
+    monkeypatch.setattr(principal_cache.time, "time", lambda: issued_at + 0.9)
+    principal_cache.invalidate_user(user.id, revoke_tokens=True)
+
+    with pytest.raises(HTTPException):
+        AuthService.get_principal_from_token(db, same_second)
+
+
+def test_user_from_token_is_cached_principal(fake_redis):
+    user = _user()
+    token = AuthService.create_jwt_token(str(user.id))
+    AuthService.get_principal_from_token(_mock_db(user), token)
+
+    # 바인딩 없는 세션: SELECT가 발생하면 오류
+    session = Session()
+    principal = AuthService.get_user_from_token(session, token)
+
+    assert isinstance(principal, principal_cache.UserPrincipal)
+    assert principal.id == user.id
+    assert principal.email == user.email
+    assert not hasattr(principal, "password")
+    assert not session.identity_map
@@ -0,0 +1,157 @@
+"""
+SchedulerService 테스트
+
+테스트 대상:
+1. Redis 리더 선출 (한 인스턴스만 리더)
+2. 힙 디스패치 (도래한 스케줄만 발화, 놓친 회차 병합)
+3. misfire 정책
+4. 회차별 중복 발화 방지
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from apps.gateway.services import scheduler_service as scheduler_module
+from apps.gateway.services.scheduler_service import SchedulerService, _ScheduleEntry
+
+
+class FakeRedis:
+    """리더 락/발화 키에 필요한 최소 명령만 구현"""
+
+    def __init__(self):
+        self.store = {}
+
+    def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, owner, *args):
+        if self.store.get(key) != owner:
+            return 0
+        if "del" in script:
+            del self.store[key]
+        return 1
+
+    def publish(self, channel, message):
+        return 0
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _entry(cron="*/5 * * * *"):
+    return _ScheduleEntry(
+        schedule_id=uuid.uuid4(),
+        deployment_id=uuid.uuid4(),
+        cron_expression=cron,
+        timezone="UTC",
+        user_id=str(uuid.uuid4()),
+        workflow_id=str(uuid.uuid4()),
+    )
+
+
+def _leader(redis, clock):
+    service = SchedulerService(redis_client=redis, clock=clock)
+    assert service._acquire_leadership()
+    return service
+
+
+def test_only_one_instance_becomes_leader():
+    """같은 Redis를 보는 인스턴스 중 하나만 리더가 되고, 해제 후 다른 인스턴스가 승계"""
+    redis = FakeRedis()
+    first = SchedulerService(redis_client=redis, instance_id="a")
+    second = SchedulerService(redis_client=redis, instance_id="b")
+
+    assert first._acquire_leadership() is True
+    assert second._acquire_leadership() is False
+    assert first._acquire_leadership() is True  # 갱신
+
+    first.shutdown()
+    assert second._acquire_leadership() is True
+
+
+def test_dispatch_fires_due_schedules_once_and_reschedules():
+    """도래한 스케줄만 발화하고, 여러 회차를 놓쳤어도 한 번만 발화"""
+    now = datetime(2026, 1, 1, 9, 0, 30, tzinfo=timezone.utc)
+    clock = FakeClock(now)
+    service = _leader(FakeRedis(), clock)
+
+    due = _entry()
+    due.next_run_at = now - timedelta(minutes=12)  # 3회차 놓침
+    future = _entry()
+    future.next_run_at = now + timedelta(minutes=1)
+    with service._lock:
+        service._push_locked(due, heap_push=True)
+        service._push_locked(future, heap_push=True)
+
+    with patch("apps.shared.celery_app.celery_app") as mock_celery:
+        assert service._dispatch_due() == 1
+        assert service._dispatch_due() == 0
+
+    mock_celery.send_task.assert_called_once()
+    name = mock_celery.send_task.call_args[0][0]
+    args = mock_celery.send_task.call_args[1]["args"]
+    assert name == "workflow.execute_by_deployment"
+    assert args[0] == str(due.deployment_id)
+    assert args[2]["trigger_mode"] == "schedule"
+
+    assert due.next_run_at == datetime(2026, 1, 1, 9, 5, tzinfo=timezone.utc)
+    assert service._pending_updates[due.schedule_id]["last_run_at"] == now
+    assert future.schedule_id not in service._pending_updates
+
+
+def test_removed_schedule_is_not_fired():
+    """제거된 스케줄의 힙 항목은 발화하지 않음"""
+    now = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+    service = _leader(FakeRedis(), FakeClock(now))
+
+    entry = _entry()
+    entry.next_run_at = now
+    with service._lock:
+        service._push_locked(entry, heap_push=True)
+    service.remove_schedule(entry.schedule_id)
+
+    with patch("apps.shared.celery_app.celery_app") as mock_celery:
+        assert service._dispatch_due() == 0
+    mock_celery.send_task.assert_not_called()
+
+
+def test_misfire_policy():
+    """유예 시간 안에 놓친 실행은 즉시 1회 발화, 넘으면 다음 회차로 건너뜀"""
+    now = datetime(2026, 1, 1, 9, 2, tzinfo=timezone.utc)
+    service = SchedulerService(redis_client=FakeRedis(), clock=FakeClock(now))
+    entry = _entry()
+
+    recent = now - timedelta(seconds=60)
+    assert service._initial_run_at(entry, recent, now) == recent
+
+    stale = now - timedelta(seconds=scheduler_module.SCHEDULER_MISFIRE_GRACE_SECONDS + 1)
+    assert service._initial_run_at(entry, stale, now) == datetime(
+        2026, 1, 1, 9, 5, tzinfo=timezone.utc
+    )
+
+    with patch.object(scheduler_module, "SCHEDULER_MISFIRE_POLICY", "skip"):
+        assert service._initial_run_at(entry, recent, now) > now
+
+
+def test_same_run_is_not_fired_twice_across_leaders():
+    """리더 교체 중 두 인스턴스가 같은 회차를 발화해도 한 번만 전송"""
+    redis = FakeRedis()
+    now = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+    first = SchedulerService(redis_client=redis, clock=FakeClock(now))
+    second = SchedulerService(redis_client=redis, clock=FakeClock(now))
+    entry = _entry()
+
+    with patch("apps.shared.celery_app.celery_app") as mock_celery:
+        assert first._fire(entry, now) is True
+        assert second._fire(entry, now) is False
+
+    assert mock_celery.send_task.call_count == 1
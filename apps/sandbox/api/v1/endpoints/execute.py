@@ -1,7 +1,7 @@
 """
 Sandbox API - Execute Endpoint
 """
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException
@@ -24,6 +24,7 @@ class ExecuteRequest(BaseModel):
     trigger_type: Optional[str] = Field(default=None, description="트리거 유형 (manual, schedule, webhook, batch)，첫 실행 시 fallback 우선순위 결정용")
     enable_network: bool = Field(default=False, description="네트워크 허용 여부")
     tenant_id: Optional[str] = Field(default=None, description="테넌트 ID, 지금은 user_id (공정 스케줄링용)")
+    cacheable: bool = Field(default=False, description="결과 캐시 사용 여부 (동일 코드/입력이면 이전 결과 재사용, 결정적 코드만)")
 
 
 class ExecuteResponse(BaseModel):
@@ -34,6 +35,27 @@ class ExecuteResponse(BaseModel):
     error_type: Optional[str] = None
     execution_time_ms: float = 0.0
     memory_used_mb: float = 0.0
+    cpu_time_ms: float = 0.0
+    cached: bool = False
+
+
+class BatchExecuteRequest(BaseModel):
+    """배치 실행 요청 (하나의 코드를 여러 입력에 대해 실행)"""
+    code: str = Field(..., description="실행할 Python 코드 (def main(inputs): ... 형태)")
+    inputs_list: List[Dict[str, Any]] = Field(..., description="항목별 입력 데이터 (순서대로 결과 반환)")
+    timeout: int = Field(default=60, ge=1, le=300, description="배치 전체 타임아웃 (초)")
+    priority: Optional[str] = Field(default=None, description="우선순위 (high, normal, low), None이면 SJF 기반 자동 결정")
+    trigger_type: Optional[str] = Field(default=None, description="트리거 유형 (manual, schedule, webhook, batch)，첫 실행 시 fallback 우선순위 결정용")
+    enable_network: bool = Field(default=False, description="네트워크 허용 여부")
+    tenant_id: Optional[str] = Field(default=None, description="테넌트 ID, 지금은 user_id (공정 스케줄링용)")
+
+
+class BatchExecuteResponse(BaseModel):
+    """배치 실행 응답"""
+    items: List[ExecuteResponse]
+    execution_time_ms: float = 0.0
+    memory_used_mb: float = 0.0
+    cpu_time_ms: float = 0.0
 
 
 class MetricsResponse(BaseModel):
@@ -52,6 +74,31 @@ class MetricsResponse(BaseModel):
     max_workers: int
     ema_rps: float
     active_tenants: int
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_entries: int = 0
+    total_offloaded: int = 0
+    total_stolen: int = 0
+
+
+class ClusterMetricsResponse(BaseModel):
+    """클러스터 전체 메트릭 (레플리카 합산)"""
+    cluster_mode: bool
+    replicas: int
+    queue_size: int
+    queue_high: int
+    queue_normal: int
+    queue_low: int
+    running_count: int
+    current_workers: int
+    max_workers: int
+    total_submitted: int
+    total_completed: int
+    total_failed: int
+    total_aged: int
+    total_offloaded: int
+    total_stolen: int
+    active_tenants: int
 
 
 @router.post("/execute", response_model=ExecuteResponse)
@@ -70,23 +117,7 @@ async def execute_code(request: ExecuteRequest):
     ```
     """
     scheduler = SandboxScheduler.get_instance()
-    
-    # 우선순위 파싱
-    priority_map = {
-        "high": Priority.HIGH,
-        "normal": Priority.NORMAL,
-        "low": Priority.LOW,
-    }
-    priority = None
-    if request.priority:
-        priority = priority_map.get(request.priority.lower())
-    
-    # FIFO 모드 강제 (A/B 테스트용)
-    if settings.FORCE_FIFO:
-        priority = Priority.NORMAL  # 모든 요청을 NORMAL로 강제
-        trigger_mode = None  # Fallback 로직도 무시
-    else:
-        trigger_mode = request.trigger_type
+    priority, trigger_mode = _resolve_priority(request.priority, request.trigger_type)
     
     try:
         result = await scheduler.submit(
@@ -97,15 +128,52 @@ async def execute_code(request: ExecuteRequest):
             trigger_mode=trigger_mode,
             enable_network=request.enable_network,
             tenant_id=request.tenant_id,
+            cacheable=request.cacheable,
+        )
+        
+        return _to_response(result)
+        
+    except ValueError as e:
+        # Backpressure: 서비스 과부하
+        raise HTTPException(status_code=503, detail=str(e))
+    except RuntimeError as e:
+        # 스케줄러 미시작
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/execute/batch", response_model=BatchExecuteResponse)
+async def execute_batch(request: BatchExecuteRequest):
+    """
+    하나의 코드를 여러 입력에 대해 실행합니다. (반복 노드의 map 실행용)
+    
+    입력은 청크 단위로 나뉘어 하나의 샌드박스 프로세스에서 순서대로 실행되며,
+    항목별 에러는 해당 항목에만 기록됩니다. timeout은 배치 전체 예산입니다.
+    """
+    if len(request.inputs_list) > settings.MAX_BATCH_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many batch items (max {settings.MAX_BATCH_ITEMS})",
+        )
+    
+    scheduler = SandboxScheduler.get_instance()
+    priority, trigger_mode = _resolve_priority(request.priority, request.trigger_type)
+    
+    try:
+        result = await scheduler.submit_batch(
+            code=request.code,
+            inputs_list=request.inputs_list,
+            timeout=request.timeout,
+            priority=priority,
+            trigger_mode=trigger_mode,
+            enable_network=request.enable_network,
+            tenant_id=request.tenant_id,
         )
         
-        return ExecuteResponse(
-            success=result.success,
-            result=result.result,
-            error=result.error,
-            error_type=result.error_type,
+        return BatchExecuteResponse(
+            items=[_to_response(item) for item in result.items or []],
             execution_time_ms=result.execution_time_ms,
             memory_used_mb=result.memory_used_mb,
+            cpu_time_ms=result.cpu_time_ms,
         )
         
     except ValueError as e:
@@ -116,6 +184,36 @@ async def execute_code(request: ExecuteRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _resolve_priority(requested: Optional[str], trigger_type: Optional[str]):
+    """요청 우선순위 파싱 -> (priority, trigger_mode)"""
+    priority_map = {
+        "high": Priority.HIGH,
+        "normal": Priority.NORMAL,
+        "low": Priority.LOW,
+    }
+    priority = None
+    if requested:
+        priority = priority_map.get(requested.lower())
+    
+    # FIFO 모드 강제 (A/B 테스트용)
+    if settings.FORCE_FIFO:
+        return Priority.NORMAL, None  # 모든 요청을 NORMAL로 강제, Fallback 로직도 무시
+    return priority, trigger_type
+
+
+def _to_response(result) -> ExecuteResponse:
+    return ExecuteResponse(
+        success=result.success,
+        result=result.result,
+        error=result.error,
+        error_type=result.error_type,
+        execution_time_ms=result.execution_time_ms,
+        memory_used_mb=result.memory_used_mb,
+        cpu_time_ms=result.cpu_time_ms,
+        cached=result.cached,
+    )
+
+
 @router.get("/metrics", response_model=MetricsResponse)
 async def get_metrics():
     """스케줄러 메트릭을 반환합니다."""
@@ -124,6 +222,13 @@ async def get_metrics():
     return MetricsResponse(**metrics)
 
 
+@router.get("/metrics/cluster", response_model=ClusterMetricsResponse)
+async def get_cluster_metrics():
+    """클러스터 전체 메트릭을 반환합니다. (클러스터 모드가 아니면 이 레플리카만)"""
+    scheduler = SandboxScheduler.get_instance()
+    return ClusterMetricsResponse(**scheduler.get_cluster_metrics())
+
+
 @router.get("/health")
 async def health_check():
     """헬스 체크"""
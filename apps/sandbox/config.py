@@ -21,6 +21,11 @@ class SandboxSettings:
     # Queue 설정
     MAX_QUEUE_SIZE: int = int(os.getenv("SANDBOX_MAX_QUEUE_SIZE", "100"))
     
+    # 배치 실행 (하나의 코드 + 여러 입력, 청크 단위로 스케줄링)
+    MAX_BATCH_ITEMS: int = int(os.getenv("SANDBOX_MAX_BATCH_ITEMS", "1000"))
+    MAX_BATCH_TIMEOUT: int = int(os.getenv("SANDBOX_MAX_BATCH_TIMEOUT", "300"))  # 배치 전체 예산 상한 (초)
+    BATCH_CHUNK_SIZE: int = int(os.getenv("SANDBOX_BATCH_CHUNK_SIZE", "100"))  # 청크당 항목 수 (청크 = 작업 1개)
+    
     # 동적 워커 스케일링 (EMA 기반)
     SCALING_INTERVAL: int = int(os.getenv("SANDBOX_SCALING_INTERVAL", "1"))  # EMA 계산 주기 (초)
     EMA_ALPHA: float = float(os.getenv("SANDBOX_EMA_ALPHA", "0.2"))  # EMA 가중치 (0~1, 높을수록 최근값 반영)
@@ -41,12 +46,46 @@ class SandboxSettings:
     NSJAIL_CONFIG_PATH: str = os.getenv("SANDBOX_NSJAIL_CONFIG_PATH", "/app/nsjail/sandbox.cfg")
     PYTHON_PATH: str = os.getenv("SANDBOX_PYTHON_PATH", "/usr/local/bin/python3")
     
+    # 작업별 cgroup v2 자원 측정 (memory_used_mb / cpu_time_ms, 사용 불가 환경이면 자동 비활성화)
+    CGROUP_ENABLED: bool = os.getenv("SANDBOX_CGROUP_ENABLED", "true").lower() == "true"
+    CGROUP_ROOT: str = os.getenv("SANDBOX_CGROUP_ROOT", "/sys/fs/cgroup/sandbox")
+    
     # 네트워크 설정
     ENABLE_NETWORK: bool = os.getenv("SANDBOX_ENABLE_NETWORK", "false").lower() == "true"
     
     # 임시 파일 경로
     TEMP_DIR: str = os.getenv("SANDBOX_TEMP_DIR", "/tmp/sandbox")
     
+    # 공유 Redis (레플리카 간 실행 기록/결과 캐시 공유, 비어있으면 프로세스 로컬만 사용)
+    REDIS_URL: str = os.getenv("SANDBOX_REDIS_URL", "")
+    
+    # SJF 실행 기록
+    HISTORY_MAX_ENTRIES: int = int(os.getenv("SANDBOX_HISTORY_MAX_ENTRIES", "10000"))  # 로컬 LRU 크기
+    HISTORY_WINDOW_SIZE: int = int(os.getenv("SANDBOX_HISTORY_WINDOW_SIZE", "64"))  # p50/p95 추정용 최근 샘플 수
+    HISTORY_EWMA_ALPHA: float = float(os.getenv("SANDBOX_HISTORY_EWMA_ALPHA", "0.2"))  # 평균 감쇠 가중치
+    HISTORY_REFRESH_INTERVAL: float = float(os.getenv("SANDBOX_HISTORY_REFRESH_INTERVAL", "30"))  # 공유 기록 재조회 주기 (초)
+    HISTORY_TTL: int = int(os.getenv("SANDBOX_HISTORY_TTL", str(7 * 24 * 3600)))  # 공유 기록 보관 기간 (초)
+    HISTORY_REDIS_URL: str = os.getenv("SANDBOX_HISTORY_REDIS_URL", REDIS_URL)
+    
+    # 결과 캐시 (cacheable=True 요청만, 코드 해시 + 입력 해시 + 이미지 버전 기준)
+    RESULT_CACHE_ENABLED: bool = os.getenv("SANDBOX_RESULT_CACHE_ENABLED", "true").lower() == "true"
+    RESULT_CACHE_TTL: int = int(os.getenv("SANDBOX_RESULT_CACHE_TTL", "300"))  # 초
+    RESULT_CACHE_MAX_ENTRIES: int = int(os.getenv("SANDBOX_RESULT_CACHE_MAX_ENTRIES", "1000"))
+    RESULT_CACHE_REDIS_URL: str = os.getenv("SANDBOX_RESULT_CACHE_REDIS_URL", REDIS_URL)  # 비어있으면 메모리만 사용
+    SANDBOX_IMAGE_VERSION: str = os.getenv("SANDBOX_IMAGE_VERSION", "1.0.0")  # 이미지 변경 시 캐시 분리
+    
+    # 클러스터 모드 (Redis로 레플리카 간 테넌트 동시 실행/큐 깊이 조율 + 작업 스틸링)
+    CLUSTER_MODE: bool = os.getenv("SANDBOX_CLUSTER_MODE", "false").lower() == "true"
+    CLUSTER_REDIS_URL: str = os.getenv("SANDBOX_CLUSTER_REDIS_URL", REDIS_URL)
+    CLUSTER_HEARTBEAT_INTERVAL: float = float(os.getenv("SANDBOX_CLUSTER_HEARTBEAT_INTERVAL", "1.0"))  # 메트릭 보고 주기 (초)
+    CLUSTER_REPLICA_TTL: float = float(os.getenv("SANDBOX_CLUSTER_REPLICA_TTL", "5.0"))  # heartbeat 없으면 제외 (초)
+    CLUSTER_MAX_QUEUE_SIZE: int = int(os.getenv("SANDBOX_CLUSTER_MAX_QUEUE_SIZE", "0"))  # 클러스터 전체 대기 한도 (0이면 미적용)
+    CLUSTER_STEAL_AFTER: float = float(os.getenv("SANDBOX_CLUSTER_STEAL_AFTER", "1.0"))  # 이 시간 이상 대기한 작업만 양보 (초)
+    CLUSTER_STEAL_POLL_INTERVAL: float = float(os.getenv("SANDBOX_CLUSTER_STEAL_POLL_INTERVAL", "0.2"))  # 유휴 시 공유 큐 확인 주기 (초)
+    CLUSTER_CLAIM_TIMEOUT: float = float(os.getenv("SANDBOX_CLUSTER_CLAIM_TIMEOUT", "1.0"))  # 양보 후 회수까지 대기 (초)
+    CLUSTER_RESULT_GRACE: int = int(os.getenv("SANDBOX_CLUSTER_RESULT_GRACE", "10"))  # 원격 실행 결과 대기 여유 (초)
+    CLUSTER_TENANT_RETRY: float = float(os.getenv("SANDBOX_CLUSTER_TENANT_RETRY", "0.2"))  # 토큰 획득 실패 시 재시도 간격 (초)
+    
     # FIFO 모드 강제 (A/B 테스트용 - 우선순위 무시하고 순서대로 처리)
     FORCE_FIFO: bool = os.getenv("SANDBOX_FORCE_FIFO", "false").lower() == "true"
 
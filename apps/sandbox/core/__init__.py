@@ -1,7 +1,18 @@
 """
 Sandbox Core Package
 """
-from apps.sandbox.core.executor import SandboxExecutor, execute_code
+from apps.sandbox.core.executor import (
+    SandboxExecutor,
+    execute_batch_code_async,
+    execute_code,
+    execute_code_async,
+)
 from apps.sandbox.core.scheduler import SandboxScheduler
 
-__all__ = ["SandboxExecutor", "execute_code", "SandboxScheduler"]
+__all__ = [
+    "SandboxExecutor",
+    "execute_code",
+    "execute_code_async",
+    "execute_batch_code_async",
+    "SandboxScheduler",
+]
@@ -47,7 +47,16 @@ class PriorityBucket:
             self._queues[tenant_id].append(job)
             self._last_activity[tenant_id] = time.time()
 
-    
+    async def add_front(self, job: Job):
+        """작업을 테넌트 큐 맨 앞에 되돌려 놓기 (꺼냈지만 실행하지 못한 경우)"""
+        async with self._lock:
+            tenant_id = job.tenant_id or "__default__"
+            if tenant_id not in self._tenant_order:
+                self._tenant_order.append(tenant_id)
+            self._queues[tenant_id].appendleft(job)
+            self._last_activity[tenant_id] = time.time()
+
+
     async def pop(self, tenant_id: str) -> Optional[Job]:
         """특정 테넌트의 작업 가져오기"""
         async with self._lock:
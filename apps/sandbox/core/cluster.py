@@ -0,0 +1,350 @@
+"""
+Cluster Coordinator - 레플리카 간 공정 스케줄링 조율 (선택, SANDBOX_CLUSTER_MODE)
+
+여러 샌드박스 레플리카가 하나의 스케줄러처럼 동작하도록 Redis로 상태를 공유합니다.
+
+1. Tenant Token: 테넌트당 동시 실행 수(MAX_PER_TENANT)를 클러스터 전체 기준으로 제한
+   - 실행 임대(lease)를 만료 시각과 함께 ZSET에 기록 → 레플리카가 죽어도 자동 회수
+2. Heartbeat: 레플리카별 큐 깊이/실행 수를 주기적으로 보고하고 전체 스냅샷 수신
+   - 클러스터 전체 큐 깊이 기반 Backpressure, 클러스터 메트릭 집계에 사용
+3. Work Stealing: 바쁜 레플리카가 오래 대기한 작업을 공유 큐에 내놓으면
+   유휴 레플리카가 가져가서 실행하고 결과를 돌려줌
+
+키 구조:
+    sandbox:cluster:tenant:{tenant_id}  ZSET  (lease_id → 만료 시각)
+    sandbox:cluster:replicas            ZSET  (replica_id → 마지막 heartbeat)
+    sandbox:cluster:metrics             HASH  (replica_id → 메트릭 JSON)
+    sandbox:cluster:steal:{priority}    LIST  (작업 payload JSON)
+    sandbox:cluster:result:{job_id}     LIST  (실행 결과 JSON)
+
+Redis 오류 시에는 레플리카 로컬 스케줄링으로 동작합니다. (redis 패키지 필요)
+"""
+import json
+import logging
+import math
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from apps.sandbox.config import settings
+from apps.sandbox.models.job import Job, Priority
+from apps.sandbox.models.result import ExecutionResult
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - 선택 의존성
+    aioredis = None
+
+
+# 클러스터 메트릭 집계 시 합산하는 필드
+AGGREGATED_FIELDS = (
+    "queue_size",
+    "queue_high",
+    "queue_normal",
+    "queue_low",
+    "running_count",
+    "current_workers",
+    "max_workers",
+    "total_submitted",
+    "total_completed",
+    "total_failed",
+    "total_aged",
+    "total_offloaded",
+    "total_stolen",
+    "active_tenants",
+)
+
+
+def aggregate_metrics(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """레플리카별 메트릭 합산"""
+    aggregated = {name: 0 for name in AGGREGATED_FIELDS}
+    for snapshot in snapshots:
+        for name in AGGREGATED_FIELDS:
+            aggregated[name] += int(snapshot.get(name, 0) or 0)
+    aggregated["replicas"] = len(snapshots)
+    return aggregated
+
+
+def encode_job(job: Job) -> Optional[str]:
+    """다른 레플리카로 넘길 작업 payload (JSON 직렬화 불가 입력이면 None)"""
+    try:
+        return json.dumps(
+            {
+                "job_id": str(job.job_id),
+                "priority": int(job.priority),
+                "code": job.code,
+                "inputs": job.inputs,
+                "inputs_list": job.inputs_list,
+                "timeout": job.timeout,
+                "enable_network": job.enable_network,
+                "tenant_id": job.tenant_id,
+                "created_at": job.created_at,
+            },
+            ensure_ascii=False,
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def decode_job(payload: str) -> Job:
+    data = json.loads(payload)
+    return Job(
+        priority=Priority(data["priority"]),
+        created_at=data.get("created_at") or time.time(),
+        job_id=uuid.UUID(data["job_id"]),
+        code=data["code"],
+        inputs=data.get("inputs") or {},
+        inputs_list=data.get("inputs_list"),
+        timeout=data.get("timeout") or settings.DEFAULT_TIMEOUT,
+        enable_network=bool(data.get("enable_network")),
+        tenant_id=data.get("tenant_id"),
+    )
+
+
+def encode_result(result: ExecutionResult) -> str:
+    data = result.to_dict()
+    data["stdout"] = result.stdout
+    data["stderr"] = result.stderr
+    return json.dumps(data, ensure_ascii=False)
+
+
+def decode_result(raw, job_id: uuid.UUID) -> ExecutionResult:
+    return _result_from_dict(json.loads(raw), job_id)
+
+
+def _result_from_dict(data: Dict[str, Any], job_id: Optional[uuid.UUID]) -> ExecutionResult:
+    items = data.get("items")
+    return ExecutionResult(
+        success=data["success"],
+        result=data.get("result"),
+        error=data.get("error"),
+        error_type=data.get("error_type"),
+        execution_time_ms=data.get("execution_time_ms", 0.0),
+        memory_used_mb=data.get("memory_used_mb", 0.0),
+        cpu_time_ms=data.get("cpu_time_ms", 0.0),
+        stdout=data.get("stdout", ""),
+        stderr=data.get("stderr", ""),
+        job_id=job_id,
+        cached=data.get("cached", False),
+        items=[_result_from_dict(item, None) for item in items] if items is not None else None,
+    )
+
+
+class ClusterCoordinator:
+    """
+    Redis 기반 레플리카 간 스케줄링 조율
+
+    사용법:
+        cluster = ClusterCoordinator.from_settings()  # 클러스터 모드가 아니면 None
+
+        # 테넌트 실행 토큰
+        if await cluster.acquire_tenant(tenant_id, lease_id, ttl):
+            ...  # 실행
+            await cluster.release_tenant(tenant_id, lease_id)
+
+        # 주기적 보고 → 전체 스냅샷
+        snapshots = await cluster.heartbeat(scheduler.get_metrics())
+    """
+
+    KEY_PREFIX = "sandbox:cluster"
+
+    # 만료된 임대 정리 후 남은 자리가 있으면 임대 추가
+    _ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return 1
+"""
+
+    # 자기 메트릭 기록 + 죽은 레플리카 제거 + 전체 메트릭 반환
+    _HEARTBEAT_SCRIPT = """
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[3])
+redis.call('HSET', KEYS[2], ARGV[3], ARGV[4])
+local dead = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[2])
+for _, replica in ipairs(dead) do
+    redis.call('ZREM', KEYS[1], replica)
+    redis.call('HDEL', KEYS[2], replica)
+end
+return redis.call('HVALS', KEYS[2])
+"""
+
+    # 우선순위 순서대로 공유 큐에서 작업 하나 꺼내기
+    _STEAL_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    local payload = redis.call('LPOP', key)
+    if payload then
+        return payload
+    end
+end
+return false
+"""
+
+    def __init__(self, client, replica_id: str = None):
+        self._client = client
+        self.replica_id = replica_id or uuid.uuid4().hex[:12]
+        # 마지막 heartbeat로 받은 레플리카별 메트릭
+        self._snapshots: List[Dict[str, Any]] = []
+
+    @classmethod
+    def from_settings(cls) -> Optional["ClusterCoordinator"]:
+        if not settings.CLUSTER_MODE:
+            return None
+        if not settings.CLUSTER_REDIS_URL:
+            logger.warning("Cluster mode: SANDBOX_REDIS_URL not set, running as a single replica")
+            return None
+        if aioredis is None:
+            logger.warning("Cluster mode: redis package not installed, running as a single replica")
+            return None
+        return cls(aioredis.from_url(settings.CLUSTER_REDIS_URL))
+
+    # ------------------------------------------------------------------
+    # Tenant Token
+    # ------------------------------------------------------------------
+
+    def _tenant_key(self, tenant_id: str) -> str:
+        return f"{self.KEY_PREFIX}:tenant:{tenant_id}"
+
+    async def acquire_tenant(self, tenant_id: str, lease_id: str, ttl: float) -> bool:
+        """
+        테넌트 실행 토큰 획득 (클러스터 전체 MAX_PER_TENANT 기준)
+
+        Redis 오류 시에는 로컬 제한만 적용하도록 True를 반환합니다.
+        """
+        now = time.time()
+        try:
+            acquired = await self._client.eval(
+                self._ACQUIRE_SCRIPT,
+                1,
+                self._tenant_key(tenant_id),
+                repr(now),
+                settings.MAX_PER_TENANT,
+                repr(now + ttl),
+                lease_id,
+                int(math.ceil(ttl)),
+            )
+            return bool(int(acquired))
+        except Exception as e:
+            logger.debug(f"Cluster tenant acquire failed: {e}")
+            return True
+
+    async def release_tenant(self, tenant_id: str, lease_id: str):
+        try:
+            await self._client.zrem(self._tenant_key(tenant_id), lease_id)
+        except Exception as e:
+            logger.debug(f"Cluster tenant release failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Heartbeat / 메트릭
+    # ------------------------------------------------------------------
+
+    async def heartbeat(self, metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """자기 메트릭 보고 및 살아있는 레플리카 전체 메트릭 갱신"""
+        now = time.time()
+        local = dict(metrics, replica_id=self.replica_id)
+        try:
+            raw = await self._client.eval(
+                self._HEARTBEAT_SCRIPT,
+                2,
+                f"{self.KEY_PREFIX}:replicas",
+                f"{self.KEY_PREFIX}:metrics",
+                repr(now),
+                repr(now - settings.CLUSTER_REPLICA_TTL),
+                self.replica_id,
+                json.dumps(local),
+            )
+            self._snapshots = [json.loads(item) for item in raw]
+        except Exception as e:
+            logger.debug(f"Cluster heartbeat failed: {e}")
+            self._snapshots = [local]
+        return self._snapshots
+
+    async def leave(self):
+        """종료 시 레플리카 등록 해제"""
+        try:
+            pipe = self._client.pipeline()
+            pipe.zrem(f"{self.KEY_PREFIX}:replicas", self.replica_id)
+            pipe.hdel(f"{self.KEY_PREFIX}:metrics", self.replica_id)
+            await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Cluster leave failed: {e}")
+
+    @property
+    def snapshots(self) -> List[Dict[str, Any]]:
+        return self._snapshots
+
+    @property
+    def queue_size(self) -> int:
+        """클러스터 전체 대기 작업 수 (마지막 heartbeat 기준)"""
+        return sum(int(s.get("queue_size", 0) or 0) for s in self._snapshots)
+
+    def idle_peer_slots(self) -> int:
+        """다른 레플리카의 유휴 워커 수 (대기 큐가 빈 레플리카만)"""
+        slots = 0
+        for snapshot in self._snapshots:
+            if snapshot.get("replica_id") == self.replica_id:
+                continue
+            if snapshot.get("queue_size", 0):
+                continue
+            slots += max(0, snapshot.get("current_workers", 0) - snapshot.get("running_count", 0))
+        return slots
+
+    # ------------------------------------------------------------------
+    # Work Stealing
+    # ------------------------------------------------------------------
+
+    def _steal_key(self, priority: Priority) -> str:
+        return f"{self.KEY_PREFIX}:steal:{Priority(priority).name.lower()}"
+
+    def _result_key(self, job_id) -> str:
+        return f"{self.KEY_PREFIX}:result:{job_id}"
+
+    async def offer(self, priority: Priority, payload: str):
+        """작업을 공유 큐에 내놓기"""
+        await self._client.rpush(self._steal_key(priority), payload)
+
+    async def reclaim(self, priority: Priority, payload: str) -> bool:
+        """아무도 가져가지 않은 작업 회수 (회수했으면 True)"""
+        return bool(await self._client.lrem(self._steal_key(priority), 1, payload))
+
+    async def requeue(self, priority: Priority, payload: str):
+        """가져갔지만 실행할 수 없는 작업을 공유 큐 앞에 되돌려 놓기"""
+        await self._client.lpush(self._steal_key(priority), payload)
+
+    async def steal(self) -> Optional[str]:
+        """다른 레플리카가 내놓은 작업 가져오기 (HIGH → NORMAL → LOW)"""
+        try:
+            keys = [self._steal_key(p) for p in (Priority.HIGH, Priority.NORMAL, Priority.LOW)]
+            payload = await self._client.eval(self._STEAL_SCRIPT, len(keys), *keys)
+        except Exception as e:
+            logger.debug(f"Cluster steal failed: {e}")
+            return None
+        if not payload:
+            return None
+        return payload.decode() if isinstance(payload, bytes) else payload
+
+    async def publish_result(self, job_id, result: ExecutionResult):
+        """실행 결과를 작업을 내놓은 레플리카에 전달"""
+        key = self._result_key(job_id)
+        pipe = self._client.pipeline()
+        pipe.rpush(key, encode_result(result))
+        pipe.expire(key, settings.MAX_TIMEOUT + settings.CLUSTER_RESULT_GRACE)
+        await pipe.execute()
+
+    async def wait_result(self, job_id, timeout: float) -> Optional[ExecutionResult]:
+        """결과 대기 (timeout 내에 없으면 None)"""
+        item = await self._client.blpop(self._result_key(job_id), timeout=max(1, int(math.ceil(timeout))))
+        if item is None:
+            return None
+        _, raw = item
+        return decode_result(raw, job_id)
+
+    async def close(self):
+        try:
+            await self._client.close()
+        except Exception:
+            pass
@@ -2,7 +2,7 @@
 Sandbox Executor - NSJail 프로세스 실행 담당
 """
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from apps.sandbox.config import settings
@@ -15,7 +15,7 @@ class SandboxExecutor:
     코드 실행기
     
     NSJailWrapper를 사용하여 코드를 실행하고 결과를 반환합니다.
-    ProcessPoolExecutor의 워커에서 호출됩니다.
+    스케줄러는 execute_async()로 이벤트 루프에서 nsjail을 직접 실행합니다.
     """
     
     def __init__(self):
@@ -42,12 +42,7 @@ class SandboxExecutor:
         Returns:
             ExecutionResult: 실행 결과
         """
-        timeout = timeout or settings.DEFAULT_TIMEOUT
-        enable_network = enable_network if enable_network is not None else settings.ENABLE_NETWORK
-        
-        # 타임아웃 상한 체크
-        if timeout > settings.MAX_TIMEOUT:
-            timeout = settings.MAX_TIMEOUT
+        timeout, enable_network = self._normalize(timeout, enable_network)
         
         return self.wrapper.execute(
             code=code,
@@ -56,9 +51,58 @@ class SandboxExecutor:
             enable_network=enable_network,
             job_id=job_id,
         )
+    
+    async def execute_async(
+        self,
+        code: str,
+        inputs: Dict[str, Any],
+        timeout: int = None,
+        enable_network: bool = None,
+        job_id: UUID = None,
+    ) -> ExecutionResult:
+        """코드 실행 (비동기, 태스크 취소 시 샌드박스 프로세스 종료)"""
+        timeout, enable_network = self._normalize(timeout, enable_network)
+        
+        return await self.wrapper.execute_async(
+            code=code,
+            inputs=inputs,
+            timeout=timeout,
+            enable_network=enable_network,
+            job_id=job_id,
+        )
+    
+    async def execute_batch_async(
+        self,
+        code: str,
+        inputs_list: List[Dict[str, Any]],
+        timeout: int = None,
+        enable_network: bool = None,
+        job_id: UUID = None,
+    ) -> ExecutionResult:
+        """여러 입력을 하나의 샌드박스에서 실행 (항목별 결과는 result.items)"""
+        timeout, enable_network = self._normalize(timeout, enable_network)
+        
+        return await self.wrapper.execute_batch_async(
+            code=code,
+            inputs_list=inputs_list,
+            timeout=timeout,
+            enable_network=enable_network,
+            job_id=job_id,
+        )
+    
+    @staticmethod
+    def _normalize(timeout: Optional[int], enable_network: Optional[bool]) -> Tuple[int, bool]:
+        timeout = timeout or settings.DEFAULT_TIMEOUT
+        enable_network = enable_network if enable_network is not None else settings.ENABLE_NETWORK
+        
+        # 타임아웃 상한 체크
+        if timeout > settings.MAX_TIMEOUT:
+            timeout = settings.MAX_TIMEOUT
+        
+        return timeout, enable_network
 
 
-# 모듈 레벨 함수 (ProcessPoolExecutor에서 사용)
+# 모듈 레벨 함수 (동기 호출용)
 def execute_code(
     code: str,
     inputs: Dict[str, Any],
@@ -67,9 +111,7 @@ def execute_code(
     job_id: UUID = None,
 ) -> ExecutionResult:
     """
-    ProcessPoolExecutor에서 호출할 함수
-    
-    각 Worker 프로세스에서 독립적으로 실행됩니다.
+    동기 코드 실행 (호출한 스레드/프로세스에서 nsjail 완료까지 대기)
     """
     executor = SandboxExecutor()
     return executor.execute(
@@ -79,3 +121,43 @@ def execute_code(
         enable_network=enable_network,
         job_id=job_id,
     )
+
+
+async def execute_code_async(
+    code: str,
+    inputs: Dict[str, Any],
+    timeout: int = None,
+    enable_network: bool = None,
+    job_id: UUID = None,
+) -> ExecutionResult:
+    """
+    스케줄러에서 호출할 함수
+
+    이벤트 루프에서 nsjail 프로세스를 직접 실행/대기합니다. (작업당 프로세스 1개)
+    """
+    executor = SandboxExecutor()
+    return await executor.execute_async(
+        code=code,
+        inputs=inputs,
+        timeout=timeout,
+        enable_network=enable_network,
+        job_id=job_id,
+    )
+
+
+async def execute_batch_code_async(
+    code: str,
+    inputs_list: List[Dict[str, Any]],
+    timeout: int = None,
+    enable_network: bool = None,
+    job_id: UUID = None,
+) -> ExecutionResult:
+    """스케줄러에서 호출할 배치 실행 함수 (청크 하나 = nsjail 프로세스 1개)"""
+    executor = SandboxExecutor()
+    return await executor.execute_batch_async(
+        code=code,
+        inputs_list=inputs_list,
+        timeout=timeout,
+        enable_network=enable_network,
+        job_id=job_id,
+    )
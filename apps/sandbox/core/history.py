@@ -3,134 +3,337 @@ Execution History - 코드 해시 기반 실행 시간 기록
 
 SJF(Shortest Job First) 스케줄링을 위한 과거 실행 시간 기록 및 우선순위 추천.
 동일한 코드(모듈 배포 시)는 비슷한 실행 시간을 가진다는 가정 기반.
+
+- 평균은 지수 감쇠 이동평균(EWMA)으로 최근 실행을 더 반영
+- 최근 N회 실행 샘플 윈도우로 p50/p95 추정, 우선순위는 p95 기준
+- 프로세스 로컬 기록은 O(1) LRU로 크기 제한
+- SANDBOX_REDIS_URL 설정 시 Redis에 공유 저장하여 재시작/스케일아웃된 레플리카도
+  기존 기록으로 바로 스케줄링 (redis 패키지 필요)
 """
+import asyncio
 import hashlib
+import logging
+import math
 import time
-from collections import defaultdict
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Deque, List, Optional, Set
 
+from apps.sandbox.config import settings
 from apps.sandbox.models.job import Priority
 
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - 선택 의존성
+    aioredis = None
+
+
+def _percentile(sorted_samples: List[float], q: float) -> float:
+    """정렬된 샘플의 q 분위수 (nearest-rank)"""
+    if not sorted_samples:
+        return 0.0
+    rank = math.ceil(q * len(sorted_samples))
+    return sorted_samples[min(len(sorted_samples), max(1, rank)) - 1]
+
 
 @dataclass
 class ExecutionStats:
     """코드별 실행 통계"""
     total_executions: int = 0
-    total_time: float = 0.0
+    ewma_time: float = 0.0
     min_time: float = float('inf')
     max_time: float = 0.0
     last_execution: float = field(default_factory=time.time)
-    
+    samples: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=settings.HISTORY_WINDOW_SIZE)
+    )
+    # 공유 저장소에서 마지막으로 불러온 시각 (monotonic)
+    loaded_at: float = 0.0
+
     @property
     def avg_time(self) -> float:
+        """지수 감쇠 평균 실행 시간"""
         if self.total_executions == 0:
             return 0.0
-        return self.total_time / self.total_executions
-    
-    def record(self, execution_time: float):
+        return self.ewma_time
+
+    @property
+    def p50_time(self) -> float:
+        return _percentile(sorted(self.samples), 0.50)
+
+    @property
+    def p95_time(self) -> float:
+        return _percentile(sorted(self.samples), 0.95)
+
+    def record(self, execution_time: float, alpha: float = None):
         """실행 시간 기록"""
+        alpha = settings.HISTORY_EWMA_ALPHA if alpha is None else alpha
+        if self.total_executions == 0:
+            self.ewma_time = execution_time
+        else:
+            self.ewma_time = alpha * execution_time + (1 - alpha) * self.ewma_time
         self.total_executions += 1
-        self.total_time += execution_time
         self.min_time = min(self.min_time, execution_time)
         self.max_time = max(self.max_time, execution_time)
+        self.samples.append(execution_time)
         self.last_execution = time.time()
 
 
+class RedisHistoryStore:
+    """
+    레플리카 간 공유 실행 기록 (Redis)
+
+    - sandbox:history:{hash}          : Hash (count, ewma, min, max, last)
+    - sandbox:history:{hash}:samples  : List (최근 샘플, 최신이 앞)
+    """
+
+    KEY_PREFIX = "sandbox:history"
+
+    # EWMA 갱신 + 샘플 윈도우 유지를 원자적으로 처리
+    _RECORD_SCRIPT = """
+local x = tonumber(ARGV[1])
+local alpha = tonumber(ARGV[2])
+local ewma = redis.call('HGET', KEYS[1], 'ewma')
+if ewma then
+    ewma = alpha * x + (1 - alpha) * tonumber(ewma)
+else
+    ewma = x
+end
+local min = tonumber(redis.call('HGET', KEYS[1], 'min') or x)
+local max = tonumber(redis.call('HGET', KEYS[1], 'max') or x)
+if x < min then min = x end
+if x > max then max = x end
+redis.call('HSET', KEYS[1], 'ewma', tostring(ewma), 'min', tostring(min), 'max', tostring(max), 'last', ARGV[3])
+redis.call('HINCRBY', KEYS[1], 'count', 1)
+redis.call('LPUSH', KEYS[2], ARGV[1])
+redis.call('LTRIM', KEYS[2], 0, tonumber(ARGV[4]) - 1)
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+redis.call('EXPIRE', KEYS[2], ARGV[5])
+return 1
+"""
+
+    def __init__(self, client):
+        self._client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> Optional["RedisHistoryStore"]:
+        if not url:
+            return None
+        if aioredis is None:
+            logger.warning("Execution history: redis package not installed, using local history only")
+            return None
+        return cls(aioredis.from_url(url))
+
+    def _keys(self, code_hash: str):
+        key = f"{self.KEY_PREFIX}:{code_hash}"
+        return key, f"{key}:samples"
+
+    async def record(self, code_hash: str, execution_time: float):
+        stats_key, samples_key = self._keys(code_hash)
+        await self._client.eval(
+            self._RECORD_SCRIPT,
+            2,
+            stats_key,
+            samples_key,
+            repr(execution_time),
+            repr(settings.HISTORY_EWMA_ALPHA),
+            repr(time.time()),
+            settings.HISTORY_WINDOW_SIZE,
+            settings.HISTORY_TTL,
+        )
+
+    async def load(self, code_hash: str) -> Optional[ExecutionStats]:
+        stats_key, samples_key = self._keys(code_hash)
+        pipe = self._client.pipeline()
+        pipe.hgetall(stats_key)
+        pipe.lrange(samples_key, 0, settings.HISTORY_WINDOW_SIZE - 1)
+        raw, samples = await pipe.execute()
+        if not raw:
+            return None
+        raw = {
+            (k.decode() if isinstance(k, bytes) else k): float(v)
+            for k, v in raw.items()
+        }
+        stats = ExecutionStats(
+            total_executions=int(raw.get("count", 0)),
+            ewma_time=raw.get("ewma", 0.0),
+            min_time=raw.get("min", float('inf')),
+            max_time=raw.get("max", 0.0),
+            last_execution=raw.get("last", time.time()),
+        )
+        # Redis는 최신이 앞 → 오래된 순으로 채움
+        stats.samples.extend(float(s) for s in reversed(samples))
+        return stats
+
+    async def close(self):
+        try:
+            await self._client.close()
+        except Exception:
+            pass
+
+
 class ExecutionHistory:
     """
     코드 해시 기반 실행 기록 관리
-    
+
     사용법:
         history = ExecutionHistory()
-        
+
+        # (공유 저장소 사용 시) 기록 불러오기
+        await history.prefetch(code)
+
         # 우선순위 추천
         priority = history.suggest_priority(code)
-        
+
         # 실행 후 기록
         history.record(code, execution_time)
     """
-    
-    # 우선순위 결정 임계값 (초)
+
+    # 우선순위 결정 임계값 (초, p95 기준)
     FAST_THRESHOLD = 0.5   # 0.5초 미만 → HIGH
     SLOW_THRESHOLD = 2.0   # 2초 초과 → LOW
-    
-    def __init__(self, max_entries: int = 10000):
-        self._stats: Dict[str, ExecutionStats] = defaultdict(ExecutionStats)
+
+    def __init__(self, max_entries: int = 10000, store: Optional[RedisHistoryStore] = None):
+        self._stats: "OrderedDict[str, ExecutionStats]" = OrderedDict()
         self._max_entries = max_entries
-    
+        self._store = store
+        self._pending: Set[asyncio.Task] = set()
+
+    @classmethod
+    def from_settings(cls) -> "ExecutionHistory":
+        return cls(
+            max_entries=settings.HISTORY_MAX_ENTRIES,
+            store=RedisHistoryStore.from_url(settings.HISTORY_REDIS_URL),
+        )
+
     @staticmethod
     def _hash_code(code: str) -> str:
         """코드를 해시로 변환"""
         return hashlib.md5(code.encode()).hexdigest()
-    
+
+    def _get(self, code_hash: str) -> Optional[ExecutionStats]:
+        stats = self._stats.get(code_hash)
+        if stats is not None:
+            self._stats.move_to_end(code_hash)
+        return stats
+
+    def _put(self, code_hash: str, stats: ExecutionStats):
+        self._stats[code_hash] = stats
+        self._stats.move_to_end(code_hash)
+        # 메모리 제한: 가장 오래 사용하지 않은 항목 제거 (O(1))
+        while len(self._stats) > self._max_entries:
+            self._stats.popitem(last=False)
+
+    async def prefetch(self, code: str):
+        """
+        공유 저장소에서 기록 불러오기
+
+        로컬에 없거나 HISTORY_REFRESH_INTERVAL보다 오래된 경우에만 조회합니다.
+        (다른 레플리카의 실행 기록 반영)
+        """
+        if self._store is None:
+            return
+        code_hash = self._hash_code(code)
+        local = self._stats.get(code_hash)
+        if local is not None and time.monotonic() - local.loaded_at < settings.HISTORY_REFRESH_INTERVAL:
+            return
+        try:
+            stats = await self._store.load(code_hash)
+        except Exception as e:
+            logger.debug(f"Execution history load failed: {e}")
+            return
+        if stats is None:
+            # 공유 기록 없음: 빈 항목으로 표시하여 재조회 주기 동안 다시 묻지 않음
+            if local is None:
+                local = ExecutionStats()
+                self._put(code_hash, local)
+            local.loaded_at = time.monotonic()
+            return
+        stats.loaded_at = time.monotonic()
+        self._put(code_hash, stats)
+
     def record(self, code: str, execution_time: float):
-        """실행 시간 기록"""
+        """실행 시간 기록 (공유 저장소에는 비동기로 반영)"""
         code_hash = self._hash_code(code)
-        self._stats[code_hash].record(execution_time)
-        
-        # 메모리 제한: 오래된 항목 정리
-        if len(self._stats) > self._max_entries:
-            self._cleanup_old_entries()
-    
+        stats = self._get(code_hash)
+        if stats is None:
+            stats = ExecutionStats(loaded_at=time.monotonic())
+            self._put(code_hash, stats)
+        stats.record(execution_time)
+
+        if self._store is not None:
+            try:
+                task = asyncio.get_running_loop().create_task(
+                    self._store.record(code_hash, execution_time)
+                )
+            except RuntimeError:
+                return  # 이벤트 루프 밖 (테스트 등)
+            self._pending.add(task)
+            task.add_done_callback(self._on_store_done)
+
+    def _on_store_done(self, task: asyncio.Task):
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Execution history store failed: {task.exception()}")
+
     def get_avg_time(self, code: str) -> Optional[float]:
-        """코드의 평균 실행 시간 조회 (기록 없으면 None)"""
-        code_hash = self._hash_code(code)
-        if code_hash not in self._stats:
-            return None
-        stats = self._stats[code_hash]
-        if stats.total_executions == 0:
+        """코드의 평균(EWMA) 실행 시간 조회 (기록 없으면 None)"""
+        stats = self._get(self._hash_code(code))
+        if stats is None or stats.total_executions == 0:
             return None
         return stats.avg_time
-    
-    def suggest_priority(self, code: str, fallback: Priority = Priority.NORMAL) -> Priority:
+
+    def get_predicted_time(self, code: str) -> Optional[float]:
+        """코드의 예상 실행 시간 (p95, 기록 없으면 None)"""
+        stats = self._get(self._hash_code(code))
+        if stats is None or not stats.samples:
+            return None
+        return stats.p95_time
+
+    def suggest_priority(
+        self, code: str, fallback: Priority = Priority.NORMAL, scale: int = 1
+    ) -> Priority:
         """
         과거 실행 기록 기반 우선순위 추천
-        
+
+        가끔 느려지는 코드가 HIGH를 차지하지 않도록 평균 대신 p95를 사용합니다.
+
         Args:
             code: 실행할 코드
             fallback: 기록이 없을 때 기본값
-        
+            scale: 한 작업에서 main()을 실행하는 횟수 (배치 청크의 항목 수)
+
         Returns:
             추천 우선순위 (HIGH/NORMAL/LOW)
         """
-        avg_time = self.get_avg_time(code)
-        
+        predicted = self.get_predicted_time(code)
+
         # 기록 없음 → 기본값 사용
-        if avg_time is None:
+        if predicted is None:
             return fallback
-        
+        predicted *= scale
+
         # SJF 원칙: 짧은 작업 우선
-        if avg_time < self.FAST_THRESHOLD:
+        if predicted < self.FAST_THRESHOLD:
             return Priority.HIGH
-        elif avg_time > self.SLOW_THRESHOLD:
+        elif predicted > self.SLOW_THRESHOLD:
             return Priority.LOW
         else:
             return Priority.NORMAL
-    
+
     def get_stats(self, code: str) -> Optional[ExecutionStats]:
         """코드의 상세 통계 조회"""
-        code_hash = self._hash_code(code)
-        if code_hash in self._stats:
-            return self._stats[code_hash]
-        return None
-    
-    def _cleanup_old_entries(self):
-        """오래된 항목 정리 (LRU 방식)"""
-        if len(self._stats) <= self._max_entries:
-            return
-        
-        # 마지막 실행 시간 기준 정렬 후 오래된 것 제거
-        sorted_hashes = sorted(
-            self._stats.keys(),
-            key=lambda h: self._stats[h].last_execution
-        )
-        
-        # 25% 제거
-        remove_count = len(sorted_hashes) // 4
-        for code_hash in sorted_hashes[:remove_count]:
-            del self._stats[code_hash]
-    
+        return self._get(self._hash_code(code))
+
+    async def close(self):
+        """대기 중인 저장 작업 정리 및 연결 종료"""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self._store is not None:
+            await self._store.close()
+
     @property
     def total_entries(self) -> int:
         return len(self._stats)
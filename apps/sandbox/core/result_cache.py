@@ -0,0 +1,167 @@
+"""
+Result Cache - 결정적 코드 실행 결과 캐시
+
+동일한 코드 + 동일한 입력 + 동일한 샌드박스 이미지 버전이면 결과가 같다고 보고
+이전 실행 결과를 재사용합니다. (요청 시 cacheable=True인 경우에만)
+
+- L1: 프로세스 메모리 (TTL + 크기 제한 LRU)
+- L2: Redis (선택, SANDBOX_RESULT_CACHE_REDIS_URL 설정 시, redis 패키지 필요)
+- 성공한 결과만 저장하며, 네트워크 허용 작업은 캐시하지 않습니다.
+"""
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from apps.sandbox.config import settings
+from apps.sandbox.models.result import ExecutionResult
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - 선택 의존성
+    aioredis = None
+
+
+class ResultCache:
+    """
+    실행 결과 캐시
+
+    사용법:
+        cache = ResultCache()
+        key = cache.make_key(code, inputs)
+
+        cached = await cache.get(key)
+        if cached is None:
+            result = ...  # 실행
+            await cache.set(key, result)
+    """
+
+    KEY_PREFIX = "sandbox:result"
+
+    def __init__(
+        self,
+        max_entries: int = None,
+        ttl: float = None,
+        redis_url: str = None,
+    ):
+        self._max_entries = max_entries if max_entries is not None else settings.RESULT_CACHE_MAX_ENTRIES
+        self._ttl = ttl if ttl is not None else settings.RESULT_CACHE_TTL
+        # key → (만료 시각(monotonic), ExecutionResult)
+        self._entries: "OrderedDict[str, Tuple[float, ExecutionResult]]" = OrderedDict()
+
+        self._redis = None
+        redis_url = redis_url if redis_url is not None else settings.RESULT_CACHE_REDIS_URL
+        if redis_url:
+            if aioredis is None:
+                logger.warning("Result cache: redis package not installed, using memory only")
+            else:
+                self._redis = aioredis.from_url(redis_url)
+
+        # 메트릭
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(code: str, inputs: Dict[str, Any], enable_network: bool = False) -> Optional[str]:
+        """
+        캐시 키 생성 (코드 해시 + 정규화된 입력 해시 + 이미지 버전)
+
+        Returns:
+            캐시 키, 캐시할 수 없는 요청이면 None (네트워크 허용, JSON 직렬화 불가 입력)
+        """
+        if enable_network:
+            return None
+        try:
+            canonical_inputs = json.dumps(
+                inputs, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+            )
+        except (TypeError, ValueError):
+            return None
+
+        code_hash = hashlib.sha256(code.encode()).hexdigest()
+        inputs_hash = hashlib.sha256(canonical_inputs.encode()).hexdigest()
+        return f"{settings.SANDBOX_IMAGE_VERSION}:{code_hash}:{inputs_hash}"
+
+    async def get(self, key: str) -> Optional[ExecutionResult]:
+        """캐시 조회 (L1 → Redis)"""
+        item = self._entries.get(key)
+        if item is not None:
+            expires_at, result = item
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._as_cached(result)
+            del self._entries[key]
+
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(f"{self.KEY_PREFIX}:{key}")
+                if raw:
+                    data = json.loads(raw)
+                    result = ExecutionResult(
+                        success=True,
+                        result=data.get("result"),
+                        execution_time_ms=data.get("execution_time_ms", 0.0),
+                        memory_used_mb=data.get("memory_used_mb", 0.0),
+                    )
+                    self._store_local(key, result)
+                    self.hits += 1
+                    return self._as_cached(result)
+            except Exception as e:
+                logger.debug(f"Result cache redis lookup failed: {e}")
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, result: ExecutionResult):
+        """성공한 결과만 저장"""
+        if not result.success:
+            return
+        self._store_local(key, result)
+
+        if self._redis is not None:
+            try:
+                payload = json.dumps(
+                    {
+                        "result": result.result,
+                        "execution_time_ms": result.execution_time_ms,
+                        "memory_used_mb": result.memory_used_mb,
+                    },
+                    ensure_ascii=False,
+                )
+                await self._redis.set(f"{self.KEY_PREFIX}:{key}", payload, ex=int(self._ttl))
+            except Exception as e:
+                logger.debug(f"Result cache redis store failed: {e}")
+
+    def _store_local(self, key: str, result: ExecutionResult):
+        self._entries[key] = (time.monotonic() + self._ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _as_cached(result: ExecutionResult) -> ExecutionResult:
+        """캐시 히트 결과 (공유 객체를 수정하지 않도록 사본 반환)"""
+        return ExecutionResult(
+            success=True,
+            result=json.loads(json.dumps(result.result)) if result.result is not None else None,
+            execution_time_ms=result.execution_time_ms,
+            memory_used_mb=result.memory_used_mb,
+            cached=True,
+        )
+
+    async def close(self):
+        if self._redis is not None:
+            try:
+                await self._redis.close()
+            except Exception:
+                pass
+            self._redis = None
+
+    @property
+    def total_entries(self) -> int:
+        return len(self._entries)
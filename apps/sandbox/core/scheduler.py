@@ -5,23 +5,28 @@ Fair Scheduler - MLFQ + Round-Robin + EMA-Based Dynamic Worker Pool Manager
 1. Multi-Level Feedback Queue (MLFQ): 우선순위별 버킷 (HIGH/NORMAL/LOW)
 2. Round-Robin: 테넌트 간 공정한 스케줄링 (Head-of-Line Blocking 해결)
 3. Aging: 오래 대기한 작업 우선순위 자동 승급 (Starvation 방지)
-4. EMA-Based Dynamic Scaling: 요청 수의 이동평균 기반 워커 수 자동 조절
+4. EMA-Based Dynamic Scaling: 요청 수의 이동평균 기반 워커 수 자동 조절 (크기 조절 세마포어)
 5. Tenant Limit: 테넌트당 동시 실행 제한
-6. SJF (Shortest Job First): 과거 실행 기록 기반 우선순위 자동 결정
+6. SJF (Shortest Job First): 과거 실행 기록(p95) 기반 우선순위 자동 결정
+7. Result Cache: 결정적 코드(cacheable)의 결과 재사용 (히트 시 스케줄링 생략)
+8. Batch: 하나의 코드 + 여러 입력을 청크 단위 작업으로 실행 (청크 = 테넌트 실행 1회)
+9. Cluster Mode: Redis로 테넌트 토큰/큐 깊이 조율, 유휴 레플리카의 작업 스틸링 (선택)
 """
 import asyncio
 import logging
 import math
 import time
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 
 from apps.sandbox.config import settings
 from apps.sandbox.core.bucket import PriorityBucket
-from apps.sandbox.core.executor import execute_code
+from apps.sandbox.core.cluster import ClusterCoordinator, aggregate_metrics, decode_job, encode_job
+from apps.sandbox.core.executor import execute_batch_code_async, execute_code_async
 from apps.sandbox.core.history import ExecutionHistory
+from apps.sandbox.core.result_cache import ResultCache
+from apps.sandbox.core.semaphore import ResizableSemaphore
 from apps.sandbox.models.job import Job, Priority
 from apps.sandbox.models.result import ExecutionResult
 
@@ -51,12 +56,13 @@ class FairScheduler:
             Priority.LOW: PriorityBucket(Priority.LOW),
         }
         
-        # Worker Pool
-        self._executor: Optional[ProcessPoolExecutor] = None
+        # Worker 슬롯: nsjail 프로세스를 직접 실행하며, 동시 실행 수는 세마포어로 제한
         self._current_workers = settings.MIN_WORKERS
+        self._slots = ResizableSemaphore(self._current_workers)
         
         # 실행 중인 작업 추적
         self._running_count = 0
+        self._job_tasks: Set[asyncio.Task] = set()
         self._tenant_running: Dict[str, int] = defaultdict(int)
         
         # 메트릭
@@ -64,6 +70,8 @@ class FairScheduler:
         self._total_completed = 0
         self._total_failed = 0
         self._total_aged = 0  # Aging으로 승급된 작업 수
+        self._total_offloaded = 0  # 다른 레플리카로 넘긴 작업 수
+        self._total_stolen = 0  # 다른 레플리카에서 가져와 실행한 작업 수
         
         # EMA 기반 스케일링 상태
         self._requests_this_interval = 0
@@ -77,9 +85,19 @@ class FairScheduler:
         self._scaling_task: Optional[asyncio.Task] = None
         self._aging_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._cluster_task: Optional[asyncio.Task] = None
         
-        # SJF: 실행 기록 기반 우선순위 결정
-        self._execution_history = ExecutionHistory()
+        # SJF: 실행 기록 기반 우선순위 결정 (SANDBOX_REDIS_URL 설정 시 레플리카 간 공유)
+        self._execution_history = ExecutionHistory.from_settings()
+        
+        # 결정적 코드 실행 결과 캐시
+        self._result_cache = ResultCache()
+        
+        # 클러스터 모드 (SANDBOX_CLUSTER_MODE=true, 아니면 None)
+        self._cluster: Optional[ClusterCoordinator] = ClusterCoordinator.from_settings()
+        self._tenant_blocked_until: Dict[str, float] = {}  # 클러스터 토큰 획득 실패한 테넌트
+        self._last_steal_attempt = 0.0
+        self._offload_tasks: Set[asyncio.Task] = set()
     
     @classmethod
     def get_instance(cls) -> "FairScheduler":
@@ -94,13 +112,15 @@ class FairScheduler:
             return
         
         self._running = True
-        self._executor = ProcessPoolExecutor(max_workers=settings.MAX_WORKERS)
         
         # 백그라운드 태스크 시작
         self._worker_task = asyncio.create_task(self._worker_loop())
         self._scaling_task = asyncio.create_task(self._scaling_loop())
         self._aging_task = asyncio.create_task(self._aging_loop())
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        if self._cluster:
+            self._cluster_task = asyncio.create_task(self._cluster_loop())
+            logger.info(f"Cluster mode enabled (replica={self._cluster.replica_id})")
         
         if settings.FORCE_FIFO:
             logger.info(f"Fair Scheduler started in [FIFO MODE] (Priority Ignored) with {self._current_workers}/{settings.MAX_WORKERS} workers")
@@ -112,7 +132,7 @@ class FairScheduler:
         self._running = False
         
         # 1. 백그라운드 태스크 중지
-        for task in [self._worker_task, self._scaling_task, self._aging_task, self._cleanup_task]:
+        for task in [self._worker_task, self._scaling_task, self._aging_task, self._cleanup_task, self._cluster_task]:
             if task:
                 task.cancel()
                 try:
@@ -130,13 +150,24 @@ class FairScheduler:
                     )
                     pending_count += 1
         
+        # 다른 레플리카로 넘긴 작업 결과 대기 중단
+        for task in list(self._offload_tasks):
+            task.cancel()
+        if self._offload_tasks:
+            await asyncio.gather(*self._offload_tasks, return_exceptions=True)
+        
         if pending_count > 0:
             logger.warning(f"Graceful shutdown: {pending_count} pending jobs cancelled")
         
-        # 3. 워커 풀 종료
-        if self._executor:
-            self._executor.shutdown(wait=True)
-            self._executor = None
+        # 3. 실행 중인 작업 완료 대기
+        if self._job_tasks:
+            await asyncio.gather(*self._job_tasks, return_exceptions=True)
+        
+        await self._result_cache.close()
+        await self._execution_history.close()
+        if self._cluster:
+            await self._cluster.leave()
+            await self._cluster.close()
         
         logger.info("Fair Scheduler stopped")
     
@@ -149,95 +180,244 @@ class FairScheduler:
         trigger_mode: str = None,
         enable_network: bool = False,
         tenant_id: str = None,
+        cacheable: bool = False,
     ) -> ExecutionResult:
-        """작업 제출 및 결과 대기"""
+        """
+        작업 제출 및 결과 대기
+        
+        cacheable=True면 동일 코드/입력의 이전 성공 결과를 재사용합니다.
+        (캐시 히트 시 큐/워커를 거치지 않음)
+        """
         if not self._running:
             raise RuntimeError("Scheduler not running")
         
-        # Backpressure
-        total_jobs = sum(b.total_jobs for b in self._buckets.values())
-        if total_jobs >= settings.MAX_QUEUE_SIZE:
-            raise ValueError("Service overloaded, please retry later")
+        cache_key = None
+        if cacheable and settings.RESULT_CACHE_ENABLED:
+            cache_key = self._result_cache.make_key(code, inputs, enable_network)
+            if cache_key:
+                cached = await self._result_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+        
+        self._check_backpressure()
         
         # EMA 계산용 카운터
         self._requests_this_interval += 1
         
         # 우선순위 결정 (SJF + 트리거 유형 기반 fallback)
         if priority is None:
-            # 트리거 유형에 따른 fallback 우선순위
-            fallback_map = {
-                "manual": Priority.HIGH,    # 사용자가 테스트 실행 중 (대기 중)
-                "app": Priority.HIGH,       # 웹 앱 호출 (사용자 대기)
-                "api": Priority.NORMAL,     # API 호출 (일반)
-                "webhook": Priority.LOW,    # Webhook (백그라운드)
-                "schedule": Priority.LOW,   # 스케줄 트리거 (백그라운드)
-            }
-            fallback = fallback_map.get(trigger_mode, Priority.NORMAL)
-            priority = self._execution_history.suggest_priority(code, fallback=fallback)
-        
-        # Job 생성
-        loop = asyncio.get_event_loop()
-        future = loop.create_future()
-        
-        job = Job(
-            priority=priority,
-            code=code,
-            inputs=inputs,
-            timeout=timeout or settings.DEFAULT_TIMEOUT,
-            enable_network=enable_network,
-            future=future,
-            tenant_id=tenant_id,
-        )
+            priority = await self._suggest_priority(code, trigger_mode)
         
-        # 해당 우선순위 버킷에 추가
-        await self._buckets[priority].add(job)
-        self._total_submitted += 1
-        
-        logger.debug(f"Job {job.job_id} submitted (priority={priority.name}, tenant={tenant_id})")
+        # Job 생성 및 해당 우선순위 버킷에 추가
+        job = await self._enqueue(
+            Job(
+                priority=priority,
+                code=code,
+                inputs=inputs,
+                timeout=timeout or settings.DEFAULT_TIMEOUT,
+                enable_network=enable_network,
+                tenant_id=tenant_id,
+            )
+        )
+        future = job.future
         
         try:
             result = await future
+            if cache_key and result.success:
+                await self._result_cache.set(cache_key, result)
             return result
         except asyncio.CancelledError:
             return ExecutionResult.sandbox_error("Job cancelled", job.job_id)
     
+    async def submit_batch(
+        self,
+        code: str,
+        inputs_list: List[Dict[str, Any]],
+        timeout: int = None,
+        priority: Priority = None,  # None이면 자동 결정
+        trigger_mode: str = None,
+        enable_network: bool = False,
+        tenant_id: str = None,
+    ) -> ExecutionResult:
+        """
+        배치 작업 제출 및 결과 대기
+        
+        BATCH_CHUNK_SIZE 단위 청크마다 작업 하나로 스케줄링합니다.
+        (청크가 워커 슬롯/테넌트 실행 제한을 하나씩 차지하므로 다른 테넌트와 번갈아 실행됨)
+        timeout은 배치 전체 예산이며, 예산 안에 끝나지 않은 청크는 취소하고 timeout 에러로 채웁니다.
+        
+        Returns:
+            ExecutionResult (items: 입력 순서대로 항목별 결과)
+        """
+        if not self._running:
+            raise RuntimeError("Scheduler not running")
+        
+        budget = min(timeout or settings.DEFAULT_TIMEOUT, settings.MAX_BATCH_TIMEOUT)
+        chunk_size = max(1, settings.BATCH_CHUNK_SIZE)
+        chunks = [inputs_list[i:i + chunk_size] for i in range(0, len(inputs_list), chunk_size)]
+        if not chunks:
+            return ExecutionResult(success=True, items=[])
+        
+        self._check_backpressure(len(chunks))
+        self._requests_this_interval += len(chunks)
+        
+        if priority is None:
+            # 청크는 항목 수만큼 실행하므로 예상 시간도 그만큼 길게 보고 결정
+            priority = await self._suggest_priority(code, trigger_mode, scale=len(chunks[0]))
+        
+        start_time = time.time()
+        jobs = []
+        for chunk in chunks:
+            jobs.append(
+                await self._enqueue(
+                    Job(
+                        priority=priority,
+                        code=code,
+                        inputs_list=chunk,
+                        timeout=min(budget, settings.MAX_TIMEOUT),
+                        enable_network=enable_network,
+                        tenant_id=tenant_id,
+                    )
+                )
+            )
+        
+        futures = [job.future for job in jobs]
+        try:
+            done, pending = await asyncio.wait(futures, timeout=budget)
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        # 예산 초과: 대기 중인 청크는 실행하지 않고, 실행 중인 청크는 샌드박스 종료
+        for future in pending:
+            future.cancel()
+        
+        items: List[ExecutionResult] = []
+        memory_used_mb = 0.0
+        cpu_time_ms = 0.0
+        for chunk, job in zip(chunks, jobs):
+            if job.future in done and not job.future.cancelled():
+                result = job.future.result()
+                memory_used_mb = max(memory_used_mb, result.memory_used_mb)
+                cpu_time_ms += result.cpu_time_ms
+                if result.items is not None:
+                    items.extend(result.items)
+                    continue
+                missing = result
+            else:
+                missing = ExecutionResult.timeout_error(budget, job.job_id)
+            items.extend(
+                ExecutionResult(success=False, error=missing.error, error_type=missing.error_type)
+                for _ in chunk
+            )
+        
+        return ExecutionResult(
+            success=True,
+            items=items,
+            execution_time_ms=(time.time() - start_time) * 1000,
+            memory_used_mb=memory_used_mb,
+            cpu_time_ms=cpu_time_ms,
+        )
+    
+    def _check_backpressure(self, new_jobs: int = 1):
+        total_jobs = sum(b.total_jobs for b in self._buckets.values())
+        if total_jobs + new_jobs > settings.MAX_QUEUE_SIZE:
+            raise ValueError("Service overloaded, please retry later")
+        if (
+            self._cluster
+            and settings.CLUSTER_MAX_QUEUE_SIZE > 0
+            and self._cluster.queue_size + new_jobs > settings.CLUSTER_MAX_QUEUE_SIZE
+        ):
+            raise ValueError("Cluster overloaded, please retry later")
+    
+    async def _suggest_priority(self, code: str, trigger_mode: Optional[str], scale: int = 1) -> Priority:
+        """SJF(실행 기록) + 트리거 유형 기반 fallback 우선순위"""
+        # 트리거 유형에 따른 fallback 우선순위
+        fallback_map = {
+            "manual": Priority.HIGH,    # 사용자가 테스트 실행 중 (대기 중)
+            "app": Priority.HIGH,       # 웹 앱 호출 (사용자 대기)
+            "api": Priority.NORMAL,     # API 호출 (일반)
+            "webhook": Priority.LOW,    # Webhook (백그라운드)
+            "schedule": Priority.LOW,   # 스케줄 트리거 (백그라운드)
+        }
+        fallback = fallback_map.get(trigger_mode, Priority.NORMAL)
+        await self._execution_history.prefetch(code)
+        return self._execution_history.suggest_priority(code, fallback=fallback, scale=scale)
+    
+    async def _enqueue(self, job: Job) -> Job:
+        """결과 future를 붙여 우선순위 버킷에 추가"""
+        job.future = asyncio.get_event_loop().create_future()
+        await self._buckets[job.priority].add(job)
+        self._total_submitted += 1
+        
+        logger.debug(f"Job {job.job_id} submitted (priority={Priority(job.priority).name}, tenant={job.tenant_id})")
+        return job
+    
     async def _worker_loop(self):
         """메인 워커 루프: MLFQ + Round-Robin으로 작업 선택 및 실행"""
         loop = asyncio.get_event_loop()
         
         while self._running:
+            slot_held = False
             try:
-                # 워커 가용성 체크 
-                if self._running_count >= self._current_workers:
-                    await asyncio.sleep(0.05)
-                    continue
+                # 워커 슬롯이 빌 때까지 대기 (작업 종료/스케일 업 시 깨어남)
+                await self._slots.acquire()
+                slot_held = True
                 
                 # 워커가 있을 때만 작업 꺼내기
                 job = await self._get_next_job()
                 
                 if job is None:
+                    # 클러스터 모드: 할 일이 없으면 다른 레플리카가 내놓은 작업 가져오기
+                    if self._cluster and await self._try_steal(loop):
+                        continue
+                    self._slots.release()
                     await asyncio.sleep(0.1)
                     continue
                 
-                # 실행
-                self._running_count += 1
-                self._last_busy_time = time.time()
-                
-                tenant_id = job.tenant_id or "__default__"
-                self._tenant_running[tenant_id] += 1
+                # 대기 중 취소된 작업 (요청 취소, 배치 예산 초과)은 실행하지 않음
+                if job.future is not None and job.future.done():
+                    if self._cluster:
+                        await self._cluster.release_tenant(job.tenant_id or "__default__", str(job.job_id))
+                    self._slots.release()
+                    continue
                 
-                asyncio.create_task(self._execute_job(job, loop))
+                # 실행 (슬롯은 작업 종료 시 반환)
+                self._start_job(job)
                 
             except asyncio.CancelledError:
+                if slot_held:
+                    self._slots.release()
                 break
             except Exception as e:
                 logger.error(f"Worker loop error: {e}")
+                if slot_held:
+                    self._slots.release()
                 await asyncio.sleep(0.5)
     
+    def _start_job(self, job: Job):
+        """슬롯을 확보한 작업 실행 시작"""
+        self._running_count += 1
+        self._last_busy_time = time.time()
+        self._tenant_running[job.tenant_id or "__default__"] += 1
+        
+        task = asyncio.create_task(self._execute_job(job))
+        self._job_tasks.add(task)
+        task.add_done_callback(self._job_tasks.discard)
+        
+        # 요청자가 대기를 취소하면 실행 중인 샌드박스도 종료
+        if job.future is not None:
+            job.future.add_done_callback(lambda f: task.cancel() if f.cancelled() else None)
+        return task
+    
     async def _get_next_job(self) -> Optional[Job]:
         """MLFQ + Round-Robin으로 다음 작업 선택 """
+        now = time.time()
+        
         # 테넌트 실행 제한 체크 콜백
         def is_tenant_allowed(tenant_id: str) -> bool:
+            if self._tenant_blocked_until.get(tenant_id, 0) > now:
+                return False
             return self._tenant_running[tenant_id] < settings.MAX_PER_TENANT
         
         # 우선순위 순서대로 버킷 순회
@@ -250,28 +430,50 @@ class FairScheduler:
             # 원자적 Round-Robin pop
             job = await bucket.pop_next_round_robin(is_tenant_allowed)
             if job:
+                # 클러스터 모드: 다른 레플리카 실행분까지 포함한 테넌트 토큰 획득
+                if self._cluster and not await self._acquire_cluster_token(job):
+                    tenant_id = job.tenant_id or "__default__"
+                    self._tenant_blocked_until[tenant_id] = now + settings.CLUSTER_TENANT_RETRY
+                    await bucket.add_front(job)
+                    return None
                 return job
         
         return None
     
-    async def _execute_job(self, job: Job, loop: asyncio.AbstractEventLoop):
-        """작업 실행 및 결과 반환"""
+    async def _acquire_cluster_token(self, job: Job) -> bool:
+        tenant_id = job.tenant_id or "__default__"
+        # 레플리카가 죽어도 실행 제한 시간 후 토큰이 회수되도록 임대 만료 설정
+        ttl = job.timeout + settings.CLUSTER_RESULT_GRACE
+        acquired = await self._cluster.acquire_tenant(tenant_id, str(job.job_id), ttl)
+        if acquired:
+            self._tenant_blocked_until.pop(tenant_id, None)
+        return acquired
+    
+    async def _execute_job(self, job: Job):
+        """작업 실행 및 결과 반환 (취소 시 nsjail 프로세스 종료)"""
         tenant_id = job.tenant_id or "__default__"
         start_time = time.time()
         
         try:
-            result = await loop.run_in_executor(
-                self._executor,
-                execute_code,
-                job.code,
-                job.inputs,
-                job.timeout,
-                job.enable_network,
-                job.job_id,
-            )
+            if job.inputs_list is not None:
+                result = await execute_batch_code_async(
+                    job.code,
+                    job.inputs_list,
+                    job.timeout,
+                    job.enable_network,
+                    job.job_id,
+                )
+            else:
+                result = await execute_code_async(
+                    job.code,
+                    job.inputs,
+                    job.timeout,
+                    job.enable_network,
+                    job.job_id,
+                )
             
-            # SJF: 실행 시간 기록 (성공한 경우만)
-            if result.success:
+            # SJF: 실행 시간 기록 (단건 실행이 성공한 경우만)
+            if result.success and job.inputs_list is None:
                 execution_time = time.time() - start_time
                 self._execution_history.record(job.code, execution_time)
             
@@ -296,6 +498,9 @@ class FairScheduler:
         finally:
             self._running_count -= 1
             self._tenant_running[tenant_id] -= 1
+            self._slots.release()
+            if self._cluster:
+                await self._cluster.release_tenant(tenant_id, str(job.job_id))
     
     async def _scaling_loop(self):
         """EMA 기반 동적 워커 스케일링"""
@@ -323,6 +528,7 @@ class FairScheduler:
                 
                 if required_workers > current:
                     self._current_workers = required_workers
+                    self._slots.resize(required_workers)
                     logger.info(f"Scale UP: {current} → {required_workers} workers (EMA RPS={self._ema_rps:.2f})")
                 
                 elif required_workers < current:
@@ -335,6 +541,7 @@ class FairScheduler:
                     
                     if total_jobs == 0 and self._running_count == 0 and idle_time >= settings.SCALE_DOWN_IDLE_TIME:
                         self._current_workers = required_workers
+                        self._slots.resize(required_workers)
                         self._last_scale_down_time = now
                         logger.info(f"Scale DOWN: {current} → {required_workers} workers (EMA RPS={self._ema_rps:.2f}, idle={idle_time:.1f}s)")
                 
@@ -392,6 +599,116 @@ class FairScheduler:
             except Exception as e:
                 logger.error(f"Cleanup loop error: {e}")
     
+    async def _cluster_loop(self):
+        """클러스터 모드: 메트릭 보고 + 오래 대기한 작업을 유휴 레플리카에 양보"""
+        while self._running:
+            try:
+                await self._cluster.heartbeat(self.get_metrics())
+                await self._offload_waiting_jobs()
+                await asyncio.sleep(settings.CLUSTER_HEARTBEAT_INTERVAL)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Cluster loop error: {e}")
+                await asyncio.sleep(settings.CLUSTER_HEARTBEAT_INTERVAL)
+    
+    async def _offload_waiting_jobs(self):
+        """
+        로컬 워커가 모두 바쁘고 다른 레플리카에 유휴 워커가 있으면
+        CLUSTER_STEAL_AFTER 이상 대기한 작업을 공유 큐에 내놓음 (유휴 워커 수만큼)
+        """
+        if self._running_count < self._current_workers:
+            return
+        slots = self._cluster.idle_peer_slots()
+        if slots <= 0:
+            return
+        
+        now = time.time()
+        candidates = []
+        for priority in [Priority.HIGH, Priority.NORMAL, Priority.LOW]:
+            for job in await self._buckets[priority].get_all_jobs():
+                if now - job.created_at >= settings.CLUSTER_STEAL_AFTER:
+                    candidates.append(job)
+        
+        for job in candidates[:slots]:
+            payload = encode_job(job)
+            if payload is None:
+                continue
+            if not await self._buckets[job.priority].remove_job(job):
+                continue  # 그 사이 로컬에서 실행됨
+            task = asyncio.create_task(self._run_offloaded(job, payload))
+            self._offload_tasks.add(task)
+            task.add_done_callback(self._offload_tasks.discard)
+    
+    async def _run_offloaded(self, job: Job, payload: str):
+        """양보한 작업의 원격 실행 결과 대기 (아무도 가져가지 않으면 로컬 큐로 회수)"""
+        try:
+            await self._cluster.offer(job.priority, payload)
+        except Exception as e:
+            logger.debug(f"Cluster offer failed: {e}")
+            await self._buckets[job.priority].add_front(job)
+            return
+        
+        try:
+            result = await self._cluster.wait_result(job.job_id, settings.CLUSTER_CLAIM_TIMEOUT)
+            if result is None:
+                if await self._cluster.reclaim(job.priority, payload):
+                    await self._buckets[job.priority].add_front(job)
+                    return
+                result = await self._cluster.wait_result(
+                    job.job_id, job.timeout + settings.CLUSTER_RESULT_GRACE
+                )
+            if result is None:
+                result = ExecutionResult.sandbox_error("Remote replica did not return a result", job.job_id)
+            
+            self._total_offloaded += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        except asyncio.CancelledError:
+            if not job.future.done():
+                job.future.set_result(ExecutionResult.sandbox_error("Server shutting down", job.job_id))
+            raise
+        except Exception as e:
+            # 결과 대기 중 Redis 오류: 다른 레플리카가 실행 중일 수 있으므로 실패로 응답 (중복 실행 방지)
+            logger.error(f"Offloaded job {job.job_id} failed: {e}")
+            if not job.future.done():
+                job.future.set_result(ExecutionResult.sandbox_error(str(e), job.job_id))
+    
+    async def _try_steal(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """
+        다른 레플리카가 내놓은 작업을 가져와 실행 (가져왔으면 True)
+        
+        호출 전에 워커 슬롯을 확보해야 하며, 가져온 경우 슬롯은 작업 종료 시 반환됩니다.
+        """
+        now = time.monotonic()
+        if now - self._last_steal_attempt < settings.CLUSTER_STEAL_POLL_INTERVAL:
+            return False
+        self._last_steal_attempt = now
+        
+        payload = await self._cluster.steal()
+        if payload is None:
+            return False
+        
+        job = decode_job(payload)
+        if not await self._acquire_cluster_token(job):
+            await self._cluster.requeue(job.priority, payload)
+            return False
+        
+        job.future = loop.create_future()
+        self._total_stolen += 1
+        task = self._start_job(job)
+        asyncio.create_task(self._publish_stolen(job, task))
+        return True
+    
+    async def _publish_stolen(self, job: Job, task: asyncio.Task):
+        await asyncio.gather(task, return_exceptions=True)
+        if not job.future.done():
+            return
+        try:
+            await self._cluster.publish_result(job.job_id, job.future.result())
+        except Exception as e:
+            logger.error(f"Stolen job {job.job_id} result publish failed: {e}")
+    
     @property
     def queue_size(self) -> int:
         return sum(b.total_jobs for b in self._buckets.values())
@@ -416,7 +733,27 @@ class FairScheduler:
             "max_workers": settings.MAX_WORKERS,
             "ema_rps": round(self._ema_rps, 2),
             "active_tenants": sum(b.active_tenants for b in self._buckets.values()),
+            "cache_hits": self._result_cache.hits,
+            "cache_misses": self._result_cache.misses,
+            "cache_entries": self._result_cache.total_entries,
+            "total_offloaded": self._total_offloaded,
+            "total_stolen": self._total_stolen,
         }
+    
+    def get_cluster_metrics(self) -> dict:
+        """클러스터 전체 메트릭 (마지막 heartbeat 기준, 클러스터 모드가 아니면 로컬만)"""
+        local = self.get_metrics()
+        if self._cluster is None or not self._cluster.snapshots:
+            snapshots = [local]
+        else:
+            # 자기 항목은 최신 값으로 교체
+            snapshots = [
+                s for s in self._cluster.snapshots
+                if s.get("replica_id") != self._cluster.replica_id
+            ] + [local]
+        metrics = aggregate_metrics(snapshots)
+        metrics["cluster_mode"] = self._cluster is not None
+        return metrics
 
 
 # 기존 SandboxScheduler와의 호환성을 위한 별칭
@@ -0,0 +1,71 @@
+"""
+Resizable Semaphore - 크기 조절 가능한 동시 실행 제한
+
+EMA 스케일링으로 워커 수(_current_workers)가 바뀌면 resize()로 즉시 반영합니다.
+축소 시 이미 실행 중인 작업은 그대로 두고, 사용 중인 수가 새 크기 아래로 내려간 뒤부터
+새 작업을 허용합니다.
+"""
+import asyncio
+from collections import deque
+from typing import Deque
+
+
+class ResizableSemaphore:
+    """
+    사용법:
+        slots = ResizableSemaphore(2)
+
+        await slots.acquire()
+        try:
+            ...  # 실행
+        finally:
+            slots.release()
+
+        slots.resize(4)  # 대기 중인 acquire() 즉시 깨움
+    """
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._in_use = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self):
+        while self._in_use >= self._capacity:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_use += 1
+
+    def release(self):
+        if self._in_use > 0:
+            self._in_use -= 1
+        self._wake()
+
+    def resize(self, capacity: int):
+        self._capacity = capacity
+        self._wake()
+
+    def _wake(self):
+        """남은 자리 수만큼 대기자 깨우기 (깨어난 쪽에서 다시 확인)"""
+        free = self._capacity - self._in_use
+        for waiter in list(self._waiters):
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def locked(self) -> bool:
+        return self._in_use >= self._capacity
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
@@ -3,7 +3,7 @@ Sandbox Service - Job and Priority Models
 """
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 import asyncio
 import time
@@ -33,6 +33,8 @@ class Job:
     # 실행할 코드
     code: str = field(default="", compare=False)
     inputs: Dict[str, Any] = field(default_factory=dict, compare=False)
+    # 배치 실행 청크 (None이 아니면 inputs 대신 항목별로 main() 실행)
+    inputs_list: Optional[List[Dict[str, Any]]] = field(default=None, compare=False)
     
     # 실행 옵션
     timeout: int = field(default=10, compare=False)
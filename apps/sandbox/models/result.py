@@ -2,7 +2,7 @@
 Sandbox Service - Execution Result Models
 """
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 
@@ -23,6 +23,7 @@ class ExecutionResult:
     # 실행 메트릭
     execution_time_ms: float = 0.0
     memory_used_mb: float = 0.0
+    cpu_time_ms: float = 0.0
     
     # stdout/stderr (디버깅용)
     stdout: str = ""
@@ -30,17 +31,24 @@ class ExecutionResult:
     
     # 메타데이터
     job_id: Optional[UUID] = None
+    cached: bool = False  # 결과 캐시 히트 여부
+    items: Optional[List["ExecutionResult"]] = None  # 배치 실행 시 항목별 결과 (입력 순서)
     
     def to_dict(self) -> Dict[str, Any]:
         """API 응답용 딕셔너리 변환"""
-        return {
+        data = {
             "success": self.success,
             "result": self.result,
             "error": self.error,
             "error_type": self.error_type,
             "execution_time_ms": self.execution_time_ms,
             "memory_used_mb": self.memory_used_mb,
+            "cpu_time_ms": self.cpu_time_ms,
+            "cached": self.cached,
         }
+        if self.items is not None:
+            data["items"] = [item.to_dict() for item in self.items]
+        return data
     
     @classmethod
     def timeout_error(cls, timeout: int, job_id: UUID = None) -> "ExecutionResult":
@@ -0,0 +1,135 @@
+"""
+Cgroup v2 기반 작업별 자원 사용량 측정
+
+작업마다 SANDBOX_CGROUP_ROOT 아래에 cgroup을 만들고 nsjail 프로세스를 exec 전에 넣어서
+샌드박스 안의 모든 프로세스의 메모리 최대 사용량(memory.peak)과 CPU 시간(cpu.stat)을 측정합니다.
+
+- cgroup v2가 마운트되어 있고 SANDBOX_CGROUP_ROOT에 쓰기 권한이 있어야 합니다.
+  (컨테이너에서는 cgroup 위임 필요, 사용 불가하면 측정 없이 실행)
+- 취소/타임아웃 시 cgroup.kill로 샌드박스 안 프로세스를 한번에 종료합니다.
+"""
+import logging
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from apps.sandbox.config import settings
+
+logger = logging.getLogger(__name__)
+
+# cgroup 사용 가능 여부 (최초 1회 확인)
+_available: Optional[bool] = None
+
+
+@dataclass
+class CgroupUsage:
+    """작업 자원 사용량"""
+    memory_peak_mb: float = 0.0
+    cpu_time_ms: float = 0.0
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def cgroup_available() -> bool:
+    """작업별 cgroup을 만들 수 있는지 확인 (memory/cpu 컨트롤러 활성화 포함)"""
+    global _available
+    if _available is not None:
+        return _available
+
+    _available = False
+    if not settings.CGROUP_ENABLED:
+        return False
+
+    root = settings.CGROUP_ROOT
+    try:
+        os.makedirs(root, exist_ok=True)
+        controllers = (_read(os.path.join(root, "cgroup.controllers")) or "").split()
+        if "memory" not in controllers:
+            raise OSError("memory controller not delegated")
+
+        enabled = (_read(os.path.join(root, "cgroup.subtree_control")) or "").split()
+        wanted = [c for c in ("memory", "cpu") if c in controllers and c not in enabled]
+        if wanted:
+            with open(os.path.join(root, "cgroup.subtree_control"), "w") as f:
+                f.write(" ".join(f"+{c}" for c in wanted))
+        _available = True
+    except OSError as e:
+        logger.info(f"Cgroup accounting disabled ({root}): {e}")
+    return _available
+
+
+class JobCgroup:
+    """
+    작업 하나의 cgroup
+
+    사용법:
+        cgroup = JobCgroup.create(f"job-{job_id}")  # 사용 불가하면 None
+        proc = await asyncio.create_subprocess_exec(..., preexec_fn=cgroup.attach)
+        await proc.wait()
+        usage = cgroup.usage()
+        cgroup.remove()
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def create(cls, name: str) -> Optional["JobCgroup"]:
+        if not cgroup_available():
+            return None
+        path = os.path.join(settings.CGROUP_ROOT, name)
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+        except OSError as e:
+            logger.debug(f"Cgroup create failed ({path}): {e}")
+            return None
+        return cls(path)
+
+    def attach(self):
+        """
+        현재 프로세스를 cgroup에 추가
+
+        fork 후 exec 전(preexec_fn)에 자식 프로세스에서 호출되므로 예외를 올리지 않습니다.
+        """
+        try:
+            with open(os.path.join(self.path, "cgroup.procs"), "w") as f:
+                f.write(str(os.getpid()))
+        except OSError:
+            pass
+
+    def usage(self) -> CgroupUsage:
+        usage = CgroupUsage()
+
+        # memory.peak: 커널 5.19+
+        peak = _read(os.path.join(self.path, "memory.peak"))
+        if peak and peak.strip().isdigit():
+            usage.memory_peak_mb = round(int(peak) / (1024 * 1024), 2)
+
+        for line in (_read(os.path.join(self.path, "cpu.stat")) or "").splitlines():
+            name, _, value = line.partition(" ")
+            if name == "usage_usec" and value.strip().isdigit():
+                usage.cpu_time_ms = round(int(value) / 1000, 2)
+                break
+        return usage
+
+    def kill(self):
+        """cgroup 안의 모든 프로세스 종료 (cgroup.kill, 커널 5.14+)"""
+        try:
+            with open(os.path.join(self.path, "cgroup.kill"), "w") as f:
+                f.write("1")
+        except OSError:
+            pass
+
+    def remove(self):
+        try:
+            os.rmdir(self.path)
+        except OSError as e:
+            logger.debug(f"Cgroup remove failed ({self.path}): {e}")
@@ -1,16 +1,20 @@
 """
 NSJail Wrapper - NSJail CLI를 Python에서 호출하기 위한 래퍼
 """
+import asyncio
 import json
 import os
+import secrets
+import signal
 import subprocess
 import tempfile
 import time
-from typing import Any, Dict, Optional
-from uuid import UUID
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
 
 from apps.sandbox.config import settings
 from apps.sandbox.models.result import ExecutionResult
+from apps.sandbox.nsjail.cgroup import JobCgroup
 
 
 class NSJailWrapper:
@@ -18,6 +22,7 @@ class NSJailWrapper:
     NSJail CLI 래퍼
     
     subprocess를 사용하여 nsjail 프로세스를 생성하고 관리합니다.
+    스케줄러는 execute_async()로 이벤트 루프에서 직접 nsjail을 실행/대기합니다.
     """
     
     def __init__(
@@ -88,6 +93,160 @@ class NSJailWrapper:
             # 임시 파일 정리
             self._cleanup_temp_script(script_path)
     
+    async def execute_async(
+        self,
+        code: str,
+        inputs: Dict[str, Any],
+        timeout: int = 10,
+        enable_network: bool = False,
+        job_id: UUID = None,
+    ) -> ExecutionResult:
+        """
+        execute()의 비동기 버전 (asyncio subprocess로 nsjail 직접 실행)
+
+        - 중간 워커 프로세스 없이 nsjail 프로세스 하나만 생성
+        - cgroup 사용 가능 시 메모리 최대 사용량/CPU 시간 측정
+        - 태스크 취소/타임아웃 시 nsjail과 샌드박스 안 프로세스를 모두 종료
+        """
+        return await self._run_async(
+            self._create_wrapper_script(code, inputs),
+            timeout,
+            enable_network,
+            job_id,
+            parse=lambda completed, execution_time: self._parse_result(completed, execution_time, job_id),
+            on_timeout=lambda completed, execution_time: ExecutionResult.timeout_error(timeout, job_id),
+        )
+    
+    async def execute_batch_async(
+        self,
+        code: str,
+        inputs_list: List[Dict[str, Any]],
+        timeout: int = 10,
+        enable_network: bool = False,
+        job_id: UUID = None,
+    ) -> ExecutionResult:
+        """
+        하나의 샌드박스 인터프리터에서 여러 입력으로 main()을 순서대로 실행
+
+        - 항목별 예외는 해당 항목의 에러로 기록하고 다음 항목 계속 실행
+        - timeout은 배치 전체 예산이며, 예산을 넘긴 뒤의 항목은 실행하지 않고 timeout 에러
+        - 결과는 ExecutionResult.items에 입력 순서대로 담김
+        - 타임아웃으로 종료되어도 이미 출력된 항목 결과는 유지
+        """
+        total = len(inputs_list)
+        # 실행마다 새 마커 (사용자 코드가 결과 줄을 흉내 내지 못하도록)
+        marker = f"__MODULY_BATCH_{secrets.token_hex(16)}__"
+        return await self._run_async(
+            self._create_batch_wrapper_script(code, inputs_list, timeout, marker),
+            timeout,
+            enable_network,
+            job_id,
+            parse=lambda completed, execution_time: self._parse_batch_result(
+                completed, execution_time, total, timeout, marker, job_id
+            ),
+            on_timeout=lambda completed, execution_time: self._parse_batch_result(
+                completed, execution_time, total, timeout, marker, job_id, timed_out=True
+            ),
+        )
+    
+    async def _run_async(
+        self,
+        script_content: str,
+        timeout: int,
+        enable_network: bool,
+        job_id: Optional[UUID],
+        parse: Callable[[subprocess.CompletedProcess, float], ExecutionResult],
+        on_timeout: Callable[[subprocess.CompletedProcess, float], ExecutionResult],
+    ) -> ExecutionResult:
+        """
+        nsjail 프로세스 실행/대기 공통 로직
+
+        타임아웃 시에는 프로세스를 종료한 뒤 그때까지의 출력을 on_timeout에 전달합니다.
+        """
+        start_time = time.time()
+        
+        script_path = self._write_temp_script(script_content, job_id)
+        cgroup = JobCgroup.create(f"job-{job_id or uuid4().hex}")
+        proc = None
+        communicate = None
+        
+        try:
+            cmd = self._build_command(script_path, timeout, enable_network)
+            
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,  # 종료 시 프로세스 그룹 단위로 kill
+                preexec_fn=cgroup.attach if cgroup else None,
+            )
+            
+            # 타임아웃 후에도 이미 나온 출력을 읽을 수 있도록 communicate를 별도 태스크로 유지
+            communicate = asyncio.ensure_future(proc.communicate())
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    asyncio.shield(communicate),
+                    timeout=timeout + 2,  # NSJail 자체 타임아웃 + 여유
+                )
+                timed_out = False
+            except asyncio.TimeoutError:
+                await self._kill(proc, cgroup)
+                try:
+                    # 프로세스가 종료되어 파이프가 닫히면 남은 출력까지 반환
+                    stdout, stderr = await asyncio.wait_for(communicate, timeout=2)
+                except Exception:
+                    stdout, stderr = b"", b""
+                timed_out = True
+            
+            execution_time = (time.time() - start_time) * 1000
+            
+            completed = subprocess.CompletedProcess(
+                cmd,
+                proc.returncode,
+                stdout.decode("utf-8", errors="replace"),
+                stderr.decode("utf-8", errors="replace"),
+            )
+            if timed_out:
+                return on_timeout(completed, execution_time)
+            result = parse(completed, execution_time)
+            
+            if cgroup:
+                usage = cgroup.usage()
+                result.memory_used_mb = usage.memory_peak_mb
+                result.cpu_time_ms = usage.cpu_time_ms
+            return result
+        
+        except asyncio.CancelledError:
+            # 요청 취소: 샌드박스 프로세스를 남기지 않음
+            if proc is not None:
+                await self._kill(proc, cgroup)
+            raise
+        
+        except Exception as e:
+            return ExecutionResult.sandbox_error(str(e), job_id)
+        
+        finally:
+            if communicate is not None and not communicate.done():
+                communicate.cancel()
+            if cgroup:
+                cgroup.remove()
+            self._cleanup_temp_script(script_path)
+    
+    @staticmethod
+    async def _kill(proc: asyncio.subprocess.Process, cgroup: Optional[JobCgroup]):
+        """nsjail 프로세스 그룹 + cgroup 안 프로세스 종료 후 회수"""
+        if proc.returncode is None:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+        if cgroup:
+            cgroup.kill()
+        try:
+            await asyncio.shield(proc.wait())
+        except Exception:
+            pass
+    
     def _auto_convert(self, value):
         """문자열을 적절한 타입으로 자동 변환"""
         if not isinstance(value, str):
@@ -149,6 +308,45 @@ except Exception as e:
     sys.exit(1)
 '''
     
+    def _create_batch_wrapper_script(
+        self, user_code: str, inputs_list: List[Dict[str, Any]], timeout: int, marker: str
+    ) -> str:
+        """
+        배치 실행 스크립트 생성
+        항목 결과를 "<marker><index>:<json>" 한 줄씩 바로 출력하여 중간에 종료되어도 완료된 항목은 보존
+        (marker는 실행마다 무작위로 만들어 사용자 코드의 print 출력과 구분)
+        """
+        inputs_list_repr = repr([self._preprocess_inputs(inputs) for inputs in inputs_list])
+        # NSJail time_limit보다 먼저 남은 항목을 중단하도록 여유를 둠
+        budget = max(0.5, timeout - 1)
+        
+        return f'''
+import json
+import sys
+import time
+
+# 사용자 코드
+{user_code}
+
+# 배치 실행 로직
+_deadline = time.monotonic() + {budget!r}
+for _index, inputs in enumerate({inputs_list_repr}):
+    if time.monotonic() > _deadline:
+        _item = {{"success": False, "error": "Batch time budget exceeded", "error_type": "timeout"}}
+    else:
+        try:
+            result = main(inputs)
+            if not isinstance(result, dict):
+                raise TypeError("main() must return a dict")
+            json.dumps(result)
+            _item = {{"success": True, "result": result}}
+        except Exception as e:
+            _item = {{"success": False, "error": str(e), "error_type": "runtime"}}
+    # 사용자 코드가 줄바꿈 없이 출력했어도 결과 줄이 줄 맨 앞에서 시작하도록 개행 먼저 출력
+    sys.stdout.write("\\n{marker}" + str(_index) + ":" + json.dumps(_item, ensure_ascii=False) + "\\n")
+    sys.stdout.flush()
+'''
+    
     def _write_temp_script(self, content: str, job_id: UUID = None) -> str:
         """임시 스크립트 파일 생성"""
         filename = f"script_{job_id or 'tmp'}.py"
@@ -251,3 +449,65 @@ except Exception as e:
                 stderr=stderr,
                 job_id=job_id,
             )
+    
+    def _parse_batch_result(
+        self,
+        proc_result: subprocess.CompletedProcess,
+        execution_time: float,
+        total: int,
+        timeout: int,
+        marker: str,
+        job_id: UUID = None,
+        timed_out: bool = False,
+    ) -> ExecutionResult:
+        """
+        배치 출력을 항목별 ExecutionResult로 변환
+
+        결과 줄의 인덱스로 자리를 정하므로 순서가 어긋나지 않으며,
+        범위 밖/중복 인덱스는 무시하고 출력되지 않은 항목은 에러로 채움
+        """
+        by_index: Dict[int, ExecutionResult] = {}
+        for line in proc_result.stdout.splitlines():
+            if not line.startswith(marker):
+                continue
+            index, _, payload = line[len(marker):].partition(":")
+            try:
+                index = int(index)
+                data = json.loads(payload)
+            except ValueError:
+                continue
+            if not 0 <= index < total or index in by_index:
+                continue
+            by_index[index] = ExecutionResult(
+                success=bool(data.get("success")),
+                result=data.get("result"),
+                error=data.get("error"),
+                error_type=data.get("error_type"),
+            )
+        
+        batch = ExecutionResult(
+            success=True,
+            execution_time_ms=execution_time,
+            stderr=proc_result.stderr.strip(),
+            job_id=job_id,
+        )
+        if len(by_index) < total:
+            # NSJail time_limit 또는 인터프리터 비정상 종료 (문법 오류 등)
+            if timed_out or execution_time >= timeout * 1000:
+                missing = ExecutionResult.timeout_error(timeout, job_id)
+            else:
+                stderr = proc_result.stderr.strip()
+                missing = ExecutionResult.sandbox_error(
+                    stderr[-500:] or f"NSJail exited with code {proc_result.returncode}", job_id
+                )
+            batch.success = bool(by_index)
+            batch.error, batch.error_type = missing.error, missing.error_type
+        else:
+            missing = None
+        
+        batch.items = [
+            by_index.get(i)
+            or ExecutionResult(success=False, error=missing.error, error_type=missing.error_type)
+            for i in range(total)
+        ]
+        return batch
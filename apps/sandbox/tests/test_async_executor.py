@@ -0,0 +1,78 @@
+"""
+Async Executor Unit Tests
+
+테스트 항목:
+1. 크기 조절 세마포어: 스케일 업 시 대기 중인 작업 즉시 시작
+2. nsjail 프로세스 직접 실행 및 결과 파싱
+3. 취소 시 샌드박스 프로세스 종료
+"""
+import asyncio
+import os
+import stat
+
+import pytest
+
+from apps.sandbox.core.semaphore import ResizableSemaphore
+from apps.sandbox.nsjail.wrapper import NSJailWrapper
+
+
+def _fake_nsjail(tmp_path, body: str) -> str:
+    """인자를 무시하고 body를 실행하는 nsjail 대역 스크립트"""
+    path = tmp_path / "nsjail"
+    path.write_text(f"#!/bin/sh\n{body}\n")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_resizable_semaphore_wakes_waiters_on_resize():
+    slots = ResizableSemaphore(1)
+    await slots.acquire()
+
+    waiter = asyncio.create_task(slots.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    slots.resize(2)  # 스케일 업
+    await asyncio.wait_for(waiter, timeout=1)
+    assert slots.in_use == 2
+
+    # 스케일 다운: 실행 중인 작업이 끝나 새 크기 아래로 내려가야 다시 허용
+    slots.resize(1)
+    slots.release()
+    assert slots.locked()
+    slots.release()
+    assert not slots.locked()
+
+
+@pytest.mark.asyncio
+async def test_execute_async_parses_output(tmp_path):
+    nsjail = _fake_nsjail(tmp_path, """echo '{"success": true, "result": {"x": 1}}'""")
+    wrapper = NSJailWrapper(nsjail_path=nsjail)
+
+    result = await wrapper.execute_async("def main(inputs):\n    return {}", {}, timeout=5)
+
+    assert result.success is True
+    assert result.result == {"x": 1}
+    assert result.execution_time_ms > 0
+
+
+@pytest.mark.asyncio
+async def test_execute_async_kills_process_on_cancel(tmp_path):
+    pid_file = tmp_path / "pid"
+    nsjail = _fake_nsjail(tmp_path, f"echo $$ > {pid_file}; exec sleep 30")
+    wrapper = NSJailWrapper(nsjail_path=nsjail)
+
+    task = asyncio.create_task(wrapper.execute_async("", {}, timeout=30))
+    for _ in range(100):
+        if pid_file.exists() and pid_file.read_text().strip():
+            break
+        await asyncio.sleep(0.02)
+    pid = int(pid_file.read_text())
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
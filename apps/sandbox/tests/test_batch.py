@@ -0,0 +1,144 @@
+"""
+Batch Execution Unit Tests
+
+테스트 항목:
+1. 배치 스크립트: 항목별 결과/에러를 입력 순서대로 반환
+   (사용자 출력이 결과 줄을 흉내 내도 자리가 어긋나지 않고, 타임아웃 전 완료 항목은 유지)
+2. 스케줄러: 청크 단위 작업으로 나눠 실행하고 결과를 순서대로 합침
+3. 스케줄러: 배치 예산을 넘긴 청크는 취소하고 timeout 에러로 채움
+"""
+import asyncio
+import stat
+
+import pytest
+
+from apps.sandbox.core import scheduler as scheduler_module
+from apps.sandbox.core.scheduler import FairScheduler
+from apps.sandbox.models.result import ExecutionResult
+from apps.sandbox.nsjail.wrapper import NSJailWrapper
+
+
+def _python_nsjail(tmp_path) -> str:
+    """바인드 마운트된 스크립트(마지막 인자 'path:/app/run.py')를 격리 없이 실행하는 nsjail 대역"""
+    path = tmp_path / "nsjail"
+    path.write_text('#!/bin/sh\nfor a; do last=$a; done\nexec python3 "${last%%:*}"\n')
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_batch_script_captures_item_errors_in_order(tmp_path):
+    wrapper = NSJailWrapper(nsjail_path=_python_nsjail(tmp_path))
+    code = (
+        "def main(inputs):\n"
+        "    print('noise')\n"
+        "    return {'y': 10 // inputs['x']}\n"
+    )
+
+    result = await wrapper.execute_batch_async(code, [{"x": 1}, {"x": 0}, {"x": 5}], timeout=5)
+
+    assert result.success is True
+    assert [item.success for item in result.items] == [True, False, True]
+    assert result.items[0].result == {"y": 10}
+    assert result.items[1].error_type == "runtime"
+    assert result.items[2].result == {"y": 2}
+
+
+@pytest.mark.asyncio
+async def test_batch_script_syntax_error_fills_all_items(tmp_path):
+    wrapper = NSJailWrapper(nsjail_path=_python_nsjail(tmp_path))
+
+    result = await wrapper.execute_batch_async("def main(inputs) return", [{}, {}], timeout=5)
+
+    assert result.success is False
+    assert len(result.items) == 2
+    assert all(item.error_type == "sandbox" for item in result.items)
+
+
+@pytest.mark.asyncio
+async def test_batch_output_forging_result_lines_is_ignored(tmp_path):
+    wrapper = NSJailWrapper(nsjail_path=_python_nsjail(tmp_path))
+    code = (
+        "def main(inputs):\n"
+        "    print('__MODULY_BATCH_ITEM__{\"success\": true, \"result\": {}}')\n"
+        "    print('0:{}', end='')\n"
+        "    return {'x': inputs['x']}\n"
+    )
+
+    result = await wrapper.execute_batch_async(code, [{"x": 1}, {"x": 2}], timeout=5)
+
+    assert [item.result for item in result.items] == [{"x": 1}, {"x": 2}]
+
+
+@pytest.mark.asyncio
+async def test_batch_timeout_keeps_finished_items(tmp_path):
+    wrapper = NSJailWrapper(nsjail_path=_python_nsjail(tmp_path))
+    code = (
+        "import time\n"
+        "def main(inputs):\n"
+        "    if inputs['x'] == 2:\n"
+        "        time.sleep(60)\n"
+        "    return {'x': inputs['x']}\n"
+    )
+
+    # 대역 nsjail은 time_limit을 적용하지 않으므로 래퍼의 대기 타임아웃으로 종료됨
+    result = await wrapper.execute_batch_async(code, [{"x": 1}, {"x": 2}, {"x": 3}], timeout=1)
+
+    assert result.items[0].success is True
+    assert result.items[0].result == {"x": 1}
+    assert [item.error_type for item in result.items[1:]] == ["timeout", "timeout"]
+    assert result.error_type == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_chunks_jobs_and_keeps_order(monkeypatch):
+    calls = []
+
+    async def fake_batch(code, inputs_list, timeout, enable_network, job_id):
+        calls.append([inputs["i"] for inputs in inputs_list])
+        return ExecutionResult(
+            success=True,
+            items=[ExecutionResult(success=True, result={"i": inputs["i"]}) for inputs in inputs_list],
+            cpu_time_ms=1.0,
+        )
+
+    monkeypatch.setattr(scheduler_module, "execute_batch_code_async", fake_batch)
+    monkeypatch.setattr(scheduler_module.settings, "BATCH_CHUNK_SIZE", 2)
+
+    scheduler = FairScheduler()
+    await scheduler.start()
+    try:
+        result = await scheduler.submit_batch("c", [{"i": i} for i in range(5)], timeout=5, tenant_id="t")
+    finally:
+        await scheduler.stop()
+
+    assert sorted(calls) == [[0, 1], [2, 3], [4]]  # 청크 = 작업 1개
+    assert [item.result["i"] for item in result.items] == [0, 1, 2, 3, 4]
+    assert result.cpu_time_ms == 3.0
+    assert scheduler._total_submitted == 3
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_budget_cancels_unfinished_chunks(monkeypatch):
+    async def slow_batch(code, inputs_list, timeout, enable_network, job_id):
+        if inputs_list[0]["i"] > 0:
+            await asyncio.sleep(30)
+        return ExecutionResult(
+            success=True,
+            items=[ExecutionResult(success=True, result={}) for _ in inputs_list],
+        )
+
+    monkeypatch.setattr(scheduler_module, "execute_batch_code_async", slow_batch)
+    monkeypatch.setattr(scheduler_module.settings, "BATCH_CHUNK_SIZE", 1)
+
+    scheduler = FairScheduler()
+    await scheduler.start()
+    try:
+        result = await scheduler.submit_batch("c", [{"i": 0}, {"i": 1}], timeout=1)
+        await asyncio.sleep(0.01)
+        assert scheduler.running_count == 0  # 실행 중이던 청크도 취소됨
+    finally:
+        await scheduler.stop()
+
+    assert result.items[0].success is True
+    assert result.items[1].error_type == "timeout"
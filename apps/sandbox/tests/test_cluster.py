@@ -0,0 +1,180 @@
+"""
+Cluster Mode Unit Tests
+
+테스트 항목:
+1. 클러스터 전체 테넌트 토큰이 없으면 작업을 꺼내지 않음
+2. 유휴 레플리카가 공유 큐의 작업을 가져와 실행하고 결과 전달
+3. 바쁜 레플리카가 오래 대기한 작업을 양보하고 원격 결과로 응답
+4. 클러스터 메트릭 합산
+"""
+import asyncio
+
+import pytest
+
+from apps.sandbox.core import scheduler as scheduler_module
+from apps.sandbox.core.cluster import aggregate_metrics, decode_job, encode_job
+from apps.sandbox.core.scheduler import FairScheduler
+from apps.sandbox.models.job import Job, Priority
+from apps.sandbox.models.result import ExecutionResult
+
+
+class FakeCoordinator:
+    """Redis 없이 한 프로세스 안에서 공유 상태를 흉내내는 조율자"""
+
+    def __init__(self, replica_id="local", tenant_limit=3, shared=None):
+        self.replica_id = replica_id
+        self.tenant_limit = tenant_limit
+        self.shared = shared if shared is not None else {"leases": {}, "steal": [], "results": {}}
+        self.snapshots = []
+
+    async def acquire_tenant(self, tenant_id, lease_id, ttl):
+        leases = self.shared["leases"].setdefault(tenant_id, set())
+        if len(leases) >= self.tenant_limit:
+            return False
+        leases.add(lease_id)
+        return True
+
+    async def release_tenant(self, tenant_id, lease_id):
+        self.shared["leases"].get(tenant_id, set()).discard(lease_id)
+
+    def idle_peer_slots(self):
+        return sum(
+            s["current_workers"] - s["running_count"]
+            for s in self.snapshots
+            if s["replica_id"] != self.replica_id and s["queue_size"] == 0
+        )
+
+    @property
+    def queue_size(self):
+        return sum(s["queue_size"] for s in self.snapshots)
+
+    async def offer(self, priority, payload):
+        self.shared["steal"].append(payload)
+
+    async def reclaim(self, priority, payload):
+        if payload in self.shared["steal"]:
+            self.shared["steal"].remove(payload)
+            return True
+        return False
+
+    async def requeue(self, priority, payload):
+        self.shared["steal"].insert(0, payload)
+
+    async def steal(self):
+        return self.shared["steal"].pop(0) if self.shared["steal"] else None
+
+    async def publish_result(self, job_id, result):
+        self.shared["results"][str(job_id)] = result
+
+    async def wait_result(self, job_id, timeout):
+        deadline = asyncio.get_running_loop().time() + timeout
+        while asyncio.get_running_loop().time() < deadline:
+            if str(job_id) in self.shared["results"]:
+                return self.shared["results"].pop(str(job_id))
+            await asyncio.sleep(0.01)
+        return None
+
+
+def _scheduler(coordinator) -> FairScheduler:
+    scheduler = FairScheduler()
+    scheduler._running = True
+    scheduler._cluster = coordinator
+    return scheduler
+
+
+async def _fake_execute(code, inputs, timeout, enable_network, job_id):
+    return ExecutionResult(success=True, result={"echo": inputs}, job_id=job_id)
+
+
+@pytest.mark.asyncio
+async def test_cluster_tenant_token_limits_across_replicas():
+    """다른 레플리카가 토큰을 모두 쓰고 있으면 로컬에 여유가 있어도 대기"""
+    coordinator = FakeCoordinator(tenant_limit=1)
+    coordinator.shared["leases"]["tenant_a"] = {"remote-job"}
+    scheduler = _scheduler(coordinator)
+
+    job_a = Job(priority=Priority.NORMAL, code="a", tenant_id="tenant_a")
+    await scheduler._buckets[Priority.NORMAL].add(job_a)
+
+    assert await scheduler._get_next_job() is None
+    assert scheduler.queue_size == 1  # 큐에 되돌려 놓음
+
+    # 토큰 반환 후 재시도 간격이 지나면 실행
+    await coordinator.release_tenant("tenant_a", "remote-job")
+    scheduler._tenant_blocked_until.clear()
+    assert await scheduler._get_next_job() is job_a
+    assert coordinator.shared["leases"]["tenant_a"] == {str(job_a.job_id)}
+
+
+@pytest.mark.asyncio
+async def test_idle_replica_steals_and_publishes_result(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "execute_code_async", _fake_execute)
+    coordinator = FakeCoordinator(replica_id="idle")
+    scheduler = _scheduler(coordinator)
+
+    job = Job(priority=Priority.HIGH, code="x", inputs={"n": 1}, tenant_id="tenant_a")
+    await coordinator.offer(job.priority, encode_job(job))
+
+    loop = asyncio.get_running_loop()
+    await scheduler._slots.acquire()  # 워커 루프처럼 슬롯 확보 후 스틸
+    assert await scheduler._try_steal(loop) is True
+    result = await coordinator.wait_result(job.job_id, timeout=2)
+
+    assert result.success is True
+    assert result.result == {"echo": {"n": 1}}
+    assert scheduler._total_stolen == 1
+    assert scheduler.running_count == 0
+    assert scheduler._slots.in_use == 0  # 작업 종료 시 슬롯 반환
+    assert coordinator.shared["leases"]["tenant_a"] == set()  # 토큰 반환
+
+
+@pytest.mark.asyncio
+async def test_busy_replica_offloads_waiting_job(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "execute_code_async", _fake_execute)
+    monkeypatch.setattr(scheduler_module.settings, "CLUSTER_STEAL_AFTER", 0.0)
+
+    shared = {"leases": {}, "steal": [], "results": {}}
+    busy = _scheduler(FakeCoordinator(replica_id="busy", shared=shared))
+    idle = _scheduler(FakeCoordinator(replica_id="idle", shared=shared))
+
+    # busy: 워커 모두 사용 중, idle: 유휴 워커 2개
+    busy._running_count = busy._current_workers
+    busy._cluster.snapshots = [
+        {"replica_id": "busy", "queue_size": 1, "current_workers": 2, "running_count": 2},
+        {"replica_id": "idle", "queue_size": 0, "current_workers": 2, "running_count": 0},
+    ]
+
+    loop = asyncio.get_running_loop()
+    job = Job(priority=Priority.NORMAL, code="x", inputs={"n": 2}, tenant_id="t")
+    job.future = loop.create_future()
+    await busy._buckets[Priority.NORMAL].add(job)
+
+    await busy._offload_waiting_jobs()
+    await asyncio.sleep(0)  # 양보 태스크가 공유 큐에 올릴 때까지
+    assert busy.queue_size == 0
+    assert len(shared["steal"]) == 1
+    await idle._slots.acquire()
+    assert await idle._try_steal(loop) is True
+
+    result = await asyncio.wait_for(job.future, timeout=2)
+    assert result.result == {"echo": {"n": 2}}
+    assert busy._total_offloaded == 1
+    assert idle._total_stolen == 1
+
+
+def test_job_payload_roundtrip_and_aggregation():
+    job = Job(priority=Priority.LOW, code="c", inputs={"a": [1]}, timeout=5, tenant_id="t")
+    restored = decode_job(encode_job(job))
+    assert (restored.job_id, restored.priority, restored.inputs, restored.timeout) == (
+        job.job_id, Priority.LOW, {"a": [1]}, 5,
+    )
+    assert encode_job(Job(priority=Priority.LOW, inputs={"x": object()})) is None
+
+    metrics = aggregate_metrics([
+        {"queue_size": 2, "running_count": 1, "current_workers": 2},
+        {"queue_size": 3, "running_count": 2, "current_workers": 4, "total_stolen": 1},
+    ])
+    assert metrics["replicas"] == 2
+    assert metrics["queue_size"] == 5
+    assert metrics["current_workers"] == 6
+    assert metrics["total_stolen"] == 1
@@ -0,0 +1,98 @@
+"""
+Execution History Unit Tests
+
+테스트 항목:
+1. EWMA 평균이 최근 실행을 반영
+2. p95 기준 우선순위 추천
+3. O(1) LRU 제거
+4. 공유 저장소에서 불러온 기록으로 즉시 스케줄링
+"""
+import pytest
+
+from apps.sandbox.core.history import ExecutionHistory, ExecutionStats
+from apps.sandbox.models.job import Priority
+
+
+def test_ewma_tracks_recent_runs():
+    """오래된 느린 실행보다 최근 빠른 실행을 더 반영"""
+    stats = ExecutionStats()
+    stats.record(10.0, alpha=0.5)
+    for _ in range(5):
+        stats.record(0.1, alpha=0.5)
+
+    assert stats.avg_time < 0.5
+    assert stats.max_time == 10.0
+    assert stats.total_executions == 6
+
+
+def test_priority_uses_p95_instead_of_mean():
+    """평균은 빠르지만 꼬리 지연이 긴 코드는 HIGH를 받지 않음"""
+    history = ExecutionHistory()
+    code = "def main(inputs):\n    return {}"
+
+    for _ in range(18):
+        history.record(code, 0.1)
+    history.record(code, 3.0)
+    history.record(code, 3.0)
+
+    stats = history.get_stats(code)
+    assert stats.p50_time == pytest.approx(0.1)
+    assert history.get_avg_time(code) < ExecutionHistory.SLOW_THRESHOLD
+    assert history.get_predicted_time(code) == pytest.approx(3.0)
+    assert history.suggest_priority(code) == Priority.LOW
+
+    fast = "def main(inputs):\n    return {'fast': True}"
+    history.record(fast, 0.05)
+    assert history.suggest_priority(fast) == Priority.HIGH
+    assert history.suggest_priority("unknown", fallback=Priority.NORMAL) == Priority.NORMAL
+
+
+def test_lru_eviction_keeps_recently_used():
+    history = ExecutionHistory(max_entries=2)
+    history.record("a", 0.1)
+    history.record("b", 0.1)
+    history.get_stats("a")  # a를 최근 사용으로
+    history.record("c", 0.1)
+
+    assert history.total_entries == 2
+    assert history.get_stats("b") is None
+    assert history.get_stats("a") is not None
+
+
+class FakeStore:
+    """공유 저장소 대역 (다른 레플리카가 기록해 둔 상태)"""
+
+    def __init__(self, stats_by_hash):
+        self.stats_by_hash = stats_by_hash
+        self.loads = 0
+
+    async def load(self, code_hash):
+        self.loads += 1
+        return self.stats_by_hash.get(code_hash)
+
+    async def record(self, code_hash, execution_time):
+        pass
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_new_replica_uses_shared_history():
+    code = "def main(inputs):\n    return {'slow': True}"
+    shared = ExecutionStats()
+    for _ in range(10):
+        shared.record(5.0)
+
+    store = FakeStore({ExecutionHistory._hash_code(code): shared})
+    history = ExecutionHistory(store=store)
+
+    assert history.suggest_priority(code) == Priority.NORMAL  # 불러오기 전
+    await history.prefetch(code)
+    assert history.suggest_priority(code) == Priority.LOW
+
+    # 재조회 주기 내에는 다시 조회하지 않음 (기록 없는 코드 포함)
+    await history.prefetch(code)
+    await history.prefetch("unknown")
+    await history.prefetch("unknown")
+    assert store.loads == 2
@@ -0,0 +1,96 @@
+"""
+Result Cache Unit Tests
+
+테스트 항목:
+1. 캐시 키: 입력 순서와 무관, 네트워크 허용 작업 제외
+2. TTL 만료 / LRU 크기 제한
+3. 스케줄러: 캐시 히트 시 큐를 거치지 않음
+"""
+import asyncio
+
+import pytest
+
+from apps.sandbox.core.result_cache import ResultCache
+from apps.sandbox.core.scheduler import FairScheduler
+from apps.sandbox.models.result import ExecutionResult
+
+CODE = "def main(inputs):\n    return {'v': inputs['a'] + inputs['b']}"
+
+
+def _ok(value) -> ExecutionResult:
+    return ExecutionResult(success=True, result={"v": value}, execution_time_ms=12.0)
+
+
+def test_cache_key_is_canonical():
+    """입력 dict 순서가 달라도 같은 키, 코드/입력이 다르면 다른 키"""
+    key1 = ResultCache.make_key(CODE, {"a": 1, "b": 2})
+    key2 = ResultCache.make_key(CODE, {"b": 2, "a": 1})
+
+    assert key1 == key2
+    assert key1 != ResultCache.make_key(CODE, {"a": 1, "b": 3})
+    assert key1 != ResultCache.make_key(CODE + "\n", {"a": 1, "b": 2})
+    assert ResultCache.make_key(CODE, {"a": 1}, enable_network=True) is None
+    assert ResultCache.make_key(CODE, {"a": object()}) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_miss_and_failed_results():
+    cache = ResultCache(max_entries=10, ttl=60, redis_url="")
+    key = ResultCache.make_key(CODE, {"a": 1, "b": 2})
+
+    assert await cache.get(key) is None
+    await cache.set(key, ExecutionResult(success=False, error="boom"))
+    assert await cache.get(key) is None  # 실패 결과는 저장하지 않음
+
+    await cache.set(key, _ok(3))
+    cached = await cache.get(key)
+    assert cached.cached is True
+    assert cached.result == {"v": 3}
+
+    # 반환된 결과를 수정해도 캐시에 영향 없음
+    cached.result["v"] = 99
+    assert (await cache.get(key)).result == {"v": 3}
+
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_ttl_and_lru_eviction():
+    cache = ResultCache(max_entries=2, ttl=60, redis_url="")
+    await cache.set("a", _ok(1))
+    await cache.set("b", _ok(2))
+    await cache.get("a")  # a를 최근 사용으로
+    await cache.set("c", _ok(3))
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert cache.total_entries == 2
+
+    expired = ResultCache(max_entries=2, ttl=0, redis_url="")
+    await expired.set("a", _ok(1))
+    assert await expired.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_cache_hit_skips_queue():
+    """캐시 히트 요청은 버킷에 들어가지 않고 즉시 반환"""
+    scheduler = FairScheduler()
+    scheduler._running = True  # 워커 루프 없이 submit 경로만 검증
+    scheduler._result_cache = ResultCache(max_entries=10, ttl=60, redis_url="")
+
+    key = ResultCache.make_key(CODE, {"a": 1, "b": 2})
+    await scheduler._result_cache.set(key, _ok(3))
+
+    result = await asyncio.wait_for(
+        scheduler.submit(CODE, {"b": 2, "a": 1}, cacheable=True), timeout=1
+    )
+
+    assert result.cached is True
+    assert result.result == {"v": 3}
+    assert scheduler.queue_size == 0
+    assert scheduler._total_submitted == 0
+
+    metrics = scheduler.get_metrics()
+    assert metrics["cache_hits"] == 1
+    assert metrics["cache_entries"] == 1
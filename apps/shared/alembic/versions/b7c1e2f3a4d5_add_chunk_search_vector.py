@@ -0,0 +1,76 @@
+"""add stored search_vector to document_chunks
+
+Revision ID: b7c1e2f3a4d5
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c1e2f3a4d5"
+down_revision: Union[str, Sequence[str], None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 지식 베이스별 텍스트 검색 설정 (기존 검색과 동일하게 english 기본값)
+    op.add_column(
+        "knowledge_bases",
+        sa.Column(
+            "text_search_config",
+            sa.String(length=64),
+            server_default="english",
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "document_chunks",
+        sa.Column(
+            "text_search_config",
+            postgresql.REGCONFIG(),
+            server_default="english",
+            nullable=False,
+        ),
+    )
+    # 저장형 생성 컬럼 추가 (기존 청크 전체를 한 번 다시 씀)
+    op.add_column(
+        "document_chunks",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector(text_search_config, "
+                "content || ' ' || COALESCE(CAST(metadata->'keywords' AS TEXT), ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    # 대용량 테이블 쓰기 차단을 피하기 위해 CONCURRENTLY로 인덱스 생성
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_document_chunks_search_vector",
+            "document_chunks",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_document_chunks_search_vector",
+        table_name="document_chunks",
+        postgresql_using="gin",
+    )
+    op.drop_column("document_chunks", "search_vector")
+    op.drop_column("document_chunks", "text_search_config")
+    op.drop_column("knowledge_bases", "text_search_config")
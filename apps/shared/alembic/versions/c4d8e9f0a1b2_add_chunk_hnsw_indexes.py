@@ -0,0 +1,60 @@
+"""add per-dimension HNSW indexes to document_chunks
+
+Revision ID: c4d8e9f0a1b2
+Revises: b7c1e2f3a4d5
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d8e9f0a1b2"
+down_revision: Union[str, Sequence[str], None] = "b7c1e2f3a4d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 임베딩 차원 -> (캐스트 타입, 연산자 클래스)
+# apps/shared/services/vector_search.py의 INDEXED_EMBEDDING_DIMENSIONS와 맞춰야 함
+HNSW_INDEXES = {
+    768: ("vector", "vector_cosine_ops"),
+    1024: ("vector", "vector_cosine_ops"),
+    1536: ("vector", "vector_cosine_ops"),
+    3072: ("halfvec", "halfvec_cosine_ops"),
+}
+
+
+def _index_name(dimension: int) -> str:
+    return f"ix_document_chunks_embedding_hnsw_{dimension}"
+
+
+def upgrade() -> None:
+    # 대용량 테이블 쓰기 차단을 피하기 위해 CONCURRENTLY로 인덱스 생성
+    with op.get_context().autocommit_block():
+        # 작은 지식 베이스는 이 인덱스로 필터 후 정확 검색
+        op.create_index(
+            "ix_document_chunks_knowledge_base_id",
+            "document_chunks",
+            ["knowledge_base_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # 차원 없는 vector 컬럼은 직접 인덱싱할 수 없으므로 차원별 부분 표현식 인덱스 생성
+        for dimension, (type_name, opclass) in HNSW_INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {_index_name(dimension)} "
+                f"ON document_chunks USING hnsw "
+                f"((embedding::{type_name}({dimension})) {opclass}) "
+                f"WITH (m = 16, ef_construction = 64) "
+                f"WHERE vector_dims(embedding) = {dimension}"
+            )
+
+
+def downgrade() -> None:
+    for dimension in HNSW_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {_index_name(dimension)}")
+    op.drop_index(
+        "ix_document_chunks_knowledge_base_id", table_name="document_chunks"
+    )
@@ -59,12 +59,15 @@ celery_app.conf.update(
     task_soft_time_limit=540,  # 소프트 타임아웃 (9분)
     # 워커 설정
     worker_prefetch_multiplier=1,  # [FIX] 공정한 작업 분배를 위해 1로 설정 (Long-running task 최적화)
-    worker_concurrency=100,  # [NEW] gevent pool: 높은 동시성 (4 → 100)
+    worker_concurrency=100,  # [NEW] 높은 동시성 (4 → 100, 각 엔트리포인트의 --concurrency가 우선)
     # 결과 설정
     result_expires=3600,  # 결과 만료 시간 (1시간)
     # [NEW] 메모리 누수 방지 설정 (워커 재시작)
-    worker_max_tasks_per_child=1000,  # [UPDATE] gevent: 1000개 태스크 처리 후 재시작
-    worker_max_memory_per_child=500000,  # [UPDATE] gevent: 500MB 초과 시 재시작 (단일 프로세스)
+    # prefork pool(log_system 워커)의 자식 프로세스에만 적용됨
+    # workflow 워커(threads pool)는 자식 프로세스가 없어 무시되므로
+    # apps/workflow_engine/memory_guard.py가 RSS 한도를 넘으면 워커를 재시작함
+    worker_max_tasks_per_child=1000,  # 1000개 태스크 처리 후 자식 프로세스 재시작
+    worker_max_memory_per_child=500000,  # 자식 프로세스 500MB 초과 시 재시작
     # Heartbeat 설정 (LLM/Code 노드 실행 시 안정성 향상)
     broker_heartbeat=120,  # 브로커 heartbeat 간격 (기본 60초 → 120초)
     worker_send_task_events=True,  # 워커 이벤트 전송
@@ -79,7 +82,7 @@ celery_app.conf.update(
 
 
 # [FIX] 워커 프로세스 초기화 시 DB 커넥션 풀 리셋
-# gevent pool은 단일 프로세스지만 greenlet 간 DB 연결 공유 이슈 방지
+# prefork 자식 프로세스가 부모의 DB 연결을 공유하지 않도록 방지
 from celery.signals import worker_process_init  # noqa: E402
 
 
@@ -90,7 +93,7 @@ def init_worker_process(**kwargs):
     1. .env 환경 변수를 다시 로드 (override=True)
     2. 상속받은 SQL Engine의 커넥션 풀 폐기 (DB 연결 초기화)
 
-    Note: gevent pool은 단일 프로세스지만 초기화 시 DB 연결 리셋 필요
+    Note: prefork(자식 프로세스마다)/solo pool에서만 발생하며 threads pool에서는 호출되지 않습니다.
     """
     import os
     from pathlib import Path
@@ -5,8 +5,18 @@ from typing import List, Optional
 
 from apps.shared.db.base import Base
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, REGCONFIG, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -32,6 +42,10 @@ class KnowledgeBase(Base):
     similarity_threshold: Mapped[float] = mapped_column(
         Float, default=0.7, nullable=False
     )
+    # 키워드 검색용 PostgreSQL 텍스트 검색 설정 (english: 어간 추출, simple: 한국어 등 공백 기준)
+    text_search_config: Mapped[str] = mapped_column(
+        String(64), default="english", server_default="english", nullable=False
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
@@ -121,6 +135,13 @@ class Document(Base):
     )
 
 
+# 키워드 검색 대상 (본문 + 추출 키워드), 청크의 text_search_config로 토큰화
+CHUNK_SEARCH_VECTOR_SQL = (
+    "to_tsvector(text_search_config, "
+    "content || ' ' || COALESCE(CAST(metadata->'keywords' AS TEXT), ''))"
+)
+
+
 class DocumentChunk(Base):
     """
     문서 청크 모델 (Vector Store)
@@ -128,6 +149,16 @@ class DocumentChunk(Base):
     """
 
     __tablename__ = "document_chunks"
+    __table_args__ = (
+        # [PERF] 키워드 검색이 청크마다 to_tsvector를 다시 계산하지 않도록 GIN 인덱스 사용
+        Index(
+            "ix_document_chunks_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        # [PERF] 벡터 검색용 HNSW 인덱스는 차원별 부분 표현식 인덱스라 마이그레이션에서만 관리
+        # (c4d8e9f0a1b2, apps/shared/services/vector_search.py 참고)
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False
@@ -138,13 +169,13 @@ class DocumentChunk(Base):
     )
     # 바로 검색 가능하도록 성능 최적화를 위해 추가함
     knowledge_base_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("knowledge_bases.id"), nullable=False
+        ForeignKey("knowledge_bases.id"), nullable=False, index=True
     )
 
     # 실제 검색될 텍스트 내용
     content: Mapped[str] = mapped_column(Text, nullable=False)
 
-    # 벡터 데이터
+    # 벡터 데이터 (모델마다 차원이 달라 차원 없이 저장, 인덱스는 차원별로 생성)
     embedding: Mapped[list] = mapped_column(Vector(), nullable=False)
 
     # 문서 내 순서 (나중에 앞뒤 문맥 가져올 때 사용)
@@ -158,6 +189,15 @@ class DocumentChunk(Base):
         "metadata", JSONB, default={}, nullable=False
     )
 
+    # 키워드 검색 설정 (지식 베이스 설정을 복사, 변경 시 search_vector 재생성)
+    text_search_config: Mapped[str] = mapped_column(
+        REGCONFIG, default="english", server_default="english", nullable=False
+    )
+    # [PERF] 저장형 생성 컬럼 (INSERT/UPDATE 시에만 계산)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed(CHUNK_SEARCH_VECTOR_SQL, persisted=True)
+    )
+
     # Relationships
     document: Mapped["Document"] = relationship("Document", back_populates="chunks")
 
@@ -20,8 +20,8 @@ class Schedule(Base):
     - deployment_id는 UNIQUE 제약 조건
 
     동작 방식:
-    - 서버 시작 시: DB에서 모든 활성 스케줄 로드 → APScheduler 메모리 등록
-    - 배포 생성 시: Schedule 레코드 생성 → APScheduler에 즉시 등록
+    - 리더 선출 시: DB에서 모든 활성 스케줄 로드 → SchedulerService 힙 등록
+    - 배포 생성 시: Schedule 레코드 생성 → SchedulerService에 즉시 등록
     - 배포 삭제 시: ON DELETE CASCADE로 자동 삭제
     """
 
@@ -1,7 +1,12 @@
+import asyncio
+import importlib.util
 import os
+import weakref
+from typing import Any, Callable, Optional, TypeVar
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 # 환경변수에서 개별 DB 설정 가져오기
 DB_HOST = os.getenv("DB_HOST", "localhost")
@@ -12,6 +17,18 @@ DB_NAME = os.getenv("DB_NAME", "moduly_local")
 
 # DATABASE_URL 구성
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+ASYNC_DATABASE_URL = (
+    f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+)
+
+# [PERF] 비동기 엔진 설정 (워크플로우 엔진 hot path 전용)
+# asyncpg가 설치되지 않은 환경에서는 자동으로 비활성화되어 동기 세션을 사용합니다.
+ASYNC_DB_ENABLED = (
+    os.getenv("ASYNC_DB_ENABLED", "true").lower() == "true"
+    and importlib.util.find_spec("asyncpg") is not None
+)
+ASYNC_DB_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", 10))
+ASYNC_DB_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", 20))
 
 # SQLAlchemy 엔진 생성
 engine = create_engine(
@@ -26,6 +43,84 @@ engine = create_engine(
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# asyncpg 커넥션은 생성된 이벤트 루프에 묶이므로 루프별로 엔진을 만듭니다.
+# (Celery 워크플로우 워커는 프로세스 공용 루프를 쓰므로 풀이 태스크 간에 재사용됨)
+_async_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = (
+    weakref.WeakKeyDictionary()
+)
+
+T = TypeVar("T")
+
+
+def get_async_engine() -> AsyncEngine:
+    """현재 실행 중인 이벤트 루프의 비동기 엔진 반환 (없으면 생성)"""
+    loop = asyncio.get_running_loop()
+    async_engine = _async_engines.get(loop)
+    if async_engine is None:
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            echo=False,
+            pool_size=ASYNC_DB_POOL_SIZE,
+            max_overflow=ASYNC_DB_MAX_OVERFLOW,
+            pool_timeout=60,
+            pool_pre_ping=True,
+        )
+        _async_engines[loop] = async_engine
+    return async_engine
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    """
+    비동기 세션 생성 (태스크 단위로 생성 후 닫아야 함)
+    `async with AsyncSessionLocal() as session:` 형태로 사용합니다.
+    """
+    return AsyncSession(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def dispose_async_engine() -> None:
+    """
+    현재 이벤트 루프의 비동기 엔진 커넥션 풀 정리
+    [FIX] Celery 태스크 종료 시 루프를 닫기 전에 호출해야 커넥션이 누수되지 않음
+    """
+    loop = asyncio.get_running_loop()
+    async_engine = _async_engines.pop(loop, None)
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+async def run_with_session(
+    fn: Callable[..., T],
+    *args: Any,
+    session_factory: Optional[Callable[[], AsyncSession]] = None,
+    fallback_db: Optional[Session] = None,
+    **kwargs: Any,
+) -> T:
+    """
+    fn(session, *args, **kwargs)을 DB 세션과 함께 실행합니다.
+
+    - session_factory가 있으면 풀에서 태스크 전용 AsyncSession을 받아 run_sync로 실행합니다.
+      I/O는 asyncpg로 처리되어 이벤트 루프를 막지 않고, 병렬 노드끼리 세션을 공유하지 않습니다.
+    - 없으면 기존 동기 세션(fallback_db, 없으면 임시 SessionLocal)으로 실행합니다.
+
+    fn은 기존 동기 Session API로 작성하면 되며, 세션이 닫힌 뒤에도 쓸 수 있는 값을 반환해야 합니다.
+    """
+    if session_factory is not None:
+        async with session_factory() as session:
+            return await session.run_sync(fn, *args, **kwargs)
+
+    if fallback_db is not None:
+        return fn(fallback_db, *args, **kwargs)
+
+    db = SessionLocal()
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
 
 # FastAPI 의존성 주입용 함수
 def get_db():
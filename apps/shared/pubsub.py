@@ -3,11 +3,25 @@ Redis Pub/Sub 유틸리티
 
 워크플로우 실행 상태를 실시간으로 스트리밍하기 위한 Pub/Sub 헬퍼 함수들입니다.
 Gateway와 Workflow-Engine 간 실시간 통신에 사용됩니다.
+
+[PERF] 비동기 발행
+- 이벤트 루프마다 커넥션 풀을 가진 클라이언트 하나를 재사용 (루프가 살아있는 동안 유지)
+- 이벤트를 WORKFLOW_EVENT_BATCH_DELAY_MS 동안 모아 파이프라인 한 번으로 전송
+  (workflow_finish/error는 즉시 전송, 발행 순서는 유지)
+
+전송 방식 (WORKFLOW_EVENT_TRANSPORT)
+- pubsub (기본): PUBLISH workflow:{run_id}
+- stream: XADD workflow:{run_id}:events (MAXLEN ~, TTL) - 구독 전 이벤트도 재생 가능
+- both: 둘 다 발행 (구독은 stream 사용, 전환 기간용)
 """
 
+import asyncio
 import json
+import logging
 import os
-from typing import Any, Dict, Generator, Optional
+import time
+import weakref
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
 import redis
 import redis.asyncio as aioredis  # [NEW] 비동기 Redis 클라이언트
@@ -24,25 +38,174 @@ if REDIS_PASSWORD:
 else:
     REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
 
+# 커넥션 풀 설정
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))  # 초
+
+# 이벤트 발행 설정
+WORKFLOW_EVENT_TRANSPORT = os.getenv("WORKFLOW_EVENT_TRANSPORT", "pubsub").lower()
+WORKFLOW_EVENT_BATCH_DELAY_MS = float(os.getenv("WORKFLOW_EVENT_BATCH_DELAY_MS", "5"))  # 0이면 즉시 전송
+WORKFLOW_EVENT_BATCH_SIZE = int(os.getenv("WORKFLOW_EVENT_BATCH_SIZE", "64"))
+WORKFLOW_EVENT_STREAM_MAXLEN = int(os.getenv("WORKFLOW_EVENT_STREAM_MAXLEN", "1000"))
+WORKFLOW_EVENT_STREAM_TTL = int(os.getenv("WORKFLOW_EVENT_STREAM_TTL", "3600"))  # 초
+WORKFLOW_EVENT_READ_BLOCK_MS = int(os.getenv("WORKFLOW_EVENT_READ_BLOCK_MS", "5000"))
+
+# 이 이벤트 이후로는 구독자가 종료하므로 지연 없이 바로 전송
+TERMINAL_EVENT_TYPES = ("workflow_finish", "error")
+
+logger = logging.getLogger(__name__)
+
 # Redis 클라이언트 (지연 초기화)
 _redis_client: Optional[redis.Redis] = None
-_async_redis_client: Optional[aioredis.Redis] = None  # [NEW] 비동기 클라이언트
+# [PERF] 이벤트 루프별 비동기 클라이언트/발행기 (비동기 커넥션은 만든 루프에서만 사용 가능)
+_async_redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aioredis.Redis]" = (
+    weakref.WeakKeyDictionary()
+)
+_event_publishers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _EventPublisher]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def get_redis_client() -> redis.Redis:
     """Redis 클라이언트 싱글톤 반환 (동기)"""
     global _redis_client
     if _redis_client is None:
-        _redis_client = redis.from_url(REDIS_URL)
+        _redis_client = redis.from_url(
+            REDIS_URL,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+        )
     return _redis_client
 
 
 def get_async_redis_client() -> aioredis.Redis:
-    """Redis 클라이언트 싱글톤 반환 (비동기)"""
-    global _async_redis_client
-    if _async_redis_client is None:
-        _async_redis_client = aioredis.from_url(REDIS_URL)
-    return _async_redis_client
+    """
+    현재 이벤트 루프의 Redis 클라이언트 반환 (비동기)
+
+    같은 루프에서 실행되는 태스크들은 커넥션 풀을 공유합니다.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_redis_clients.get(loop)
+    if client is None:
+        client = aioredis.from_url(
+            REDIS_URL,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+        )
+        _async_redis_clients[loop] = client
+    return client
+
+
+def _use_pubsub() -> bool:
+    return WORKFLOW_EVENT_TRANSPORT in ("pubsub", "both")
+
+
+def _use_stream() -> bool:
+    return WORKFLOW_EVENT_TRANSPORT in ("stream", "both")
+
+
+def _channel(workflow_run_id: str) -> str:
+    return f"workflow:{workflow_run_id}"
+
+
+def _stream_key(workflow_run_id: str) -> str:
+    return f"workflow:{workflow_run_id}:events"
+
+
+def _encode_event(event_type: str, data: Dict[str, Any]) -> str:
+    return json.dumps(
+        {
+            "type": event_type,
+            "data": data,
+        }
+    )
+
+
+def _queue_event(pipe, workflow_run_id: str, message: str) -> None:
+    """파이프라인에 이벤트 전송 명령 추가 (동기/비동기 파이프라인 공용)"""
+    if _use_pubsub():
+        pipe.publish(_channel(workflow_run_id), message)
+    if _use_stream():
+        key = _stream_key(workflow_run_id)
+        pipe.xadd(
+            key,
+            {"event": message},
+            maxlen=WORKFLOW_EVENT_STREAM_MAXLEN,
+            approximate=True,
+        )
+        pipe.expire(key, WORKFLOW_EVENT_STREAM_TTL)
+
+
+class _EventPublisher:
+    """
+    이벤트 루프 하나의 이벤트 배치 발행기
+
+    publish()는 이벤트를 버퍼에 넣고, 첫 이벤트 후 delay가 지나거나 버퍼가 가득 차거나
+    종료 이벤트가 들어오면 쌓인 이벤트를 파이프라인 한 번으로 순서대로 전송합니다.
+    """
+
+    def __init__(self, client: aioredis.Redis, delay: float, max_batch: int):
+        self._client = client
+        self._delay = delay
+        self._max_batch = max(1, max_batch)
+        self._buffer: List[Tuple[str, str]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock = asyncio.Lock()  # 배치 간 전송 순서 보장
+        self._pending: "set[asyncio.Task]" = set()
+
+    async def publish(self, workflow_run_id: str, message: str, immediate: bool) -> None:
+        self._buffer.append((workflow_run_id, message))
+        if immediate or self._delay <= 0 or len(self._buffer) >= self._max_batch:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._delay, self._flush_in_background
+            )
+
+    def _flush_in_background(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self._flush_logged())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _flush_logged(self) -> None:
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"[PubSub] 이벤트 배치 발행 실패: {e}")
+
+    async def flush(self) -> None:
+        """버퍼의 이벤트를 모두 전송"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            pipe = self._client.pipeline(transaction=False)
+            for workflow_run_id, message in batch:
+                _queue_event(pipe, workflow_run_id, message)
+            await pipe.execute()
+
+    async def drain(self) -> None:
+        """예약된 전송까지 모두 완료될 때까지 대기"""
+        await self.flush()
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+
+def _get_event_publisher() -> _EventPublisher:
+    loop = asyncio.get_running_loop()
+    publisher = _event_publishers.get(loop)
+    if publisher is None:
+        publisher = _EventPublisher(
+            get_async_redis_client(),
+            delay=WORKFLOW_EVENT_BATCH_DELAY_MS / 1000,
+            max_batch=WORKFLOW_EVENT_BATCH_SIZE,
+        )
+        _event_publishers[loop] = publisher
+    return publisher
 
 
 def publish_workflow_event(
@@ -56,15 +219,9 @@ def publish_workflow_event(
         event_type: 이벤트 타입 (node_start, node_finish, workflow_finish, error 등)
         data: 이벤트 데이터
     """
-    client = get_redis_client()
-    channel = f"workflow:{workflow_run_id}"
-    message = json.dumps(
-        {
-            "type": event_type,
-            "data": data,
-        }
-    )
-    client.publish(channel, message)
+    pipe = get_redis_client().pipeline(transaction=False)
+    _queue_event(pipe, workflow_run_id, _encode_event(event_type, data))
+    pipe.execute()
 
 
 async def publish_workflow_event_async(
@@ -73,60 +230,108 @@ async def publish_workflow_event_async(
     """
     워크플로우 이벤트 발행 (비동기)
     [PERF] 이벤트 루프 차단을 방지하기 위해 비동기 Redis 클라이언트 사용
+    [PERF] 짧은 지연 동안 모아서 파이프라인으로 전송 (종료 이벤트는 즉시 전송)
 
     Args:
         workflow_run_id: 워크플로우 실행 ID
         event_type: 이벤트 타입
         data: 이벤트 데이터
     """
-    client = get_async_redis_client()
-    channel = f"workflow:{workflow_run_id}"
-    message = json.dumps(
-        {
-            "type": event_type,
-            "data": data,
-        }
+    await _get_event_publisher().publish(
+        workflow_run_id,
+        _encode_event(event_type, data),
+        immediate=event_type in TERMINAL_EVENT_TYPES,
     )
-    # await로 비동기 발행
-    await client.publish(channel, message)
+
+
+async def flush_workflow_events() -> None:
+    """현재 이벤트 루프에서 아직 전송되지 않은 이벤트를 모두 전송"""
+    publisher = _event_publishers.get(asyncio.get_running_loop())
+    if publisher is not None:
+        await publisher.drain()
 
 
 def subscribe_workflow_events(
     workflow_run_id: str,
+    on_subscribed: Optional[Callable[[], None]] = None,
 ) -> Generator[Dict[str, Any], None, None]:
     """
     워크플로우 이벤트 구독 (Generator)
 
     Args:
         workflow_run_id: 워크플로우 실행 ID
+        on_subscribed: 구독 준비 후 호출 (이 안에서 실행을 시작하면 이벤트 누락 없음)
 
     Yields:
         이벤트 딕셔너리 {"type": str, "data": dict}
     """
+    if _use_stream():
+        yield from _read_stream_events(workflow_run_id, on_subscribed)
+        return
+
     client = get_redis_client()
     pubsub = client.pubsub()
-    channel = f"workflow:{workflow_run_id}"
+    channel = _channel(workflow_run_id)
     pubsub.subscribe(channel)
 
     try:
+        if on_subscribed is not None:
+            on_subscribed()
         for message in pubsub.listen():
             if message["type"] == "message":
                 event = json.loads(message["data"])
                 yield event
                 # 워크플로우 종료 시 구독 종료
-                if event.get("type") in ("workflow_finish", "error"):
+                if event.get("type") in TERMINAL_EVENT_TYPES:
                     break
     finally:
         pubsub.unsubscribe(channel)
         pubsub.close()
 
 
+def _read_stream_events(
+    workflow_run_id: str,
+    on_subscribed: Optional[Callable[[], None]] = None,
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Redis Stream에서 처음부터 이벤트 읽기 (재접속 시에도 전체 이벤트 재생)
+
+    종료 이벤트 없이 스트림 TTL 동안 새 이벤트가 없으면 구독을 끝냅니다.
+    """
+    client = get_redis_client()
+    key = _stream_key(workflow_run_id)
+    last_id = "0-0"
+    idle_deadline = time.monotonic() + WORKFLOW_EVENT_STREAM_TTL
+
+    if on_subscribed is not None:
+        on_subscribed()
+
+    while time.monotonic() < idle_deadline:
+        response = client.xread({key: last_id}, block=WORKFLOW_EVENT_READ_BLOCK_MS, count=100)
+        if not response:
+            continue
+        idle_deadline = time.monotonic() + WORKFLOW_EVENT_STREAM_TTL
+        for _, entries in response:
+            for entry_id, fields in entries:
+                last_id = entry_id
+                event = json.loads(fields[b"event"])
+                yield event
+                if event.get("type") in TERMINAL_EVENT_TYPES:
+                    return
+
+
 async def close_async_redis_client() -> None:
     """
-    비동기 Redis 클라이언트 연결 종료
+    현재 이벤트 루프의 비동기 Redis 클라이언트 연결 종료 (남은 이벤트는 전송 후 종료)
     [FIX] Celery 태스크 종료 시 이벤트 루프와 함께 클라이언트를 정리하기 위함
     """
-    global _async_redis_client
-    if _async_redis_client is not None:
-        await _async_redis_client.close()
-        _async_redis_client = None
+    loop = asyncio.get_running_loop()
+    publisher = _event_publishers.pop(loop, None)
+    if publisher is not None:
+        try:
+            await publisher.drain()
+        except Exception as e:
+            logger.warning(f"[PubSub] 남은 이벤트 발행 실패: {e}")
+    client = _async_redis_clients.pop(loop, None)
+    if client is not None:
+        await client.close()
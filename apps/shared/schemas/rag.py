@@ -22,18 +22,21 @@ class KnowledgeBaseResponse(BaseModel):
     updated_at: Optional[datetime] = None  # 문서 최종 업데이트 시간
     source_types: List[str] = []  # 포함된 소스 타입 목록
     embedding_model: str
+    text_search_config: str = "english"  # 키워드 검색 텍스트 검색 설정
 
 
 class KnowledgeBaseCreate(BaseModel):
     name: str
     description: Optional[str] = None
     embedding_model: str = "text-embedding-3-small"
+    text_search_config: str = "english"  # english, simple(한국어 등 공백 기준)
 
 
 class KnowledgeUpdate(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
     embedding_model: Optional[str] = None
+    text_search_config: Optional[str] = None
 
 
 class DocumentResponse(BaseModel):
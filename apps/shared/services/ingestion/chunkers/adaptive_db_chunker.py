@@ -46,11 +46,20 @@ class AdaptiveDbChunker:
         except Exception:
             self.tokenizer = tiktoken.get_encoding("cl100k_base")
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        [PERF] 여러 텍스트의 토큰 수를 한 번에 계산
+
+        tiktoken의 encode_batch는 GIL을 풀고 내부 스레드로 인코딩합니다.
+        """
+        return [len(tokens) for tokens in self.tokenizer.encode_batch(texts)]
+
     def chunk_if_needed(
         self,
         text: str,
         metadata: Optional[Dict[str, Any]] = None,
         enable_chunking: bool = True,
+        token_count: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         조건부 청킹 실행 (비상 청킹 포함)
@@ -59,6 +68,7 @@ class AdaptiveDbChunker:
             text: Jinja2 렌더링 결과 (이미 자연어 문장)
             metadata: 원본 메타데이터
             enable_chunking: 자동 청킹 활성화 여부 (UI 설정)
+            token_count: count_tokens_batch로 미리 계산한 토큰 수 (없으면 여기서 계산)
 
         Returns:
             List[{"content": str, "metadata": dict}]
@@ -69,7 +79,8 @@ class AdaptiveDbChunker:
 
         # 1. 길이 측정
         char_count = len(text)
-        token_count = len(self.tokenizer.encode(text))
+        if token_count is None:
+            token_count = len(self.tokenizer.encode(text))
 
         # 2. 비상 청킹 임계값 (임베딩 모델 한계)
         EMERGENCY_THRESHOLD = 8000  # text-embedding-3-small 한계의 ~98%
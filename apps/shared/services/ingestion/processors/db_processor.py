@@ -1,8 +1,14 @@
+import concurrent.futures
 import logging
+import multiprocessing
+import os
 import uuid
+from collections import deque
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterable, List, Optional
 
 from apps.shared.services.ingestion.chunkers.adaptive_db_chunker import (
     AdaptiveDbChunker,
@@ -18,6 +24,13 @@ from apps.shared.utils.encryption import encryption_manager
 
 logger = logging.getLogger(__name__)
 
+# row 배치 크기 (변환/암호화/토큰 계산 단위)
+DB_INGEST_BATCH_SIZE = int(os.getenv("DB_INGEST_BATCH_SIZE", "500"))
+# 배치 처리 프로세스 수 (1이면 현재 프로세스에서 순차 처리)
+DB_INGEST_WORKERS = int(os.getenv("DB_INGEST_WORKERS", "1"))
+
+_process_executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
 
 class DbProcessor(BaseProcessor):
     """
@@ -241,29 +254,17 @@ class DbProcessor(BaseProcessor):
         req_cols = ", ".join(columns)
         query = f"SELECT {req_cols} FROM {table_name} LIMIT {limit}"
 
-        # Strategies
-        def transform_strategy(row_dict):
-            # 선택된 컬럼만 포함 (중복 출력 방지)
-            return transformer.transform(
-                row_dict,
-                template_str=source_config.get("template") or selection.get("template"),
-                table_name=table_name,
-            )
-
-        def encryption_key_strategy(table, col):
-            return col
-
-        return self._process_common_logic(
-            connector,
-            query,
-            config_dict,
+        spec = self._build_batch_spec(
             selections,
             conn_record,
-            transformer,
             chunker,
             source_config,
-            transform_strategy,
-            encryption_key_strategy,
+            # 선택된 컬럼만 포함 (중복 출력 방지)
+            template_str=source_config.get("template") or selection.get("template"),
+            table_name=table_name,
+        )
+        return self._process_common_logic(
+            connector, query, config_dict, spec, transformer, chunker
         )
 
     def _process_with_join(
@@ -278,10 +279,7 @@ class DbProcessor(BaseProcessor):
         chunker,
     ):
         """2테이블 JOIN 모드 처리"""
-        from apps.shared.utils.join_query_utils import (
-            convert_to_namespace,
-            generate_join_query,
-        )
+        from apps.shared.utils.join_query_utils import generate_join_query
 
         limit = source_config.get("limit", 1000)
         query = generate_join_query(selections, join_config, limit)
@@ -295,40 +293,35 @@ class DbProcessor(BaseProcessor):
                     template_str = sel.get("template")
                     break
 
-        # Strategies
-        def transform_strategy(row_dict):
-            # 네임스페이스 변환: {table__col: val} → {table: {col: val}}
-            namespaced_data = convert_to_namespace(row_dict)
-
-            # JSON 직렬화 가능한 형태로 변환 (Decimal, datetime 등)
-            serialized_data = {}
-            for table, cols in namespaced_data.items():
-                if isinstance(cols, dict):
-                    serialized_data[table] = self._convert_to_json_serializable(cols)
-                else:
-                    serialized_data[table] = cols
-
-            # DbNlTransformer 사용하여 일관된 처리
-            return transformer.transform(
-                serialized_data,
-                template_str=template_str,
-            )
-
-        def encryption_key_strategy(table, col):
-            # JOIN 쿼리는 table__col 형식으로 키가 생성됨
-            return f"{table}__{col}"
-
-        return self._process_common_logic(
-            connector,
-            query,
-            config_dict,
+        spec = self._build_batch_spec(
             selections,
             conn_record,
-            transformer,
             chunker,
             source_config,
-            transform_strategy,
-            encryption_key_strategy,
+            template_str=template_str,
+            table_name=None,
+        )
+        return self._process_common_logic(
+            connector, query, config_dict, spec, transformer, chunker
+        )
+
+    @staticmethod
+    def _build_batch_spec(
+        selections,
+        conn_record,
+        chunker,
+        source_config,
+        template_str: Optional[str],
+        table_name: Optional[str],
+    ) -> "RowBatchSpec":
+        return RowBatchSpec(
+            selections=selections,
+            source=f"DB:{conn_record.name}:{'JOIN' if len(selections) > 1 else selections[0]['table_name']}",
+            template_str=template_str,
+            table_name=table_name,
+            enable_chunking=source_config.get("enable_auto_chunking", True),
+            chunk_size=chunker.chunk_size,
+            chunk_overlap=chunker.chunk_overlap,
         )
 
     def _process_common_logic(
@@ -336,68 +329,203 @@ class DbProcessor(BaseProcessor):
         connector,
         query,
         config_dict,
-        selections,
-        conn_record,
+        spec: "RowBatchSpec",
         transformer,
         chunker,
-        source_config,
-        transform_strategy,
-        encryption_key_strategy,
     ):
         """
         JOIN 모드와 단일 테이블 모드의 공통 처리 로직
+
+        [PERF] row를 DB_INGEST_BATCH_SIZE개씩 묶어 변환/암호화/토큰 계산을 배치로 수행합니다.
+        DB_INGEST_WORKERS > 1이면 배치를 프로세스 풀에서 병렬 처리합니다 (결과 순서 유지).
         """
         chunks = []
-        enable_chunking = source_config.get("enable_auto_chunking", True)
-
         row_count = 0
         logger.info("[DB처리] 쿼리 실행 중...")
 
-        for row_dict in connector.fetch_data(config_dict, query):
-            row_count += 1
-            if row_count % 100 == 0:
+        batches = _iter_row_batches(
+            connector.fetch_data(config_dict, query), DB_INGEST_BATCH_SIZE
+        )
+
+        if DB_INGEST_WORKERS <= 1:
+            for batch in batches:
+                chunks.extend(
+                    process_row_batch(spec, row_count, batch, transformer, chunker)
+                )
+                row_count += len(batch)
                 logger.info(f"[DB처리] 처리 중: {row_count}개 행")
+        else:
+            executor = _get_process_executor()
+            # 메모리 상한: 워커 수의 2배까지만 배치를 미리 제출
+            pending: Deque[concurrent.futures.Future] = deque()
+            for batch in batches:
+                pending.append(
+                    executor.submit(process_row_batch, spec, row_count, batch)
+                )
+                row_count += len(batch)
+                if len(pending) >= DB_INGEST_WORKERS * 2:
+                    chunks.extend(pending.popleft().result())
+                    logger.info(f"[DB처리] 처리 중: {row_count}개 행")
+            while pending:
+                chunks.extend(pending.popleft().result())
 
-            # 1. 텍스트 변환 (Strategy)
-            nl_text = transform_strategy(row_dict)
+        logger.info(f"[DB처리] 완료: {row_count}개 행, {len(chunks)}개 청크")
+        return chunks
 
-            # 2. 원본 데이터 직렬화
-            original_data = self._convert_to_json_serializable(row_dict)
 
-            # 3. 암호화 (Strategy)
-            for sel in selections:
-                table_name = sel["table_name"]
-                sensitive_cols = sel.get("sensitive_columns", [])
-                for col in sensitive_cols:
-                    # 키 매핑 전략: (table_name, col) -> data_key
-                    key = encryption_key_strategy(table_name, col)
-                    if key in original_data and original_data[key] is not None:
-                        original_data[key] = encryption_manager.encrypt(
-                            str(original_data[key])
-                        )
+@dataclass(frozen=True)
+class RowBatchSpec:
+    """
+    row 배치 처리 설정
 
-            # 4. 메타데이터 구성
-            metadata = {
-                "source": f"DB:{conn_record.name}:{'JOIN' if len(selections) > 1 else selections[0]['table_name']}",
-                "tables": [s["table_name"] for s in selections],
-                "row_index": row_count,
-                "original_data": original_data,
-                "sensitive_columns": [
-                    c for s in selections for c in s.get("sensitive_columns", [])
-                ],
-            }
+    프로세스 풀 워커로 전달되므로 pickle 가능한 값만 보관합니다.
+    table_name이 있으면 단일 테이블 모드, 없으면 JOIN 모드(table__col 키)입니다.
+    """
 
-            # 5. 청킹
-            try:
-                row_chunks = chunker.chunk_if_needed(
+    selections: List[Dict[str, Any]]
+    source: str
+    template_str: Optional[str]
+    table_name: Optional[str]
+    enable_chunking: bool
+    chunk_size: int
+    chunk_overlap: int
+
+
+def _iter_row_batches(rows: Iterable[Dict[str, Any]], batch_size: int):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@lru_cache(maxsize=8)
+def _get_worker_tools(chunk_size: int, chunk_overlap: int):
+    """워커 프로세스당 변환기/청커를 한 번만 생성 (tiktoken 인코더 로딩 비용 절감)"""
+    return DbNlTransformer(), AdaptiveDbChunker(
+        chunk_size=chunk_size, chunk_overlap=chunk_overlap
+    )
+
+
+def _transform_rows(
+    spec: RowBatchSpec, rows: List[Dict[str, Any]], transformer: DbNlTransformer
+) -> List[str]:
+    if spec.table_name:
+        return transformer.transform_batch(
+            rows, template_str=spec.template_str, table_name=spec.table_name
+        )
+
+    from apps.shared.utils.join_query_utils import convert_to_namespace
+
+    serialized_rows = []
+    for row_dict in rows:
+        # 네임스페이스 변환: {table__col: val} → {table: {col: val}}
+        namespaced_data = convert_to_namespace(row_dict)
+
+        # JSON 직렬화 가능한 형태로 변환 (Decimal, datetime 등)
+        serialized_data = {}
+        for table, cols in namespaced_data.items():
+            if isinstance(cols, dict):
+                serialized_data[table] = DbProcessor._convert_to_json_serializable(
+                    cols
+                )
+            else:
+                serialized_data[table] = cols
+        serialized_rows.append(serialized_data)
+
+    return transformer.transform_batch(serialized_rows, template_str=spec.template_str)
+
+
+def process_row_batch(
+    spec: RowBatchSpec,
+    start_index: int,
+    rows: List[Dict[str, Any]],
+    transformer: Optional[DbNlTransformer] = None,
+    chunker: Optional[AdaptiveDbChunker] = None,
+) -> List[Dict[str, Any]]:
+    """
+    row 배치를 청크로 변환 (프로세스 풀 워커에서도 실행)
+
+    Args:
+        spec: 배치 처리 설정
+        start_index: 배치 앞에서 처리된 row 수 (row_index는 1부터)
+        rows: DB 조회 결과 row 목록
+        transformer/chunker: 현재 프로세스의 인스턴스 (워커에서는 None → 프로세스별 캐시 사용)
+    """
+    if transformer is None or chunker is None:
+        transformer, chunker = _get_worker_tools(spec.chunk_size, spec.chunk_overlap)
+
+    # 1. 텍스트 변환 (템플릿 컴파일 1회)
+    texts = _transform_rows(spec, rows, transformer)
+
+    # 2. 토큰 수 일괄 계산
+    token_counts = chunker.count_tokens_batch(texts)
+
+    # 암호화 대상 키 (JOIN 쿼리는 table__col 형식으로 키가 생성됨)
+    sensitive_keys = [
+        col if spec.table_name else f"{sel['table_name']}__{col}"
+        for sel in spec.selections
+        for col in sel.get("sensitive_columns", [])
+    ]
+    tables = [s["table_name"] for s in spec.selections]
+    sensitive_columns = [
+        c for s in spec.selections for c in s.get("sensitive_columns", [])
+    ]
+
+    chunks = []
+    for offset, (row_dict, nl_text, token_count) in enumerate(
+        zip(rows, texts, token_counts)
+    ):
+        row_index = start_index + offset + 1
+
+        # 3. 원본 데이터 직렬화 + 민감 컬럼 암호화
+        original_data = DbProcessor._convert_to_json_serializable(row_dict)
+        for key in sensitive_keys:
+            if key in original_data and original_data[key] is not None:
+                original_data[key] = encryption_manager.encrypt(
+                    str(original_data[key])
+                )
+
+        # 4. 메타데이터 구성
+        metadata = {
+            "source": spec.source,
+            "tables": tables,
+            "row_index": row_index,
+            "original_data": original_data,
+            "sensitive_columns": sensitive_columns,
+        }
+
+        # 5. 청킹
+        try:
+            chunks.extend(
+                chunker.chunk_if_needed(
                     text=nl_text,
                     metadata=metadata,
-                    enable_chunking=enable_chunking,
+                    enable_chunking=spec.enable_chunking,
+                    token_count=token_count,
                 )
-                chunks.extend(row_chunks)
-            except ValueError as e:
-                logger.error(f"Row {row_count} chunking failed: {e}")
-                continue
+            )
+        except ValueError as e:
+            logger.error(f"Row {row_index} chunking failed: {e}")
+            continue
 
-        logger.info(f"[DB처리] 완료: {row_count}개 행, {len(chunks)}개 청크")
-        return chunks
+    return chunks
+
+
+def _get_process_executor() -> concurrent.futures.ProcessPoolExecutor:
+    """
+    DB 수집 전용 ProcessPoolExecutor 싱글톤 반환
+
+    Jinja2 렌더링/직렬화는 GIL을 잡고 있으므로 코어 수만큼 확장하려면 프로세스가 필요합니다.
+    fork 시 DB 커넥션/SSH 터널이 복제되지 않도록 spawn 컨텍스트를 사용합니다.
+    """
+    global _process_executor
+    if _process_executor is None:
+        _process_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=DB_INGEST_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_executor
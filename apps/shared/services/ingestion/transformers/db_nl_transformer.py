@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
 
 from apps.shared.services.ingestion.transformers.base import BaseTransformer
 from jinja2 import Template, TemplateSyntaxError, UndefinedError
@@ -7,6 +8,22 @@ from jinja2 import Template, TemplateSyntaxError, UndefinedError
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def compile_template(template_str: Optional[str]) -> Optional[Template]:
+    """
+    [PERF] 템플릿 문자열을 한 번만 컴파일 (같은 템플릿의 모든 row/배치가 재사용)
+
+    변수({{ }})가 없거나 문법 오류면 None (key: value fallback 사용)
+    """
+    if not template_str or "{{" not in template_str:
+        return None
+    try:
+        return Template(template_str)
+    except TemplateSyntaxError as e:
+        logger.error(f"Template compilation failed: {e}")
+        return None
+
+
 class DbNlTransformer(BaseTransformer):
     """
     [DbNlTransformer]
@@ -17,6 +34,7 @@ class DbNlTransformer(BaseTransformer):
     - JOIN 모드: {table: {col: val}} 구조 직접 지원
 
     템플릿이 없으면 선택된 컬럼만 key: value 형식으로 fallback.
+    대량 변환은 transform_batch를 사용 (템플릿 컴파일 1회 후 row마다 렌더링만 수행).
     """
 
     def transform(
@@ -38,6 +56,31 @@ class DbNlTransformer(BaseTransformer):
         Returns:
             템플릿이 있으면 렌더링 결과, 없으면 key: value 형식
         """
+        return self._render(input_data, compile_template(template_str), table_name)
+
+    def transform_batch(
+        self,
+        rows: Iterable[Any],
+        template_str: Optional[str] = None,
+        table_name: Optional[str] = None,
+    ) -> List[str]:
+        """
+        여러 row를 같은 템플릿으로 변환 (결과는 입력 순서와 동일)
+
+        Args:
+            rows: transform의 input_data와 같은 형식의 row 목록
+            template_str: 모든 row에 적용할 템플릿
+            table_name: 단일 테이블 모드에서 테이블명
+
+        Returns:
+            row별 변환 결과 리스트
+        """
+        template = compile_template(template_str)
+        return [self._render(row, template, table_name) for row in rows]
+
+    def _render(
+        self, input_data: Any, template: Optional[Template], table_name: Optional[str]
+    ) -> str:
         if not isinstance(input_data, dict):
             return str(input_data)
 
@@ -49,13 +92,11 @@ class DbNlTransformer(BaseTransformer):
             # JOIN: 이미 {table: {col: val}} 구조
             namespaced_data = input_data
 
-        # 2. 템플릿 렌더링 ({{ }} 변수가 있는 경우만)
-        if template_str and '{{' in template_str:
+        # 2. 템플릿 렌더링 (컴파일된 템플릿이 있는 경우만)
+        if template is not None:
             try:
-                template = Template(template_str)
-                result = template.render(**namespaced_data)
-                return result.strip()
-            except (TemplateSyntaxError, UndefinedError) as e:
+                return template.render(**namespaced_data).strip()
+            except UndefinedError as e:
                 logger.error(f"Template rendering failed: {e}")
                 # Fallback (아래)
 
@@ -145,6 +145,8 @@ class VectorStoreService:
                     raise RuntimeError(f"임베딩 생성 실패로 동기화 중단: {e}")
 
         # 4. DocumentChunk 저장 (Atomic Swap)
+        # 키워드 검색 토큰화 설정은 지식 베이스 설정을 따름
+        text_search_config = doc.knowledge_base.text_search_config
         new_document_chunks = []
         for i, chunk in enumerate(chunks):
             content = chunk["content"]
@@ -172,6 +174,7 @@ class VectorStoreService:
                     token_count=chunk.get("token_count", 0),
                     metadata_=metadata,
                     embedding=embedding,
+                    text_search_config=text_search_config,
                 )
             )
 
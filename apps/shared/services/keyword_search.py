@@ -0,0 +1,70 @@
+"""
+하이브리드 검색의 키워드(전문 검색) 단계
+
+document_chunks.search_vector(저장형 tsvector + GIN 인덱스)를 사용하므로
+검색 시 청크 본문을 다시 토큰화하지 않습니다.
+쿼리는 지식 베이스의 text_search_config로 파싱해야 청크와 같은 규칙으로 매칭됩니다.
+"""
+
+import os
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from apps.shared.db.models.knowledge import KnowledgeBase
+
+DEFAULT_TEXT_SEARCH_CONFIG = "english"
+
+# 지식 베이스에 설정 가능한 텍스트 검색 설정 (한국어 파서 확장 설치 시 환경변수로 추가)
+SUPPORTED_TEXT_SEARCH_CONFIGS = tuple(
+    name.strip()
+    for name in os.getenv("TEXT_SEARCH_CONFIGS", "english,simple").split(",")
+    if name.strip()
+)
+
+_KEYWORD_SEARCH_SQL = text("""
+    SELECT dc.id, dc.content, dc.metadata, dc.document_id, d.filename,
+           ts_rank_cd(dc.search_vector, q.query) AS rank
+    FROM document_chunks dc
+    JOIN documents d ON dc.document_id = d.id,
+         websearch_to_tsquery(CAST(:ts_config AS regconfig), :query) AS q(query)
+    WHERE dc.knowledge_base_id = :kb_id
+      AND dc.search_vector @@ q.query
+    ORDER BY rank DESC
+    LIMIT :top_k
+""")
+
+
+def get_text_search_config(session: Session, knowledge_base_id: str) -> str:
+    """지식 베이스의 텍스트 검색 설정 (없으면 기본값)"""
+    config: Optional[str] = (
+        session.query(KnowledgeBase.text_search_config)
+        .filter(KnowledgeBase.id == knowledge_base_id)
+        .scalar()
+    )
+    return config or DEFAULT_TEXT_SEARCH_CONFIG
+
+
+def keyword_search(
+    session: Session,
+    query: str,
+    knowledge_base_id: str,
+    top_k: int,
+    text_search_config: str = DEFAULT_TEXT_SEARCH_CONFIG,
+) -> List:
+    """
+    전문 검색 (websearch 문법: "정확한 구문", OR, -제외)
+
+    Returns:
+        (chunk_id, content, metadata, document_id, filename, rank) 행 목록
+    """
+    return session.execute(
+        _KEYWORD_SEARCH_SQL,
+        {
+            "query": query,
+            "kb_id": knowledge_base_id,
+            "top_k": top_k,
+            "ts_config": text_search_config,
+        },
+    ).fetchall()
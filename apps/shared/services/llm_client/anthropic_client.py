@@ -22,6 +22,8 @@ class AnthropicClient(BaseLLMClient):
     }
     """
 
+    rate_limit_provider = "anthropic"
+
     # 현재 Anthropic API 버전
     ANTHROPIC_VERSION = "2023-06-01"
 
@@ -106,8 +108,8 @@ class AnthropicClient(BaseLLMClient):
 
         async with httpx.AsyncClient(timeout=60) as client:
             try:
-                resp = await client.post(
-                    self.messages_url, headers=self._build_headers(), json=payload
+                resp = await self._rate_limited_post(
+                    client, self.messages_url, messages, headers=self._build_headers(), json=payload
                 )
             except httpx.RequestError as exc:
                 raise ValueError(f"Anthropic 호출 실패: {exc}") from exc
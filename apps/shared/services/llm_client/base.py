@@ -7,6 +7,8 @@ LLM 클라이언트의 공통 인터페이스.
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
+from .rate_limiter import acquire_llm_capacity
+
 
 class BaseLLMClient(ABC):
     """
@@ -17,10 +19,51 @@ class BaseLLMClient(ABC):
         credentials: API 호출에 필요한 자격 정보 딕셔너리
     """
 
+    # 클러스터 공용 속도 제한 키의 provider 부분 (LLM_RATE_LIMITS 조회에도 사용)
+    rate_limit_provider = "default"
+
     def __init__(self, model_id: str, credentials: Optional[Dict[str, Any]] = None):
         self.model_id = model_id
         self.credentials = credentials or {}
 
+    async def _rate_limited_post(
+        self,
+        client: Any,
+        url: str,
+        messages: List[Dict[str, Any]],
+        output_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        [PERF] 클러스터 공용 속도 제한을 거쳐 provider 호출
+
+        호출 전에 provider/credential/model 버킷에서 용량을 확보하고,
+        응답(429 retry-after, 실제 usage)을 버킷에 반영합니다.
+
+        Args:
+            client: httpx.AsyncClient
+            url: 호출 URL
+            messages: 토큰 예약량 추정용 메시지
+            output_tokens: 출력 토큰 예약량 (None이면 요청 본문의 max_tokens 등 사용)
+            **kwargs: client.post에 그대로 전달 (json=요청 본문)
+        """
+        reservation = await acquire_llm_capacity(
+            self, messages, kwargs.get("json"), output_tokens=output_tokens
+        )
+        resp = None
+        try:
+            resp = await client.post(url, **kwargs)
+            return resp
+        finally:
+            await reservation.release(resp)
+
+    async def _rate_limited_embedding_post(
+        self, client: Any, url: str, texts: List[str], **kwargs
+    ) -> Any:
+        """임베딩 호출용 _rate_limited_post (입력 텍스트로 토큰 추정, 출력 토큰 없음)"""
+        messages = [{"role": "user", "content": text} for text in texts]
+        return await self._rate_limited_post(client, url, messages, output_tokens=0, **kwargs)
+
     @abstractmethod
     async def invoke(self, messages: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
         """
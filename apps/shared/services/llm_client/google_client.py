@@ -23,6 +23,8 @@ class GoogleClient(BaseLLMClient):
     }
     """
 
+    rate_limit_provider = "google"
+
     def __init__(self, model_id: str, credentials: Dict[str, Any]):
         # Google API에서 반환하는 모델 ID에는 'models/' 접두사가 붙어있지만,
         # OpenAI 호환 엔드포인트 호출 시에는 접두사 없이 호출해야 함
@@ -60,8 +62,10 @@ class GoogleClient(BaseLLMClient):
 
         async with httpx.AsyncClient(timeout=30) as client:
             try:
-                resp = await client.post(
+                resp = await self._rate_limited_embedding_post(
+                    client,
                     self.embedding_url,
+                    [text],
                     headers=self._build_headers(),
                     json=payload,
                 )
@@ -102,8 +106,8 @@ class GoogleClient(BaseLLMClient):
 
         async with httpx.AsyncClient(timeout=60) as client:
             try:
-                resp = await client.post(
-                    self.chat_url, headers=self._build_headers(), json=payload
+                resp = await self._rate_limited_post(
+                    client, self.chat_url, messages, headers=self._build_headers(), json=payload
                 )
             except httpx.RequestError as exc:
                 raise ValueError(f"Google Gemini 호출 실패: {exc}") from exc
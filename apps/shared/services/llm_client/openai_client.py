@@ -23,6 +23,8 @@ class OpenAIClient(BaseLLMClient):
     }
     """
 
+    rate_limit_provider = "openai"
+
     def __init__(self, model_id: str, credentials: Dict[str, Any], provider_name: str = "OpenAI"):
         super().__init__(model_id=model_id, credentials=credentials)
         self.provider_name = provider_name
@@ -330,8 +332,10 @@ class OpenAIClient(BaseLLMClient):
         responses_payload.pop("max_tokens", None)
 
         try:
-            responses_resp = await client.post(
+            responses_resp = await self._rate_limited_post(
+                client,
                 self.responses_url,
+                messages,
                 headers=self._build_headers(),
                 json=responses_payload,
                 timeout=timeout_seconds,
@@ -364,8 +368,10 @@ class OpenAIClient(BaseLLMClient):
                 )
                 completion_payload.pop("max_completion_tokens", None)
             try:
-                completion_resp = await client.post(
+                completion_resp = await self._rate_limited_post(
+                    client,
                     self.completions_url,
+                    messages,
                     headers=self._build_headers(),
                     json=completion_payload,
                     timeout=timeout_seconds,
@@ -415,8 +421,10 @@ class OpenAIClient(BaseLLMClient):
 
         async with httpx.AsyncClient(timeout=30) as client:
             try:
-                resp = await client.post(
+                resp = await self._rate_limited_embedding_post(
+                    client,
                     self.embedding_url,
+                    [text],
                     headers=self._build_headers(),
                     json=payload,
                 )
@@ -455,8 +463,10 @@ class OpenAIClient(BaseLLMClient):
 
         async with httpx.AsyncClient(timeout=60) as client:
             try:
-                resp = await client.post(
+                resp = await self._rate_limited_embedding_post(
+                    client,
                     self.embedding_url,
+                    texts,
                     headers=self._build_headers(),
                     json=payload,
                 )
@@ -500,8 +510,10 @@ class OpenAIClient(BaseLLMClient):
 
         async with httpx.AsyncClient(timeout=60) as client:
             try:
-                resp = await client.post(
+                resp = await self._rate_limited_post(
+                    client,
                     self.chat_url,
+                    messages,
                     headers=self._build_headers(),
                     json=payload,
                     timeout=timeout_seconds,
@@ -549,8 +561,10 @@ class OpenAIClient(BaseLLMClient):
                     if needs_retry and retry_payload is not None:
                         try:
                             # Re-use client for retry
-                            resp = await client.post(
+                            resp = await self._rate_limited_post(
+                                client,
                                 self.chat_url,
+                                messages,
                                 headers=self._build_headers(),
                                 json=retry_payload,
                                 timeout=timeout_seconds,
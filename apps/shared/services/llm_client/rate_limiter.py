@@ -0,0 +1,380 @@
+"""
+LLM 호출 클러스터 공용 속도 제한 (provider + credential + model 단위)
+
+워커마다 provider를 독립적으로 호출하면 동시 요청이 몰릴 때 429가 한꺼번에 나고,
+재시도가 부하를 더 키워 처리량이 한도 주변에서 출렁입니다.
+Redis 토큰 버킷 하나를 모든 워커/게이트웨이가 공유해서 호출 전에 용량을 먼저 확보합니다.
+
+- 분당 요청 수(rpm)와 분당 토큰 수(tpm)를 함께 계량 (토큰은 입력 추정치 + 최대 출력 토큰으로 예약)
+- 성공 응답의 실제 usage로 예약량을 보정
+- 동시 실행 수(concurrency) 제한: 만료 시각이 있는 임대(lease) ZSET → 워커가 죽어도 자동 회수
+- 429(또는 retry-after가 있는 5xx) 응답을 보면
+  1. retry-after 동안 같은 키의 모든 호출을 대기시키고
+  2. 버킷 속도를 절반으로 줄인 뒤(최소 LLM_RATE_LIMIT_MIN_SCALE) 성공할 때마다 조금씩 회복 (AIMD)
+- 그 밖의 실패(네트워크 오류, 취소, 4xx/5xx)는 임대만 반납하고 속도는 회복하지 않음
+
+한도 설정 (LLM_RATE_LIMITS, JSON): "provider:model" > "provider" > "*" 순으로 찾습니다.
+    {"openai": {"rpm": 500, "tpm": 200000, "concurrency": 50},
+     "anthropic:claude-3-5-sonnet-20241022": {"rpm": 50, "tpm": 40000}}
+설정이 없는 키는 제한하지 않으며(Redis 호출 없음), Redis 오류 시에도 제한 없이 호출합니다.
+
+키 구조:
+    llm:ratelimit:{provider}:{credential}:{model}           HASH  (r, t, ts, scale, until)
+    llm:ratelimit:{provider}:{credential}:{model}:inflight  ZSET  (lease_id → 만료 시각)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import time
+import uuid
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+from apps.shared.pubsub import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+LLM_RATE_LIMIT_ENABLED = os.getenv("LLM_RATE_LIMIT_ENABLED", "1") != "0"
+LLM_RATE_LIMIT_MAX_WAIT = float(os.getenv("LLM_RATE_LIMIT_MAX_WAIT", "120"))  # 초, 넘으면 그냥 호출
+LLM_RATE_LIMIT_MIN_SCALE = float(os.getenv("LLM_RATE_LIMIT_MIN_SCALE", "0.1"))
+LLM_RATE_LIMIT_RECOVERY_STEP = float(os.getenv("LLM_RATE_LIMIT_RECOVERY_STEP", "0.02"))
+LLM_RATE_LIMIT_DEFAULT_RETRY_MS = int(os.getenv("LLM_RATE_LIMIT_DEFAULT_RETRY_MS", "1000"))
+LLM_RATE_LIMIT_DEFAULT_OUTPUT_TOKENS = int(
+    os.getenv("LLM_RATE_LIMIT_DEFAULT_OUTPUT_TOKENS", "512")
+)
+LLM_RATE_LIMIT_LEASE_TTL = int(os.getenv("LLM_RATE_LIMIT_LEASE_TTL", "300"))  # 초
+
+
+def _load_limits(raw: str) -> Dict[str, Dict[str, float]]:
+    if not raw:
+        return {}
+    try:
+        limits = json.loads(raw)
+    except ValueError:
+        logger.warning("LLM_RATE_LIMITS 파싱 실패, 속도 제한 비활성화")
+        return {}
+    return {str(k).lower(): v for k, v in limits.items() if isinstance(v, dict)}
+
+
+LLM_RATE_LIMITS = _load_limits(os.getenv("LLM_RATE_LIMITS", ""))
+
+_KEY_PREFIX = "llm:ratelimit"
+
+# 현재 시각(ms)은 Redis 서버 시계로 계산 (게이트웨이/워커 간 시계 차이와 무관하게 보충/대기 계산)
+# TIME 이후 쓰기를 허용하도록 효과 복제 사용 (Redis 5+ 기본값, 이전 버전 호환용)
+_REDIS_NOW = """
+if redis.replicate_commands then redis.replicate_commands() end
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+"""
+
+# 두 버킷(요청/토큰)을 함께 보충하고, 둘 다 충분할 때만 차감 → 대기 시간(ms) 반환 (0이면 획득)
+# 동시 실행 제한이 있으면 만료된 임대를 회수한 뒤 자리가 있을 때만 임대 등록
+_ACQUIRE_SCRIPT = _REDIS_NOW + """
+local rpm = tonumber(ARGV[1])
+local tpm = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local concurrency = tonumber(ARGV[4])
+local s = redis.call('HMGET', KEYS[1], 'r', 't', 'ts', 'scale', 'until')
+local blocked = tonumber(s[5]) or 0
+if blocked > now then
+    return math.ceil(blocked - now)
+end
+local scale = tonumber(s[4]) or 1
+local rcap = rpm * scale
+local tcap = tpm * scale
+local last = tonumber(s[3]) or now
+local elapsed = math.max(0, now - last)
+local r = tonumber(s[1]) or rcap
+local t = tonumber(s[2]) or tcap
+local wait = 0
+if rpm > 0 then
+    r = math.min(rcap, r + elapsed * rcap / 60000)
+    if r < 1 then wait = math.max(wait, (1 - r) * 60000 / rcap) end
+end
+if tpm > 0 then
+    t = math.min(tcap, t + elapsed * tcap / 60000)
+    local need = math.min(cost, tcap)
+    if t < need then wait = math.max(wait, (need - t) * 60000 / tcap) end
+end
+if wait == 0 and concurrency > 0 then
+    redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+    if redis.call('ZCARD', KEYS[2]) >= concurrency then
+        wait = tonumber(ARGV[7])
+    else
+        redis.call('ZADD', KEYS[2], now + tonumber(ARGV[5]) * 1000, ARGV[6])
+        redis.call('EXPIRE', KEYS[2], tonumber(ARGV[5]))
+    end
+end
+if wait == 0 then
+    if rpm > 0 then r = r - 1 end
+    if tpm > 0 then t = t - cost end
+end
+redis.call('HSET', KEYS[1], 'r', tostring(r), 't', tostring(t), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], 3600)
+return math.ceil(wait)
+"""
+
+# 응답 반영: 임대 반납 + 토큰 예약량 보정, 성공 응답(ARGV[4] == '1')이면 속도 회복 (가산 증가)
+_SETTLE_SCRIPT = """
+redis.call('ZREM', KEYS[2], ARGV[3])
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+local delta = tonumber(ARGV[1])
+if delta ~= 0 then
+    local t = tonumber(redis.call('HGET', KEYS[1], 't'))
+    if t then redis.call('HSET', KEYS[1], 't', tostring(t + delta)) end
+end
+local scale = tonumber(redis.call('HGET', KEYS[1], 'scale')) or 1
+if ARGV[4] == '1' and scale < 1 then
+    redis.call('HSET', KEYS[1], 'scale', tostring(math.min(1, scale + tonumber(ARGV[2]))))
+end
+return 1
+"""
+
+# 429 응답: retry-after 동안 전체 대기, 진행 중인 대기 구간이 아니면 속도 절반 (곱셈 감소)
+# 동시에 받은 429 여러 개가 속도를 연쇄로 깎지 않도록 대기 구간 안에서는 한 번만 감소
+_PENALIZE_SCRIPT = _REDIS_NOW + """
+redis.call('ZREM', KEYS[2], ARGV[3])
+local s = redis.call('HMGET', KEYS[1], 'scale', 'until')
+local scale = tonumber(s[1]) or 1
+local blocked = tonumber(s[2]) or 0
+if blocked <= now then
+    scale = math.max(tonumber(ARGV[2]), scale * 0.5)
+end
+local release = math.max(blocked, now + tonumber(ARGV[1]))
+redis.call('HSET', KEYS[1], 'scale', tostring(scale), 'until', tostring(release), 'r', '0', 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], 3600)
+return 1
+"""
+
+# 동시 실행 자리가 없을 때 다시 확인하기까지 대기 (ms)
+_CONCURRENCY_POLL_MS = 50
+
+
+def find_limits(provider: str, model_id: str) -> Optional[Dict[str, float]]:
+    """provider/model에 적용할 한도 (설정이 없으면 None)"""
+    provider = provider.lower()
+    for key in (f"{provider}:{model_id.lower()}", provider, "*"):
+        limits = LLM_RATE_LIMITS.get(key)
+        if limits:
+            return limits
+    return None
+
+
+def parse_retry_after(headers: Any) -> Optional[int]:
+    """
+    retry-after-ms / retry-after 헤더 → 대기 시간(ms)
+
+    retry-after는 초(소수 허용) 또는 HTTP 날짜 형식입니다.
+    """
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0, int(float(value)))
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0, int(float(value) * 1000))
+    except ValueError:
+        pass
+    try:
+        return max(0, int((parsedate_to_datetime(value).timestamp() - time.time()) * 1000))
+    except (TypeError, ValueError):
+        return None
+
+
+class Reservation:
+    """호출 한 번의 용량 예약 (release에 응답을 넘기면 버킷에 반영)"""
+
+    def __init__(self, limiter: Optional["LLMRateLimiter"], lease_id: str, estimated_tokens: int):
+        self._limiter = limiter
+        self.lease_id = lease_id
+        self.estimated_tokens = estimated_tokens
+
+    async def release(self, resp: Any = None) -> None:
+        """
+        응답 결과 반영
+
+        - 429 또는 retry-after가 있는 5xx: retry-after 동안 전체 대기 + 감속
+        - 성공(status < 400): 동시 실행 임대 반납, 실제 usage로 토큰 예약량 보정, 속도 회복
+        - 그 외(응답 없음/취소, 4xx/5xx): 임대만 반납
+        """
+        if self._limiter is None:
+            return
+        status = getattr(resp, "status_code", None)
+        retry_after = parse_retry_after(getattr(resp, "headers", None))
+        if status == 429 or (status and status >= 500 and retry_after is not None):
+            if retry_after is None:
+                retry_after = LLM_RATE_LIMIT_DEFAULT_RETRY_MS
+            await self._limiter.penalize(self, retry_after)
+        elif status and status < 400:
+            actual_tokens = _total_tokens(resp) if self._limiter.tpm else None
+            await self._limiter.settle(self, actual_tokens)
+        else:
+            await self._limiter.settle(self, None, succeeded=False)
+
+
+NOOP_RESERVATION = Reservation(None, "", 0)
+
+
+def _total_tokens(resp: Any) -> Optional[int]:
+    """응답 usage의 총 토큰 수 (OpenAI: total_tokens, Anthropic: input_tokens + output_tokens)"""
+    try:
+        usage = resp.json().get("usage")
+    except Exception:
+        return None
+    if not isinstance(usage, dict):
+        return None
+    if usage.get("total_tokens") is not None:
+        return int(usage["total_tokens"])
+    if "input_tokens" in usage or "output_tokens" in usage:
+        return int(usage.get("input_tokens") or 0) + int(usage.get("output_tokens") or 0)
+    return None
+
+
+class LLMRateLimiter:
+    """provider + credential + model 하나의 클러스터 공용 토큰 버킷"""
+
+    def __init__(self, provider: str, credential: str, model_id: str, limits: Dict[str, float]):
+        self.key = f"{_KEY_PREFIX}:{provider}:{credential}:{model_id}"
+        self.inflight_key = f"{self.key}:inflight"
+        self.rpm = float(limits.get("rpm") or 0)
+        self.tpm = float(limits.get("tpm") or 0)
+        self.concurrency = int(limits.get("concurrency") or 0)
+
+    @classmethod
+    def for_client(cls, client: Any) -> Optional["LLMRateLimiter"]:
+        """클라이언트에 적용할 제한기 (설정이 없거나 비활성화면 None)"""
+        if not LLM_RATE_LIMIT_ENABLED or not LLM_RATE_LIMITS:
+            return None
+        provider = client.rate_limit_provider
+        limits = find_limits(provider, client.model_id)
+        if not limits:
+            return None
+        api_key = str(client.credentials.get("apiKey") or client.credentials.get("api_key") or "")
+        credential = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+        return cls(provider, credential, client.model_id.lower(), limits)
+
+    async def acquire(self, estimated_tokens: int) -> Reservation:
+        """
+        용량을 확보할 때까지 대기
+
+        LLM_RATE_LIMIT_MAX_WAIT를 넘기거나 Redis 오류가 나면 제한 없이 진행합니다.
+        """
+        reservation = Reservation(self, uuid.uuid4().hex, estimated_tokens)
+        deadline = time.monotonic() + LLM_RATE_LIMIT_MAX_WAIT
+        while True:
+            try:
+                wait_ms = await get_async_redis_client().eval(
+                    _ACQUIRE_SCRIPT,
+                    2,
+                    self.key,
+                    self.inflight_key,
+                    repr(self.rpm),
+                    repr(self.tpm),
+                    estimated_tokens,
+                    self.concurrency,
+                    LLM_RATE_LIMIT_LEASE_TTL,
+                    reservation.lease_id,
+                    _CONCURRENCY_POLL_MS,
+                )
+            except Exception as e:
+                logger.debug(f"[RateLimit] {self.key} 획득 실패, 제한 없이 호출: {e}")
+                return reservation
+
+            wait = int(wait_ms) / 1000
+            if wait <= 0:
+                return reservation
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"[RateLimit] {self.key} 대기 {LLM_RATE_LIMIT_MAX_WAIT:.0f}초 초과, 제한 없이 호출"
+                )
+                return reservation
+            # 같은 시점에 깨어난 호출들이 다시 몰리지 않도록 지터 추가
+            await asyncio.sleep(min(wait * random.uniform(1.0, 1.2), remaining))
+
+    async def settle(
+        self, reservation: Reservation, actual_tokens: Optional[int], succeeded: bool = True
+    ) -> None:
+        """임대 반납 + 토큰 예약량 보정 (succeeded면 속도 회복)"""
+        delta = 0
+        if actual_tokens is not None:
+            delta = reservation.estimated_tokens - actual_tokens
+        try:
+            await get_async_redis_client().eval(
+                _SETTLE_SCRIPT,
+                2,
+                self.key,
+                self.inflight_key,
+                delta,
+                repr(LLM_RATE_LIMIT_RECOVERY_STEP),
+                reservation.lease_id,
+                "1" if succeeded else "0",
+            )
+        except Exception as e:
+            logger.debug(f"[RateLimit] {self.key} 반영 실패: {e}")
+
+    async def penalize(self, reservation: Reservation, retry_after_ms: int) -> None:
+        """429 응답: retry-after 동안 같은 키 전체 대기 + 감속"""
+        try:
+            await get_async_redis_client().eval(
+                _PENALIZE_SCRIPT,
+                2,
+                self.key,
+                self.inflight_key,
+                retry_after_ms,
+                repr(LLM_RATE_LIMIT_MIN_SCALE),
+                reservation.lease_id,
+            )
+            logger.info(f"[RateLimit] {self.key} 한도 초과 응답, {retry_after_ms}ms 대기 후 감속")
+        except Exception as e:
+            logger.debug(f"[RateLimit] {self.key} 반영 실패: {e}")
+
+
+async def acquire_llm_capacity(
+    client: Any,
+    messages: List[Dict[str, Any]],
+    payload: Dict[str, Any],
+    output_tokens: Optional[int] = None,
+) -> Reservation:
+    """
+    LLM 호출 전에 용량 확보
+
+    Args:
+        client: BaseLLMClient (rate_limit_provider, model_id, credentials, get_num_tokens 사용)
+        messages: 호출할 메시지 (tpm 제한이 있을 때만 토큰 추정)
+        payload: 요청 본문 (max_tokens/max_completion_tokens를 출력 토큰 예약량으로 사용)
+        output_tokens: 출력 토큰 예약량 직접 지정 (임베딩처럼 출력 토큰이 없는 호출은 0)
+
+    Returns:
+        Reservation (응답을 받은 뒤 release(resp) 호출 필요)
+    """
+    limiter = LLMRateLimiter.for_client(client)
+    if limiter is None:
+        return NOOP_RESERVATION
+
+    estimated_tokens = 0
+    if limiter.tpm:
+        payload = payload or {}
+        if output_tokens is None:
+            output_tokens = (
+                payload.get("max_completion_tokens")
+                or payload.get("max_output_tokens")
+                or payload.get("max_tokens")
+                or LLM_RATE_LIMIT_DEFAULT_OUTPUT_TOKENS
+            )
+        try:
+            estimated_tokens = client.get_num_tokens(messages) + int(output_tokens)
+        except Exception:
+            estimated_tokens = int(output_tokens)
+    return await limiter.acquire(estimated_tokens)
@@ -0,0 +1,160 @@
+"""
+검색 쿼리 임베딩 캐시
+
+챗봇 반복 질문, 웹훅 재시도, 평가 실행처럼 같은 쿼리가 자주 반복되므로
+쿼리 임베딩을 2단계로 캐시합니다.
+- L1: 프로세스 내 LRU (QUERY_EMBEDDING_CACHE_SIZE개)
+- L2: Redis (QUERY_EMBEDDING_CACHE_TTL초, float32 바이트로 저장)
+
+키는 provider/모델, 자격 증명 범위(base URL + API 키 해시), 정규화된 텍스트, 차원으로 구성하며
+(같은 모델명이라도 다른 엔드포인트/계정의 벡터를 섞지 않음)
+같은 키의 동시 요청은 진행 중인 호출 하나의 결과를 함께 사용합니다 (single-flight).
+정규화는 캐시 키에만 사용하고, 캐시 미스 시에는 호출자가 넘긴 원문을 임베딩합니다.
+Redis 장애 시에는 캐시 없이 임베딩 API를 직접 호출합니다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import unicodedata
+import weakref
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from apps.shared.pubsub import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+QUERY_EMBEDDING_CACHE_TTL = int(os.getenv("QUERY_EMBEDDING_CACHE_TTL", "86400"))  # 초
+# 0이면 Redis(L2) 캐시를 사용하지 않음
+QUERY_EMBEDDING_REDIS_ENABLED = os.getenv("QUERY_EMBEDDING_REDIS_ENABLED", "1") != "0"
+
+_KEY_PREFIX = "embedding:query"
+
+# L1 캐시 (gateway 스레드풀/워커 스레드에서 함께 쓰므로 락으로 보호)
+_local_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+_local_lock = threading.Lock()
+
+# 이벤트 루프별 진행 중인 임베딩 호출 (Future는 만든 루프에서만 await 가능)
+_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def normalize_query(text: str) -> str:
+    """캐시 키용 쿼리 정규화 (유니코드 NFC + 공백 정리, 대소문자는 의미가 있으므로 유지)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def _credential_scope(client) -> str:
+    """base URL + API 키 해시 (키 원문은 캐시 키에 남기지 않음)"""
+    credentials = getattr(client, "credentials", None) or {}
+    base_url = str(credentials.get("baseUrl") or credentials.get("base_url") or "")
+    api_key = str(credentials.get("apiKey") or credentials.get("api_key") or "")
+    scope = f"{base_url.rstrip('/')}\n{api_key}"
+    return hashlib.sha256(scope.encode("utf-8")).hexdigest()[:16]
+
+
+def _cache_key(client, text: str, dimensions: Optional[int]) -> str:
+    provider = getattr(client, "provider_name", type(client).__name__)
+    scope = _credential_scope(client)
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return (
+        f"{_KEY_PREFIX}:{provider}:{scope}:{client.model_id}:"
+        f"{dimensions or 'native'}:{digest}"
+    )
+
+
+def _local_get(key: str) -> Optional[List[float]]:
+    with _local_lock:
+        vector = _local_cache.get(key)
+        if vector is not None:
+            _local_cache.move_to_end(key)
+        return vector
+
+
+def _local_set(key: str, vector: List[float]) -> None:
+    with _local_lock:
+        _local_cache[key] = vector
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+            _local_cache.popitem(last=False)
+
+
+def clear_local_cache() -> None:
+    """L1 캐시 비우기 (테스트/모델 교체 시)"""
+    with _local_lock:
+        _local_cache.clear()
+
+
+async def _redis_get(key: str) -> Optional[List[float]]:
+    if not QUERY_EMBEDDING_REDIS_ENABLED:
+        return None
+    try:
+        raw = await get_async_redis_client().get(key)
+    except Exception as e:
+        logger.warning(f"[QueryEmbeddingCache] Redis 조회 실패: {e}")
+        return None
+    if not raw:
+        return None
+    return array("f", raw).tolist()
+
+
+async def _redis_set(key: str, vector: List[float]) -> None:
+    if not QUERY_EMBEDDING_REDIS_ENABLED:
+        return
+    try:
+        await get_async_redis_client().set(
+            key, array("f", vector).tobytes(), ex=QUERY_EMBEDDING_CACHE_TTL
+        )
+    except Exception as e:
+        logger.warning(f"[QueryEmbeddingCache] Redis 저장 실패: {e}")
+
+
+async def _load(client, key: str, text: str, dimensions: Optional[int]) -> List[float]:
+    vector = await _redis_get(key)
+    if vector is None:
+        vector = await client.embed(text)
+        if dimensions is not None and len(vector) != dimensions:
+            raise ValueError(
+                f"임베딩 차원 불일치: 기대 {dimensions}, 실제 {len(vector)}"
+            )
+        await _redis_set(key, vector)
+    _local_set(key, vector)
+    return vector
+
+
+async def embed_query(
+    client, text: str, dimensions: Optional[int] = None
+) -> List[float]:
+    """
+    캐시를 거쳐 쿼리 임베딩 반환
+
+    Args:
+        client: embed()를 가진 LLM 클라이언트 (model_id 필요)
+        text: 검색 쿼리
+        dimensions: 기대 차원 (지정 시 키에 포함하고 결과 차원을 검증)
+
+    Returns:
+        임베딩 벡터 (호출자 간 공유되므로 수정하지 말 것)
+    """
+    key = _cache_key(client, normalize_query(text), dimensions)
+
+    vector = _local_get(key)
+    if vector is not None:
+        return vector
+
+    loop = asyncio.get_running_loop()
+    inflight = _inflight.setdefault(loop, {})
+    future = inflight.get(key)
+    if future is None:
+        # 임베딩은 원문으로 호출 (정규화 결과는 키 계산에만 사용)
+        future = loop.create_task(_load(client, key, text, dimensions))
+        inflight[key] = future
+        future.add_done_callback(lambda _: inflight.pop(key, None))
+    # 한 호출자가 취소되어도 공유 호출은 계속 진행
+    return await asyncio.shield(future)
@@ -0,0 +1,103 @@
+"""
+하이브리드 검색의 벡터(ANN) 단계
+
+document_chunks.embedding은 모델마다 차원이 달라 차원 없는 vector 컬럼이지만,
+차원별로 `embedding::vector(N)` 표현식 + `vector_dims(embedding) = N` 조건의
+부분 HNSW 인덱스를 두어 임베딩 모델(차원)별로 고정 차원 인덱스를 사용합니다.
+플래너가 인덱스를 고르려면 쿼리의 캐스트/조건이 인덱스 정의와 글자 그대로 같아야 하므로
+차원은 바인드 파라미터가 아닌 리터럴로 렌더링합니다.
+
+작은 지식 베이스는 knowledge_base_id btree 인덱스로 정확 검색(전수 거리 계산)이 선택되고,
+큰 공용 테이블 안의 필터 검색은 hnsw.iterative_scan으로 결과 수가 줄지 않게 합니다.
+"""
+
+import os
+from typing import List, Optional
+
+from pgvector.sqlalchemy import HALFVEC, VECTOR
+from sqlalchemy import cast, func, literal, select, text
+from sqlalchemy.orm import Session
+
+from apps.shared.db.models.knowledge import Document, DocumentChunk
+
+# HNSW 부분 인덱스가 있는 임베딩 차원 -> 인덱스 타입
+# (vector HNSW는 2000차원까지이므로 3072차원은 halfvec으로 인덱싱)
+INDEXED_EMBEDDING_DIMENSIONS = {
+    768: VECTOR,  # text-embedding-004
+    1024: VECTOR,
+    1536: VECTOR,  # text-embedding-3-small, text-embedding-ada-002
+    3072: HALFVEC,  # text-embedding-3-large
+}
+
+# 쿼리당 HNSW 후보 수 (recall/지연 트레이드오프, 최소 검색 개수 이상으로 보정)
+DEFAULT_EF_SEARCH = int(os.getenv("VECTOR_EF_SEARCH", "100"))
+MAX_EF_SEARCH = 1000  # pgvector hnsw.ef_search 상한
+
+# 필터 조건으로 후보가 부족할 때 인덱스를 계속 스캔 (pgvector 0.8+, 빈 값이면 끔)
+ITERATIVE_SCAN = os.getenv("VECTOR_ITERATIVE_SCAN", "relaxed_order")
+
+
+def _apply_search_settings(session: Session, ef_search: int) -> None:
+    """현재 트랜잭션에만 HNSW 검색 파라미터 적용 (SET LOCAL과 동일)"""
+    session.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+        {"ef_search": str(ef_search)},
+    )
+    if ITERATIVE_SCAN:
+        session.execute(
+            text("SELECT set_config('hnsw.iterative_scan', :mode, true)"),
+            {"mode": ITERATIVE_SCAN},
+        )
+
+
+def resolve_ef_search(top_k: int, ef_search: Optional[int] = None) -> int:
+    """ef_search는 가져올 개수보다 작으면 결과가 잘리므로 top_k 이상, 상한 이하로 맞춤"""
+    requested = ef_search or DEFAULT_EF_SEARCH
+    return min(max(requested, top_k), MAX_EF_SEARCH)
+
+
+def build_vector_search_query(
+    query_vector: list, knowledge_base_id: str, top_k: int
+):
+    """(DocumentChunk, Document, distance) 행을 가까운 순으로 가져오는 쿼리"""
+    dimension = len(query_vector)
+    index_type = INDEXED_EMBEDDING_DIMENSIONS.get(dimension)
+
+    if index_type is None:
+        # 인덱스 없는 차원: 기존과 같은 정확 검색
+        embedding = DocumentChunk.embedding
+    else:
+        embedding = cast(DocumentChunk.embedding, index_type(dimension))
+
+    distance_col = embedding.cosine_distance(query_vector).label("distance")
+    return (
+        select(DocumentChunk, Document, distance_col)
+        .join(Document)
+        .where(
+            DocumentChunk.knowledge_base_id == knowledge_base_id,
+            # 부분 인덱스 조건과 일치해야 하므로 리터럴로 렌더링
+            func.vector_dims(DocumentChunk.embedding)
+            == literal(dimension, literal_execute=True),
+        )
+        .order_by(distance_col)
+        .limit(top_k)
+    )
+
+
+def vector_search(
+    session: Session,
+    query_vector: list,
+    knowledge_base_id: str,
+    top_k: int,
+    ef_search: Optional[int] = None,
+) -> List:
+    """
+    코사인 거리 기준 벡터 검색
+
+    Returns:
+        (DocumentChunk, Document, distance) 행 목록
+    """
+    if len(query_vector) in INDEXED_EMBEDDING_DIMENSIONS:
+        _apply_search_settings(session, resolve_ef_search(top_k, ef_search))
+    stmt = build_vector_search_query(query_vector, knowledge_base_id, top_k)
+    return session.execute(stmt).all()
@@ -0,0 +1,106 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+from apps.shared.services.ingestion.processors import db_processor
+from apps.shared.services.ingestion.processors.db_processor import DbProcessor
+from apps.shared.services.ingestion.transformers.db_nl_transformer import (
+    DbNlTransformer,
+    compile_template,
+)
+
+
+class FakeConnector:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetch_data(self, config, query):
+        yield from self.rows
+
+
+class FakeChunker:
+    """tiktoken 없이 글자 수를 토큰 수로 쓰는 청커 대역"""
+
+    chunk_size = 1000
+    chunk_overlap = 150
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def count_tokens_batch(self, texts):
+        self.batch_sizes.append(len(texts))
+        return [len(text) for text in texts]
+
+    def chunk_if_needed(self, text, metadata=None, enable_chunking=True, token_count=None):
+        return [{"content": text, "metadata": {**metadata, "token_count": token_count}}]
+
+
+def test_template_compiled_once_for_batch():
+    compile_template.cache_clear()
+    transformer = DbNlTransformer()
+
+    texts = transformer.transform_batch(
+        [{"sku": "A1", "qty": 3}, {"sku": "B2", "qty": 0}],
+        template_str="{{ inventory.sku }}: {{ inventory.qty }}개",
+        table_name="inventory",
+    )
+
+    assert texts == ["A1: 3개", "B2: 0개"]
+    assert compile_template.cache_info().misses == 1
+
+
+def test_single_table_rows_processed_in_batches(monkeypatch):
+    monkeypatch.setattr(db_processor, "DB_INGEST_BATCH_SIZE", 2)
+    monkeypatch.setattr(
+        db_processor.encryption_manager, "encrypt", lambda value: f"enc({value})"
+    )
+    rows = [{"sku": f"S{i}", "price": Decimal("1.5"), "owner": "kim"} for i in range(5)]
+    chunker = FakeChunker()
+
+    chunks = DbProcessor()._process_single_table(
+        FakeConnector(rows),
+        {},
+        [{"table_name": "inventory", "sensitive_columns": ["owner"]}],
+        {"template": "{{ inventory.sku }}"},
+        SimpleNamespace(name="shop"),
+        DbNlTransformer(),
+        chunker,
+    )
+
+    assert chunker.batch_sizes == [2, 2, 1]
+    assert [c["content"] for c in chunks] == ["S0", "S1", "S2", "S3", "S4"]
+    assert [c["metadata"]["row_index"] for c in chunks] == [1, 2, 3, 4, 5]
+    first = chunks[0]["metadata"]
+    assert first["source"] == "DB:shop:inventory"
+    assert first["token_count"] == 2
+    assert first["original_data"] == {"sku": "S0", "price": 1.5, "owner": "enc(kim)"}
+
+
+def test_join_rows_use_namespaced_keys(monkeypatch):
+    monkeypatch.setattr(
+        db_processor.encryption_manager, "encrypt", lambda value: f"enc({value})"
+    )
+    rows = [{"orders__id": 1, "users__name": "hong", "users__email": "h@x.io"}]
+    selections = [
+        {"table_name": "orders"},
+        {"table_name": "users", "sensitive_columns": ["email"]},
+    ]
+    monkeypatch.setattr(
+        "apps.shared.utils.join_query_utils.generate_join_query",
+        lambda selections, join_config, limit: "SELECT 1",
+    )
+
+    chunks = DbProcessor()._process_with_join(
+        FakeConnector(rows),
+        {},
+        selections,
+        {"enabled": True},
+        {"template": "{{ orders.id }} by {{ users.name }}"},
+        SimpleNamespace(name="shop"),
+        DbNlTransformer(),
+        FakeChunker(),
+    )
+
+    assert chunks[0]["content"] == "1 by hong"
+    metadata = chunks[0]["metadata"]
+    assert metadata["source"] == "DB:shop:JOIN"
+    assert metadata["original_data"]["users__email"] == "enc(h@x.io)"
@@ -0,0 +1,197 @@
+import httpx
+import pytest
+
+from apps.shared.services.llm_client import OpenAIClient
+from apps.shared.services.llm_client import rate_limiter as rl
+
+CREDENTIALS = {"apiKey": "sk-test", "baseUrl": "https://api.openai.com/v1"}
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class FakeAsyncRedis:
+    """스크립트별 eval 호출을 기록하고 acquire 결과(대기 ms)를 순서대로 돌려줌"""
+
+    def __init__(self, waits=None, error=None):
+        self.waits = list(waits or [])
+        self.error = error
+        self.calls = []
+
+    async def eval(self, script, numkeys, *args):
+        if self.error:
+            raise self.error
+        name = {
+            rl._ACQUIRE_SCRIPT: "acquire",
+            rl._SETTLE_SCRIPT: "settle",
+            rl._PENALIZE_SCRIPT: "penalize",
+        }[script]
+        self.calls.append((name, args))
+        if name == "acquire":
+            return self.waits.pop(0) if self.waits else 0
+        return 1
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    def configure(value):
+        monkeypatch.setattr(rl, "LLM_RATE_LIMITS", value)
+
+    configure({"openai": {"rpm": 60, "tpm": 1000, "concurrency": 2}})
+    return configure
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeAsyncRedis()
+    monkeypatch.setattr(rl, "get_async_redis_client", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waited = []
+
+    async def fake_sleep(seconds):
+        waited.append(seconds)
+
+    monkeypatch.setattr(rl.asyncio, "sleep", fake_sleep)
+    return waited
+
+
+def _client():
+    client = OpenAIClient(model_id="gpt-4o", credentials=CREDENTIALS)
+    client.get_num_tokens = lambda messages: 7  # tiktoken 인코딩 다운로드 방지
+    return client
+
+
+def _mock_transport(monkeypatch, response):
+    transport = httpx.MockTransport(lambda request: response)
+    real_client = httpx.AsyncClient
+
+    monkeypatch.setattr(
+        "apps.shared.services.llm_client.openai_client.httpx.AsyncClient",
+        lambda **kw: real_client(transport=transport),
+    )
+
+
+def test_limits_prefer_model_then_provider_then_default(limits):
+    limits({"openai:gpt-4o": {"rpm": 1}, "openai": {"rpm": 2}, "*": {"rpm": 3}})
+
+    assert rl.find_limits("OpenAI", "GPT-4o") == {"rpm": 1}
+    assert rl.find_limits("openai", "gpt-4o-mini") == {"rpm": 2}
+    assert rl.find_limits("google", "gemini-2.0-flash") == {"rpm": 3}
+
+
+def test_parse_retry_after_headers():
+    assert rl.parse_retry_after(httpx.Headers({"retry-after-ms": "250"})) == 250
+    assert rl.parse_retry_after(httpx.Headers({"Retry-After": "1.5"})) == 1500
+    assert rl.parse_retry_after(
+        httpx.Headers({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    ) == 0
+    assert rl.parse_retry_after(httpx.Headers({})) is None
+
+
+@pytest.mark.asyncio
+async def test_unconfigured_provider_skips_redis(limits, redis):
+    limits({"anthropic": {"rpm": 10}})
+
+    reservation = await rl.acquire_llm_capacity(_client(), MESSAGES, {})
+    await reservation.release(httpx.Response(429))
+
+    assert reservation is rl.NOOP_RESERVATION
+    assert redis.calls == []
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_until_bucket_grants(limits, redis, sleeps):
+    redis.waits = [300, 0]
+
+    reservation = await rl.acquire_llm_capacity(_client(), MESSAGES, {"max_tokens": 100})
+
+    assert [name for name, _ in redis.calls] == ["acquire", "acquire"]
+    assert len(sleeps) == 1 and 0.3 <= sleeps[0] <= 0.36
+    key = redis.calls[0][1][0]
+    assert key.startswith("llm:ratelimit:openai:") and key.endswith(":gpt-4o")
+    assert "sk-test" not in key
+    assert reservation.estimated_tokens == 107
+    # 현재 시각은 스크립트가 Redis TIME으로 읽음 (호출자 시계를 넘기지 않음)
+    assert "redis.call('TIME')" in rl._ACQUIRE_SCRIPT
+    assert redis.calls[0][1][2:4] == (repr(60.0), repr(1000.0))
+
+
+@pytest.mark.asyncio
+async def test_redis_error_fails_open(limits, redis, sleeps):
+    redis.error = ConnectionError("down")
+
+    reservation = await rl.acquire_llm_capacity(_client(), MESSAGES, {})
+    await reservation.release(httpx.Response(200))
+
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_success_settles_actual_usage(limits, redis, monkeypatch):
+    _mock_transport(
+        monkeypatch,
+        httpx.Response(200, json={"choices": [], "usage": {"total_tokens": 40}}),
+    )
+
+    await _client().invoke(MESSAGES, max_tokens=100)
+
+    (_, acquire_args), (name, settle_args) = redis.calls
+    assert acquire_args[4] == 107
+    assert name == "settle"
+    assert settle_args[2] == 107 - 40  # 남은 예약량 반환
+    assert settle_args[4] == acquire_args[7]  # 같은 임대 반납
+    assert settle_args[5] == "1"  # 성공 응답만 속도 회복
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response", [None, httpx.Response(400), httpx.Response(503)])
+async def test_failed_call_releases_lease_without_recovery(limits, redis, response):
+    reservation = await rl.acquire_llm_capacity(_client(), MESSAGES, {})
+    await reservation.release(response)
+
+    name, args = redis.calls[-1]
+    assert name == "settle"
+    assert args[2] == 0  # 예약량 보정 없음
+    assert args[5] == "0"
+
+
+@pytest.mark.asyncio
+async def test_throttled_response_blocks_key_for_retry_after(limits, redis, monkeypatch):
+    _mock_transport(
+        monkeypatch,
+        httpx.Response(429, headers={"retry-after": "2"}, text="rate limited"),
+    )
+
+    with pytest.raises(ValueError, match="status 429"):
+        await _client().invoke(MESSAGES)
+
+    name, args = redis.calls[-1]
+    assert name == "penalize"
+    assert args[2] == 2000
+
+
+@pytest.mark.asyncio
+async def test_embedding_batch_reserves_input_tokens_only(limits, redis, monkeypatch):
+    _mock_transport(
+        monkeypatch,
+        httpx.Response(
+            200,
+            json={
+                "data": [{"index": 0, "embedding": [0.1]}, {"index": 1, "embedding": [0.2]}],
+                "usage": {"prompt_tokens": 5, "total_tokens": 5},
+            },
+        ),
+    )
+    client = _client()
+    estimated = []
+    client.get_num_tokens = lambda messages: estimated.append(messages) or 7
+
+    vectors = await client.embed_batch(["a", "b"])
+
+    assert vectors == [[0.1], [0.2]]
+    assert [m["content"] for m in estimated[0]] == ["a", "b"]
+    (_, acquire_args), (name, settle_args) = redis.calls
+    assert acquire_args[4] == 7  # 출력 토큰 예약 없음
+    assert name == "settle" and settle_args[2] == 7 - 5
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from apps.shared.services import query_embedding_cache as cache
+
+
+class FakeEmbedClient:
+    provider_name = "openai"
+
+    def __init__(self, model_id="text-embedding-3-small", credentials=None):
+        self.model_id = model_id
+        self.credentials = credentials or {
+            "apiKey": "sk-test",
+            "baseUrl": "https://api.openai.com/v1",
+        }
+        self.calls = []
+
+    async def embed(self, text):
+        self.calls.append(text)
+        await asyncio.sleep(0.01)
+        return [0.5, float(len(text))]
+
+
+class FakeAsyncRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeAsyncRedis()
+    monkeypatch.setattr(cache, "get_async_redis_client", lambda: redis)
+    cache.clear_local_cache()
+    yield redis
+    cache.clear_local_cache()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_call(fake_redis):
+    client = FakeEmbedClient()
+
+    vectors = await asyncio.gather(
+        *[cache.embed_query(client, "  환불   정책은? ") for _ in range(5)],
+        cache.embed_query(client, "환불 정책은?"),  # 정규화 후 같은 키
+    )
+
+    # 공유 호출은 먼저 들어온 호출자의 원문으로 임베딩
+    assert client.calls == ["  환불   정책은? "]
+    assert all(vector == vectors[0] for vector in vectors)
+    assert len(fake_redis.store) == 1
+
+
+@pytest.mark.asyncio
+async def test_embeds_original_text_and_normalizes_only_the_key(fake_redis):
+    client = FakeEmbedClient()
+    text = "line one\n\n  line two\t"
+
+    vector = await cache.embed_query(client, text)
+
+    assert client.calls == [text]
+    assert vector == [0.5, float(len(text))]
+    # 공백만 다른 쿼리는 같은 키로 캐시 적중
+    assert await cache.embed_query(client, "line one line two") == vector
+    assert client.calls == [text]
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_serves_after_local_eviction(fake_redis):
+    client = FakeEmbedClient()
+    await cache.embed_query(client, "q")
+    cache.clear_local_cache()  # 다른 프로세스라고 가정
+
+    assert await cache.embed_query(client, "q") == [0.5, 1.0]
+    assert client.calls == ["q"]
+
+    # 모델/차원이 다르면 다른 키
+    other = FakeEmbedClient(model_id="text-embedding-3-large")
+    await cache.embed_query(other, "q")
+    assert other.calls == ["q"]
+    with pytest.raises(ValueError):
+        await cache.embed_query(client, "q", dimensions=1536)
+
+
+@pytest.mark.asyncio
+async def test_key_is_scoped_to_endpoint_and_credential(fake_redis):
+    client = FakeEmbedClient()
+    other_endpoint = FakeEmbedClient(
+        credentials={"apiKey": "sk-test", "baseUrl": "http://localhost:8000/v1"}
+    )
+    other_key = FakeEmbedClient(
+        credentials={"apiKey": "sk-other", "baseUrl": "https://api.openai.com/v1"}
+    )
+
+    for c in (client, other_endpoint, other_key):
+        await cache.embed_query(c, "q")
+
+    assert [len(c.calls) for c in (client, other_endpoint, other_key)] == [1, 1, 1]
+    assert len(fake_redis.store) == 3
+    assert not any("sk-" in key for key in fake_redis.store)
+
+
+@pytest.mark.asyncio
+async def test_local_cache_is_bounded_and_redis_errors_fall_through(monkeypatch):
+    def broken_client():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(cache, "get_async_redis_client", broken_client)
+    monkeypatch.setattr(cache, "QUERY_EMBEDDING_CACHE_SIZE", 2)
+    cache.clear_local_cache()
+    client = FakeEmbedClient()
+
+    for text in ["a", "b", "c", "a"]:
+        await cache.embed_query(client, text)
+
+    assert client.calls == ["a", "b", "c", "a"]  # "a"는 LRU에서 밀려남
+    assert len(cache._local_cache) == 2
+    cache.clear_local_cache()
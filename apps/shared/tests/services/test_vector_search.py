@@ -0,0 +1,37 @@
+from sqlalchemy.dialects import postgresql
+
+from apps.shared.services import vector_search as vs
+
+
+def _sql(query_vector) -> str:
+    stmt = vs.build_vector_search_query(query_vector, "kb-1", 50)
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"render_postcompile": True},
+        )
+    )
+
+
+def test_query_matches_partial_hnsw_index_definition():
+    """부분 인덱스가 선택되려면 캐스트와 차원 조건이 인덱스 정의와 같아야 합니다."""
+    sql = _sql([0.1] * 1536)
+    assert "CAST(document_chunks.embedding AS VECTOR(1536)) <=>" in sql
+    assert "vector_dims(document_chunks.embedding) = 1536" in sql  # 리터럴
+    assert "document_chunks.knowledge_base_id =" in sql
+
+    assert "CAST(document_chunks.embedding AS HALFVEC(3072))" in _sql([0.1] * 3072)
+
+
+def test_unindexed_dimension_falls_back_to_exact_search():
+    sql = _sql([0.1] * 10)
+    assert "CAST(" not in sql
+    assert "vector_dims(document_chunks.embedding) = 10" in sql
+
+
+def test_ef_search_covers_requested_rows(monkeypatch):
+    monkeypatch.setattr(vs, "DEFAULT_EF_SEARCH", 100)
+    assert vs.resolve_ef_search(50) == 100
+    assert vs.resolve_ef_search(200) == 200  # LIMIT보다 작으면 결과가 잘림
+    assert vs.resolve_ef_search(50, ef_search=40) == 50
+    assert vs.resolve_ef_search(50, ef_search=5000) == vs.MAX_EF_SEARCH
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from apps.shared import pubsub
+
+
+class FakePipeline:
+    def __init__(self, sent):
+        self._sent = sent
+        self._commands = []
+
+    def publish(self, channel, message):
+        self._commands.append(("publish", channel, message))
+
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        self._commands.append(("xadd", key, fields["event"], maxlen))
+
+    def expire(self, key, ttl):
+        self._commands.append(("expire", key, ttl))
+
+    async def execute(self):
+        self._sent.append(self._commands)
+
+
+class FakeAsyncRedis:
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.batches)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = FakeAsyncRedis()
+    monkeypatch.setattr(pubsub.aioredis, "from_url", lambda *args, **kwargs: client)
+    monkeypatch.setattr(pubsub, "WORKFLOW_EVENT_BATCH_DELAY_MS", 20)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_events_are_batched_until_terminal_event(fake_client):
+    await pubsub.publish_workflow_event_async("run-1", "node_start", {"node_id": "a"})
+    await pubsub.publish_workflow_event_async("run-1", "node_start", {"node_id": "b"})
+    assert fake_client.batches == []  # 지연 동안 모으는 중
+
+    await pubsub.publish_workflow_event_async("run-1", "workflow_finish", {})
+
+    # 한 번의 파이프라인으로 발행 순서대로 전송
+    assert len(fake_client.batches) == 1
+    assert [cmd[2] for cmd in fake_client.batches[0]] == [
+        '{"type": "node_start", "data": {"node_id": "a"}}',
+        '{"type": "node_start", "data": {"node_id": "b"}}',
+        '{"type": "workflow_finish", "data": {}}',
+    ]
+    await pubsub.close_async_redis_client()
+
+
+@pytest.mark.asyncio
+async def test_delayed_flush_and_client_reused_within_loop(fake_client):
+    assert pubsub.get_async_redis_client() is pubsub.get_async_redis_client()
+
+    await pubsub.publish_workflow_event_async("run-1", "node_finish", {})
+    await asyncio.sleep(0.05)
+    assert len(fake_client.batches) == 1
+
+    await pubsub.publish_workflow_event_async("run-1", "node_finish", {})
+    await pubsub.close_async_redis_client()  # 남은 이벤트 전송 후 종료
+    assert len(fake_client.batches) == 2
+    assert fake_client.closed is True
+
+
+@pytest.mark.asyncio
+async def test_stream_transport_uses_capped_xadd(fake_client, monkeypatch):
+    monkeypatch.setattr(pubsub, "WORKFLOW_EVENT_TRANSPORT", "stream")
+    monkeypatch.setattr(pubsub, "WORKFLOW_EVENT_STREAM_MAXLEN", 500)
+
+    await pubsub.publish_workflow_event_async("run-2", "error", {"message": "x"})
+
+    commands = fake_client.batches[0]
+    assert commands[0][:2] == ("xadd", "workflow:run-2:events")
+    assert commands[0][3] == 500
+    assert commands[1][0] == "expire"
+    await pubsub.close_async_redis_client()
@@ -29,7 +29,8 @@ if ENV_PATH.exists():
 from apps.shared.celery_app import celery_app
 
 # Celery가 tasks 모듈을 인식하도록 import
-from apps.workflow_engine import tasks  # noqa: F401
+# memory_guard: threads pool은 max-tasks-per-child가 적용되지 않으므로 RSS 기준으로 워커 재시작
+from apps.workflow_engine import memory_guard, tasks  # noqa: F401
 
 # Celery 앱을 apps.shared에서 재사용
 __all__ = ["celery_app"]
@@ -0,0 +1,67 @@
+"""
+워크플로우 워커 메모리 누수 방지
+
+threads pool은 자식 프로세스가 없어 worker_max_tasks_per_child /
+worker_max_memory_per_child가 적용되지 않습니다.
+태스크가 끝날 때마다 워커 프로세스의 RSS를 확인하고, WORKFLOW_WORKER_MAX_MEMORY_MB를 넘으면
+warm shutdown(SIGTERM: 새 태스크 수신 중단, 실행 중인 태스크는 완료)을 요청합니다.
+재시작은 오케스트레이터(k8s Deployment, docker compose restart 정책)가 담당합니다.
+
+- WORKFLOW_WORKER_MAX_MEMORY_MB: 0이면 비활성화 (기본 1536MB, k8s 메모리 limit 2Gi보다 낮게)
+"""
+
+import logging
+import os
+import signal
+import threading
+from typing import Optional
+
+from celery.signals import task_postrun
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_WORKER_MAX_MEMORY_MB = int(os.getenv("WORKFLOW_WORKER_MAX_MEMORY_MB", "1536"))
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_shutdown_requested = False
+_lock = threading.Lock()
+
+
+def current_rss_mb() -> Optional[float]:
+    """현재 프로세스 RSS (MB, /proc을 읽을 수 없으면 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * _PAGE_SIZE / (1024 * 1024)
+
+
+def check_memory() -> bool:
+    """
+    메모리 한도를 넘었으면 워커 warm shutdown 요청 (프로세스당 한 번)
+
+    Returns:
+        이번 호출에서 종료를 요청했으면 True
+    """
+    global _shutdown_requested
+    if WORKFLOW_WORKER_MAX_MEMORY_MB <= 0 or _shutdown_requested:
+        return False
+    rss_mb = current_rss_mb()
+    if rss_mb is None or rss_mb < WORKFLOW_WORKER_MAX_MEMORY_MB:
+        return False
+    with _lock:
+        if _shutdown_requested:
+            return False
+        _shutdown_requested = True
+    logger.warning(
+        f"[MemoryGuard] 워커 RSS {rss_mb:.0f}MB가 한도 {WORKFLOW_WORKER_MAX_MEMORY_MB}MB를 넘어 "
+        "실행 중인 태스크 완료 후 재시작합니다."
+    )
+    os.kill(os.getpid(), signal.SIGTERM)
+    return True
+
+
+@task_postrun.connect
+def _check_memory_after_task(**kwargs):
+    check_memory()
@@ -1,12 +1,20 @@
 import logging
 import re
+from typing import Any, Callable, Optional
 
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from apps.shared.db.models.knowledge import Document, DocumentChunk, KnowledgeBase
+from apps.shared.db.models.knowledge import KnowledgeBase
 from apps.shared.db.models.llm import LLMCredential, LLMModel, LLMProvider
+from apps.shared.db.session import run_with_session
 from apps.shared.schemas.rag import ChunkPreview, RAGResponse
+from apps.shared.services.keyword_search import (
+    get_text_search_config,
+    keyword_search,
+)
+from apps.shared.services.query_embedding_cache import embed_query
+from apps.shared.services.vector_search import vector_search
 from apps.workflow_engine.services.llm_service import LLMService
 from apps.workflow_engine.utils.encryption import encryption_manager
 
@@ -14,19 +22,41 @@ logger = logging.getLogger(__name__)
 
 
 class RetrievalService:
-    def __init__(self, db: Session, user_id):
+    def __init__(
+        self,
+        db: Optional[Session],
+        user_id,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
         self.db = db
         self.user_id = user_id
         self.llm_client = None
+        # [PERF] 비동기 세션 팩토리가 있으면 조회마다 풀에서 세션을 받아 사용 (이벤트 루프 비차단)
+        self.session_factory = session_factory
+
+    async def _run_db(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """fn(session, ...)을 비동기 세션(있으면) 또는 self.db로 실행"""
+        return await run_with_session(
+            fn,
+            *args,
+            session_factory=self.session_factory,
+            fallback_db=self.db,
+            **kwargs,
+        )
+
+    def _get_client_for_rewrite(self, session: Session):
+        """쿼리 재작성용 LLM 클라이언트 생성 (_run_db 세션에서 실행)"""
+        rewrite_model_id = self._get_efficient_rewrite_model(session)
+        return LLMService.get_client_for_user(session, self.user_id, rewrite_model_id)
 
-    def _get_efficient_rewrite_model(self) -> str:
+    def _get_efficient_rewrite_model(self, session: Session) -> str:
         """
         사용자의 credential을 확인하여 가장 효율적인(가성비) 모델을 반환합니다.
         Fallback: gpt-4o-mini
         """
         try:
             credentials = (
-                self.db.query(LLMCredential)
+                session.query(LLMCredential)
                 .filter(
                     LLMCredential.user_id == self.user_id,
                     LLMCredential.is_valid == True,
@@ -39,7 +69,7 @@ class RetrievalService:
 
             cred_map = {c.provider_id: c for c in credentials}
             providers = (
-                self.db.query(LLMProvider)
+                session.query(LLMProvider)
                 .filter(LLMProvider.id.in_(cred_map.keys()))
                 .all()
             )
@@ -71,10 +101,7 @@ class RetrievalService:
         LLM을 사용하여 검색 쿼리를 최적화합니다. (Query Rewriting, 비동기)
         """
         try:
-            rewrite_model_id = self._get_efficient_rewrite_model()
-            client = LLMService.get_client_for_user(
-                self.db, self.user_id, rewrite_model_id
-            )
+            client = await self._run_db(self._get_client_for_rewrite)
 
             system_prompt = (
                 "You are a search optimization expert. Rewrite the user's query to maximize relevance for a vector search engine.\n"
@@ -110,10 +137,7 @@ class RetrievalService:
         Multi-Query Expansion: LLM을 사용하여 원본 질문의 다양한 변형을 생성합니다. (비동기)
         """
         try:
-            rewrite_model_id = self._get_efficient_rewrite_model()
-            client = LLMService.get_client_for_user(
-                self.db, self.user_id, rewrite_model_id
-            )
+            client = await self._run_db(self._get_client_for_rewrite)
 
             system_prompt = (
                 f"You are an expert research assistant. Generate {num_variations} different search queries that would help find information to answer the user's question.\n"
@@ -152,38 +176,68 @@ class RetrievalService:
             logger.error(f"[Multi-Query] Falling back to single query: {e}")
             return [await self._rewrite_query(query)]
 
-    def _vector_search(self, query_vector: list, knowledge_base_id: str, top_k: int):
-        distance_col = DocumentChunk.embedding.cosine_distance(query_vector).label(
-            "distance"
+    def _vector_search(
+        self,
+        session: Session,
+        query_vector: list,
+        knowledge_base_id: str,
+        top_k: int,
+        ef_search: Optional[int] = None,
+    ):
+        # [PERF] 차원별 HNSW 부분 인덱스 사용 (쿼리별 ef_search 조정 가능)
+        return vector_search(
+            session, query_vector, knowledge_base_id, top_k, ef_search
+        )
+
+    def _keyword_search(
+        self, session: Session, query: str, knowledge_base_id: str, top_k: int
+    ):
+        # [PERF] 저장형 search_vector + GIN 인덱스 사용 (지식 베이스별 텍스트 검색 설정)
+        ts_config = get_text_search_config(session, knowledge_base_id)
+        return keyword_search(session, query, knowledge_base_id, top_k, ts_config)
+
+    def _get_embedding_client(self, session: Session, knowledge_base_id: str):
+        """지식 베이스의 임베딩 모델 클라이언트 생성 (_run_db 세션에서 실행, 사용 불가 시 None)"""
+        kb = (
+            session.query(KnowledgeBase)
+            .filter(KnowledgeBase.id == knowledge_base_id)
+            .first()
+        )
+        if not kb or not kb.embedding_model:
+            return None
+
+        model_info = (
+            session.query(LLMModel)
+            .filter(LLMModel.model_id_for_api_call == kb.embedding_model)
+            .first()
         )
-        stmt = (
-            select(DocumentChunk, Document, distance_col)
-            .join(Document)
-            .where(Document.knowledge_base_id == knowledge_base_id)
-            .order_by(distance_col)
-            .limit(top_k)
+        if model_info and model_info.type != "embedding":
+            return None
+
+        return LLMService.get_client_for_user(
+            session, self.user_id, kb.embedding_model
         )
-        return self.db.execute(stmt).all()
-
-    def _keyword_search(self, query: str, knowledge_base_id: str, top_k: int):
-        from sqlalchemy import text
-
-        stmt = text("""
-            SELECT dc.id, dc.content, dc.metadata, dc.document_id, d.filename,
-                   ts_rank(
-                       to_tsvector('english', dc.content || ' ' || COALESCE(CAST(dc.metadata->'keywords' AS TEXT), '')),
-                       websearch_to_tsquery('english', :query)
-                   ) as rank
-            FROM document_chunks dc
-            JOIN documents d ON dc.document_id = d.id
-            WHERE dc.knowledge_base_id = :kb_id
-              AND to_tsvector('english', dc.content || ' ' || COALESCE(CAST(dc.metadata->'keywords' AS TEXT), '')) @@ websearch_to_tsquery('english', :query)
-            ORDER BY rank DESC
-            LIMIT :top_k
-        """)
-        return self.db.execute(
-            stmt, {"query": query, "kb_id": knowledge_base_id, "top_k": top_k}
-        ).fetchall()
+
+    def _search_chunks(
+        self,
+        session: Session,
+        query: str,
+        query_vector: list,
+        knowledge_base_id: str,
+        limit: int,
+        hybrid_search: bool,
+        ef_search: Optional[int] = None,
+    ):
+        """벡터/키워드 검색을 한 세션에서 수행 (_run_db 세션에서 실행)"""
+        vector_results = self._vector_search(
+            session, query_vector, knowledge_base_id, limit, ef_search
+        )
+        keyword_results = []
+        if hybrid_search:
+            keyword_results = self._keyword_search(
+                session, query, knowledge_base_id, limit
+            )
+        return vector_results, keyword_results
 
     def _rrf_fusion(self, vector_results, keyword_results, k=60):
         """
@@ -271,9 +325,12 @@ class RetrievalService:
         hybrid_search: bool = True,
         use_rerank: bool = True,
         use_multi_query: bool = False,
+        ef_search: Optional[int] = None,
     ) -> list[ChunkPreview]:
         """
         [Public API] Hybrid Search (Vector + Keyword) with optional Multi-Query and Reranking (비동기)
+
+        ef_search: HNSW 후보 수 (None이면 VECTOR_EF_SEARCH, 클수록 recall↑ 지연↑)
         """
         if not knowledge_base_id:
             logger.error("Missing knowledge_base_id")
@@ -290,36 +347,26 @@ class RetrievalService:
         all_candidates = {}
 
         try:
-            kb = (
-                self.db.query(KnowledgeBase)
-                .filter(KnowledgeBase.id == knowledge_base_id)
-                .first()
+            embed_client = await self._run_db(
+                self._get_embedding_client, knowledge_base_id
             )
-            if not kb or not kb.embedding_model:
+            if embed_client is None:
                 return []
 
-            model_info = (
-                self.db.query(LLMModel)
-                .filter(LLMModel.model_id_for_api_call == kb.embedding_model)
-                .first()
-            )
-            if model_info and model_info.type != "embedding":
-                return []
-
-            embed_client = LLMService.get_client_for_user(
-                self.db, self.user_id, kb.embedding_model
-            )
-
             for i, q in enumerate(queries):
-                query_vector = await embed_client.embed(q)
-                vector_results = self._vector_search(
-                    query_vector, knowledge_base_id, top_k * 10
+                # [PERF] 반복 쿼리는 L1/Redis 캐시, 동시 동일 쿼리는 호출 하나로 합침
+                query_vector = await embed_query(embed_client, q)
+                vector_results, keyword_results = await self._run_db(
+                    self._search_chunks,
+                    q,
+                    query_vector,
+                    knowledge_base_id,
+                    top_k * 10,
+                    hybrid_search,
+                    ef_search,
                 )
 
                 if hybrid_search:
-                    keyword_results = self._keyword_search(
-                        q, knowledge_base_id, top_k * 10
-                    )
                     fused = self._rrf_fusion(vector_results, keyword_results)
                 else:
                     fused = []
@@ -492,8 +539,8 @@ class RetrievalService:
             pass
         else:
             try:
-                self.llm_client = LLMService.get_client_for_user(
-                    self.db, self.user_id, model_id
+                self.llm_client = await self._run_db(
+                    LLMService.get_client_for_user, self.user_id, model_id
                 )
             except Exception:
                 self.llm_client = None
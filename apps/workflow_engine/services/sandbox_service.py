@@ -13,7 +13,7 @@ Sandbox Service for secure Python code execution via Moduly Sandbox API
 
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List, Union
 
 import httpx
 
@@ -56,6 +56,7 @@ class SandboxService:
         trigger_type: str = None,  # 트리거 유형 (manual, schedule, webhook, batch)
         enable_network: bool = False,
         tenant_id: str = None,
+        cacheable: bool = False,
     ) -> Dict[str, Any]:
         """
         파이썬 코드를 Moduly Sandbox API에서 안전하게 실행
@@ -70,6 +71,7 @@ class SandboxService:
             trigger_type: 트리거 유형 (첫 실행 시 fallback 우선순위 결정용)
             enable_network: 네트워크 허용 여부
             tenant_id: 테넌트 ID (공정 스케줄링용)
+            cacheable: 결과 캐시 사용 여부 (동일 코드/입력이면 샌드박스가 이전 결과 재사용)
 
         Returns:
             실행 결과 딕셔너리 또는 에러 딕셔너리
@@ -86,6 +88,7 @@ class SandboxService:
             "trigger_type": trigger_type,
             "enable_network": enable_network,
             "tenant_id": tenant_id,
+            "cacheable": cacheable,
         }
 
         # 타임아웃 설정
@@ -124,12 +127,7 @@ class SandboxService:
 
                 # Moduly Sandbox 응답 형식 처리
                 # 응답 형식: {"success": true/false, "result": {...}, "error": "..."}
-                if response_data.get("success"):
-                    return response_data.get("result", {})
-                else:
-                    error_msg = response_data.get("error", "Unknown error")
-                    error_type = response_data.get("error_type", "unknown")
-                    return {"error": f"[{error_type}] {error_msg}"}
+                return self._to_output(response_data)
 
         except httpx.TimeoutException:
             error_msg = f"실행 시간 초과 ({timeout}초)"
@@ -143,3 +141,89 @@ class SandboxService:
             error_msg = f"예상치 못한 오류: {str(e)}"
             logger.exception(error_msg)
             return {"error": error_msg}
+
+    def execute_python_code_batch(
+        self,
+        code: str,
+        inputs_list: List[Dict[str, Any]],
+        timeout: int = 60,
+        trigger_type: str = None,
+        enable_network: bool = False,
+        tenant_id: str = None,
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        같은 코드를 여러 입력에 대해 한 번의 요청으로 실행 (반복 노드의 map 실행용)
+
+        샌드박스가 입력을 청크 단위로 하나의 인터프리터에서 실행하므로
+        항목마다 요청/프로세스를 만드는 것보다 오버헤드가 적습니다.
+
+        Args:
+            code: 실행할 파이썬 코드 (def main(inputs): ... 형태)
+            inputs_list: 항목별 입력 딕셔너리
+            timeout: 배치 전체 타임아웃 (초)
+
+        Returns:
+            입력 순서대로 항목별 결과 딕셔너리(또는 에러 딕셔너리) 리스트,
+            요청 자체가 실패하면 에러 딕셔너리
+        """
+        url = f"{self.sandbox_url}/v1/sandbox/execute/batch"
+
+        request_data = {
+            "code": code,
+            "inputs_list": inputs_list,
+            "timeout": timeout,
+            "trigger_type": trigger_type,
+            "enable_network": enable_network,
+            "tenant_id": tenant_id,
+        }
+
+        timeout_config = httpx.Timeout(
+            connect=5.0,
+            read=float(timeout) + 5.0,  # 배치 예산 + 여유
+            write=5.0,
+            pool=None,
+        )
+
+        try:
+            with httpx.Client(timeout=timeout_config) as client:
+                response = client.post(
+                    url,
+                    json=request_data,
+                    headers={"Content-Type": "application/json"},
+                )
+
+                if response.status_code == 503:
+                    return {
+                        "error": "Code execution service is overloaded, please retry later"
+                    }
+
+                if response.status_code != 200:
+                    error_msg = f"Sandbox API error (status {response.status_code}): {response.text[:200]}"
+                    return {"error": error_msg}
+
+                try:
+                    items = response.json()["items"]
+                except Exception:
+                    return {"error": "Failed to parse sandbox response"}
+
+                return [self._to_output(item) for item in items]
+
+        except httpx.TimeoutException:
+            return {"error": f"실행 시간 초과 ({timeout}초)"}
+
+        except httpx.RequestError as e:
+            return {"error": f"Sandbox API 연결 오류: {str(e)}"}
+
+        except Exception as e:
+            error_msg = f"예상치 못한 오류: {str(e)}"
+            logger.exception(error_msg)
+            return {"error": error_msg}
+
+    @staticmethod
+    def _to_output(response_data: Dict[str, Any]) -> Dict[str, Any]:
+        """샌드박스 실행 결과 -> 노드 출력 (실패 시 {"error": "[error_type] message"})"""
+        if response_data.get("success"):
+            return response_data.get("result", {})
+        error_msg = response_data.get("error", "Unknown error")
+        error_type = response_data.get("error_type", "unknown")
+        return {"error": f"[{error_type}] {error_msg}"}
@@ -3,19 +3,173 @@ Workflow-Engine Celery 태스크 정의
 워크플로우 실행을 비동기적으로 처리
 """
 
-import asyncio
+import copy
 import logging
+import os
+import threading
 import uuid
-from typing import Any, Dict
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from celery.signals import worker_process_shutdown, worker_shutdown
 
 from apps.shared.celery_app import celery_app
 from apps.shared.db.session import SessionLocal
-from apps.shared.pubsub import close_async_redis_client
+from apps.shared.pubsub import get_redis_client
+from apps.workflow_engine.worker_loop import (
+    WorkflowDeadlineExceeded,
+    run_in_worker_loop,
+    shutdown_worker_loop,
+)
+from apps.workflow_engine.workflow.core.checkpoint import (
+    WORKFLOW_CHECKPOINT_ENABLED,
+    WORKFLOW_CHECKPOINT_TTL,
+)
 
 logger = logging.getLogger(__name__)
 
+# [PERF] 배포 그래프 캐시 (deployment_id → graph_snapshot)
+# 배포 스냅샷은 생성 후 변경되지 않으므로 무효화 없이 LRU로만 관리
+DEPLOYMENT_GRAPH_CACHE_SIZE = int(os.getenv("DEPLOYMENT_GRAPH_CACHE_SIZE", 64))
+_deployment_graphs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_deployment_graphs_lock = threading.Lock()
+
+# [FIX] 태스크 ID당 최대 실행 횟수 (재시도 + 워커 유실 재전달 포함, 0이면 제한 없음)
+# 워커를 죽이는 실행(OOM, 네이티브 크래시)이 재전달되며 워커를 하나씩 죽이지 않도록 제한
+WORKFLOW_MAX_DELIVERIES = int(os.getenv("WORKFLOW_MAX_DELIVERIES", "5"))
+
+
+def _load_deployment_graph(session, deployment_id: str) -> Optional[Dict[str, Any]]:
+    """
+    배포 그래프 조회 (워커 프로세스 LRU 캐시 우선)
+
+    Returns:
+        그래프 사본 (엔진이 수정해도 캐시에 영향 없음)
+
+    Raises:
+        ValueError: 배포가 없거나 그래프가 비어있는 경우
+    """
+    from apps.shared.db.models.workflow_deployment import WorkflowDeployment
+
+    key = str(deployment_id)
+    with _deployment_graphs_lock:
+        graph = _deployment_graphs.get(key)
+        if graph is not None:
+            _deployment_graphs.move_to_end(key)
+            return copy.deepcopy(graph)
+
+    # 그래프 컬럼만 조회
+    row = (
+        session.query(WorkflowDeployment.graph_snapshot)
+        .filter(WorkflowDeployment.id == deployment_id)
+        .first()
+    )
+    if not row:
+        raise ValueError(f"배포를 찾을 수 없습니다: {deployment_id}")
+
+    graph = row[0]
+    if not graph:
+        raise ValueError(f"배포 그래프 데이터가 없습니다: {deployment_id}")
+
+    if DEPLOYMENT_GRAPH_CACHE_SIZE > 0:
+        with _deployment_graphs_lock:
+            _deployment_graphs[key] = copy.deepcopy(graph)
+            _deployment_graphs.move_to_end(key)
+            while len(_deployment_graphs) > DEPLOYMENT_GRAPH_CACHE_SIZE:
+                _deployment_graphs.popitem(last=False)
+    return graph
+
+
+def _is_deployment_active(session, deployment_id: str) -> bool:
+    """배포 활성 여부 (그래프 캐시와 달리 매번 조회, 배포가 없으면 False)"""
+    from apps.shared.db.models.workflow_deployment import WorkflowDeployment
+
+    row = (
+        session.query(WorkflowDeployment.is_active)
+        .filter(WorkflowDeployment.id == deployment_id)
+        .first()
+    )
+    return bool(row and row[0])
+
+
+def _claim_delivery(task_id: Optional[str]) -> bool:
+    """
+    이번 실행 회차 기록 (Redis INCR, TTL은 체크포인트와 동일)
+
+    Returns:
+        WORKFLOW_MAX_DELIVERIES 이내면 True (Redis 오류 시에도 True)
+    """
+    if not task_id or WORKFLOW_MAX_DELIVERIES <= 0:
+        return True
+    key = f"workflow:deliveries:{task_id}"
+    try:
+        pipe = get_redis_client().pipeline()
+        pipe.incr(key)
+        pipe.expire(key, WORKFLOW_CHECKPOINT_TTL)
+        count, _ = pipe.execute()
+    except Exception as e:
+        logger.warning(f"[Workflow-Engine] 실행 횟수 기록 실패 (계속 진행): {e}")
+        return True
+    return int(count) <= WORKFLOW_MAX_DELIVERIES
+
+
+def _reject_exhausted_run(task_id: str, execution_context: Dict[str, Any]) -> Dict[str, Any]:
+    """실행 횟수를 넘은 태스크를 실패로 기록하고 정상 종료 (메시지 ack → 재전달 중단)"""
+    from apps.shared.pubsub import publish_workflow_event
+    from apps.workflow_engine.workflow.core.workflow_logger import WorkflowLogger
+
+    message = (
+        f"Workflow task {task_id} exceeded {WORKFLOW_MAX_DELIVERIES} attempts "
+        "(retries and redeliveries after worker loss)."
+    )
+    logger.error(f"[Workflow-Engine] {message}")
+    run_id = execution_context.get("workflow_run_id")
+    if run_id:
+        try:
+            run_logger = WorkflowLogger()
+            run_logger.workflow_run_id = uuid.UUID(str(run_id))
+            run_logger.update_run_log_error(message)
+            publish_workflow_event(str(run_id), "error", {"message": message})
+        except Exception as e:
+            logger.error(f"[Workflow-Engine] 실행 실패 기록 실패: {e}")
+    return {"status": "failed", "error": message}
+
+
+def _fail_cancelled_run(engine, message: str, publish: bool = True) -> None:
+    """
+    [FIX] 엔진이 실패를 기록하기 전에 취소된 실행(데드라인 초과)을 실패로 기록
+
+    취소는 엔진의 예외 처리(except Exception)를 거치지 않으므로
+    실행 로그 갱신과 error 이벤트 발행을 직접 합니다.
+    """
+    if engine is None:
+        return
+    try:
+        engine.logger.update_run_log_error(message)
+        run_id = engine.execution_context.get("workflow_run_id")
+        if publish and run_id:
+            from apps.shared.pubsub import publish_workflow_event
+
+            publish_workflow_event(run_id, "error", {"message": message})
+    except Exception as e:
+        logger.error(f"[Workflow-Engine] 실행 실패 기록 실패: {e}")
+
 
-@celery_app.task(name="workflow.execute", bind=True, max_retries=3)
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def _shutdown_worker_loop(**kwargs):
+    """워커(프로세스) 종료 시 공용 이벤트 루프와 루프에 묶인 Redis/DB 풀 정리"""
+    shutdown_worker_loop()
+
+
+@celery_app.task(
+    name="workflow.execute",
+    bind=True,
+    max_retries=3,
+    acks_late=True,  # [PERF] 워커가 죽으면 재전달 → 체크포인트에서 이어서 실행
+    # 체크포인트가 꺼져 있으면 재전달 시 처음부터 다시 실행(외부 부작용 반복)되므로 재전달하지 않음
+    reject_on_worker_lost=WORKFLOW_CHECKPOINT_ENABLED,
+)
 def execute_workflow(
     self,
     graph: Dict[str, Any],
@@ -39,11 +193,12 @@ def execute_workflow(
 
     session = SessionLocal()
     engine = None
-    # [FIX] 명시적 이벤트 루프 관리 (메모리 누수 방지)
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
     sync_result = {}
     try:
+        # [FIX] 재시도/재전달 횟수 제한
+        if not _claim_delivery(self.request.id):
+            return _reject_exhausted_run(self.request.id, execution_context)
+
         # [NEW] DB Knowledge Base 동기화 (Sync Hook)
         try:
             user_id_str = execution_context.get("user_id")
@@ -56,6 +211,9 @@ def execute_workflow(
         except Exception as e:
             logger.error(f"[Workflow-Engine] 동기화 훅 실패: {e}")
 
+        # [PERF] 재시도/재전달에도 같은 태스크 ID → 완료된 노드 결과 복원
+        execution_context.setdefault("checkpoint_id", self.request.id)
+
         engine = WorkflowEngine(
             graph=graph,
             user_input=user_input,
@@ -64,12 +222,16 @@ def execute_workflow(
             db=session,
         )
 
-        # 워크플로우 실행 (async → sync 변환 )
-        result = loop.run_until_complete(engine.execute())
+        # 워크플로우 실행 (async → sync 변환, [PERF] 워커 공용 이벤트 루프)
+        result = run_in_worker_loop(engine.execute())
         return {"status": "success", "result": result, "sync_status": sync_result}
 
     except Exception as e:
         logger.error(f"[Workflow-Engine] execute_workflow 실패: {e}")
+        if isinstance(e, WorkflowDeadlineExceeded):
+            # [FIX] 데드라인 초과는 재시도해도 같은 결과 → 실패로 기록하고 재시도하지 않음
+            _fail_cancelled_run(engine, str(e))
+            raise Exception(str(e))
         # Session 객체 참조를 제거하기 위해 예외를 새로 생성
         raise self.retry(exc=Exception(str(e)), countdown=2**self.request.retries)
     finally:
@@ -77,13 +239,16 @@ def execute_workflow(
         if engine is not None:
             engine.cleanup()
         session.close()
-        # [FIX] Redis 클라이언트 정리 (Event Loop Closed 오류 방지)
-        loop.run_until_complete(close_async_redis_client())
-        loop.close()
-        asyncio.set_event_loop(None)
 
 
-@celery_app.task(name="workflow.execute_deployed", bind=True, max_retries=3)
+@celery_app.task(
+    name="workflow.execute_deployed",
+    bind=True,
+    max_retries=3,
+    acks_late=True,  # [PERF] 워커가 죽으면 재전달 → 체크포인트에서 이어서 실행
+    # 체크포인트가 꺼져 있으면 재전달 시 처음부터 다시 실행(외부 부작용 반복)되므로 재전달하지 않음
+    reject_on_worker_lost=WORKFLOW_CHECKPOINT_ENABLED,
+)
 def execute_deployed_workflow(
     self,
     workflow_id: str,
@@ -106,10 +271,11 @@ def execute_deployed_workflow(
 
     session = SessionLocal()
     engine = None
-    # [FIX] 명시적 이벤트 루프 관리 (메모리 누수 방지)
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
     try:
+        # [FIX] 재시도/재전달 횟수 제한
+        if not _claim_delivery(self.request.id):
+            return _reject_exhausted_run(self.request.id, execution_context)
+
         # 배포된 워크플로우 조회
         deployment = (
             session.query(WorkflowDeployment)
@@ -140,6 +306,9 @@ def execute_deployed_workflow(
         except Exception as e:
             logger.error(f"[Workflow-Engine] 동기화 훅 실패: {e}")
 
+        # [PERF] 재시도/재전달에도 같은 태스크 ID → 완료된 노드 결과 복원
+        execution_context.setdefault("checkpoint_id", self.request.id)
+
         engine = WorkflowEngine(
             graph=graph,
             user_input=user_input,
@@ -148,12 +317,16 @@ def execute_deployed_workflow(
             db=session,
         )
 
-        # 워크플로우 실행 (async → sync 변환)
-        result = loop.run_until_complete(engine.execute())
+        # 워크플로우 실행 (async → sync 변환, [PERF] 워커 공용 이벤트 루프)
+        result = run_in_worker_loop(engine.execute())
         return {"status": "success", "result": result, "sync_status": sync_result}
 
     except Exception as e:
         logger.error(f"[Workflow-Engine] execute_deployed_workflow 실패: {e}")
+        if isinstance(e, WorkflowDeadlineExceeded):
+            # [FIX] 데드라인 초과는 재시도해도 같은 결과 → 실패로 기록하고 재시도하지 않음
+            _fail_cancelled_run(engine, str(e))
+            raise Exception(str(e))
         # Session 객체 참조를 제거하기 위해 예외를 새로 생성
         raise self.retry(exc=Exception(str(e)), countdown=2**self.request.retries)
     finally:
@@ -161,13 +334,16 @@ def execute_deployed_workflow(
         if engine is not None:
             engine.cleanup()
         session.close()
-        # [FIX] Redis 클라이언트 정리 (Event Loop Closed 오류 방지)
-        loop.run_until_complete(close_async_redis_client())
-        loop.close()
-        asyncio.set_event_loop(None)
 
 
-@celery_app.task(name="workflow.execute_by_deployment", bind=True, max_retries=3)
+@celery_app.task(
+    name="workflow.execute_by_deployment",
+    bind=True,
+    max_retries=3,
+    acks_late=True,  # [PERF] 워커가 죽으면 재전달 → 체크포인트에서 이어서 실행
+    # 체크포인트가 꺼져 있으면 재전달 시 처음부터 다시 실행(외부 부작용 반복)되므로 재전달하지 않음
+    reject_on_worker_lost=WORKFLOW_CHECKPOINT_ENABLED,
+)
 def execute_by_deployment(
     self,
     deployment_id: str,
@@ -185,27 +361,28 @@ def execute_by_deployment(
     Returns:
         워크플로우 실행 결과
     """
-    from apps.shared.db.models.workflow_deployment import WorkflowDeployment
     from apps.workflow_engine.workflow.core.workflow_engine import WorkflowEngine
 
     session = SessionLocal()
     engine = None
-    # [FIX] 명시적 이벤트 루프 관리 (메모리 누수 방지)
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
     try:
-        # 배포 정보 조회
-        deployment = (
-            session.query(WorkflowDeployment)
-            .filter(WorkflowDeployment.id == deployment_id)
-            .first()
-        )
-
-        if not deployment:
-            raise ValueError(f"배포를 찾을 수 없습니다: {deployment_id}")
-
-        if not deployment.graph_snapshot:
-            raise ValueError(f"배포 그래프 데이터가 없습니다: {deployment_id}")
+        # [FIX] 재시도/재전달 횟수 제한
+        if not _claim_delivery(self.request.id):
+            return _reject_exhausted_run(self.request.id, execution_context)
+
+        # [FIX] 스케줄 실행은 실행 시점에 배포 활성 여부 확인
+        # 스케줄러의 제거/변경 이벤트가 유실·지연되어도 비활성화/롤백된 배포는 실행하지 않음
+        if execution_context.get("trigger_mode") == "schedule" and not _is_deployment_active(
+            session, deployment_id
+        ):
+            logger.info(
+                f"[Workflow-Engine] 비활성 배포의 스케줄 실행 건너뜀: {deployment_id} "
+                f"(schedule_id: {user_input.get('schedule_id')})"
+            )
+            return {"status": "skipped", "reason": "deployment_inactive"}
+
+        # 배포 그래프 조회 ([PERF] 워커 LRU 캐시)
+        graph = _load_deployment_graph(session, deployment_id)
 
         # [NEW] DB Knowledge Base 동기화 (Sync Hook)
         sync_result = {}
@@ -216,24 +393,31 @@ def execute_by_deployment(
 
                 user_id = uuid.UUID(user_id_str)
                 syncer = SyncService(db=session, user_id=user_id)
-                sync_result = syncer.sync_knowledge_bases(deployment.graph_snapshot)
+                sync_result = syncer.sync_knowledge_bases(graph)
         except Exception as e:
             logger.error(f"[Workflow-Engine] 동기화 훅 실패: {e}")
 
+        # [PERF] 재시도/재전달에도 같은 태스크 ID → 완료된 노드 결과 복원
+        execution_context.setdefault("checkpoint_id", self.request.id)
+
         engine = WorkflowEngine(
-            graph=deployment.graph_snapshot,
+            graph=graph,
             user_input=user_input,
             execution_context=execution_context,
             is_deployed=True,
             db=session,
         )
 
-        # 워크플로우 실행 (async → sync 변환)
-        result = loop.run_until_complete(engine.execute())
+        # 워크플로우 실행 (async → sync 변환, [PERF] 워커 공용 이벤트 루프)
+        result = run_in_worker_loop(engine.execute())
         return {"status": "success", "result": result, "sync_status": sync_result}
 
     except Exception as e:
         logger.error(f"[Workflow-Engine] execute_by_deployment 실패: {e}")
+        if isinstance(e, WorkflowDeadlineExceeded):
+            # [FIX] 데드라인 초과는 재시도해도 같은 결과 → 실패로 기록하고 재시도하지 않음
+            _fail_cancelled_run(engine, str(e))
+            raise Exception(str(e))
         # Session 객체 참조를 제거하기 위해 예외를 새로 생성
         raise self.retry(exc=Exception(str(e)), countdown=2**self.request.retries)
     finally:
@@ -241,13 +425,13 @@ def execute_by_deployment(
         if engine is not None:
             engine.cleanup()
         session.close()
-        # [FIX] Redis 클라이언트 정리 (Event Loop Closed 오류 방지)
-        loop.run_until_complete(close_async_redis_client())
-        loop.close()
-        asyncio.set_event_loop(None)
 
 
-@celery_app.task(name="workflow.stream", bind=True, max_retries=3)
+@celery_app.task(
+    name="workflow.stream",
+    bind=True,
+    max_retries=3,
+)
 def stream_workflow(
     self,
     graph: Dict[str, Any],
@@ -274,9 +458,6 @@ def stream_workflow(
 
     session = SessionLocal()
     engine = None
-    # [FIX] 명시적 이벤트 루프 관리 (메모리 누수 방지)
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
     try:
         # 외부 run_id를 execution_context에 주입
         execution_context["workflow_run_id"] = external_run_id
@@ -301,6 +482,9 @@ def stream_workflow(
         except Exception as e:
             logger.error(f"[Workflow-Engine] 동기화 훅 실패: {e}")
 
+        # [PERF] 재시도/재전달에도 같은 태스크 ID → 완료된 노드 결과 복원
+        execution_context.setdefault("checkpoint_id", self.request.id)
+
         engine = WorkflowEngine(
             graph=graph,
             user_input=user_input,
@@ -322,7 +506,7 @@ def stream_workflow(
                     )
             return final_result
 
-        result = loop.run_until_complete(run_stream())
+        result = run_in_worker_loop(run_stream())
         return {"status": "success", "result": result, "sync_status": sync_result}
 
     except Exception as e:
@@ -331,6 +515,10 @@ def stream_workflow(
         from apps.shared.pubsub import publish_workflow_event
 
         publish_workflow_event(external_run_id, "error", {"message": str(e)})
+        if isinstance(e, WorkflowDeadlineExceeded):
+            # [FIX] 데드라인 초과는 재시도해도 같은 결과 → 실패로 기록하고 재시도하지 않음
+            _fail_cancelled_run(engine, str(e), publish=False)
+            raise Exception(str(e))
         # Session 객체 참조를 제거하기 위해 예외를 새로 생성
         raise self.retry(exc=Exception(str(e)), countdown=2**self.request.retries)
     finally:
@@ -338,7 +526,3 @@ def stream_workflow(
         if engine is not None:
             engine.cleanup()
         session.close()
-        # [FIX] Redis 클라이언트 정리 (Event Loop Closed 오류 방지)
-        loop.run_until_complete(close_async_redis_client())
-        loop.close()
-        asyncio.set_event_loop(None)
@@ -0,0 +1,180 @@
+import concurrent.futures
+from unittest.mock import patch
+
+import pytest
+
+from apps.workflow_engine.workflow.nodes.file_extraction import file_extraction_node
+from apps.workflow_engine.workflow.nodes.file_extraction.entities import (
+    FileExtractionNodeData,
+    FileExtractionVariable,
+)
+from apps.workflow_engine.workflow.nodes.file_extraction.file_extraction_node import (
+    FileExtractionNode,
+)
+
+
+def _make_node(output_pages: bool = False) -> FileExtractionNode:
+    data = FileExtractionNodeData(
+        title="File Extraction",
+        referenced_variables=[
+            FileExtractionVariable(name="doc", value_selector=["start", "file"])
+        ],
+        output_pages=output_pages,
+    )
+    return FileExtractionNode(id="file-1", data=data)
+
+
+def _fake_extract(path, pages=None):
+    pages = pages if pages is not None else range(3)
+    return [f"page-{i}" for i in pages]
+
+
+@pytest.fixture
+def thread_executor():
+    """프로세스 풀 대신 스레드 풀로 대체 (테스트에서 프로세스 spawn 방지)"""
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    file_extraction_node._extraction_cache.clear()
+    with patch.object(
+        file_extraction_node, "_get_process_executor", return_value=executor
+    ):
+        yield executor
+    executor.shutdown(wait=True)
+    file_extraction_node._extraction_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_same_content_is_parsed_once(tmp_path, thread_executor):
+    """동일 콘텐츠는 캐시를 사용하여 한 번만 파싱"""
+    file_a = tmp_path / "a.pdf"
+    file_b = tmp_path / "b.pdf"
+    file_a.write_bytes(b"same-bytes")
+    file_b.write_bytes(b"same-bytes")
+
+    with patch.object(
+        file_extraction_node, "_count_pages", return_value=3
+    ), patch.object(
+        file_extraction_node, "_extract_pages", side_effect=_fake_extract
+    ) as mock_extract:
+        first = await _make_node().execute({"start": {"file": str(file_a)}})
+        second = await _make_node().execute({"start": {"file": str(file_b)}})
+
+    assert first["doc"] == "page-0\n\npage-1\n\npage-2"
+    assert second == first
+    assert mock_extract.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_large_pdf_split_into_page_ranges(tmp_path, thread_executor):
+    """페이지 수가 많은 문서는 구간별로 나눠 추출하고 순서를 유지"""
+    file_path = tmp_path / "big.pdf"
+    file_path.write_bytes(b"big-document")
+    page_count = file_extraction_node.PARALLEL_PAGE_THRESHOLD + 5
+
+    with patch.object(
+        file_extraction_node, "_count_pages", return_value=page_count
+    ), patch.object(
+        file_extraction_node, "_extract_pages", side_effect=_fake_extract
+    ) as mock_extract:
+        outputs = await _make_node(output_pages=True).execute(
+            {"start": {"file": str(file_path)}}
+        )
+
+    assert outputs["doc"] == [f"page-{i}" for i in range(page_count)]
+    expected_calls = -(-page_count // file_extraction_node.PAGES_PER_TASK)
+    assert mock_extract.call_count == expected_calls
+
+
+@pytest.mark.asyncio
+async def test_download_rejects_oversized_file():
+    """Content-Length가 제한을 넘으면 다운로드 중단"""
+    import httpx
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            headers={"content-length": str(file_extraction_node.MAX_DOWNLOAD_BYTES + 1)},
+            content=b"x",
+        )
+
+    transport = httpx.MockTransport(handler)
+    original_client = httpx.AsyncClient
+
+    with patch.object(
+        file_extraction_node.httpx,
+        "AsyncClient",
+        lambda **kwargs: original_client(transport=transport, **kwargs),
+    ):
+        with pytest.raises(RuntimeError, match="제한"):
+            await _make_node()._download_file("https://example.com/file.pdf")
+
+
+@pytest.mark.asyncio
+async def test_download_streams_to_temp_file_with_digest():
+    """스트리밍 다운로드 결과와 다이제스트가 파일 내용과 일치"""
+    import hashlib
+    import os
+
+    import httpx
+
+    body = b"%PDF" + b"x" * (file_extraction_node.DOWNLOAD_CHUNK_SIZE * 2)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    original_client = httpx.AsyncClient
+
+    with patch.object(
+        file_extraction_node.httpx,
+        "AsyncClient",
+        lambda **kwargs: original_client(transport=transport, **kwargs),
+    ):
+        path, digest = await _make_node()._download_file("https://example.com/a.pdf")
+
+    try:
+        with open(path, "rb") as f:
+            assert f.read() == body
+        assert digest == hashlib.sha256(body).hexdigest()
+        assert path.endswith(".pdf")
+    finally:
+        os.remove(path)
+
+
+@pytest.mark.asyncio
+async def test_download_batches_disk_writes():
+    """64KB 청크마다가 아니라 DOWNLOAD_WRITE_BUFFER 단위로 모아서 기록"""
+    import os
+    import tempfile
+
+    import httpx
+
+    buffer_size = file_extraction_node.DOWNLOAD_WRITE_BUFFER
+    body = b"y" * (buffer_size * 2 + 10)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    original_client = httpx.AsyncClient
+    writes = []
+    original_temp_file = tempfile.NamedTemporaryFile
+
+    def counting_temp_file(**kwargs):
+        tmp = original_temp_file(**kwargs)
+        original_write = tmp.write
+
+        def write(data):
+            writes.append(len(data))
+            return original_write(data)
+
+        tmp.write = write
+        return tmp
+
+    with patch.object(
+        file_extraction_node.httpx,
+        "AsyncClient",
+        lambda **kwargs: original_client(transport=transport, **kwargs),
+    ), patch.object(
+        file_extraction_node.tempfile, "NamedTemporaryFile", counting_temp_file
+    ):
+        path, _ = await _make_node()._download_file("https://example.com/a.pdf")
+
+    try:
+        with open(path, "rb") as f:
+            assert f.read() == body
+        assert sum(writes) == len(body)
+        assert len(writes) == 3
+    finally:
+        os.remove(path)
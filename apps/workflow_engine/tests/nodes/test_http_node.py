@@ -16,6 +16,7 @@ import os
 import sys
 from unittest.mock import Mock, patch, AsyncMock
 
+import httpx
 import pytest
 
 # Add project root to sys.path
@@ -182,3 +183,87 @@ async def test_http_node_variable_substitution():
     assert outputs["status"] == 200
 
 
+
+
+class _MockPool:
+    """HttpClientPool 대체: MockTransport 기반 단일 클라이언트"""
+
+    def __init__(self, handler):
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.requested_urls = []
+
+    def get_client(self, url):
+        self.requested_urls.append(url)
+        return self.client
+
+
+@pytest.mark.asyncio
+async def test_http_node_uses_engine_pool():
+    """execution_context의 커넥션 풀이 있으면 단발성 클라이언트를 만들지 않음"""
+    pool = _MockPool(lambda request: httpx.Response(200, json={"ok": True}))
+    node_data = HttpRequestNodeData(
+        title="풀 사용", url="https://api.example.com/items", timeout=5000
+    )
+    node = HttpRequestNode(
+        id="http-1", data=node_data, execution_context={"http_client_pool": pool}
+    )
+
+    with patch("httpx.AsyncClient") as MockClient:
+        outputs = await node.execute({})
+        MockClient.assert_not_called()
+
+    assert outputs["data"] == {"ok": True}
+    assert pool.requested_urls == ["https://api.example.com/items"]
+
+
+@pytest.mark.asyncio
+async def test_http_node_ttl_cache_and_etag_revalidation():
+    """TTL 내에는 요청을 생략하고, 만료 후에는 If-None-Match로 재검증"""
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"value": 1}, headers={"ETag": '"v1"'})
+
+    pool = _MockPool(handler)
+    node_data = HttpRequestNodeData(
+        title="캐시", url="https://api.example.com/config", timeout=5000, cache_ttl=60
+    )
+    node = HttpRequestNode(
+        id="http-1", data=node_data, execution_context={"http_client_pool": pool}
+    )
+
+    first = await node.execute({})
+    second = await node.execute({})
+    assert len(seen_headers) == 1
+    assert second == first
+
+    # TTL 만료 → 조건부 요청 → 304면 캐시된 응답 반환
+    for entry in node._response_cache.values():
+        entry["expires_at"] = 0
+    third = await node.execute({})
+
+    assert len(seen_headers) == 2
+    assert seen_headers[1]["if-none-match"] == '"v1"'
+    assert third["status"] == 200
+    assert third["data"] == {"value": 1}
+
+
+@pytest.mark.asyncio
+async def test_http_node_response_size_limit():
+    """max_response_bytes를 넘는 응답은 실패 처리"""
+    pool = _MockPool(lambda request: httpx.Response(200, content=b"x" * 2048))
+    node_data = HttpRequestNodeData(
+        title="크기 제한",
+        url="https://api.example.com/large",
+        timeout=5000,
+        max_response_bytes=1024,
+    )
+    node = HttpRequestNode(
+        id="http-1", data=node_data, execution_context={"http_client_pool": pool}
+    )
+
+    with pytest.raises(ValueError, match="제한"):
+        await node.execute({})
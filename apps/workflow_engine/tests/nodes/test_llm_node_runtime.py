@@ -139,3 +139,176 @@ async def test_llm_node_uses_fallback_model_on_failure(monkeypatch):
     assert fallback_client.calls
     assert result["text"] == "fallback ok"
     assert result["model"] == "fallback-model"
+
+
+class FakeAsyncSession:
+    """run_sync만 흉내내는 비동기 세션"""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.closed = False
+
+    async def __aenter__(self):
+        self.registry.append(self)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self, *args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_llm_node_uses_per_task_async_sessions(monkeypatch):
+    """async_session_factory가 있으면 공유 동기 세션 대신 태스크 전용 세션 사용"""
+    dummy_client = DummyClient()
+    sessions = []
+    seen = {}
+
+    def fake_get_client_for_user(db, user_id, model_id):
+        seen["client_db"] = db
+        return dummy_client
+
+    def fake_calculate_cost(db, model_id, prompt_tokens, completion_tokens):
+        seen["cost_db"] = db
+        return 0.5
+
+    def fake_log_usage(db, **kwargs):
+        seen["log_db"] = db
+
+    monkeypatch.setattr(LLMService, "get_client_for_user", fake_get_client_for_user)
+    monkeypatch.setattr(LLMService, "calculate_cost", fake_calculate_cost)
+    monkeypatch.setattr(LLMService, "log_usage", fake_log_usage)
+
+    data = LLMNodeData(
+        title="LLM",
+        provider="openai",
+        model_id="gpt-4o",
+        system_prompt="sys",
+        user_prompt="user",
+        assistant_prompt=None,
+        referenced_variables=[],
+        context_variable=None,
+        parameters={},
+    )
+    shared_db = object()
+    node = LLMNode(
+        "llm-1",
+        data,
+        execution_context={
+            "user_id": str(uuid.uuid4()),
+            "db": shared_db,
+            "async_session_factory": lambda: FakeAsyncSession(sessions),
+        },
+    )
+
+    result = await node.execute({})
+
+    assert result["cost"] == 0.5
+    assert seen["client_db"] in sessions
+    assert seen["cost_db"] is seen["log_db"]
+    assert shared_db not in seen.values()
+    assert all(s.closed for s in sessions)
+
+
+def _memory_node(execution_context, client):
+    data = LLMNodeData(
+        title="LLM",
+        provider="openai",
+        model_id="gpt-4o",
+        system_prompt="sys",
+        user_prompt="user",
+        assistant_prompt=None,
+        referenced_variables=[],
+        context_variable=None,
+        parameters={},
+    )
+    node = LLMNode("llm-1", data, execution_context=execution_context)
+    node._client_override = client  # noqa: SLF001 - 테스트용
+    return node
+
+
+def _memory_context():
+    return {
+        "memory_mode": True,
+        "workflow_id": str(uuid.uuid4()),
+        "user_id": str(uuid.uuid4()),
+        "memory_summaries": {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_memory_summary_shared_across_nodes_in_run(monkeypatch):
+    """같은 실행의 LLM 노드들은 요약 호출을 한 번만 수행하고 결과를 저장"""
+    import asyncio
+    from datetime import datetime
+
+    from apps.workflow_engine.workflow.nodes.llm import llm_node as llm_node_module
+
+    summary_client = DummyClient()
+    saved = []
+
+    async def fake_load(workflow_id, user_id):
+        return None
+
+    async def fake_save(workflow_id, user_id, summary, last_run_id, last_started_at):
+        saved.append((summary, last_run_id))
+
+    def fake_history(self, session, workflow_id, user_id, current_run_id, since=None):
+        return {
+            "last_run_id": "run-9",
+            "last_started_at": datetime(2026, 1, 1),
+            "history_lines": ["- #1 [llm-1] input=a | output=b"],
+            "client": summary_client,
+        }
+
+    monkeypatch.setattr(llm_node_module, "load_memory_summary", fake_load)
+    monkeypatch.setattr(llm_node_module, "save_memory_summary", fake_save)
+    monkeypatch.setattr(LLMNode, "_load_memory_history", fake_history)
+
+    context = _memory_context()
+    first_client, second_client = DummyClient(), DummyClient()
+    await asyncio.gather(
+        _memory_node(context, first_client).execute({}),
+        _memory_node(context, second_client).execute({}),
+    )
+
+    assert len(summary_client.calls) == 1
+    assert saved == [("hello world", "run-9")]
+    for client in (first_client, second_client):
+        contents = [m["content"] for m in client.calls[0]["messages"]]
+        assert any("hello world" in c for c in contents)
+
+
+@pytest.mark.asyncio
+async def test_memory_summary_reused_when_no_new_runs(monkeypatch):
+    """캐시된 요약 이후 새 실행이 없으면 LLM 호출 없이 기존 요약 사용"""
+    from datetime import datetime
+
+    from apps.workflow_engine.workflow.nodes.llm import llm_node as llm_node_module
+
+    last_started_at = datetime(2026, 1, 1)
+    seen_since = []
+
+    async def fake_load(workflow_id, user_id):
+        return {
+            "summary": "cached summary",
+            "last_run_id": "run-1",
+            "last_started_at": last_started_at,
+        }
+
+    def fake_history(self, session, workflow_id, user_id, current_run_id, since=None):
+        seen_since.append(since)
+        return None
+
+    monkeypatch.setattr(llm_node_module, "load_memory_summary", fake_load)
+    monkeypatch.setattr(LLMNode, "_load_memory_history", fake_history)
+
+    client = DummyClient()
+    await _memory_node(_memory_context(), client).execute({})
+
+    assert seen_since == [last_started_at]
+    assert len(client.calls) == 1  # 본 호출만 수행
+    contents = [m["content"] for m in client.calls[0]["messages"]]
+    assert any("cached summary" in c for c in contents)
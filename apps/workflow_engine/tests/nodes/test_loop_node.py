@@ -0,0 +1,103 @@
+import pytest
+
+from apps.workflow_engine.services.sandbox_service import SandboxService
+from apps.workflow_engine.workflow.nodes.loop import LoopNode, LoopNodeData
+
+
+def _code_loop_data(**overrides) -> LoopNodeData:
+    """시작 노드 + 코드 노드 하나로 된 서브그래프 (map 모드 대상)"""
+    position = {"x": 0, "y": 0}
+    data = {
+        "title": "반복",
+        "loop_key": "src.items",
+        "subGraph": {
+            "nodes": [
+                {
+                    "id": "start",
+                    "type": "startNode",
+                    "position": position,
+                    "data": {
+                        "title": "시작",
+                        "variables": [
+                            {"id": "v-loop", "name": "loop", "label": "Loop", "type": "text"}
+                        ],
+                    },
+                },
+                {
+                    "id": "code",
+                    "type": "codeNode",
+                    "position": position,
+                    "data": {
+                        "title": "코드",
+                        "code": "def main(inputs):\n    return {'y': inputs['x']['item'] * 2}",
+                        "inputs": [{"name": "x", "source": "start.loop"}],
+                    },
+                },
+                {"id": "memo", "type": "note", "position": position, "data": {}},
+            ],
+            "edges": [{"id": "e1", "source": "start", "target": "code"}],
+        },
+        "outputs": [{"name": "ys", "value_selector": ["code", "y"]}],
+    }
+    data.update(overrides)
+    return LoopNodeData(**data)
+
+
+@pytest.mark.asyncio
+async def test_loop_single_code_node_runs_as_one_batch(monkeypatch):
+    """코드 노드 하나짜리 서브그래프는 반복마다가 아니라 한 번의 배치 요청으로 실행합니다."""
+    calls = []
+
+    def fake_batch(self, code, inputs_list, timeout=60, **kwargs):
+        calls.append((inputs_list, timeout))
+        return [
+            {"error": "[runtime] boom"} if inputs["x"]["item"] == 2 else {"y": inputs["x"]["item"] * 2}
+            for inputs in inputs_list
+        ]
+
+    def fail_single(self, *args, **kwargs):
+        raise AssertionError("map 모드에서는 단건 실행을 호출하지 않아야 합니다")
+
+    monkeypatch.setattr(SandboxService, "execute_python_code_batch", fake_batch)
+    monkeypatch.setattr(SandboxService, "execute_python_code", fail_single)
+
+    node = LoopNode(id="loop-1", data=_code_loop_data(max_iterations=4))
+    outputs = await node.execute({"src": {"items": [1, 2, 3, 4, 5]}})
+
+    assert len(calls) == 1
+    assert [inputs["x"]["index"] for inputs in calls[0][0]] == [0, 1, 2, 3]
+    assert calls[0][1] == 40  # 코드 노드 타임아웃 x 항목 수
+    # 항목별 에러는 해당 반복에만 남고, 출력 매핑은 반복 실행과 동일
+    assert outputs == {"ys": [2, 6, 8]}
+
+
+@pytest.mark.asyncio
+async def test_loop_batch_request_failure_marks_every_iteration(monkeypatch):
+    monkeypatch.setattr(
+        SandboxService,
+        "execute_python_code_batch",
+        lambda self, code, inputs_list, **kwargs: {"error": "overloaded"},
+    )
+
+    node = LoopNode(id="loop-1", data=_code_loop_data(outputs=[]))
+    outputs = await node.execute({"src": {"items": [1, 2]}})
+
+    assert [result["code"] for result in outputs["results"]] == [
+        {"error": "overloaded"},
+        {"error": "overloaded"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "template, context, expected",
+    [
+        ("{{ src.name }}", {"src": {"name": "a"}}, "a"),
+        ("{{ src.name", {}, "{{ src.name"),
+        ("{{ obj.__class__.__mro__ }}", {"obj": object()}, "{{ obj.__class__.__mro__ }}"),
+    ],
+)
+def test_render_template_returns_raw_template_on_error(template, context, expected):
+    """문법 오류나 샌드박스가 막은 접근(SecurityError)은 예외 대신 원본 템플릿 반환"""
+    node = LoopNode(id="loop", data=_code_loop_data())
+
+    assert node._render_template(template, context) == expected
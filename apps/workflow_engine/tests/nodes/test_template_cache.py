@@ -0,0 +1,106 @@
+import pytest
+from jinja2.exceptions import SecurityError
+
+from apps.workflow_engine.workflow.core import template_cache
+from apps.workflow_engine.workflow.core.template_cache import (
+    clear_template_cache,
+    get_template,
+    render_template,
+)
+from apps.workflow_engine.workflow.core.workflow_engine import WorkflowEngine
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    clear_template_cache()
+    yield
+    clear_template_cache()
+
+
+def test_same_source_compiled_once():
+    """동일 소스는 캐시된 컴파일 결과를 재사용"""
+    first = get_template("Hello {{ name }}")
+    second = get_template("Hello {{ name }}")
+
+    assert first is second
+    assert not first.is_static
+    assert render_template("Hello {{ name }}", {"name": "Moduly"}) == "Hello Moduly"
+
+
+def test_static_template_rendered_once():
+    """변수/호출/필터가 없는 템플릿은 렌더링 결과를 재사용"""
+    compiled = get_template("{% set greeting = 'Hi' %}{{ greeting }} {{ 1 + 2 }}")
+
+    assert compiled.is_static
+    assert compiled.render() == "Hi 3"
+    assert compiled.render({"ignored": 1}) == "Hi 3"
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "{{ range(10) | random }}",
+        "{% for i in range(3) %}{{ i }}{% endfor %}",
+        "{% set c = cycler('a', 'b') %}{{ c.next() }}",
+        "{{ 1 is odd }}",
+    ],
+)
+def test_template_with_call_filter_or_test_is_not_static(source):
+    """변수가 없어도 호출/필터/테스트가 있으면 매번 렌더링 (random 등 비결정적 결과)"""
+    compiled = get_template(source)
+
+    assert not compiled.is_static
+
+
+def test_random_filter_rendered_each_time():
+    compiled = get_template("{{ range(100) | random }}")
+
+    assert len({compiled.render() for _ in range(20)}) > 1
+
+
+def test_lru_eviction(monkeypatch):
+    """최대 크기를 넘으면 가장 오래된 항목부터 제거"""
+    monkeypatch.setattr(template_cache, "TEMPLATE_CACHE_SIZE", 2)
+
+    a = get_template("{{ a }}")
+    get_template("{{ b }}")
+    get_template("{{ c }}")
+
+    assert get_template("{{ a }}") is not a
+
+
+def test_sandboxed_environment_blocks_unsafe_access():
+    """샌드박스 환경에서 내부 속성 접근 차단"""
+    with pytest.raises(SecurityError):
+        render_template("{{ obj.__class__.__mro__ }}", {"obj": object()})
+
+
+def test_engine_precompiles_node_templates():
+    """엔진 로드 시 노드 템플릿이 미리 컴파일됨"""
+    graph = {
+        "nodes": [
+            {
+                "id": "start",
+                "type": "startNode",
+                "position": {"x": 0, "y": 0},
+                "data": {"title": "Start"},
+            },
+            {
+                "id": "tpl",
+                "type": "templateNode",
+                "position": {"x": 200, "y": 0},
+                "data": {
+                    "title": "Template",
+                    "template": "Hi {{ user }}",
+                    "variables": [
+                        {"name": "user", "value_selector": ["start", "user"]}
+                    ],
+                },
+            },
+        ],
+        "edges": [{"id": "e1", "source": "start", "target": "tpl"}],
+    }
+
+    WorkflowEngine(graph, {})
+
+    assert len(template_cache._cache) == 1
@@ -0,0 +1,170 @@
+import json
+
+import pytest
+
+from apps.workflow_engine.workflow.core import checkpoint
+from apps.workflow_engine.workflow.core.workflow_engine import WorkflowEngine
+from apps.workflow_engine.workflow.nodes.base.node import Node
+
+POSITION = {"x": 0, "y": 0}
+
+GRAPH = {
+    "nodes": [
+        {"id": "start-1", "type": "startNode", "position": POSITION, "data": {"title": "Start"}},
+        {
+            "id": "template-a",
+            "type": "templateNode",
+            "position": POSITION,
+            "data": {"title": "A", "template": "A: static"},
+        },
+        {
+            "id": "template-b",
+            "type": "templateNode",
+            "position": POSITION,
+            "data": {
+                "title": "B",
+                "template": "B <- {{ a }}",
+                "variables": [{"name": "a", "value_selector": ["template-a", "text"]}],
+            },
+        },
+    ],
+    "edges": [
+        {"id": "e1", "source": "start-1", "target": "template-a"},
+        {"id": "e2", "source": "template-a", "target": "template-b"},
+    ],
+}
+
+KEY = "workflow:checkpoint:task-1"
+
+
+class FakeAsyncRedis:
+    """체크포인트가 쓰는 명령만 구현한 인메모리 async Redis"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.deleted = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def delete(self, key):
+        self.deleted.append(key)
+        self.hashes.pop(key, None)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def hset(self, key, field, value):
+        self._commands.append((key, field, value))
+
+    def expire(self, key, seconds):
+        pass
+
+    async def execute(self):
+        for key, field, value in self._commands:
+            self._redis.hashes.setdefault(key, {})[field] = value
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeAsyncRedis()
+    monkeypatch.setattr(checkpoint, "get_async_redis_client", lambda: fake)
+    # 템플릿 노드도 체크포인트 대상으로 (기본값은 저비용 노드라 다시 실행)
+    monkeypatch.setattr(checkpoint, "CHECKPOINT_SKIP_NODE_TYPES", {"startNode"})
+    return fake
+
+
+@pytest.fixture
+def executed(monkeypatch):
+    node_ids = []
+    execute = Node.execute
+
+    async def recording_execute(node, inputs):
+        node_ids.append(node.id)
+        return await execute(node, inputs)
+
+    monkeypatch.setattr(Node, "execute", recording_execute)
+    return node_ids
+
+
+@pytest.mark.asyncio
+async def test_completed_nodes_saved_and_cleared_on_success(redis, executed, monkeypatch):
+    saved = {}
+
+    async def clear(self):
+        saved.update(redis.hashes.get(self.key, {}))
+        await redis.delete(self.key)
+
+    monkeypatch.setattr(checkpoint.RunCheckpoint, "clear", clear)
+
+    engine = WorkflowEngine(
+        graph=GRAPH, user_input={}, execution_context={"checkpoint_id": "task-1"}
+    )
+    await engine.execute()
+
+    assert executed == ["start-1", "template-a", "template-b"]
+    assert set(saved) == {"template-a", "template-b"}
+    assert json.loads(saved["template-b"]) == {"text": "B <- A: static"}
+    assert redis.deleted == [KEY]
+
+
+@pytest.mark.asyncio
+async def test_retry_restores_completed_nodes_and_runs_remaining(redis, executed):
+    redis.hashes[KEY] = {"template-a": json.dumps({"text": "A: from checkpoint"})}
+
+    engine = WorkflowEngine(
+        graph=GRAPH, user_input={}, execution_context={"checkpoint_id": "task-1"}
+    )
+    result = await engine.execute()
+
+    assert executed == ["start-1", "template-b"]
+    assert result["template-b"] == {"text": "B <- A: from checkpoint"}
+
+
+@pytest.mark.asyncio
+async def test_failed_run_keeps_checkpoint_for_retry(redis, monkeypatch):
+    execute = Node.execute
+
+    async def failing_execute(node, inputs):
+        if node.id == "template-b":
+            raise RuntimeError("transient")
+        return await execute(node, inputs)
+
+    monkeypatch.setattr(Node, "execute", failing_execute)
+
+    engine = WorkflowEngine(
+        graph=GRAPH, user_input={}, execution_context={"checkpoint_id": "task-1"}
+    )
+    with pytest.raises(ValueError, match="transient"):
+        await engine.execute()
+
+    assert set(redis.hashes[KEY]) == {"template-a"}
+    assert redis.deleted == []
+
+
+@pytest.mark.asyncio
+async def test_no_checkpoint_id_uses_noop(redis):
+    engine = WorkflowEngine(graph=GRAPH, user_input={})
+    await engine.execute()
+
+    assert engine.checkpoint is checkpoint.NOOP_CHECKPOINT
+    assert redis.hashes == {}
+
+
+def test_checkpoint_id_not_passed_to_nodes(redis):
+    """서브그래프/서브 워크플로우 엔진이 부모 체크포인트를 복원하지 않도록 노드에는 전달하지 않음"""
+    engine = WorkflowEngine(
+        graph=GRAPH, user_input={}, execution_context={"checkpoint_id": "task-1"}
+    )
+
+    assert engine.checkpoint_id == "task-1"
+    assert all(
+        "checkpoint_id" not in (node.execution_context or {})
+        for node in engine.node_instances.values()
+    )
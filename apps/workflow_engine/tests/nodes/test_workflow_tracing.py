@@ -0,0 +1,122 @@
+import json
+
+import httpx
+import pytest
+
+from apps.workflow_engine.workflow.core import tracing
+from apps.workflow_engine.workflow.core.workflow_engine import WorkflowEngine
+
+GRAPH = {
+    "nodes": [
+        {
+            "id": "start-1",
+            "type": "startNode",
+            "position": {"x": 0, "y": 0},
+            "data": {"title": "Start"},
+        },
+        {
+            "id": "template-a",
+            "type": "templateNode",
+            "position": {"x": 200, "y": 0},
+            "data": {"title": "A", "template": "A: static"},
+        },
+    ],
+    "edges": [{"id": "e1", "source": "start-1", "target": "template-a"}],
+}
+
+PHASES = {
+    "input_resolution",
+    "output_persistence",
+    "event_publish",
+    "scheduled",
+    "waiting",
+    "execution",
+    "collect",
+}
+
+
+@pytest.mark.asyncio
+async def test_unsampled_run_uses_noop_trace(monkeypatch):
+    monkeypatch.setattr(tracing, "WORKFLOW_TRACE_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(tracing, "WORKFLOW_TRACE_SLOW_MS", 0.0)
+
+    engine = WorkflowEngine(graph=GRAPH, user_input={})
+    await engine.execute()
+
+    assert engine.trace is tracing.NOOP_TRACE
+
+
+@pytest.mark.asyncio
+async def test_forced_trace_records_node_phases_and_exports(monkeypatch, tmp_path):
+    monkeypatch.setattr(tracing, "WORKFLOW_TRACE_DIR", str(tmp_path))
+
+    engine = WorkflowEngine(
+        graph=GRAPH,
+        user_input={},
+        execution_context={"trace": True, "workflow_run_id": None},
+    )
+    await engine.execute()
+    trace = engine.trace
+    await tracing.close_trace_exporter()  # 백그라운드 내보내기 완료 대기
+
+    node_spans = [s for s in trace.spans if s.parent_id == trace.root.span_id]
+    assert [s.name for s in node_spans] == ["node.startNode", "node.templateNode"]
+
+    template_span = node_spans[1]
+    phases = {
+        s.name for s in trace.spans if s.parent_id == template_span.span_id
+    }
+    assert phases == PHASES
+    assert all(s.end_ns >= s.start_ns for s in trace.spans)
+
+    otlp = json.loads((tmp_path / f"{trace.trace_id}.otlp.json").read_text())
+    spans = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(spans) == len(trace.spans) + 1  # 루트 포함
+    attributes = {a["key"]: a["value"]["stringValue"] for a in spans[-1]["attributes"]}
+    assert attributes["workflow.node_type"] == "templateNode"
+    assert "workflow.phase" in attributes
+
+    folded = (tmp_path / f"{trace.trace_id}.folded").read_text().splitlines()
+    assert any(line.startswith("workflow;templateNode:template-a;execution ") for line in folded)
+    assert any(line.startswith("workflow;templateNode:template-a ") for line in folded)
+
+
+def test_slow_only_trace_exports_past_threshold(monkeypatch):
+    monkeypatch.setattr(tracing, "WORKFLOW_TRACE_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(tracing, "WORKFLOW_TRACE_SLOW_MS", 1000.0)
+
+    trace = tracing.start_run_trace("run-1", {})
+    trace.finish()
+    assert trace.enabled and not trace.should_export()
+
+    trace.root.end_ns = trace.root.start_ns + 2_000_000_000  # 2초
+    assert trace.should_export()
+
+
+@pytest.mark.asyncio
+async def test_otlp_export_runs_in_background_with_shared_client(monkeypatch):
+    monkeypatch.setattr(tracing, "WORKFLOW_TRACE_OTLP_ENDPOINT", "http://collector/v1/traces")
+    posted, clients = [], []
+    real_client = httpx.AsyncClient
+
+    def make_client(**kwargs):
+        transport = httpx.MockTransport(
+            lambda request: posted.append(json.loads(request.content)) or httpx.Response(200)
+        )
+        clients.append(real_client(transport=transport, **kwargs))
+        return clients[-1]
+
+    monkeypatch.setattr(httpx, "AsyncClient", make_client)
+
+    for _ in range(2):
+        engine = WorkflowEngine(
+            graph=GRAPH, user_input={}, execution_context={"trace": True}
+        )
+        await engine.execute()
+
+    assert tracing._pending_exports  # execute는 내보내기를 기다리지 않음
+    await tracing.close_trace_exporter()
+
+    assert len(posted) == 2
+    assert len(clients) == 1 and clients[0].is_closed
+    assert not tracing._pending_exports
@@ -0,0 +1,50 @@
+import signal
+
+import pytest
+
+from apps.workflow_engine import memory_guard
+
+
+@pytest.fixture
+def guard(monkeypatch):
+    kills = []
+    monkeypatch.setattr(memory_guard, "_shutdown_requested", False)
+    monkeypatch.setattr(memory_guard, "WORKFLOW_WORKER_MAX_MEMORY_MB", 1000)
+    monkeypatch.setattr(memory_guard.os, "kill", lambda pid, sig: kills.append(sig))
+    return kills
+
+
+def test_current_rss_mb_reads_proc():
+    rss = memory_guard.current_rss_mb()
+    assert rss is None or rss > 0
+
+
+def test_under_limit_keeps_worker_running(guard, monkeypatch):
+    monkeypatch.setattr(memory_guard, "current_rss_mb", lambda: 999.0)
+
+    assert memory_guard.check_memory() is False
+    assert guard == []
+
+
+def test_over_limit_requests_warm_shutdown_once(guard, monkeypatch):
+    monkeypatch.setattr(memory_guard, "current_rss_mb", lambda: 1200.0)
+
+    assert memory_guard.check_memory() is True
+    assert memory_guard.check_memory() is False
+    assert guard == [signal.SIGTERM]
+
+
+def test_zero_limit_disables_guard(guard, monkeypatch):
+    monkeypatch.setattr(memory_guard, "WORKFLOW_WORKER_MAX_MEMORY_MB", 0)
+    monkeypatch.setattr(memory_guard, "current_rss_mb", lambda: 99999.0)
+
+    assert memory_guard.check_memory() is False
+    assert guard == []
+
+
+def test_task_postrun_signal_runs_check(guard, monkeypatch):
+    monkeypatch.setattr(memory_guard, "current_rss_mb", lambda: 1200.0)
+
+    memory_guard.task_postrun.send(sender=None, task_id="t", task=None)
+
+    assert guard == [signal.SIGTERM]
@@ -0,0 +1,124 @@
+import pytest
+
+from apps.workflow_engine import tasks
+
+
+class FakeQuery:
+    def __init__(self, row):
+        self._row = row
+
+    def filter(self, *args):
+        return self
+
+    def first(self):
+        return self._row
+
+
+class FakeSession:
+    def __init__(self, row):
+        self._row = row
+        self.closed = False
+
+    def query(self, *columns):
+        return FakeQuery(self._row)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def session(monkeypatch):
+    def use(row):
+        fake = FakeSession(row)
+        monkeypatch.setattr(tasks, "SessionLocal", lambda: fake)
+        return fake
+
+    return use
+
+
+@pytest.fixture
+def graph_loads(monkeypatch):
+    calls = []
+
+    def load(session, deployment_id):
+        calls.append(deployment_id)
+        raise RuntimeError("graph load should not be reached")
+
+    monkeypatch.setattr(tasks, "_load_deployment_graph", load)
+    return calls
+
+
+@pytest.mark.parametrize("row", [(False,), None])
+def test_scheduled_run_of_inactive_deployment_is_skipped(session, graph_loads, row):
+    fake = session(row)
+
+    result = tasks.execute_by_deployment(
+        "dep-1", {"schedule_id": "sch-1"}, {"trigger_mode": "schedule"}
+    )
+
+    assert result == {"status": "skipped", "reason": "deployment_inactive"}
+    assert graph_loads == []
+    assert fake.closed
+
+
+class FakePipeline:
+    def __init__(self, counts):
+        self._counts = counts
+        self._key = None
+
+    def incr(self, key):
+        self._key = key
+
+    def expire(self, key, seconds):
+        pass
+
+    def execute(self):
+        self._counts[self._key] = self._counts.get(self._key, 0) + 1
+        return [self._counts[self._key], True]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.counts = {}
+
+    def pipeline(self):
+        return FakePipeline(self.counts)
+
+
+@pytest.fixture
+def deliveries(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(tasks, "get_redis_client", lambda: fake)
+    monkeypatch.setattr(tasks, "WORKFLOW_MAX_DELIVERIES", 2)
+    return fake
+
+
+def test_run_past_delivery_limit_is_failed_and_acked(
+    session, graph_loads, deliveries, monkeypatch
+):
+    from apps.shared import pubsub
+    from apps.workflow_engine.workflow.core.workflow_logger import WorkflowLogger
+
+    errors, events = [], []
+    monkeypatch.setattr(
+        WorkflowLogger,
+        "update_run_log_error",
+        lambda self, message: errors.append((str(self.workflow_run_id), message)),
+    )
+    monkeypatch.setattr(
+        pubsub, "publish_workflow_event", lambda *args: events.append(args)
+    )
+    run_id = "00000000-0000-0000-0000-000000000001"
+    fake = session((True,))
+    deliveries.counts["workflow:deliveries:task-1"] = 2
+
+    result = tasks.execute_by_deployment.apply(
+        args=("dep-1", {}, {"workflow_run_id": run_id}), task_id="task-1"
+    ).get()
+
+    assert result["status"] == "failed"
+    assert "exceeded 2 attempts" in result["error"]
+    assert graph_loads == []
+    assert errors == [(run_id, result["error"])]
+    assert events[0][:2] == (run_id, "error")
+    assert fake.closed
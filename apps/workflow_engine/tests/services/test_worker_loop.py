@@ -0,0 +1,102 @@
+import asyncio
+import threading
+
+import pytest
+
+from apps.workflow_engine import worker_loop
+
+
+async def _current_loop():
+    await asyncio.sleep(0)
+    return asyncio.get_running_loop(), threading.current_thread().name
+
+
+async def _fail():
+    raise ValueError("boom")
+
+
+@pytest.fixture
+def persistent(monkeypatch):
+    monkeypatch.setattr(worker_loop, "WORKFLOW_EVENT_LOOP", "persistent")
+    monkeypatch.setattr(worker_loop, "_gevent_patched", lambda: False)
+    loop = worker_loop.WorkerEventLoop()
+    monkeypatch.setattr(worker_loop, "_worker_loop", loop)
+    yield loop
+    loop.shutdown()
+
+
+def test_persistent_mode_reuses_one_loop_across_tasks(persistent):
+    first, thread_name = worker_loop.run_in_worker_loop(_current_loop())
+    second, _ = worker_loop.run_in_worker_loop(_current_loop())
+
+    assert first is second
+    assert not first.is_closed()
+    assert thread_name == "workflow-event-loop"
+
+
+def test_persistent_mode_propagates_errors_and_keeps_running(persistent):
+    with pytest.raises(ValueError, match="boom"):
+        worker_loop.run_in_worker_loop(_fail())
+
+    loop, _ = worker_loop.run_in_worker_loop(_current_loop())
+    assert loop.is_running()
+
+
+def test_persistent_loop_restarts_after_fork(persistent, monkeypatch):
+    before, _ = worker_loop.run_in_worker_loop(_current_loop())
+    monkeypatch.setattr(worker_loop.os, "getpid", lambda: -1)
+
+    after, _ = worker_loop.run_in_worker_loop(_current_loop())
+
+    assert after is not before
+
+
+def test_shutdown_stops_and_closes_loop(persistent):
+    loop, _ = worker_loop.run_in_worker_loop(_current_loop())
+
+    persistent.shutdown()
+
+    assert not persistent.running
+    assert loop.is_closed()
+
+
+def test_gevent_patched_worker_falls_back_to_per_task_loops(monkeypatch):
+    monkeypatch.setattr(worker_loop, "WORKFLOW_EVENT_LOOP", "persistent")
+    monkeypatch.setattr(worker_loop, "_gevent_patched", lambda: True)
+
+    first, thread_name = worker_loop.run_in_worker_loop(_current_loop())
+    second, _ = worker_loop.run_in_worker_loop(_current_loop())
+
+    assert first is not second
+    assert first.is_closed()
+    assert thread_name == threading.current_thread().name
+
+
+async def _hang(cancelled):
+    try:
+        await asyncio.sleep(60)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
+
+
+def test_persistent_mode_cancels_coroutine_past_deadline(persistent):
+    cancelled = threading.Event()
+
+    with pytest.raises(worker_loop.WorkflowDeadlineExceeded, match="deadline"):
+        worker_loop.run_in_worker_loop(_hang(cancelled), deadline=0.05)
+
+    assert cancelled.wait(1)
+    loop, _ = worker_loop.run_in_worker_loop(_current_loop())
+    assert loop.is_running()
+
+
+def test_per_task_mode_applies_default_deadline(monkeypatch):
+    monkeypatch.setattr(worker_loop, "WORKFLOW_EVENT_LOOP", "per_task")
+    monkeypatch.setattr(worker_loop, "WORKFLOW_TASK_DEADLINE", 0.05)
+    cancelled = threading.Event()
+
+    with pytest.raises(worker_loop.WorkflowDeadlineExceeded):
+        worker_loop.run_in_worker_loop(_hang(cancelled))
+
+    assert cancelled.is_set()
@@ -0,0 +1,234 @@
+"""
+워커 프로세스 공용 asyncio 이벤트 루프
+
+Celery 태스크마다 새 루프를 만들고 닫으면 루프에 묶인 자원
+(비동기 Redis 클라이언트/이벤트 발행기, asyncpg 커넥션 풀)을 태스크마다 새로 만들고 정리해야 합니다.
+[PERF] 프로세스당 하나의 루프를 전용 스레드에서 계속 돌리고, 태스크는 코루틴만 제출합니다.
+루프별로 캐시되는 커넥션 풀이 태스크 간에 재사용되어 태스크당 준비 비용이 사라집니다.
+
+- WORKFLOW_EVENT_LOOP=persistent (기본): 공용 루프에 제출 (threads / solo / prefork 풀)
+- WORKFLOW_EVENT_LOOP=per_task: 기존처럼 태스크마다 새 루프 생성 후 정리
+
+gevent로 패치된 워커에서는 네이티브 스레드의 asyncio 루프와 패치된 소켓/셀렉터가 섞이므로
+자동으로 per_task 모드로 실행합니다. (워크플로우 워커는 --pool=threads 권장)
+
+[FIX] threads 풀은 Celery task_time_limit/task_soft_time_limit을 적용하지 않으므로
+코루틴마다 WORKFLOW_TASK_DEADLINE(기본: task_soft_time_limit)을 직접 적용합니다.
+초과하면 루프에서 실행을 취소하고 WorkflowDeadlineExceeded를 발생시킵니다.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from apps.shared.celery_app import celery_app
+from apps.shared.db.session import dispose_async_engine
+from apps.shared.pubsub import close_async_redis_client, flush_workflow_events
+from apps.workflow_engine.workflow.core.tracing import close_trace_exporter
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_EVENT_LOOP = os.getenv("WORKFLOW_EVENT_LOOP", "persistent")
+# 공용 루프의 기본 스레드풀 크기 (run_in_executor(None, ...)를 모든 동시 실행이 공유)
+WORKFLOW_LOOP_EXECUTOR_WORKERS = int(os.getenv("WORKFLOW_LOOP_EXECUTOR_WORKERS", "64"))
+# 태스크 하나의 최대 실행 시간 (초, 0이면 제한 없음)
+WORKFLOW_TASK_DEADLINE = float(
+    os.getenv(
+        "WORKFLOW_TASK_DEADLINE", str(celery_app.conf.task_soft_time_limit or 540)
+    )
+)
+# 루프에서 취소가 끝나기를 기다리는 추가 시간 (초)
+WORKFLOW_TASK_CANCEL_GRACE = float(os.getenv("WORKFLOW_TASK_CANCEL_GRACE", "30"))
+
+T = TypeVar("T")
+
+
+class WorkflowDeadlineExceeded(TimeoutError):
+    """태스크 실행 시간이 WORKFLOW_TASK_DEADLINE을 넘은 경우 (재시도 대상 아님)"""
+
+
+def _gevent_patched() -> bool:
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched("threading")
+
+
+class WorkerEventLoop:
+    """
+    전용 스레드에서 계속 실행되는 이벤트 루프
+
+    fork된 자식 프로세스에는 루프 스레드가 없으므로 PID가 바뀌면 새로 시작합니다.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return (
+            self._loop is not None
+            and self._pid == os.getpid()
+            and self._thread is not None
+            and self._thread.is_alive()
+        )
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """공용 루프 반환 (없으면 스레드와 함께 시작)"""
+        if self.running:
+            return self._loop
+        with self._lock:
+            if not self.running:
+                self._start()
+            return self._loop
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=WORKFLOW_LOOP_EXECUTOR_WORKERS,
+                thread_name_prefix="workflow-loop-executor",
+            )
+        )
+        ready = threading.Event()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=run, name="workflow-event-loop", daemon=True)
+        thread.start()
+        ready.wait()
+        self._loop, self._thread, self._pid = loop, thread, os.getpid()
+        logger.info(f"[WorkerLoop] 공용 이벤트 루프 시작 (PID: {self._pid})")
+
+    def run(self, coro: Coroutine[Any, Any, T], deadline: float = 0) -> T:
+        """코루틴을 공용 루프에 제출하고 결과를 기다림 (호출 스레드만 블로킹)"""
+        future = asyncio.run_coroutine_threadsafe(
+            _run_and_flush(coro, deadline), self.get_loop()
+        )
+        # 루프 안의 wait_for가 취소를 마치지 못해도 태스크 스레드는 풀려나도록 여유를 둔 대기
+        timeout = deadline + WORKFLOW_TASK_CANCEL_GRACE if deadline > 0 else None
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise WorkflowDeadlineExceeded(
+                f"Workflow task exceeded deadline of {deadline:g} seconds."
+            )
+        except BaseException:
+            # 태스크 스레드가 중단되면(타임아웃 등) 루프의 실행도 취소
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """루프에 묶인 Redis/DB 풀을 정리하고 루프 스레드 종료"""
+        with self._lock:
+            if not self.running:
+                return
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._pid = None
+
+        try:
+            asyncio.run_coroutine_threadsafe(_close_loop_resources(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"[WorkerLoop] 루프 자원 정리 실패: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+
+async def _run_and_flush(coro: Coroutine[Any, Any, T], deadline: float = 0) -> T:
+    try:
+        if deadline > 0:
+            try:
+                return await asyncio.wait_for(coro, deadline)
+            except asyncio.TimeoutError:
+                raise WorkflowDeadlineExceeded(
+                    f"Workflow task exceeded deadline of {deadline:g} seconds."
+                ) from None
+        return await coro
+    finally:
+        # 루프를 닫지 않으므로 배치 대기 중인 이벤트만 전송 (클라이언트는 다음 태스크가 재사용)
+        try:
+            await flush_workflow_events()
+        except Exception as e:
+            logger.warning(f"[WorkerLoop] 남은 이벤트 발행 실패: {e}")
+
+
+async def _close_loop_resources() -> None:
+    # 백그라운드 트레이스 내보내기 완료 후 OTLP 클라이언트 정리
+    await close_trace_exporter()
+    # [FIX] Redis 클라이언트 정리 (Event Loop Closed 오류 방지)
+    await close_async_redis_client()
+    # [PERF] 루프에 묶인 비동기 DB 커넥션 풀 정리
+    await dispose_async_engine()
+
+
+def _run_on_new_loop(coro: Coroutine[Any, Any, T], deadline: float = 0) -> T:
+    """per_task 모드: 태스크 전용 루프에서 실행 후 루프에 묶인 자원까지 정리"""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(_run_and_flush(coro, deadline))
+    finally:
+        loop.run_until_complete(_close_loop_resources())
+        loop.close()
+        asyncio.set_event_loop(None)
+
+
+_worker_loop = WorkerEventLoop()
+_gevent_warned = False
+
+
+def use_persistent_loop() -> bool:
+    global _gevent_warned
+    if WORKFLOW_EVENT_LOOP != "persistent":
+        return False
+    if _gevent_patched():
+        if not _gevent_warned:
+            logger.warning(
+                "[WorkerLoop] gevent 패치된 워커에서는 태스크별 이벤트 루프로 실행합니다. "
+                "공용 루프를 쓰려면 --pool=threads로 실행하세요."
+            )
+            _gevent_warned = True
+        return False
+    return True
+
+
+def run_in_worker_loop(
+    coro: Coroutine[Any, Any, T], deadline: Optional[float] = None
+) -> T:
+    """
+    Celery 태스크(동기)에서 코루틴 실행
+
+    Args:
+        coro: 실행할 코루틴 (예: engine.execute())
+        deadline: 최대 실행 시간 (초, 기본 WORKFLOW_TASK_DEADLINE, 0이면 제한 없음)
+
+    Returns:
+        코루틴 결과 (예외는 그대로 전파)
+
+    Raises:
+        WorkflowDeadlineExceeded: 최대 실행 시간 초과 (코루틴은 취소됨)
+    """
+    if deadline is None:
+        deadline = WORKFLOW_TASK_DEADLINE
+    if use_persistent_loop():
+        return _worker_loop.run(coro, deadline)
+    return _run_on_new_loop(coro, deadline)
+
+
+def shutdown_worker_loop() -> None:
+    """워커 종료 시 공용 루프 정리 (실행 중이 아니면 no-op)"""
+    _worker_loop.shutdown()
@@ -0,0 +1,138 @@
+"""
+워크플로우 실행 체크포인트 (노드 결과 저장/복원)
+
+Celery 태스크가 실행 도중 실패해 재시도되거나 워커가 죽어 재전달되면
+그래프를 시작 노드부터 다시 실행하므로 이미 성공한 LLM/샌드박스/HTTP 호출 비용을 다시 냅니다.
+완료된 노드 결과를 Redis 해시(workflow:checkpoint:<checkpoint_id>, 필드=node_id)에 저장하고,
+같은 checkpoint_id로 다시 실행되면 저장된 노드는 실행하지 않고 결과만 복원합니다.
+엔진의 스케줄링(분기 선택, 의존성 대기)은 그대로 타므로 남은 노드만 실제로 실행됩니다.
+
+- checkpoint_id: execution_context["checkpoint_id"] (Celery 태스크 ID, 재시도/재전달에도 동일)
+- 결과 비용이 없는 결정적 노드(CHECKPOINT_SKIP_NODE_TYPES)는 저장하지 않고 다시 실행
+- WORKFLOW_CHECKPOINT_MAX_BYTES보다 큰 결과는 저장하지 않음 (재시도 시 다시 실행)
+- 실행이 성공하면 체크포인트 삭제, 최종 실패 시 TTL로 만료
+Redis 장애 시에는 체크포인트 없이 실행합니다.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from apps.shared.pubsub import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_CHECKPOINT_ENABLED = os.getenv("WORKFLOW_CHECKPOINT_ENABLED", "1") != "0"
+WORKFLOW_CHECKPOINT_TTL = int(os.getenv("WORKFLOW_CHECKPOINT_TTL", "21600"))  # 초
+WORKFLOW_CHECKPOINT_MAX_BYTES = int(
+    os.getenv("WORKFLOW_CHECKPOINT_MAX_BYTES", str(1024 * 1024))
+)
+
+# 입력만으로 결과가 정해지고 실행 비용이 거의 없는 노드 (복원하지 않고 다시 실행)
+CHECKPOINT_SKIP_NODE_TYPES = {
+    "startNode",
+    "webhookTrigger",
+    "scheduleTrigger",
+    "templateNode",
+    "conditionNode",
+    "answerNode",
+}
+
+_KEY_PREFIX = "workflow:checkpoint"
+
+
+class NoopCheckpoint:
+    """체크포인트를 쓰지 않는 실행 (서브 워크플로우, checkpoint_id 없음, 비활성화)"""
+
+    enabled = False
+    restored_count = 0
+
+    def restored(self, node_id: str) -> Optional[Dict[str, Any]]:
+        return None
+
+    async def save(self, node_id: str, node_type: str, result: Dict[str, Any]) -> None:
+        pass
+
+    async def clear(self) -> None:
+        pass
+
+
+NOOP_CHECKPOINT = NoopCheckpoint()
+
+
+class RunCheckpoint:
+    """실행 하나의 체크포인트 (이전 시도에서 저장된 결과 + 이번 시도의 저장)"""
+
+    enabled = True
+
+    def __init__(self, checkpoint_id: str, saved: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.checkpoint_id = checkpoint_id
+        self.key = f"{_KEY_PREFIX}:{checkpoint_id}"
+        self._saved = saved or {}
+
+    @property
+    def restored_count(self) -> int:
+        return len(self._saved)
+
+    def restored(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """이전 시도에서 완료된 노드의 결과 (없으면 None)"""
+        return self._saved.get(node_id)
+
+    async def save(self, node_id: str, node_type: str, result: Dict[str, Any]) -> None:
+        """노드 완료 직후 결과 저장 (실패해도 실행에는 영향 없음)"""
+        if node_type in CHECKPOINT_SKIP_NODE_TYPES:
+            return
+        try:
+            payload = json.dumps(result, ensure_ascii=False, default=str)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"[Checkpoint] 노드 {node_id} 결과 직렬화 실패: {e}")
+            return
+        if len(payload.encode("utf-8")) > WORKFLOW_CHECKPOINT_MAX_BYTES:
+            return
+        try:
+            pipe = get_async_redis_client().pipeline(transaction=False)
+            pipe.hset(self.key, node_id, payload)
+            pipe.expire(self.key, WORKFLOW_CHECKPOINT_TTL)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[Checkpoint] 노드 {node_id} 저장 실패: {e}")
+
+    async def clear(self) -> None:
+        """실행 성공 시 체크포인트 삭제"""
+        try:
+            await get_async_redis_client().delete(self.key)
+        except Exception as e:
+            logger.warning(f"[Checkpoint] 삭제 실패: {e}")
+
+
+async def open_run_checkpoint(checkpoint_id: Optional[str]):
+    """
+    checkpoint_id의 체크포인트를 열고 이전 시도에서 저장된 노드 결과를 불러옴
+
+    Returns:
+        RunCheckpoint (checkpoint_id가 없거나 비활성화면 NoopCheckpoint)
+    """
+    if not checkpoint_id or not WORKFLOW_CHECKPOINT_ENABLED:
+        return NOOP_CHECKPOINT
+
+    checkpoint = RunCheckpoint(checkpoint_id)
+    try:
+        raw = await get_async_redis_client().hgetall(checkpoint.key)
+    except Exception as e:
+        logger.warning(f"[Checkpoint] 불러오기 실패, 처음부터 실행: {e}")
+        return checkpoint
+
+    saved = {}
+    for node_id, payload in raw.items():
+        if isinstance(node_id, bytes):
+            node_id = node_id.decode("utf-8")
+        try:
+            saved[node_id] = json.loads(payload)
+        except ValueError:
+            continue
+    if saved:
+        logger.info(
+            f"[Checkpoint] {checkpoint_id}: 이전 시도에서 완료된 노드 {len(saved)}개 복원"
+        )
+    return RunCheckpoint(checkpoint_id, saved)
@@ -0,0 +1,103 @@
+"""
+컴파일된 Jinja2 템플릿 캐시 (프로세스 전역)
+
+LLM/HTTP/Loop/Template 노드가 실행마다 템플릿을 파싱·컴파일하지 않도록
+소스 해시를 키로 컴파일 결과와 정적 여부를 LRU로 보관합니다.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from jinja2 import meta, nodes
+from jinja2.sandbox import SandboxedEnvironment
+
+TEMPLATE_CACHE_SIZE = int(os.getenv("TEMPLATE_CACHE_SIZE", 2048))
+
+# 사용자 입력 템플릿이므로 샌드박스 환경에서 컴파일 (속성/메서드 접근 제한)
+_env = SandboxedEnvironment(autoescape=False)
+
+# 호출/필터/테스트가 있으면 변수가 없어도 렌더링마다 결과가 달라질 수 있음 (random, cycler 등)
+_DYNAMIC_NODES = (nodes.Call, nodes.Filter, nodes.Test)
+
+_cache: "OrderedDict[str, CompiledTemplate]" = OrderedDict()
+_lock = threading.Lock()
+
+
+class CompiledTemplate:
+    """컴파일된 템플릿과 1회 분석한 메타데이터"""
+
+    __slots__ = ("template", "is_static", "_static_text")
+
+    _UNRENDERED = object()
+
+    def __init__(self, source: str):
+        ast = _env.parse(source)
+        self.template = _env.from_string(ast)
+        # 참조 변수도 호출/필터/테스트도 없는 템플릿만 결과가 항상 같음
+        variables = meta.find_undeclared_variables(ast)
+        self.is_static = not variables and ast.find(_DYNAMIC_NODES) is None
+        self._static_text = self._UNRENDERED
+
+    def render(self, context: Optional[Dict[str, Any]] = None) -> str:
+        """정적 템플릿은 최초 1회만 렌더링하고 결과를 재사용"""
+        if self.is_static:
+            if self._static_text is self._UNRENDERED:
+                self._static_text = self.template.render()
+            return self._static_text
+        return self.template.render(context or {})
+
+
+def _cache_key(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def get_template(source: str) -> CompiledTemplate:
+    """
+    소스 문자열에 해당하는 컴파일된 템플릿 반환 (없으면 컴파일 후 캐시)
+
+    Raises:
+        jinja2.TemplateSyntaxError: 템플릿 문법 오류
+    """
+    key = _cache_key(source)
+    with _lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            _cache.move_to_end(key)
+            return compiled
+
+    compiled = CompiledTemplate(source)
+
+    with _lock:
+        _cache[key] = compiled
+        _cache.move_to_end(key)
+        while len(_cache) > TEMPLATE_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return compiled
+
+
+def render_template(source: str, context: Optional[Dict[str, Any]] = None) -> str:
+    """캐시된 템플릿으로 렌더링"""
+    return get_template(source).render(context)
+
+
+def precompile_templates(sources: Iterable[Optional[str]]) -> None:
+    """
+    워크플로우 로드 시 템플릿을 미리 컴파일합니다.
+    문법 오류는 여기서 무시하고, 노드 실행 시점에 각 노드의 방식대로 처리합니다.
+    """
+    for source in sources:
+        if not source or not isinstance(source, str) or "{" not in source:
+            continue
+        try:
+            get_template(source)
+        except Exception:
+            continue
+
+
+def clear_template_cache() -> None:
+    """캐시 비우기 (테스트용)"""
+    with _lock:
+        _cache.clear()
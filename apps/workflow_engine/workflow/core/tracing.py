@@ -0,0 +1,391 @@
+"""
+워크플로우 실행 트레이싱 (노드별 단계 스팬)
+
+느린 실행의 시간이 어디서 쓰였는지 보기 위해 노드마다 스팬을 만들고
+아래 단계를 하위 스팬으로 기록합니다. (모든 스팬에 run_id, node_type 태그)
+- input_resolution: 입력 컨텍스트 구성
+- output_persistence: 노드 로그 생성/완료 기록 (실행기 스레드)
+- event_publish: node_start/node_finish 이벤트 발행
+- scheduled: 태스크 생성 후 이벤트 루프가 실행을 시작하기까지
+- waiting: 동시 실행 세마포어 대기
+- execution: 노드 실행 (DB 조회, provider 호출 포함)
+- collect: 노드 완료 후 엔진 메인 루프가 결과를 수거하기까지 (대기 루프 지연)
+
+내보내기
+- OTLP/JSON (OpenTelemetry 호환): WORKFLOW_TRACE_DIR 파일 또는 WORKFLOW_TRACE_OTLP_ENDPOINT로 POST
+- folded stack (flamegraph.pl, speedscope 입력): WORKFLOW_TRACE_DIR 파일
+- 둘 다 설정이 없으면 단계별 합계를 로그로 남김
+- 실행 결과 반환을 늦추지 않도록 백그라운드 태스크로 내보내고,
+  OTLP 전송은 이벤트 루프별 httpx.AsyncClient 하나를 재사용
+
+샘플링 (운영 상시 사용)
+- WORKFLOW_TRACE_SAMPLE_RATE: 실행 단위 헤드 샘플링 비율 (0~1)
+- WORKFLOW_TRACE_SLOW_MS: 0보다 크면 모든 실행을 기록하고 이 시간 이상 걸린 실행만 내보냄
+- execution_context["trace"] = True 이면 항상 기록
+샘플링되지 않은 실행은 NoopTrace를 사용하므로 비용이 거의 없습니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import secrets
+import time
+import weakref
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_TRACE_SAMPLE_RATE = float(os.getenv("WORKFLOW_TRACE_SAMPLE_RATE", "0"))
+WORKFLOW_TRACE_SLOW_MS = float(os.getenv("WORKFLOW_TRACE_SLOW_MS", "0"))
+WORKFLOW_TRACE_DIR = os.getenv("WORKFLOW_TRACE_DIR", "")
+WORKFLOW_TRACE_OTLP_ENDPOINT = os.getenv("WORKFLOW_TRACE_OTLP_ENDPOINT", "")
+
+SERVICE_NAME = "moduly-workflow-engine"
+
+# 루프별 OTLP 전송 클라이언트 (커넥션 재사용)
+_otlp_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+# 진행 중인 내보내기 태스크 (강한 참조가 없으면 완료 전에 GC될 수 있음)
+_pending_exports: Set["asyncio.Task[None]"] = set()
+
+# OTLP status code
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+
+class Span:
+    """단일 스팬 (시간은 perf_counter_ns 기준, 내보낼 때 벽시계로 변환)"""
+
+    __slots__ = ("name", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, parent_id: Optional[str], start_ns: int, attributes: Dict[str, Any]):
+        self.name = name
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = start_ns
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or self.start_ns) - self.start_ns
+
+
+class _Phase:
+    """with 블록 구간을 노드 스팬의 하위 단계로 기록"""
+
+    __slots__ = ("_trace", "_span", "_name", "_start")
+
+    def __init__(self, trace: "RunTrace", span: Span, name: str):
+        self._trace = trace
+        self._span = span
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._trace.record(self._span, self._name, self._start)
+        return False
+
+
+class _NoopPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_PHASE = _NoopPhase()
+
+
+class NoopTrace:
+    """샘플링되지 않은 실행용 (모든 호출이 즉시 반환)"""
+
+    enabled = False
+
+    def now(self) -> int:
+        return 0
+
+    def start_node(self, node_id: str, node_type: str) -> None:
+        return None
+
+    def phase(self, span, name: str):
+        return _NOOP_PHASE
+
+    def record(self, span, name: str, start_ns: int, end_ns: Optional[int] = None) -> None:
+        pass
+
+    def end_node(self, span, error: Optional[str] = None) -> None:
+        pass
+
+    def node_collected(self, node_id: str) -> None:
+        pass
+
+    def finish(self, error: Optional[str] = None) -> None:
+        pass
+
+
+NOOP_TRACE = NoopTrace()
+
+
+class RunTrace:
+    """워크플로우 실행 1회의 트레이스 (루트 스팬 + 노드 스팬 + 단계 스팬)"""
+
+    enabled = True
+
+    def __init__(self, run_id: Optional[str], workflow_id: Optional[str] = None, export: bool = True):
+        self.run_id = run_id or ""
+        self.trace_id = secrets.token_hex(16)
+        # export=False면 느린 실행일 때만 내보냄 (WORKFLOW_TRACE_SLOW_MS)
+        self.export = export
+        # perf_counter 기준 시간을 벽시계(Unix ns)로 바꾸기 위한 기준점
+        self._wall_anchor = time.time_ns()
+        self._perf_anchor = time.perf_counter_ns()
+        self.root = Span(
+            "workflow.run",
+            None,
+            self._perf_anchor,
+            {"workflow.run_id": self.run_id, "workflow.id": str(workflow_id or "")},
+        )
+        self.spans: List[Span] = []
+        self._node_spans: Dict[str, Span] = {}
+
+    def now(self) -> int:
+        return time.perf_counter_ns()
+
+    def start_node(self, node_id: str, node_type: str) -> Span:
+        span = Span(
+            f"node.{node_type}",
+            self.root.span_id,
+            time.perf_counter_ns(),
+            {
+                "workflow.run_id": self.run_id,
+                "workflow.node_id": node_id,
+                "workflow.node_type": node_type,
+            },
+        )
+        self.spans.append(span)
+        self._node_spans[node_id] = span
+        return span
+
+    def phase(self, span: Optional[Span], name: str):
+        if span is None:
+            return _NOOP_PHASE
+        return _Phase(self, span, name)
+
+    def record(self, span: Optional[Span], name: str, start_ns: int, end_ns: Optional[int] = None) -> None:
+        """노드 스팬 아래에 이미 지난 구간을 단계 스팬으로 추가"""
+        if span is None:
+            return
+        phase = Span(
+            name,
+            span.span_id,
+            start_ns,
+            {
+                "workflow.run_id": self.run_id,
+                "workflow.node_id": span.attributes["workflow.node_id"],
+                "workflow.node_type": span.attributes["workflow.node_type"],
+                "workflow.phase": name,
+            },
+        )
+        phase.end_ns = end_ns if end_ns is not None else time.perf_counter_ns()
+        self.spans.append(phase)
+
+    def end_node(self, span: Optional[Span], error: Optional[str] = None) -> None:
+        if span is None or span.end_ns is not None:
+            return
+        span.end_ns = time.perf_counter_ns()
+        span.error = error
+
+    def node_collected(self, node_id: str) -> None:
+        """메인 루프가 완료된 노드 태스크를 수거한 시점까지를 collect 단계로 기록"""
+        span = self._node_spans.get(node_id)
+        if span is not None and span.end_ns is not None:
+            self.record(span, "collect", span.end_ns)
+
+    def finish(self, error: Optional[str] = None) -> None:
+        self.root.end_ns = time.perf_counter_ns()
+        self.root.error = error
+
+    @property
+    def duration_ms(self) -> float:
+        return self.root.duration_ns / 1e6
+
+    def should_export(self) -> bool:
+        if self.export:
+            return True
+        return WORKFLOW_TRACE_SLOW_MS > 0 and self.duration_ms >= WORKFLOW_TRACE_SLOW_MS
+
+    # ------------------------------------------------------------------
+    # 내보내기 형식
+    # ------------------------------------------------------------------
+
+    def _wall_ns(self, perf_ns: int) -> int:
+        return self._wall_anchor + (perf_ns - self._perf_anchor)
+
+    def _otlp_span(self, span: Span) -> Dict[str, Any]:
+        data = {
+            "traceId": self.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self._wall_ns(span.start_ns)),
+            "endTimeUnixNano": str(self._wall_ns(span.end_ns or span.start_ns)),
+            "attributes": [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in span.attributes.items()
+            ],
+            "status": {"code": _STATUS_ERROR if span.error else _STATUS_OK},
+        }
+        if span.parent_id:
+            data["parentSpanId"] = span.parent_id
+        if span.error:
+            data["status"]["message"] = span.error
+        return data
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON ExportTraceServiceRequest (collector /v1/traces에 그대로 POST 가능)"""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": SERVICE_NAME}}
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [self._otlp_span(self.root)]
+                            + [self._otlp_span(span) for span in self.spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def to_folded(self) -> str:
+        """
+        folded stack 형식 ("workflow;노드타입:노드ID;단계 마이크로초")
+
+        노드 값은 단계에 속하지 않은 자기 시간만 기록합니다 (flamegraph는 자식 값을 합산).
+        """
+        by_id = {span.span_id: span for span in self.spans}
+        phase_totals: Dict[str, int] = defaultdict(int)
+        lines: List[str] = []
+
+        for span in self.spans:
+            parent = by_id.get(span.parent_id)
+            if parent is None:
+                continue
+            frame = f"{parent.attributes['workflow.node_type']}:{parent.attributes['workflow.node_id']}"
+            # collect는 노드 스팬이 끝난 뒤의 구간이므로 자기 시간 계산에서 제외
+            if span.name != "collect":
+                phase_totals[parent.span_id] += span.duration_ns
+            lines.append(f"workflow;{frame};{span.name} {span.duration_ns // 1000}")
+
+        for span in self.spans:
+            if span.parent_id != self.root.span_id:
+                continue
+            frame = f"{span.attributes['workflow.node_type']}:{span.attributes['workflow.node_id']}"
+            self_ns = max(span.duration_ns - phase_totals[span.span_id], 0)
+            lines.append(f"workflow;{frame} {self_ns // 1000}")
+
+        return "\n".join(lines) + "\n"
+
+    def phase_summary_ms(self) -> Dict[str, float]:
+        """단계별 합계 (ms)"""
+        totals: Dict[str, float] = defaultdict(float)
+        for span in self.spans:
+            if "workflow.phase" in span.attributes:
+                totals[span.name] += span.duration_ns / 1e6
+        return {name: round(value, 3) for name, value in totals.items()}
+
+
+def start_run_trace(run_id: Optional[str], execution_context: Dict[str, Any]):
+    """샘플링 설정에 따라 RunTrace 또는 NoopTrace 반환"""
+    forced = bool(execution_context.get("trace"))
+    sampled = forced or (
+        WORKFLOW_TRACE_SAMPLE_RATE > 0 and random.random() < WORKFLOW_TRACE_SAMPLE_RATE
+    )
+    if not sampled and WORKFLOW_TRACE_SLOW_MS <= 0:
+        return NOOP_TRACE
+    return RunTrace(run_id, execution_context.get("workflow_id"), export=sampled)
+
+
+def _write_files(trace: RunTrace) -> None:
+    os.makedirs(WORKFLOW_TRACE_DIR, exist_ok=True)
+    name = trace.run_id or trace.trace_id
+    with open(os.path.join(WORKFLOW_TRACE_DIR, f"{name}.otlp.json"), "w") as f:
+        json.dump(trace.to_otlp(), f)
+    with open(os.path.join(WORKFLOW_TRACE_DIR, f"{name}.folded"), "w") as f:
+        f.write(trace.to_folded())
+
+
+def _get_otlp_client():
+    """현재 이벤트 루프의 OTLP 전송 클라이언트 (루프마다 하나)"""
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    client = _otlp_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(timeout=5)
+        _otlp_clients[loop] = client
+    return client
+
+
+async def export_run_trace(trace) -> None:
+    """완료된 트레이스 내보내기 (실패해도 워크플로우 결과에는 영향 없음)"""
+    if not trace.enabled or not trace.should_export():
+        return
+    try:
+        if WORKFLOW_TRACE_DIR:
+            await asyncio.get_running_loop().run_in_executor(None, _write_files, trace)
+        if WORKFLOW_TRACE_OTLP_ENDPOINT:
+            await _get_otlp_client().post(WORKFLOW_TRACE_OTLP_ENDPOINT, json=trace.to_otlp())
+        if not WORKFLOW_TRACE_DIR and not WORKFLOW_TRACE_OTLP_ENDPOINT:
+            logger.info(
+                f"[Trace] run={trace.run_id} duration_ms={trace.duration_ms:.1f} "
+                f"phases={trace.phase_summary_ms()}"
+            )
+    except Exception as e:
+        logger.warning(f"[Trace] 트레이스 내보내기 실패: {e}")
+
+
+def schedule_run_trace_export(trace) -> Optional["asyncio.Task[None]"]:
+    """
+    트레이스 내보내기를 백그라운드 태스크로 시작 (실행 결과 반환을 기다리게 하지 않음)
+
+    Returns:
+        내보내기 태스크 (내보낼 트레이스가 없으면 None)
+    """
+    if not trace.enabled or not trace.should_export():
+        return None
+    task = asyncio.get_running_loop().create_task(export_run_trace(trace))
+    _pending_exports.add(task)
+    task.add_done_callback(_pending_exports.discard)
+    return task
+
+
+async def close_trace_exporter() -> None:
+    """
+    현재 루프의 남은 내보내기를 마치고 OTLP 클라이언트 종료
+    (루프를 닫기 전에 호출, 공용 루프에서는 워커 종료 시)
+    """
+    loop = asyncio.get_running_loop()
+    pending = [task for task in _pending_exports if task.get_loop() is loop]
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    client = _otlp_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
@@ -4,14 +4,26 @@ from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
+from apps.shared.db.session import ASYNC_DB_ENABLED, AsyncSessionLocal
 from apps.shared.pubsub import (
     publish_workflow_event_async,  # [NEW] Async Redis Pub/Sub
 )
 from apps.shared.schemas.workflow import EdgeSchema, NodeSchema
+from apps.workflow_engine.workflow.core.checkpoint import (
+    NOOP_CHECKPOINT,
+    open_run_checkpoint,
+)
+from apps.workflow_engine.workflow.core.template_cache import precompile_templates
+from apps.workflow_engine.workflow.core.tracing import (
+    NOOP_TRACE,
+    schedule_run_trace_export,
+    start_run_trace,
+)
 from apps.workflow_engine.workflow.core.workflow_logger import (
     WorkflowLogger,  # [NEW] 로깅 유틸리티
 )
 from apps.workflow_engine.workflow.core.workflow_node_factory import NodeFactory
+from apps.workflow_engine.workflow.nodes.http.client_pool import HttpClientPool
 
 
 class WorkflowEngine:
@@ -65,6 +77,11 @@ class WorkflowEngine:
             # execution_context에 db가 없으면 경고 (옵션)
             pass
 
+        # [PERF] 노드용 비동기 세션 팩토리 주입
+        # 병렬 노드가 하나의 동기 세션을 공유하며 이벤트 루프를 막지 않도록 태스크마다 풀에서 세션을 받음
+        if ASYNC_DB_ENABLED and "async_session_factory" not in self.execution_context:
+            self.execution_context["async_session_factory"] = AsyncSessionLocal
+
         # [PERF] 그래프 구조 사전 계산
         self.adjacency_list = {}  # source -> [targets]
         self.reverse_graph = {}  # target -> [sources]
@@ -79,7 +96,21 @@ class WorkflowEngine:
                 self.nodes_by_type[schema.type] = []
             self.nodes_by_type[schema.type].append(node_id)
 
+        # [PERF] 호스트별 HTTP 커넥션 풀 (서브그래프/서브 워크플로우 엔진은 부모 풀을 공유)
+        self._owns_http_client_pool = "http_client_pool" not in self.execution_context
+        if self._owns_http_client_pool:
+            self.execution_context["http_client_pool"] = HttpClientPool()
+
+        # [PERF] 기억 모드 요약을 실행 내 LLM 노드끼리 공유 (서브그래프 엔진은 같은 dict 참조)
+        if self.execution_context.get("memory_mode"):
+            self.execution_context.setdefault("memory_summaries", {})
+
+        # [PERF] 재시도/재전달 시 완료된 노드 결과 복원용 체크포인트 ID
+        # 노드 생성 전에 꺼내서 서브그래프/서브 워크플로우 엔진에는 전달되지 않도록 함
+        self.checkpoint_id = self.execution_context.pop("checkpoint_id", None)
+
         self._build_node_instances()  # Schema → Node 변환
+        self._precompile_templates()  # [PERF] 템플릿 사전 컴파일
 
         # ============================================================
         # [NEW SECTION] 모니터링/로깅 관련 초기화
@@ -88,6 +119,8 @@ class WorkflowEngine:
         self.parent_run_id = parent_run_id  # 서브 워크플로우용 부모 run_id
         self.start_node_id = None  # [NEW] 시작 노드 ID 캐싱
         self.is_subworkflow = is_subworkflow  # [NEW] 서브 워크플로우 여부
+        self.trace = NOOP_TRACE  # [NEW] 노드별 단계 트레이싱 (샘플링 시 RunTrace)
+        self.checkpoint = NOOP_CHECKPOINT  # [PERF] 노드 결과 체크포인트 (실행 시작 시 로드)
 
         # [VALIDATION] 그래프 구조 검증 (순환, 시작 노드 등)
         self.validate_graph()
@@ -253,6 +286,17 @@ class WorkflowEngine:
                 self.execution_context["workflow_run_id"] = str(workflow_run_id)
         # ============================================================
 
+        # [NEW] 노드별 단계 스팬 기록 (서브 워크플로우는 부모 노드 실행 시간에 포함)
+        if not self.is_subworkflow:
+            self.trace = start_run_trace(
+                self.execution_context.get("workflow_run_id"), self.execution_context
+            )
+        trace_error = None
+
+        # [PERF] 이전 시도(Celery 재시도/재전달)에서 완료된 노드 결과 로드
+        if not self.is_subworkflow:
+            self.checkpoint = await open_run_checkpoint(self.checkpoint_id)
+
         start_node = self._find_start_node()
         results = {}
 
@@ -320,6 +364,7 @@ class WorkflowEngine:
                 for task in done:
                     node_id = running_tasks.pop(task)
                     executed_nodes.add(node_id)
+                    self.trace.node_collected(node_id)
 
                     try:
                         # 실행 결과 가져오기 (예외 발생 시 여기서 raise됨)
@@ -372,6 +417,9 @@ class WorkflowEngine:
                     event = event_queue.get_nowait()
                     yield event
 
+            # [PERF] 성공한 실행은 다시 시도될 일이 없으므로 체크포인트 삭제
+            await self.checkpoint.clear()
+
             # 4. 워크플로우 종료
             run_id = self.execution_context.get("workflow_run_id")
             if stream_mode:
@@ -403,6 +451,7 @@ class WorkflowEngine:
                 yield {"type": "workflow_finish", "data": final_result}
 
         except Exception as e:
+            trace_error = str(e)
             run_id = self.execution_context.get("workflow_run_id")
             if not stream_mode:
                 if not self.is_subworkflow:
@@ -429,6 +478,15 @@ class WorkflowEngine:
                         run_id, "error", {"message": error_msg}
                     )
                 yield {"type": "error", "data": {"message": error_msg}}
+        finally:
+            # [PERF] 풀을 만든 엔진만 실행 종료 시 커넥션 정리 (클라이언트가 이벤트 루프에 묶임)
+            if self._owns_http_client_pool:
+                pool = self.execution_context.get("http_client_pool")
+                if pool is not None:
+                    await pool.aclose()
+            self.trace.finish(trace_error)
+            # [PERF] 내보내기(파일/OTLP 전송)는 기다리지 않고 백그라운드에서 진행
+            schedule_run_trace_export(self.trace)
         # 참고: self.logger.shutdown() 호출 제거됨
         # 이제 공유 LogWorkerPool을 사용하므로 인스턴스별 종료 불필요
         # 풀은 앱 종료 시 shutdown_log_worker_pool()으로 종료됨
@@ -446,9 +504,15 @@ class WorkflowEngine:
 
         node_instance = self.node_instances[node_id]
         node_schema = self.node_schemas[node_id]
+        trace = self.trace
+        span = trace.start_node(node_id, node_schema.type)
 
         # 컨텍스트 복사 (스레드 안전성 보장 필요 시)
-        inputs = self._get_context(node_id, results)
+        with trace.phase(span, "input_resolution"):
+            inputs = self._get_context(node_id, results)
+
+        # [PERF] 이전 시도에서 완료된 노드는 실행/로그 생성 없이 저장된 결과 사용
+        restored = self.checkpoint.restored(node_id)
 
         # [실시간 스트리밍] node_start 이벤트를 Task 생성 시점(실행 시작 전)에 즉시 전송
         # [FIX] 서브 워크플로우에서는 노드 로깅도 스킵 (UI 간섭 방지)
@@ -461,7 +525,7 @@ class WorkflowEngine:
         node_options_snapshot = None
         log_id = None
 
-        if not self.is_subworkflow:
+        if not self.is_subworkflow and restored is None:
             node_options_snapshot = self._extract_node_options(node_schema)
 
             # [FIX] create_node_log가 반환하는 log_id 캡처
@@ -474,31 +538,37 @@ class WorkflowEngine:
                 )
 
             loop = asyncio.get_running_loop()
-            log_id = await loop.run_in_executor(None, _create_log)
+            with trace.phase(span, "output_persistence"):
+                log_id = await loop.run_in_executor(None, _create_log)
 
         # [FIX] Redis Pub/Sub으로 이벤트 발행 (run_id가 있고 서브워크플로우가 아닐 경우)
         # [PERF] 비동기 발행 사용
-        run_id = self.execution_context.get("workflow_run_id")
-        if run_id and not self.is_subworkflow:
-            await publish_workflow_event_async(
-                run_id,
-                "node_start",
-                {
-                    "node_id": node_id,
-                    "node_type": node_schema.type,
-                },
-            )
+        with trace.phase(span, "event_publish"):
+            run_id = self.execution_context.get("workflow_run_id")
+            if run_id and not self.is_subworkflow:
+                await publish_workflow_event_async(
+                    run_id,
+                    "node_start",
+                    {
+                        "node_id": node_id,
+                        "node_type": node_schema.type,
+                    },
+                )
 
-        if stream_mode and event_queue:
-            await event_queue.put(
-                {
-                    "type": "node_start",
-                    "data": {"node_id": node_id, "node_type": node_schema.type},
-                }
-            )
+            if stream_mode and event_queue:
+                await event_queue.put(
+                    {
+                        "type": "node_start",
+                        "data": {"node_id": node_id, "node_type": node_schema.type},
+                    }
+                )
 
         async def _task_wrapper():
+            if restored is not None:
+                return restored
+            waiting_since = trace.now()
             async with semaphore:
+                trace.record(span, "waiting", waiting_since)
                 # 비동기 노드 실행 + Upsert용 추가 정보 전달
                 return await self._execute_node_task_async(
                     node_id,
@@ -508,6 +578,7 @@ class WorkflowEngine:
                     log_id,
                     node_options_snapshot,  # [NEW] Upsert용
                     started_at,  # [NEW] Upsert용
+                    span,
                 )
 
         # [NEW] 노드별 타임아웃 적용 (asyncio.wait_for)
@@ -516,44 +587,52 @@ class WorkflowEngine:
 
         # [실시간 스트리밍] node_finish 이벤트를 완료 시점에 즉시 전송하는 래퍼
         async def _task_wrapper_with_event():
+            # 태스크 생성 후 이벤트 루프가 실제로 실행을 시작하기까지
+            trace.record(span, "scheduled", scheduled_at)
             try:
                 # [TIMEOUT] 노드 실행 타임아웃 적용
                 result = await asyncio.wait_for(_task_wrapper(), timeout=node_timeout)
             except asyncio.TimeoutError:
-                raise TimeoutError(
-                    f"Node '{node_id}' ({node_schema.type}) timed out after {node_timeout} seconds."
-                )
+                message = f"Node '{node_id}' ({node_schema.type}) timed out after {node_timeout} seconds."
+                trace.end_node(span, message)
+                raise TimeoutError(message)
+            except Exception as e:
+                trace.end_node(span, str(e))
+                raise
 
             # [FIX] Redis Pub/Sub으로 node_finish 이벤트 발행 (run_id가 있고 서브워크플로우가 아닐 경우)
             # [PERF] 비동기 발행 사용
-            run_id = self.execution_context.get("workflow_run_id")
-            if run_id and not self.is_subworkflow:
-                await publish_workflow_event_async(
-                    run_id,
-                    "node_finish",
-                    {
-                        "node_id": node_id,
-                        "node_type": node_schema.type,
-                        "output": result,
-                    },
-                )
-
-            # node_finish 이벤트를 즉시 큐에 전송
-            if stream_mode and event_queue:
-                await event_queue.put(
-                    {
-                        "type": "node_finish",
-                        "data": {
+            with trace.phase(span, "event_publish"):
+                run_id = self.execution_context.get("workflow_run_id")
+                if run_id and not self.is_subworkflow:
+                    await publish_workflow_event_async(
+                        run_id,
+                        "node_finish",
+                        {
                             "node_id": node_id,
                             "node_type": node_schema.type,
                             "output": result,
                         },
-                    }
-                )
+                    )
+
+                # node_finish 이벤트를 즉시 큐에 전송
+                if stream_mode and event_queue:
+                    await event_queue.put(
+                        {
+                            "type": "node_finish",
+                            "data": {
+                                "node_id": node_id,
+                                "node_type": node_schema.type,
+                                "output": result,
+                            },
+                        }
+                    )
 
+            trace.end_node(span)
             return {"result": result}
 
         # Task 생성 및 등록
+        scheduled_at = trace.now()
         task = asyncio.create_task(_task_wrapper_with_event())
         running_tasks[task] = node_id
 
@@ -566,6 +645,7 @@ class WorkflowEngine:
         log_id=None,
         node_options_snapshot=None,
         started_at=None,
+        span=None,
     ):
         """
         개별 노드를 실행하는 작업 (비동기 실행)
@@ -573,26 +653,30 @@ class WorkflowEngine:
         [Upsert 패턴] 추가 정보를 전달하여 Race Condition 해결
         반환값: 노드 실행 결과 (Dict)
         """
+        trace = self.trace
         try:
             # 노드 실행 (핵심) - 비동기 실행
-            result = await node_instance.execute(inputs)
+            with trace.phase(span, "execution"):
+                result = await node_instance.execute(inputs)
 
             # 노드 완료 로깅 (서브 워크플로우에서는 스킵)
             # [FIX] Upsert용 추가 정보 전달
             if not self.is_subworkflow:
                 loop = asyncio.get_running_loop()
-                await loop.run_in_executor(
-                    None,
-                    lambda: self.logger.update_node_log_finish(
-                        log_id,
-                        node_id,
-                        result,
-                        node_type=node_schema.type,
-                        inputs=inputs,
-                        process_data=node_options_snapshot,
-                        started_at=started_at,
-                    ),
-                )
+                with trace.phase(span, "output_persistence"):
+                    await loop.run_in_executor(
+                        None,
+                        lambda: self.logger.update_node_log_finish(
+                            log_id,
+                            node_id,
+                            result,
+                            node_type=node_schema.type,
+                            inputs=inputs,
+                            process_data=node_options_snapshot,
+                            started_at=started_at,
+                        ),
+                    )
+                    await self.checkpoint.save(node_id, node_schema.type, result)
 
             return result
 
@@ -601,18 +685,19 @@ class WorkflowEngine:
             # [FIX] Upsert용 추가 정보 전달
             if not self.is_subworkflow:
                 loop = asyncio.get_running_loop()
-                await loop.run_in_executor(
-                    None,
-                    lambda: self.logger.update_node_log_error(
-                        log_id,
-                        node_id,
-                        error_msg,
-                        node_type=node_schema.type,
-                        inputs=inputs,
-                        process_data=node_options_snapshot,
-                        started_at=started_at,
-                    ),
-                )
+                with trace.phase(span, "output_persistence"):
+                    await loop.run_in_executor(
+                        None,
+                        lambda: self.logger.update_node_log_error(
+                            log_id,
+                            node_id,
+                            error_msg,
+                            node_type=node_schema.type,
+                            inputs=inputs,
+                            process_data=node_options_snapshot,
+                            started_at=started_at,
+                        ),
+                    )
             raise e
 
     # ================================================================
@@ -827,6 +912,15 @@ class WorkflowEngine:
                     f"Cannot create node '{node_id}': {str(e)}"
                 ) from e
 
+    def _precompile_templates(self):
+        """[PERF] 노드들의 Jinja2 템플릿을 로드 시점에 한 번만 컴파일 (공유 캐시)"""
+        for node_instance in self.node_instances.values():
+            try:
+                precompile_templates(node_instance.get_template_sources())
+            except Exception:
+                # 사전 컴파일 실패는 실행 시점에 각 노드가 처리
+                continue
+
     def _analyze_data_dependencies(self):
         """
         [NEW] 각 노드의 value_selector를 분석하여 실제 데이터 의존성을 추출합니다.
@@ -1,6 +1,8 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, TypeVar, final
+from typing import Any, Callable, Dict, Generic, List, TypeVar, final
+
+from apps.shared.db.session import run_with_session
 
 from .entities import BaseNodeData, NodeStatus
 
@@ -50,6 +52,27 @@ class Node(ABC, Generic[NodeDataT]):
             logger.info(f"[{self.node_type}] 실행 실패: {str(e)}")
             raise e
 
+    def get_template_sources(self) -> List[str]:
+        """
+        노드가 렌더링하는 Jinja2 템플릿 소스 목록.
+        WorkflowEngine이 로드 시점에 미리 컴파일하는 데 사용합니다. (템플릿이 없으면 빈 리스트)
+        """
+        return []
+
+    async def _run_db(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        fn(session, *args, **kwargs)을 DB 세션과 함께 실행합니다.
+        WorkflowEngine이 주입한 async_session_factory가 있으면 태스크 전용 비동기 세션을,
+        없으면 execution_context["db"] 동기 세션을 사용합니다.
+        """
+        return await run_with_session(
+            fn,
+            *args,
+            session_factory=self.execution_context.get("async_session_factory"),
+            fallback_db=self.execution_context.get("db"),
+            **kwargs,
+        )
+
     @abstractmethod
     async def _run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
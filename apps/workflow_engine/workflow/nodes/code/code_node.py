@@ -1,6 +1,7 @@
 """코드 실행 노드 - Docker 샌드박스에서 Python 코드를 안전하게 실행"""
 
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, List
 
 from apps.workflow_engine.workflow.nodes.base.node import Node
 from apps.workflow_engine.workflow.nodes.code.entities import CodeNodeData
@@ -39,6 +40,77 @@ class CodeNode(Node[CodeNodeData]):
             사용자 코드의 결과 딕셔너리 또는 에러 딕셔너리
         """
         # 1. 변수 치환: UI에서 정의한 입력 변수 매핑
+        code_inputs, error = self._map_inputs(inputs)
+        if error:
+            return error
+
+        # 2. 샌드박스에서 코드 실행
+        tenant_id = self.execution_context.get("user_id") if self.execution_context else None
+        trigger_mode = self.execution_context.get("trigger_mode") if self.execution_context else None
+
+        # [PERF] 동기 HTTP 호출이므로 스레드에서 실행 (워커 공용 루프의 다른 실행을 막지 않도록)
+        result = await asyncio.get_running_loop().run_in_executor(
+            None,
+            lambda: self.sandbox_service.execute_python_code(
+                code=self.data.code,
+                inputs=code_inputs,
+                timeout=self.data.timeout,
+                trigger_type=trigger_mode,
+                tenant_id=tenant_id,
+                cacheable=self.data.cacheable,
+            ),
+        )
+
+        return result
+
+    async def run_batch(
+        self, inputs_list: List[Dict[str, Any]], timeout: int
+    ) -> List[Dict[str, Any]]:
+        """
+        [PERF] 여러 입력 컨텍스트에 대해 코드를 한 번의 배치 요청으로 실행 (반복 노드 map 모드)
+
+        Args:
+            inputs_list: 반복마다의 노드 입력 컨텍스트
+            timeout: 배치 전체 타임아웃 (초)
+
+        Returns:
+            입력 순서대로 _run()과 같은 형태의 결과 (항목별 에러 딕셔너리 포함)
+        """
+        outputs: List[Dict[str, Any]] = [None] * len(inputs_list)
+        batch_indexes, batch_inputs = [], []
+        for index, inputs in enumerate(inputs_list):
+            code_inputs, error = self._map_inputs(inputs)
+            if error:
+                outputs[index] = error
+            else:
+                batch_indexes.append(index)
+                batch_inputs.append(code_inputs)
+
+        if batch_inputs:
+            tenant_id = self.execution_context.get("user_id") if self.execution_context else None
+            trigger_mode = self.execution_context.get("trigger_mode") if self.execution_context else None
+
+            # 동기 HTTP 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            results = await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: self.sandbox_service.execute_python_code_batch(
+                    code=self.data.code,
+                    inputs_list=batch_inputs,
+                    timeout=timeout,
+                    trigger_type=trigger_mode,
+                    tenant_id=tenant_id,
+                ),
+            )
+            if isinstance(results, dict):
+                # 요청 자체 실패: 모든 항목에 같은 에러
+                results = [results] * len(batch_inputs)
+            for index, result in zip(batch_indexes, results):
+                outputs[index] = result
+
+        return outputs
+
+    def _map_inputs(self, inputs: Dict[str, Any]):
+        """UI에서 정의한 입력 변수 매핑 -> (code_inputs, error)"""
         code_inputs = {}
         for inp in self.data.inputs:
             # "Start.query" -> inputs["Start"]["query"]
@@ -48,22 +120,9 @@ class CodeNode(Node[CodeNodeData]):
                     code_inputs[inp.name] = inputs[node_id][var_name]
                 else:
                     # 변수를 찾지 못한 경우 에러 반환
-                    return {
+                    return None, {
                         "error": f"Variable not found: {inp.source} (referenced as '{inp.name}')"
                     }
             except ValueError:
-                return {"error": f"Invalid variable source format: {inp.source}"}
-
-        # 2. 샌드박스에서 코드 실행
-        tenant_id = self.execution_context.get("user_id") if self.execution_context else None
-        trigger_mode = self.execution_context.get("trigger_mode") if self.execution_context else None
-        
-        result = self.sandbox_service.execute_python_code(
-            code=self.data.code,
-            inputs=code_inputs,
-            timeout=self.data.timeout,
-            trigger_type=trigger_mode,
-            tenant_id=tenant_id,
-        )
-
-        return result
+                return None, {"error": f"Invalid variable source format: {inp.source}"}
+        return code_inputs, None
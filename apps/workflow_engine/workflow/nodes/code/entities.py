@@ -36,3 +36,7 @@ class CodeNodeData(BaseNodeData):
         default_factory=list, description="입력 변수 매핑"
     )
     timeout: int = Field(10, description="실행 타임아웃 (초)")
+    cacheable: bool = Field(
+        False,
+        description="동일 코드/입력의 실행 결과 재사용 여부 (외부 상태에 의존하지 않는 결정적 코드만)",
+    )
@@ -25,3 +25,7 @@ class FileExtractionNodeData(BaseNodeData):
         default_factory=list,
         description="파일 경로를 가져올 변수 목록",
     )
+    output_pages: bool = Field(
+        False,
+        description="True면 전체 텍스트 대신 페이지별 텍스트 리스트로 출력 (Loop 노드에서 페이지 단위 처리용)",
+    )
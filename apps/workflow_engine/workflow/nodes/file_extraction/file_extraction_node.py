@@ -1,21 +1,110 @@
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import logging
+import multiprocessing
 import os
 import tempfile
-import concurrent.futures
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
+import httpx
+import pymupdf
 import pymupdf4llm
-import requests
 
 from ..base.node import Node
 from .entities import FileExtractionNodeData
 
-# CPU 바운드 작업을 위한 전용 Executor (모듈 레벨 공유)
-# max_workers는 서버 사양에 맞게 조절 (예: CPU 코어 수 * 2 등)
-_cpu_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
-
 logger = logging.getLogger(__name__)
 
+# 다운로드 크기 상한 (기본 50MB)
+MAX_DOWNLOAD_BYTES = int(os.getenv("FILE_EXTRACTION_MAX_BYTES", 50 * 1024 * 1024))
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# 디스크 쓰기 단위: 청크를 모아 executor 호출 횟수를 줄임 (64KB마다 스레드 홉 방지)
+DOWNLOAD_WRITE_BUFFER = 1024 * 1024
+DOWNLOAD_TIMEOUT = 30.0
+
+# 이 페이지 수를 넘는 PDF는 페이지 구간으로 나눠 병렬 추출
+PARALLEL_PAGE_THRESHOLD = 20
+PAGES_PER_TASK = 10
+
+# 파싱 결과 캐시 (ParsingRegistry와 동일한 SHA-256 content digest + provider 키)
+PARSING_PROVIDER = "pymupdf4llm"
+EXTRACTION_CACHE_SIZE = int(os.getenv("FILE_EXTRACTION_CACHE_SIZE", 32))
+_extraction_cache: "OrderedDict[Tuple[str, str], List[str]]" = OrderedDict()
+
+# CPU 바운드 작업을 위한 전용 프로세스 풀 (모듈 레벨 공유, 지연 초기화)
+# pymupdf4llm 파싱은 GIL을 잡고 있으므로 스레드 풀로는 병렬화되지 않음
+_process_executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _get_process_executor() -> concurrent.futures.ProcessPoolExecutor:
+    """
+    추출 전용 ProcessPoolExecutor 싱글톤 반환
+
+    멀티스레드 Celery 워커를 fork하면 다른 스레드가 잡고 있던 락과 DB 커넥션까지 복제되므로
+    spawn 컨텍스트로 깨끗한 프로세스를 띄웁니다.
+    """
+    global _process_executor
+    if _process_executor is None:
+        max_workers = int(
+            os.getenv("FILE_EXTRACTION_WORKERS", min(4, os.cpu_count() or 1))
+        )
+        _process_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_executor
+
+
+def _count_pages(path: str) -> int:
+    """문서의 페이지 수를 반환합니다. (프로세스 풀에서 실행)"""
+    with pymupdf.open(path) as doc:
+        return doc.page_count
+
+
+def _extract_pages(path: str, pages: Optional[List[int]] = None) -> List[str]:
+    """
+    지정한 페이지들을 마크다운으로 변환합니다. (프로세스 풀에서 실행)
+    pages가 None이면 전체 페이지를 변환합니다.
+    """
+    md_text_chunks = pymupdf4llm.to_markdown(path, pages=pages, page_chunks=True)
+    return [chunk["text"] for chunk in md_text_chunks]
+
+
+def _compute_file_digest(path: str) -> str:
+    """파일 내용의 SHA-256 다이제스트 계산 (ParsingRegistry.content_digest와 동일 방식)"""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def _discard_temp_file(tmp) -> None:
+    """다운로드 실패 시 임시 파일 닫고 삭제"""
+    tmp.close()
+    if os.path.exists(tmp.name):
+        os.remove(tmp.name)
+
+
+def _get_cached_pages(content_digest: str) -> Optional[List[str]]:
+    key = (content_digest, PARSING_PROVIDER)
+    pages = _extraction_cache.get(key)
+    if pages is not None:
+        _extraction_cache.move_to_end(key)
+    return pages
+
+
+def _store_cached_pages(content_digest: str, pages: List[str]) -> None:
+    key = (content_digest, PARSING_PROVIDER)
+    _extraction_cache[key] = pages
+    _extraction_cache.move_to_end(key)
+    while len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+        _extraction_cache.popitem(last=False)
+
 
 class FileExtractionNode(Node[FileExtractionNodeData]):
     """
@@ -23,10 +112,11 @@ class FileExtractionNode(Node[FileExtractionNodeData]):
 
     기능:
     - PDF 파일 경로를 받아서 텍스트 추출
-    - S3 URL 또는 로컬 파일 경로 지원
-    - pymupdf4llm을 사용하여 마크다운 형식으로 변환
+    - S3 URL 또는 로컬 파일 경로 지원 (URL은 비동기 스트리밍 다운로드, 크기 제한)
+    - pymupdf4llm을 사용하여 마크다운 형식으로 변환 (프로세스 풀, 대용량 PDF는 페이지 병렬)
+    - 동일 콘텐츠(SHA-256)는 한 번만 파싱하고 캐시 재사용
     - 여러 변수 처리 및 중복 체크
-    - 사용자가 정의한 이름으로 출력 변수 생성
+    - 사용자가 정의한 이름으로 출력 변수 생성 (output_pages 시 페이지 리스트)
     """
 
     node_type = "fileExtractionNode"
@@ -34,8 +124,7 @@ class FileExtractionNode(Node[FileExtractionNodeData]):
     async def _run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         문서 파일에서 텍스트를 추출합니다 (비동기).
-        I/O 작업(다운로드)와 CPU 작업(PDF 변환)을 분리하여 처리합니다.
-        CPU 바운드 작업은 전용 Executor를 사용하여 이벤트 루프 블로킹을 방지합니다.
+        I/O 작업(다운로드)은 비동기 스트리밍으로, CPU 작업(PDF 변환)은 프로세스 풀에서 처리합니다.
 
         Args:
             inputs: 이전 노드 결과 (변수 풀)
@@ -44,11 +133,9 @@ class FileExtractionNode(Node[FileExtractionNodeData]):
             사용자가 정의한 변수명으로 추출된 텍스트
             {
                 "user_var1": "전체 텍스트...",
-                "user_var2": "전체 텍스트..."
+                "user_var2": ["1페이지...", "2페이지..."]  # output_pages=True
             }
         """
-        import asyncio
-
         loop = asyncio.get_running_loop()
 
         if not self.data.referenced_variables:
@@ -86,9 +173,9 @@ class FileExtractionNode(Node[FileExtractionNodeData]):
 
             try:
                 if is_remote:
-                    # S3/HTTP URL에서 파일 다운로드 (I/O Bound -> Default Executor)
-                    temp_file_path = await loop.run_in_executor(
-                        None, self._download_file, file_path
+                    # S3/HTTP URL에서 파일 다운로드 (비동기 스트리밍 + 해시 동시 계산)
+                    temp_file_path, content_digest = await self._download_file(
+                        file_path
                     )
                     target_path = temp_file_path
                 else:
@@ -98,17 +185,26 @@ class FileExtractionNode(Node[FileExtractionNodeData]):
                             f"파일을 찾을 수 없습니다: {file_path} (변수: {output_name})"
                         )
                     target_path = file_path
+                    content_digest = await loop.run_in_executor(
+                        None, _compute_file_digest, target_path
+                    )
 
-                # 문서 텍스트 추출 (CPU Bound -> Dedicated Executor)
-                # pymupdf4llm은 CPU를 많이 사용하므로 별도 스레드 풀에서 실행
-                full_text = await loop.run_in_executor(
-                    _cpu_executor,
-                    self._extract_text_sync,
-                    target_path,
-                    output_name,
-                    file_path,
-                )
-                results[output_name] = full_text
+                # 동일 콘텐츠는 재파싱하지 않음
+                pages = _get_cached_pages(content_digest)
+                if pages is None:
+                    pages = await self._extract_pages_async(
+                        target_path, output_name, file_path
+                    )
+                    _store_cached_pages(content_digest, pages)
+                else:
+                    logger.info(
+                        f"[FileExtractionNode] Cache hit: {content_digest[:12]} (변수: {output_name})"
+                    )
+
+                if self.data.output_pages:
+                    results[output_name] = list(pages)
+                else:
+                    results[output_name] = "\n\n".join(pages)
 
             finally:
                 # 임시 파일 정리
@@ -120,16 +216,33 @@ class FileExtractionNode(Node[FileExtractionNodeData]):
 
         return results
 
-    def _extract_text_sync(
+    async def _extract_pages_async(
         self, target_path: str, output_name: str, original_path: str
-    ) -> str:
+    ) -> List[str]:
         """
-        실제 PDF 파싱을 수행하는 동기 함수 (CPU Bound).
-        별도의 Executor에서 실행되어야 합니다.
+        프로세스 풀에서 PDF 파싱을 수행합니다 (CPU Bound).
+        페이지 수가 많은 문서는 페이지 구간별로 나눠 병렬로 변환한 뒤 순서대로 합칩니다.
         """
+        loop = asyncio.get_running_loop()
+        executor = _get_process_executor()
+
         try:
-            md_text_chunks = pymupdf4llm.to_markdown(target_path, page_chunks=True)
-            return "\n\n".join([chunk["text"] for chunk in md_text_chunks])
+            page_count = await loop.run_in_executor(executor, _count_pages, target_path)
+
+            if page_count <= PARALLEL_PAGE_THRESHOLD:
+                return await loop.run_in_executor(executor, _extract_pages, target_path)
+
+            page_ranges = [
+                list(range(start, min(start + PAGES_PER_TASK, page_count)))
+                for start in range(0, page_count, PAGES_PER_TASK)
+            ]
+            parts = await asyncio.gather(
+                *[
+                    loop.run_in_executor(executor, _extract_pages, target_path, pages)
+                    for pages in page_ranges
+                ]
+            )
+            return [page for part in parts for page in part]
         except Exception as e:
             raise ValueError(
                 f"문서 파싱 실패: {str(e)} (변수: {output_name}, 파일: {original_path})"
@@ -168,36 +281,61 @@ class FileExtractionNode(Node[FileExtractionNodeData]):
             # 노드 ID만 있으면 전체 데이터 반환
             return source_data
 
-    def _download_file(self, url: str) -> str:
+    async def _download_file(self, url: str) -> Tuple[str, str]:
         """
-        S3/HTTP URL에서 파일을 다운로드하여 임시 경로를 반환합니다.
+        S3/HTTP URL에서 파일을 스트리밍 다운로드하여 임시 경로를 반환합니다.
+        다운로드하면서 SHA-256 다이제스트를 함께 계산하고, MAX_DOWNLOAD_BYTES를 넘으면 중단합니다.
 
         Args:
             url: 다운로드할 파일의 URL
 
         Returns:
-            임시 파일 경로
+            (임시 파일 경로, SHA-256 다이제스트)
         """
+        # 확장자 추론
+        ext = os.path.splitext(urlparse(url).path)[1] or ".pdf"
+
+        sha256 = hashlib.sha256()
+        received = 0
+        buffer = bytearray()
+        # [FIX] 파일 I/O는 이벤트 루프를 막지 않도록 스레드 풀에서 실행
+        loop = asyncio.get_running_loop()
+        tmp = await loop.run_in_executor(
+            None, functools.partial(tempfile.NamedTemporaryFile, delete=False, suffix=ext)
+        )
+
         try:
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-
-            # 확장자 추론
-            from urllib.parse import urlparse
-
-            path = urlparse(url).path
-            ext = os.path.splitext(path)[1]
-            if not ext:
-                ext = ".pdf"
-
-            # 임시 파일 생성 및 다운로드
-            with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:  # 빈 chunk 필터링
-                        tmp.write(chunk)
-                return tmp.name
-
-        except requests.RequestException as e:
-            raise RuntimeError(f"파일 다운로드 실패: {url} - {str(e)}")
+            async with httpx.AsyncClient(
+                timeout=DOWNLOAD_TIMEOUT, follow_redirects=True
+            ) as client:
+                async with client.stream("GET", url) as response:
+                    response.raise_for_status()
+
+                    content_length = response.headers.get("content-length")
+                    if content_length and int(content_length) > MAX_DOWNLOAD_BYTES:
+                        raise ValueError(
+                            f"파일 크기가 제한({MAX_DOWNLOAD_BYTES} bytes)을 초과합니다: {content_length} bytes"
+                        )
+
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        received += len(chunk)
+                        if received > MAX_DOWNLOAD_BYTES:
+                            raise ValueError(
+                                f"파일 크기가 제한({MAX_DOWNLOAD_BYTES} bytes)을 초과합니다."
+                            )
+                        sha256.update(chunk)
+                        buffer += chunk
+                        if len(buffer) >= DOWNLOAD_WRITE_BUFFER:
+                            await loop.run_in_executor(None, tmp.write, bytes(buffer))
+                            buffer.clear()
+
+            if buffer:
+                await loop.run_in_executor(None, tmp.write, bytes(buffer))
+            await loop.run_in_executor(None, tmp.close)
+            return tmp.name, sha256.hexdigest()
+
         except Exception as e:
+            await loop.run_in_executor(None, _discard_temp_file, tmp)
+            if isinstance(e, httpx.HTTPError):
+                raise RuntimeError(f"파일 다운로드 실패: {url} - {str(e)}")
             raise RuntimeError(f"파일 처리 중 오류: {str(e)}")
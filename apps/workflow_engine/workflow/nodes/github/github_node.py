@@ -4,13 +4,11 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 import gidgethub.httpx
-from jinja2 import Environment
 
+from apps.workflow_engine.workflow.core.template_cache import render_template
 from apps.workflow_engine.workflow.nodes.base.node import Node
 from apps.workflow_engine.workflow.nodes.github.entities import GithubNodeData
 
-_jinja_env = Environment(autoescape=False)
-
 
 def _get_nested_value(data: Any, keys: List[str]) -> Any:
     """
@@ -153,6 +151,6 @@ class GithubNode(Node[GithubNodeData]):
 
         # Jinja2 템플릿 렌더링
         try:
-            return _jinja_env.from_string(template).render(**context)
+            return render_template(template, context)
         except Exception as e:
             raise ValueError(f"템플릿 렌더링 실패: {e}")
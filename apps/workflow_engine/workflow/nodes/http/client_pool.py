@@ -0,0 +1,76 @@
+"""
+HTTP 클라이언트 풀
+
+워크플로우 엔진 단위로 호스트별 httpx.AsyncClient를 재사용하여
+Loop 노드 등에서 같은 API를 반복 호출할 때 TCP/TLS 핸드셰이크 비용을 없앱니다.
+"""
+
+import importlib.util
+import logging
+import os
+from typing import Dict
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 호스트별 커넥션 제한
+HTTP_POOL_MAX_CONNECTIONS = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", 20))
+HTTP_POOL_MAX_KEEPALIVE = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", 10))
+HTTP_POOL_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY", 30.0))
+
+# HTTP/2는 h2 패키지가 설치된 경우에만 활성화 (httpx[http2])
+HTTP2_ENABLED = (
+    os.getenv("HTTP_POOL_HTTP2", "true").lower() == "true"
+    and importlib.util.find_spec("h2") is not None
+)
+
+
+class HttpClientPool:
+    """
+    호스트(scheme://host:port)별 httpx.AsyncClient 풀
+
+    WorkflowEngine이 생성하여 execution_context["http_client_pool"]로 전달하며,
+    서브그래프(Loop) 엔진은 같은 풀을 공유합니다.
+    클라이언트는 이벤트 루프에 묶이므로 풀을 만든 엔진이 실행 종료 시 aclose()로 정리합니다.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_POOL_MAX_KEEPALIVE,
+        keepalive_expiry: float = HTTP_POOL_KEEPALIVE_EXPIRY,
+        http2: bool = HTTP2_ENABLED,
+    ):
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """URL의 호스트에 해당하는 클라이언트 반환 (없으면 생성)"""
+        key = self._host_key(url)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=self._limits, http2=self._http2)
+            self._clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """풀의 모든 클라이언트 연결 종료"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"[HttpClientPool] Failed to close client: {e}")
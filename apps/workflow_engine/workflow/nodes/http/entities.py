@@ -47,3 +47,10 @@ class HttpRequestNodeData(BaseNodeData):
     referenced_variables: List[HttpVariable] = Field(
         default_factory=list, description="참조 변수 목록"
     )
+    cache_ttl: int = Field(
+        0, description="GET 응답 캐시 유지 시간 (초, 0이면 캐시 안 함)"
+    )
+    max_response_bytes: Optional[int] = Field(
+        None,
+        description="응답 본문 최대 크기 (bytes). 설정 시 스트리밍으로 읽고 초과하면 실패",
+    )
@@ -1,13 +1,16 @@
 import json
-from typing import Any, Dict
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
 
 import httpx
-from jinja2 import Environment
 
+from apps.workflow_engine.workflow.core.template_cache import render_template
 from apps.workflow_engine.workflow.nodes.base.node import Node
 from apps.workflow_engine.workflow.nodes.http.entities import HttpRequestNodeData
 
-_jinja_env = Environment(autoescape=False)
+# 노드별 응답 캐시 최대 항목 수
+RESPONSE_CACHE_MAX_ENTRIES = 128
 
 
 def _get_nested_value(data: Any, keys: list[str]) -> Any:
@@ -47,6 +50,21 @@ class HttpRequestNode(Node[HttpRequestNodeData]):  # Node 상속
 
     node_type = "httpRequestNode"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 노드 인스턴스 단위 응답 캐시 (Loop 반복 간 재사용)
+        self._response_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+    def get_template_sources(self) -> List[str]:
+        auth_config = self.data.authConfig or {}
+        return [
+            self.data.url,
+            self.data.body,
+            *(h.value for h in self.data.headers),
+            auth_config.get("token"),
+            auth_config.get("apiKeyValue"),
+        ]
+
     async def _run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         HTTP 요청을 실행하고 응답을 반환합니다 (비동기).
@@ -97,57 +115,150 @@ class HttpRequestNode(Node[HttpRequestNodeData]):  # Node 상속
         method = data.method.value
         timeout = data.timeout / 1000.0  # ms -> seconds
 
+        # 4-1. 응답 캐시 확인 (GET만, TTL 내면 요청 생략 / 만료 시 ETag로 재검증)
+        cache_key = None
+        cached = None
+        if data.cache_ttl > 0 and method == "GET":
+            cache_key = (url, tuple(sorted(headers.items())))
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                if cached["expires_at"] > time.monotonic():
+                    self._response_cache.move_to_end(cache_key)
+                    return dict(cached["output"])
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+        # 4-2. 엔진이 제공하는 호스트별 커넥션 풀 사용 (없으면 단발성 클라이언트)
+        pool = self.execution_context.get("http_client_pool")
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                # 현재는 JSON만 지원
-                # TODO: 추후 다른 Content-Type 지원 시 여기에 분기 추가
-                # - application/x-www-form-urlencoded
-                # - multipart/form-data
-                # - text/xml
-                # - text/plain
-
-                if body:
-                    try:
-                        json_body = json.loads(body)
-
-                        response = await client.request(
-                            method=method,
-                            url=url,
-                            headers={
-                                k: v
-                                for k, v in headers.items()
-                                if k.lower() != "content-type"
-                            },
-                            json=json_body,
-                        )
-                    except json.JSONDecodeError as e:
-                        # JSON 파싱 실패 시 에러 발생
-                        raise ValueError(
-                            f"Body는 유효한 JSON 형식이어야 합니다: {str(e)}"
-                        )
-                else:
-                    # Body가 없는 경우 (GET 요청 등)
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        content=None,
-                    )
-
-                # 5. 응답 처리
-                try:
-                    response_body = response.json()
-                except json.JSONDecodeError:
-                    response_body = response.text
-
-                return {
-                    "status": response.status_code,
-                    "data": response_body,
-                    "headers": dict(response.headers),
-                }
+            if pool is not None:
+                output = await self._send(
+                    pool.get_client(url), method, url, headers, body, timeout=timeout
+                )
+            else:
+                async with httpx.AsyncClient(timeout=timeout) as client:
+                    output = await self._send(client, method, url, headers, body)
         except httpx.RequestError as e:
             raise RuntimeError(f"HTTP 요청 실패: {str(e)}")
 
+        # 4-3. 캐시 갱신
+        if cache_key is not None:
+            if output["status"] == 304 and cached is not None:
+                cached["expires_at"] = time.monotonic() + data.cache_ttl
+                self._response_cache.move_to_end(cache_key)
+                return dict(cached["output"])
+            if output["status"] == 200:
+                response_headers = {k.lower(): v for k, v in output["headers"].items()}
+                self._response_cache[cache_key] = {
+                    "output": output,
+                    "etag": response_headers.get("etag"),
+                    "last_modified": response_headers.get("last-modified"),
+                    "expires_at": time.monotonic() + data.cache_ttl,
+                }
+                self._response_cache.move_to_end(cache_key)
+                while len(self._response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                    self._response_cache.popitem(last=False)
+
+        return output
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[str],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        요청을 보내고 노드 출력 포맷으로 변환합니다.
+        max_response_bytes가 설정되면 응답을 스트리밍으로 읽으며 크기를 제한합니다.
+        """
+        # 현재는 JSON만 지원
+        # TODO: 추후 다른 Content-Type 지원 시 여기에 분기 추가
+        # - application/x-www-form-urlencoded
+        # - multipart/form-data
+        # - text/xml
+        # - text/plain
+        if body:
+            try:
+                json_body = json.loads(body)
+            except json.JSONDecodeError as e:
+                # JSON 파싱 실패 시 에러 발생
+                raise ValueError(f"Body는 유효한 JSON 형식이어야 합니다: {str(e)}")
+            request_kwargs = {
+                "method": method,
+                "url": url,
+                "headers": {
+                    k: v for k, v in headers.items() if k.lower() != "content-type"
+                },
+                "json": json_body,
+            }
+        else:
+            # Body가 없는 경우 (GET 요청 등)
+            request_kwargs = {
+                "method": method,
+                "url": url,
+                "headers": headers,
+                "content": None,
+            }
+
+        # 풀 클라이언트는 노드마다 타임아웃이 다르므로 요청 단위로 지정
+        if timeout is not None:
+            request_kwargs["timeout"] = timeout
+
+        max_bytes = self.data.max_response_bytes
+        if not max_bytes:
+            response = await client.request(**request_kwargs)
+            return self._build_output(
+                response.status_code, response.headers, response.text, response.json
+            )
+
+        async with client.stream(**request_kwargs) as response:
+            content_length = response.headers.get("content-length")
+            if content_length and int(content_length) > max_bytes:
+                raise ValueError(
+                    f"응답 크기가 제한({max_bytes} bytes)을 초과했습니다: {content_length} bytes"
+                )
+
+            chunks = []
+            received = 0
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if received > max_bytes:
+                    raise ValueError(f"응답 크기가 제한({max_bytes} bytes)을 초과했습니다.")
+                chunks.append(chunk)
+
+            text = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+            return self._build_output(response.status_code, response.headers, text)
+
+    def _build_output(
+        self,
+        status_code: int,
+        headers: Any,
+        text: str,
+        json_loader: Optional[Callable[[], Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        5. 응답 처리
+        Content-Type이 JSON이거나 본문이 JSON처럼 보일 때만 파싱을 시도합니다.
+        """
+        response_body: Any = text
+        content_type = (headers.get("content-type") or "").lower()
+        if "json" in content_type or (text or "").lstrip()[:1] in ("{", "["):
+            try:
+                response_body = json_loader() if json_loader else json.loads(text)
+            except ValueError:
+                response_body = text
+
+        return {
+            "status": status_code,
+            "data": response_body,
+            "headers": dict(headers),
+        }
+
     def _render_template(
         self, template_text: str, inputs: Dict[str, Any], json_context: bool = False
     ) -> str:
@@ -181,8 +292,7 @@ class HttpRequestNode(Node[HttpRequestNodeData]):  # Node 상속
                 context[variable.name] = val
 
         try:
-            template = _jinja_env.from_string(template_text)
-            return template.render(**context)
+            return render_template(template_text, context)
         except Exception:
             # 렌더링 실패 시 원본 텍스트 반환 (로깅 필요 시 추가)
             return template_text
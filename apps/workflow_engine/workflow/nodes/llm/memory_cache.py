@@ -0,0 +1,69 @@
+"""
+기억 모드 요약 캐시
+
+(workflow, user)별 누적 요약을 Redis에 보관합니다.
+마지막으로 반영한 실행 ID/시작 시각을 함께 저장하여, 다음 실행에서는 그 이후의 실행만 요약에 덧붙입니다.
+Redis 장애 시에는 캐시 없이 동작합니다. (요약을 처음부터 다시 생성)
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from apps.shared.pubsub import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+MEMORY_SUMMARY_TTL = int(os.getenv("MEMORY_SUMMARY_TTL", 7 * 24 * 3600))
+KEY_PREFIX = "memory_summary"
+
+
+def _key(workflow_id: Any, user_id: Any) -> str:
+    return f"{KEY_PREFIX}:{workflow_id}:{user_id}"
+
+
+async def load_memory_summary(
+    workflow_id: Any, user_id: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    저장된 누적 요약 조회
+
+    Returns:
+        {"summary": str, "last_run_id": str, "last_started_at": datetime} 또는 None
+    """
+    try:
+        raw = await get_async_redis_client().get(_key(workflow_id, user_id))
+        if not raw:
+            return None
+        state = json.loads(raw)
+        state["last_started_at"] = datetime.fromisoformat(state["last_started_at"])
+        return state
+    except Exception as e:
+        logger.warning(f"[MemoryCache] Failed to load summary: {e}")
+        return None
+
+
+async def save_memory_summary(
+    workflow_id: Any,
+    user_id: Any,
+    summary: str,
+    last_run_id: Any,
+    last_started_at: datetime,
+) -> None:
+    """누적 요약과 마지막으로 반영한 실행 정보를 저장"""
+    payload = json.dumps(
+        {
+            "summary": summary,
+            "last_run_id": str(last_run_id),
+            "last_started_at": last_started_at.isoformat(),
+        },
+        ensure_ascii=False,
+    )
+    try:
+        await get_async_redis_client().set(
+            _key(workflow_id, user_id), payload, ex=MEMORY_SUMMARY_TTL
+        )
+    except Exception as e:
+        logger.warning(f"[MemoryCache] Failed to save summary: {e}")
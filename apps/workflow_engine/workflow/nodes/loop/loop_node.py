@@ -1,8 +1,10 @@
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from jinja2 import BaseLoader, Environment, TemplateSyntaxError, UndefinedError
+from jinja2 import TemplateSyntaxError, UndefinedError
+from jinja2.exceptions import SecurityError
 from pydantic import BaseModel, Field
 
+from apps.workflow_engine.workflow.core.template_cache import render_template
 from apps.workflow_engine.workflow.nodes.base.entities import BaseNodeData
 from apps.workflow_engine.workflow.nodes.base.node import Node
 
@@ -48,18 +50,27 @@ class LoopNode(Node[LoopNodeData]):
     - 템플릿 문법: {{node_id.variable}}, {{loop.item}}, {{loop.index}}
     - 암시적 접근: inputs 배열이 비어있으면 모든 외부 변수 자동 전달
     - 명시적 매핑: inputs 배열로 선택적 매핑 가능
+
+    [PERF] 서브그래프가 시작 노드 + 코드 노드 하나뿐이면 반복마다 샌드박스를 호출하지 않고
+    샌드박스 배치 API로 한 번에 실행합니다. (map 모드)
     """
 
     node_type = "loopNode"
 
+    # map 모드 최대 항목 수 (샌드박스 SANDBOX_MAX_BATCH_ITEMS 이하), 초과 시 반복 실행
+    MAX_VECTORIZED_ITEMS = 1000
+    # map 모드 배치 전체 타임아웃 상한 (초, 샌드박스 SANDBOX_MAX_BATCH_TIMEOUT)
+    MAX_VECTORIZED_TIMEOUT = 300
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Jinja2 환경 초기화
-        self.jinja_env = Environment(
-            loader=BaseLoader(),
-            autoescape=False,  # 자동 이스케이프 비활성화
-        )
         self._subgraph_engine = None  # 재사용할 엔진
+        self._vectorized_nodes = None  # map 모드 (시작 노드, 코드 노드), 대상 아니면 False
+
+    def get_template_sources(self) -> List[str]:
+        sources = [self.data.loop_key]
+        sources.extend(inp.name for inp in self.data.inputs if not inp.value_selector)
+        return sources
 
     def _render_template(self, template: str, context: Dict[str, Any]) -> Any:
         """
@@ -74,11 +85,11 @@ class LoopNode(Node[LoopNodeData]):
             return template
 
         try:
-            tmpl = self.jinja_env.from_string(template)
-            result = tmpl.render(context)
-            return result
-        except (TemplateSyntaxError, UndefinedError):
-            # 템플릿 오류 시 원본 반환 또는 에러
+            return render_template(template, context)
+        except (TemplateSyntaxError, UndefinedError, SecurityError):
+            # 템플릿 오류 시 원본 반환
+            # SecurityError(샌드박스가 막은 안전하지 않은 속성/메서드 접근)도 같은 방식으로 처리해
+            # 렌더링하지 않은 원본 문자열을 그대로 사용 (baseline의 실패 시 동작과 동일)
             return template
 
     def _build_variable_context(
@@ -119,10 +130,18 @@ class LoopNode(Node[LoopNodeData]):
         if not isinstance(array_to_iterate, list):
             return {"error": "Loop target is not an array", "results": []}
 
-        # 4. 반복 실행 (비동기)
+        max_iterations = self.data.max_iterations or 100
+
+        # 4-1. 코드 노드 하나짜리 서브그래프: 배치 실행 (map 모드)
+        items = array_to_iterate[:max_iterations]
+        vectorized_nodes = self._get_vectorized_nodes()
+        if vectorized_nodes and len(items) <= self.MAX_VECTORIZED_ITEMS:
+            results = await self._execute_vectorized(vectorized_nodes, inputs, items)
+            return self._map_outputs_hybrid(results, inputs)
+
+        # 4-2. 반복 실행 (비동기)
         results = []
         iteration_count = 0
-        max_iterations = self.data.max_iterations or 100
 
         for item in array_to_iterate:
             if iteration_count >= max_iterations:
@@ -201,6 +220,72 @@ class LoopNode(Node[LoopNodeData]):
         result = await self._subgraph_engine.execute()
         return result
 
+    def _get_vectorized_nodes(self) -> Optional[Tuple[Any, Any]]:
+        """
+        map 모드 대상이면 (시작 노드, 코드 노드) 인스턴스 반환
+
+        메모를 제외한 서브그래프 노드가 시작 노드 1개 + 코드 노드 1개일 때만 대상입니다.
+        (반복 실행과 결과 형태가 같도록 시작 노드는 그대로 실행)
+        """
+        if self._vectorized_nodes is None:
+            self._vectorized_nodes = False
+
+            nodes = [
+                node
+                for node in self.data.subGraph.get("nodes", [])
+                if node.get("type") != "note"
+            ]
+            by_type = {node.get("type"): node for node in nodes}
+            if len(nodes) == 2 and set(by_type) == {"startNode", "codeNode"}:
+                from apps.shared.schemas.workflow import NodeSchema
+                from apps.workflow_engine.workflow.core.workflow_node_factory import (
+                    NodeFactory,
+                )
+
+                context = self.execution_context.copy()
+                self._vectorized_nodes = (
+                    NodeFactory.create(NodeSchema(**by_type["startNode"]), context=context),
+                    NodeFactory.create(NodeSchema(**by_type["codeNode"]), context=context),
+                )
+
+        return self._vectorized_nodes or None
+
+    async def _execute_vectorized(
+        self, nodes: Tuple[Any, Any], inputs: Dict[str, Any], items: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        map 모드 실행: 반복마다 시작 노드만 로컬에서 실행하고 코드는 한 번의 배치로 실행
+
+        Returns:
+            반복 실행과 같은 형태의 반복별 결과 ({start_id: ..., code_id: ...})
+        """
+        start_node, code_node = nodes
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        batch_indexes, batch_inputs = [], []
+
+        for index, item in enumerate(items):
+            context = self._build_variable_context(inputs, item=item, index=index)
+            try:
+                start_output = await start_node.execute(context)
+            except Exception as e:
+                if self.data.error_strategy == "end":
+                    raise
+                results[index] = {"error": str(e)}
+                continue
+            results[index] = {start_node.id: start_output}
+            batch_indexes.append(index)
+            batch_inputs.append({start_node.id: start_output})
+
+        if batch_inputs:
+            timeout = min(
+                self.MAX_VECTORIZED_TIMEOUT, code_node.data.timeout * len(batch_inputs)
+            )
+            outputs = await code_node.run_batch(batch_inputs, timeout=timeout)
+            for index, output in zip(batch_indexes, outputs):
+                results[index][code_node.id] = output
+
+        return results
+
     def _resolve_variable(
         self, value_selector: List[str], inputs: Dict[str, Any]
     ) -> Any:
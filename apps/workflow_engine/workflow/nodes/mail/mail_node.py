@@ -6,13 +6,10 @@ from datetime import datetime
 from email.header import decode_header
 from typing import Any, Dict, List, Optional
 
-from jinja2 import Environment
-
+from apps.workflow_engine.workflow.core.template_cache import render_template
 from apps.workflow_engine.workflow.nodes.base.node import Node
 from apps.workflow_engine.workflow.nodes.mail.entities import MailNodeData
 
-_jinja_env = Environment(autoescape=False)
-
 
 def _get_nested_value(data: Any, keys: List[str]) -> Any:
     """중첩된 딕셔너리에서 키 경로를 따라 값을 추출합니다."""
@@ -304,6 +301,6 @@ class MailNode(Node[MailNodeData]):
 
         # Jinja2 템플릿 렌더링
         try:
-            return _jinja_env.from_string(template).render(**context)
+            return render_template(template, context)
         except Exception as e:
             raise ValueError(f"템플릿 렌더링 실패: {e}")
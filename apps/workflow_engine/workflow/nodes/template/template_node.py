@@ -1,7 +1,6 @@
 from typing import Any, Dict, List
 
-from jinja2 import Template
-
+from apps.workflow_engine.workflow.core.template_cache import render_template
 from apps.workflow_engine.workflow.nodes.base.node import Node
 
 from .entities import TemplateNodeData
@@ -27,6 +26,9 @@ class TemplateNode(Node[TemplateNodeData]):
 
     node_type = "templateNode"
 
+    def get_template_sources(self) -> List[str]:
+        return [self.data.template]
+
     async def _run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         1. 설정된 변수들의 값을 inputs에서 가져와 context를 구성합니다.
@@ -65,8 +67,7 @@ class TemplateNode(Node[TemplateNodeData]):
 
         # 2. 렌더링
         try:
-            template = Template(self.data.template)
-            rendered_text = template.render(context)
+            rendered_text = render_template(self.data.template, context)
         except Exception as e:
             rendered_text = f"(Error: {str(e)})"
 
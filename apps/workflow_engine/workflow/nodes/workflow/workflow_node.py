@@ -34,7 +34,7 @@ class WorkflowNode(Node[WorkflowNodeData]):
 
         workflow_id = self.data.workflowId
         db = self.execution_context.get("db")
-        if not db:
+        if not db and not self.execution_context.get("async_session_factory"):
             raise ValueError(
                 f"[WorkflowNode] DB session required in execution_context for node {self.id}"
             )
@@ -45,31 +45,8 @@ class WorkflowNode(Node[WorkflowNodeData]):
         # 여기서는 프론트엔드에서 App ID를 workflowId 필드에 저장한다고 가정하겠습니다. (또는 appId 필드 사용)
         target_app_id = self.data.appId  # 엔티티 정의에 appId가 있음
 
-        app = db.query(App).filter(App.id == target_app_id).first()
-        if not app:
-            raise ValueError(f"[WorkflowNode] Target App {target_app_id} not found")
-
-        if not app.active_deployment_id:
-            raise ValueError(f"[WorkflowNode] App {app.name} has no active deployment")
-
-        from apps.shared.db.models.workflow_deployment import WorkflowDeployment
-
-        deployment = (
-            db.query(WorkflowDeployment)
-            .filter(WorkflowDeployment.id == app.active_deployment_id)
-            .first()
-        )
-
-        if not deployment:
-            raise ValueError(
-                f"[WorkflowNode] Active deployment not found for app {app.name}"
-            )
-
-        graph = deployment.graph_snapshot
-        if not graph:
-            raise ValueError(
-                f"[WorkflowNode] Deployment {deployment.version} has no graph data"
-            )
+        # [PERF] 태스크 전용 세션에서 조회 (병렬 노드와 세션을 공유하지 않음)
+        graph = await self._run_db(self._load_target_graph, target_app_id)
 
         # 2. 입력 매핑 처리 (Inputs Mapping)
         sub_workflow_inputs = {}
@@ -117,3 +94,32 @@ class WorkflowNode(Node[WorkflowNodeData]):
         # 출력 통일: 항상 'result' 키로 반환
         # 서브 워크플로우의 출력값 구조와 관계없이 일관된 출력 제공
         return {"result": result}
+
+    def _load_target_graph(self, session, target_app_id) -> Dict[str, Any]:
+        """대상 App의 활성 배포 그래프를 조회합니다. (_run_db 세션에서 실행)"""
+        from apps.shared.db.models.workflow_deployment import WorkflowDeployment
+
+        app = session.query(App).filter(App.id == target_app_id).first()
+        if not app:
+            raise ValueError(f"[WorkflowNode] Target App {target_app_id} not found")
+
+        if not app.active_deployment_id:
+            raise ValueError(f"[WorkflowNode] App {app.name} has no active deployment")
+
+        deployment = (
+            session.query(WorkflowDeployment)
+            .filter(WorkflowDeployment.id == app.active_deployment_id)
+            .first()
+        )
+
+        if not deployment:
+            raise ValueError(
+                f"[WorkflowNode] Active deployment not found for app {app.name}"
+            )
+
+        graph = deployment.graph_snapshot
+        if not graph:
+            raise ValueError(
+                f"[WorkflowNode] Deployment {deployment.version} has no graph data"
+            )
+        return graph
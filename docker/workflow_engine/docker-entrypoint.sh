@@ -59,13 +59,15 @@ echo ""
 echo "Starting Celery worker for workflow execution..."
 echo "================================================"
 
-# Celery 워커 실행 (gevent pool for async I/O)
+# Celery 워커 실행 (threads pool + 프로세스 공용 asyncio 루프, apps/workflow_engine/worker_loop.py)
+# gevent pool은 태스크마다 이벤트 루프를 새로 만들어야 하므로 사용하지 않음
+# threads pool은 task_time_limit을 적용하지 않으므로 worker_loop가 WORKFLOW_TASK_DEADLINE(기본 540초)으로 실행을 취소함
+# threads pool은 --max-tasks-per-child도 무시하므로 memory_guard가 WORKFLOW_WORKER_MAX_MEMORY_MB 초과 시 워커를 재시작함
 cd /app
 exec celery -A apps.workflow_engine.main worker \
-    --pool=gevent \
+    --pool=threads \
     --concurrency=100 \
     --loglevel=info \
-    --queues=workflow \
-    --max-tasks-per-child=1000
+    --queues=workflow
 
 
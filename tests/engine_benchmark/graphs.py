@@ -0,0 +1,209 @@
+"""
+벤치마크용 합성 그래프
+
+엔진 코어의 서로 다른 경로를 겨냥한 그래프 모양을 크기만 바꿔 생성합니다.
+- fan_out: 시작 → N개 병렬 노드 → answer (스케줄러/세마포어/의존성 대기)
+- chain: N개 노드 직렬 (노드당 고정 오버헤드)
+- nested_loop: 반복 노드 안의 반복 노드 (서브그래프 엔진 재사용)
+- sub_workflow: workflowNode로 N단계 중첩 호출 (서브 엔진 생성/정리)
+
+말단 노드 종류(kind)는 llm / code / http / template 중 선택합니다.
+모든 노드 ID는 그래프 전체(서브그래프, 서브 워크플로우 포함)에서 유일합니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+from tests.engine_benchmark.mocks import MOCK_HTTP_HOST
+
+LEAF_KINDS = ("llm", "code", "http", "template")
+
+# 말단 노드 종류별 대표 출력 키 (answer 노드 연결용)
+_OUTPUT_KEYS = {"llm": "text", "code": "result", "http": "status", "template": "text"}
+
+_POSITION = {"x": 0, "y": 0}
+
+
+@dataclass
+class BenchmarkGraph:
+    """엔진에 넘길 그래프와 실행에 필요한 부가 정보"""
+
+    name: str
+    graph: Dict[str, Any]
+    user_input: Dict[str, Any] = field(default_factory=dict)
+    # workflowNode appId -> 대상 그래프 (MockBackends.subworkflows)
+    subworkflows: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+def _node(node_id: str, node_type: str, **data) -> Dict[str, Any]:
+    return {
+        "id": node_id,
+        "type": node_type,
+        "position": _POSITION,
+        "data": {"title": node_id, **data},
+    }
+
+
+def _edge(source: str, target: str) -> Dict[str, Any]:
+    return {"id": f"{source}->{target}", "source": source, "target": target}
+
+
+def _start(node_id: str, *variables: str) -> Dict[str, Any]:
+    return _node(
+        node_id,
+        "startNode",
+        variables=[
+            {"id": f"{node_id}-{name}", "name": name, "label": name, "type": "text"}
+            for name in variables
+        ],
+    )
+
+
+def leaf(node_id: str, kind: str) -> Dict[str, Any]:
+    """모의 백엔드를 호출하는 말단 노드"""
+    if kind == "llm":
+        return _node(node_id, "llmNode", model_id="mock-model", user_prompt="benchmark")
+    if kind == "code":
+        return _node(node_id, "codeNode", code="def main(inputs):\n    return {}")
+    if kind == "http":
+        return _node(
+            node_id, "httpRequestNode", method="GET", url=f"{MOCK_HTTP_HOST}/{node_id}"
+        )
+    if kind == "template":
+        return _node(node_id, "templateNode", template="benchmark")
+    raise ValueError(f"알 수 없는 노드 종류: {kind} (선택: {', '.join(LEAF_KINDS)})")
+
+
+def _answer(node_id: str, sources: List[str], kind: str) -> Dict[str, Any]:
+    return _node(
+        node_id,
+        "answerNode",
+        outputs=[
+            {"variable": source, "value_selector": [source, _OUTPUT_KEYS[kind]]}
+            for source in sources
+        ],
+    )
+
+
+def _chain_graph(prefix: str, length: int, kind: str) -> Dict[str, Any]:
+    start = f"{prefix}start"
+    ids = [f"{prefix}{kind}-{i}" for i in range(length)]
+    nodes = [_start(start)] + [leaf(node_id, kind) for node_id in ids]
+    nodes.append(_answer(f"{prefix}answer", ids[-1:], kind))
+    path = [start] + ids + [f"{prefix}answer"]
+    edges = [_edge(a, b) for a, b in zip(path, path[1:])]
+    return {"nodes": nodes, "edges": edges}
+
+
+def fan_out(width: int, kind: str = "llm") -> BenchmarkGraph:
+    """시작 노드에서 width개로 갈라졌다가 answer 노드에서 합류"""
+    ids = [f"{kind}-{i}" for i in range(width)]
+    nodes = [_start("start")] + [leaf(node_id, kind) for node_id in ids]
+    nodes.append(_answer("answer", ids, kind))
+    edges = [_edge("start", node_id) for node_id in ids]
+    edges += [_edge(node_id, "answer") for node_id in ids]
+    return BenchmarkGraph(f"fan_out({width},{kind})", {"nodes": nodes, "edges": edges})
+
+
+def chain(length: int, kind: str = "llm") -> BenchmarkGraph:
+    """length개 노드 직렬 연결"""
+    return BenchmarkGraph(f"chain({length},{kind})", _chain_graph("", length, kind))
+
+
+def nested_loop(
+    outer: int, inner: int, kind: str = "code", body_length: int = 2
+) -> BenchmarkGraph:
+    """
+    outer회 반복 안에서 inner회 반복, 안쪽 본문은 body_length개 노드 직렬
+
+    본문이 코드 노드 1개면 map 모드(배치)로 바뀌므로 기본값은 2개로 반복 실행 경로를 잰다.
+    """
+    inner_body = _chain_graph("inner-", body_length, kind)
+    inner_body["nodes"][0] = _start("inner-start", "loop")
+    # 안쪽 본문 answer 노드 제외 (서브그래프 엔진은 전체 결과를 반환)
+    inner_body["nodes"] = inner_body["nodes"][:-1]
+    inner_body["edges"] = inner_body["edges"][:-1]
+
+    outer_body = {
+        "nodes": [
+            _start("outer-start", "loop"),
+            _node(
+                "inner-loop",
+                "loopNode",
+                loop_key="outer-start.loop.item",
+                max_iterations=inner,
+                subGraph=inner_body,
+            ),
+        ],
+        "edges": [_edge("outer-start", "inner-loop")],
+    }
+    graph = {
+        "nodes": [
+            _start("start", "items"),
+            _node(
+                "outer-loop",
+                "loopNode",
+                loop_key="start.items",
+                max_iterations=outer,
+                subGraph=outer_body,
+            ),
+        ],
+        "edges": [_edge("start", "outer-loop")],
+    }
+    items = [list(range(inner)) for _ in range(outer)]
+    return BenchmarkGraph(
+        f"nested_loop({outer}x{inner}x{body_length},{kind})",
+        graph,
+        user_input={"items": items},
+    )
+
+
+def sub_workflow(depth: int, kind: str = "llm") -> BenchmarkGraph:
+    """
+    workflowNode로 depth단계 중첩 호출 (각 단계: 시작 → 말단 노드 → 다음 단계 → answer)
+    """
+    subworkflows = {}
+    for level in range(depth, 0, -1):
+        prefix = f"d{level}-"
+        work = f"{prefix}{kind}"
+        nodes = [_start(f"{prefix}start"), leaf(work, kind)]
+        path = [f"{prefix}start", work]
+        if level < depth:
+            nodes.append(_workflow_call(f"{prefix}call", level + 1))
+            path.append(f"{prefix}call")
+        nodes.append(_answer(f"{prefix}answer", [work], kind))
+        path.append(f"{prefix}answer")
+        subworkflows[_app_id(level)] = {
+            "nodes": nodes,
+            "edges": [_edge(a, b) for a, b in zip(path, path[1:])],
+        }
+
+    graph = {
+        "nodes": [_start("start"), _workflow_call("call", 1)],
+        "edges": [_edge("start", "call")],
+    }
+    return BenchmarkGraph(
+        f"sub_workflow({depth},{kind})", graph, subworkflows=subworkflows
+    )
+
+
+def _app_id(level: int) -> str:
+    return f"bench-app-{level}"
+
+
+def _workflow_call(node_id: str, level: int) -> Dict[str, Any]:
+    return _node(
+        node_id,
+        "workflowNode",
+        workflowId=_app_id(level),
+        appId=_app_id(level),
+    )
+
+
+# CLI에서 쓰는 시나리오 이름 -> 생성 함수
+SCENARIOS: Dict[str, Callable[..., BenchmarkGraph]] = {
+    "fan_out": fan_out,
+    "chain": chain,
+    "nested_loop": nested_loop,
+    "sub_workflow": sub_workflow,
+}
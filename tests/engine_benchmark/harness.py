@@ -0,0 +1,270 @@
+"""
+WorkflowEngine 오프라인 벤치마크 하네스
+
+모의 백엔드(mocks.py)를 주입한 상태로 합성 그래프(graphs.py)를 실행하고 다음을 측정합니다.
+- wall: WorkflowEngine.execute() 시간 (엔진 생성 시간은 build로 따로 기록)
+- ideal: 모의 백엔드 지연만으로 계산한 임계 경로 하한 (동시성 제한 없음 가정)
+- overhead: wall - ideal, 엔진 스케줄링/입력 해석/이벤트 처리 등 코어 비용
+- throughput: 초당 노드 실행 수
+- memory: tracemalloc 최대/잔존 할당량 (측정 오버헤드가 커서 시간 측정과 별도 실행)
+
+반복 노드 서브그래프는 반복별 지연 합계로 임계 경로를 계산하므로 ideal은 하한입니다.
+"""
+
+import asyncio
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from apps.workflow_engine.workflow.core.workflow_engine import WorkflowEngine
+from tests.engine_benchmark.graphs import BenchmarkGraph
+from tests.engine_benchmark.mocks import LatencyModel, MockBackends
+
+
+@dataclass
+class BenchmarkResult:
+    """시나리오 하나의 측정 결과 (시간 값은 반복 측정의 중앙값, ms)"""
+
+    scenario: str
+    repeat: int
+    node_runs: int
+    build_ms: float
+    wall_ms: float
+    wall_p95_ms: float
+    ideal_ms: float
+    overhead_ms: float
+    overhead_per_node_us: float
+    nodes_per_sec: float
+    backend_calls: Dict[str, int]
+    peak_kb: float
+    retained_kb: float
+    phases_ms: Optional[Dict[str, float]] = None
+    latencies: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def critical_path_seconds(
+    graph: Dict[str, Any],
+    node_seconds: Dict[str, float],
+    subworkflows: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> float:
+    """
+    노드별 백엔드 지연으로 그래프의 최장 경로(임계 경로) 계산
+
+    loopNode는 서브그래프 임계 경로, workflowNode는 대상 그래프 임계 경로를 노드 비용에 더합니다.
+    """
+    subworkflows = subworkflows or {}
+    nodes = {node["id"]: node for node in graph.get("nodes", []) if node["type"] != "note"}
+    cost = {}
+    for node_id, node in nodes.items():
+        seconds = node_seconds.get(node_id, 0.0)
+        data = node.get("data", {})
+        if node["type"] == "loopNode" and data.get("subGraph"):
+            seconds += critical_path_seconds(data["subGraph"], node_seconds, subworkflows)
+        elif node["type"] == "workflowNode" and data.get("appId") in subworkflows:
+            seconds += critical_path_seconds(
+                subworkflows[data["appId"]], node_seconds, subworkflows
+            )
+        cost[node_id] = seconds
+
+    parents: Dict[str, List[str]] = {node_id: [] for node_id in nodes}
+    for edge in graph.get("edges", []):
+        if edge["source"] in nodes and edge["target"] in nodes:
+            parents[edge["target"]].append(edge["source"])
+
+    finish: Dict[str, float] = {}
+
+    def finish_time(node_id: str) -> float:
+        if node_id not in finish:
+            start = max((finish_time(p) for p in parents[node_id]), default=0.0)
+            finish[node_id] = start + cost[node_id]
+        return finish[node_id]
+
+    return max((finish_time(node_id) for node_id in nodes), default=0.0)
+
+
+async def _run_once(
+    bench: BenchmarkGraph, backends: MockBackends, trace: bool = False
+):
+    """엔진 1회 생성/실행 -> (build 초, wall 초, 트레이스 또는 None)"""
+    context = backends.execution_context()
+    if trace:
+        context["trace"] = True
+
+    started = time.perf_counter()
+    engine = WorkflowEngine(
+        graph=bench.graph, user_input=dict(bench.user_input), execution_context=context
+    )
+    built = time.perf_counter()
+    try:
+        await engine.execute()
+        finished = time.perf_counter()
+        run_trace = engine.trace if trace else None
+    finally:
+        engine.cleanup()
+    return built - started, finished - built, run_trace
+
+
+async def _measure_memory(bench: BenchmarkGraph, backends: MockBackends):
+    """tracemalloc 최대 할당량과 실행 후(gc 이후) 잔존 할당량 (KB)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        await _run_once(bench, backends)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - baseline) / 1024, max(retained - baseline, 0) / 1024
+
+
+async def run_benchmark_async(
+    bench: BenchmarkGraph,
+    llm_latency: LatencyModel = LatencyModel(),
+    sandbox_latency: LatencyModel = LatencyModel(),
+    http_latency: LatencyModel = LatencyModel(),
+    repeat: int = 5,
+    warmup: int = 1,
+    seed: int = 0,
+    phases: bool = False,
+) -> BenchmarkResult:
+    """
+    시나리오 하나를 warmup + repeat회 실행하고 결과를 집계
+
+    Args:
+        bench: graphs.py가 만든 그래프
+        *_latency: 백엔드별 지연 분포
+        repeat: 측정 반복 횟수 (시간 값은 중앙값)
+        warmup: 측정 전 예열 횟수 (템플릿/임포트 캐시 등)
+        seed: 지연 샘플링 시드 (반복마다 같은 시드로 재시작)
+        phases: True면 트레이스를 켠 실행을 한 번 더 해서 단계별 시간 합계를 포함
+    """
+    backends = MockBackends(
+        llm_latency=llm_latency,
+        sandbox_latency=sandbox_latency,
+        http_latency=http_latency,
+        seed=seed,
+        subworkflows=bench.subworkflows,
+    )
+    builds, walls, ideals = [], [], []
+    node_runs = 0
+    backend_calls: Dict[str, int] = {}
+
+    with backends.install():
+        try:
+            for _ in range(warmup):
+                backends.reset()
+                await _run_once(bench, backends)
+
+            for _ in range(repeat):
+                backends.reset()
+                build, wall, _ = await _run_once(bench, backends)
+                builds.append(build)
+                walls.append(wall)
+                ideals.append(
+                    critical_path_seconds(
+                        bench.graph, backends.backend_seconds, bench.subworkflows
+                    )
+                )
+                node_runs = backends.node_runs
+                backend_calls = dict(backends.backend_calls)
+
+            phases_ms = None
+            if phases:
+                backends.reset()
+                _, _, run_trace = await _run_once(bench, backends, trace=True)
+                phases_ms = run_trace.phase_summary_ms()
+
+            backends.reset()
+            peak_kb, retained_kb = await _measure_memory(bench, backends)
+        finally:
+            await backends.http_client_pool.aclose()
+
+    wall = statistics.median(walls)
+    ideal = statistics.median(ideals)
+    overhead = max(wall - ideal, 0.0)
+    return BenchmarkResult(
+        scenario=bench.name,
+        repeat=repeat,
+        node_runs=node_runs,
+        build_ms=statistics.median(builds) * 1000,
+        wall_ms=wall * 1000,
+        wall_p95_ms=_percentile(walls, 95) * 1000,
+        ideal_ms=ideal * 1000,
+        overhead_ms=overhead * 1000,
+        overhead_per_node_us=overhead / node_runs * 1e6 if node_runs else 0.0,
+        nodes_per_sec=node_runs / wall if wall else 0.0,
+        backend_calls=backend_calls,
+        peak_kb=peak_kb,
+        retained_kb=retained_kb,
+        phases_ms=phases_ms,
+        latencies={name: str(model) for name, model in backends.latencies.items()},
+    )
+
+
+def run_benchmark(bench: BenchmarkGraph, **kwargs) -> BenchmarkResult:
+    """run_benchmark_async의 동기 래퍼 (새 이벤트 루프에서 실행)"""
+    return asyncio.run(run_benchmark_async(bench, **kwargs))
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def compare_to_baseline(
+    results: List[BenchmarkResult], baseline_path: str, threshold: float = 0.2
+) -> List[str]:
+    """
+    기준 결과(JSON)와 비교해 회귀 목록 반환
+
+    overhead_per_node_us, peak_kb가 기준보다 threshold 비율 이상 늘거나
+    nodes_per_sec가 threshold 비율 이상 줄면 회귀로 봅니다.
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {item["scenario"]: item for item in json.load(f)}
+
+    regressions = []
+    for result in results:
+        base = baseline.get(result.scenario)
+        if base is None:
+            continue
+        for metric, higher_is_worse in (
+            ("overhead_per_node_us", True),
+            ("peak_kb", True),
+            ("nodes_per_sec", False),
+        ):
+            before, after = base[metric], getattr(result, metric)
+            if not before:
+                continue
+            change = (after - before) / before
+            if (change if higher_is_worse else -change) > threshold:
+                regressions.append(
+                    f"{result.scenario} {metric}: {before:.1f} -> {after:.1f} ({change:+.0%})"
+                )
+    return regressions
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """마크다운 표 형식 요약"""
+    lines = [
+        "| Scenario | Nodes | Build (ms) | Wall (ms) | p95 (ms) | Ideal (ms) "
+        "| Overhead (ms) | Overhead/node (us) | Nodes/s | Peak (KB) | Retained (KB) |",
+        "|---|---|---|---|---|---|---|---|---|---|---|",
+    ]
+    for r in results:
+        lines.append(
+            f"| {r.scenario} | {r.node_runs} | {r.build_ms:.1f} | {r.wall_ms:.1f} "
+            f"| {r.wall_p95_ms:.1f} | {r.ideal_ms:.1f} | {r.overhead_ms:.1f} "
+            f"| {r.overhead_per_node_us:.0f} | {r.nodes_per_sec:.0f} "
+            f"| {r.peak_kb:.0f} | {r.retained_kb:.0f} |"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,265 @@
+"""
+오프라인 엔진 벤치마크용 모의 백엔드
+
+실제 LLM 프로바이더, 샌드박스, 외부 HTTP 서버 대신 지정한 지연 분포만큼 기다렸다가
+고정된 형태의 응답을 돌려줍니다. 노드 ID별로 시드를 나누므로 병렬 노드의 실행 순서와
+관계없이 같은 시드면 같은 지연이 나옵니다.
+
+- MockLLMClient: LLMNode._client_override로 주입 (async invoke)
+- MockSandboxService: CodeNode.sandbox_service 대체 (실제 서비스처럼 동기 호출)
+- StubHttpClientPool: execution_context["http_client_pool"] 대체 (httpx.MockTransport)
+- OfflineSession: 서브 워크플로우 그래프 조회용 가짜 async_session_factory
+"""
+
+import asyncio
+import random
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import httpx
+
+from apps.workflow_engine.workflow.core.workflow_node_factory import NodeFactory
+from apps.workflow_engine.workflow.nodes.base.node import Node
+from apps.workflow_engine.workflow.nodes.code.code_node import CodeNode
+from apps.workflow_engine.workflow.nodes.llm.llm_node import LLMNode
+from apps.workflow_engine.workflow.nodes.workflow.workflow_node import WorkflowNode
+
+MOCK_HTTP_HOST = "https://mock.benchmark.local"
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """
+    백엔드 호출 지연 분포 (밀리초)
+
+    - fixed: 항상 mean_ms
+    - uniform: [low_ms, high_ms] 균등 분포
+    - lognormal: 중앙값 mean_ms, 형태 sigma (꼬리가 긴 LLM 응답 시간 근사)
+    """
+
+    kind: str = "fixed"
+    mean_ms: float = 0.0
+    low_ms: float = 0.0
+    high_ms: float = 0.0
+    sigma: float = 0.5
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """
+        CLI 문자열 파싱: "fixed:50", "uniform:20-80", "lognormal:300,0.6", "0"
+        """
+        kind, _, args = spec.partition(":")
+        if not args:
+            return cls(kind="fixed", mean_ms=float(kind))
+        if kind == "fixed":
+            return cls(kind=kind, mean_ms=float(args))
+        if kind == "uniform":
+            low, high = (float(v) for v in args.split("-", 1))
+            return cls(kind=kind, low_ms=low, high_ms=high, mean_ms=(low + high) / 2)
+        if kind == "lognormal":
+            median, _, sigma = args.partition(",")
+            return cls(kind=kind, mean_ms=float(median), sigma=float(sigma or 0.5))
+        raise ValueError(f"알 수 없는 지연 분포: {spec}")
+
+    def sample(self, rng: random.Random) -> float:
+        """지연 시간 샘플 (초)"""
+        if self.kind == "uniform":
+            ms = rng.uniform(self.low_ms, self.high_ms)
+        elif self.kind == "lognormal":
+            ms = rng.lognormvariate(0.0, self.sigma) * self.mean_ms
+        else:
+            ms = self.mean_ms
+        return max(ms, 0.0) / 1000.0
+
+    def __str__(self) -> str:
+        if self.kind == "uniform":
+            return f"uniform:{self.low_ms:g}-{self.high_ms:g}"
+        if self.kind == "lognormal":
+            return f"lognormal:{self.mean_ms:g},{self.sigma:g}"
+        return f"fixed:{self.mean_ms:g}"
+
+
+class MockLLMClient:
+    """OpenAI 응답 형태를 돌려주는 LLM 클라이언트"""
+
+    def __init__(self, backends: "MockBackends", node_id: str):
+        self._backends = backends
+        self._node_id = node_id
+        self.model_id = "mock-model"
+        self.provider_name = "mock"
+
+    async def invoke(self, messages: List[Dict[str, Any]], **params) -> Dict[str, Any]:
+        await asyncio.sleep(self._backends.sample("llm", self._node_id))
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4
+        return {
+            "choices": [{"message": {"content": f"mock response from {self._node_id}"}}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": 16,
+                "total_tokens": prompt_tokens + 16,
+            },
+        }
+
+
+class MockSandboxService:
+    """
+    SandboxService와 같은 시그니처의 모의 샌드박스
+
+    실제 서비스가 동기 HTTP 호출이므로 time.sleep으로 지연을 재현합니다.
+    (CodeNode가 스레드풀에서 호출하므로 스레드풀 대기도 측정에 포함됨)
+    """
+
+    def __init__(self, backends: "MockBackends", node_id: str):
+        self._backends = backends
+        self._node_id = node_id
+
+    def execute_python_code(
+        self,
+        code: str,
+        inputs: Dict[str, Any],
+        timeout: int = 10,
+        trigger_type: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        cacheable: bool = False,
+    ) -> Dict[str, Any]:
+        time.sleep(self._backends.sample("sandbox", self._node_id))
+        return {"result": len(inputs)}
+
+    def execute_python_code_batch(
+        self,
+        code: str,
+        inputs_list: List[Dict[str, Any]],
+        timeout: int = 60,
+        trigger_type: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        # 배치는 한 번의 요청이므로 지연도 한 번
+        time.sleep(self._backends.sample("sandbox", self._node_id))
+        return [{"result": len(inputs)} for inputs in inputs_list]
+
+
+class StubHttpClientPool:
+    """
+    HttpClientPool 대체: 모든 호스트에 MockTransport 클라이언트 하나를 돌려줌
+
+    요청 경로의 첫 세그먼트를 노드 ID로 보고 노드별 지연을 적용합니다.
+    (graphs.py는 httpRequestNode URL을 MOCK_HTTP_HOST/<node_id>로 생성)
+    """
+
+    def __init__(self, backends: "MockBackends"):
+        self._backends = backends
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        node_id = request.url.path.strip("/").split("/", 1)[0]
+        await asyncio.sleep(self._backends.sample("http", node_id))
+        return httpx.Response(200, json={"ok": True, "node": node_id})
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class OfflineSession:
+    """_run_db가 요구하는 async_session_factory 대체 (DB 없이 fn(session, ...) 실행)"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self, *args, **kwargs)
+
+
+class MockBackends:
+    """
+    벤치마크 한 번에 쓰는 모의 백엔드 묶음
+
+    install() 동안 NodeFactory.create가 만드는 노드(서브그래프/서브 워크플로우 포함)에
+    모의 백엔드를 주입하고, 노드 실행 횟수와 백엔드 지연을 노드 ID별로 기록합니다.
+    """
+
+    def __init__(
+        self,
+        llm_latency: LatencyModel = LatencyModel(),
+        sandbox_latency: LatencyModel = LatencyModel(),
+        http_latency: LatencyModel = LatencyModel(),
+        seed: int = 0,
+        subworkflows: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self.latencies = {
+            "llm": llm_latency,
+            "sandbox": sandbox_latency,
+            "http": http_latency,
+        }
+        self.seed = seed
+        self.subworkflows = subworkflows or {}
+        self.http_client_pool = StubHttpClientPool(self)
+        self._rngs: Dict[str, random.Random] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """반복 측정 사이에 기록 초기화 (같은 시드 → 같은 지연 순서)"""
+        self._rngs.clear()
+        self.backend_seconds: Dict[str, float] = defaultdict(float)
+        self.backend_calls: Dict[str, int] = defaultdict(int)
+        self.node_runs = 0
+
+    def sample(self, backend: str, node_id: str) -> float:
+        key = f"{backend}:{node_id}"
+        rng = self._rngs.get(key)
+        if rng is None:
+            rng = self._rngs[key] = random.Random(f"{self.seed}:{key}")
+        seconds = self.latencies[backend].sample(rng)
+        self.backend_seconds[node_id] += seconds
+        self.backend_calls[backend] += 1
+        return seconds
+
+    def execution_context(self) -> Dict[str, Any]:
+        """엔진에 넘길 실행 컨텍스트 (실제 DB/커넥션 풀 주입 방지)"""
+        return {
+            "async_session_factory": OfflineSession,
+            "http_client_pool": self.http_client_pool,
+        }
+
+    def _attach(self, node: Node) -> None:
+        if isinstance(node, LLMNode):
+            node._client_override = MockLLMClient(self, node.id)
+            node._record_usage = lambda session, *args: 0.0
+        elif isinstance(node, CodeNode):
+            node.sandbox_service = MockSandboxService(self, node.id)
+        elif isinstance(node, WorkflowNode):
+            node._load_target_graph = lambda session, app_id: self.subworkflows[app_id]
+
+    @contextmanager
+    def install(self):
+        create = NodeFactory.create
+        execute = Node.execute
+
+        def create_with_mocks(schema, context=None):
+            node = create(schema, context=context)
+            self._attach(node)
+            return node
+
+        async def counted_execute(node, inputs):
+            self.node_runs += 1
+            return await execute(node, inputs)
+
+        with ExitStack() as stack:
+            stack.enter_context(
+                patch.object(NodeFactory, "create", staticmethod(create_with_mocks))
+            )
+            stack.enter_context(patch.object(Node, "execute", counted_execute))
+            yield self
@@ -0,0 +1,129 @@
+"""
+WorkflowEngine 오프라인 벤치마크 실행
+
+게이트웨이/DB/Redis/프로바이더 키 없이 엔진 코어만 측정합니다.
+
+실행 방법:
+    python -m tests.engine_benchmark.run_benchmark
+    python -m tests.engine_benchmark.run_benchmark --scenario fan_out --size 100 --kind http
+    python -m tests.engine_benchmark.run_benchmark --save tests/engine_benchmark/reports/baseline.json
+    python -m tests.engine_benchmark.run_benchmark --baseline tests/engine_benchmark/reports/baseline.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import List
+
+from tests.engine_benchmark import graphs
+from tests.engine_benchmark.harness import (
+    BenchmarkResult,
+    compare_to_baseline,
+    format_results,
+    run_benchmark,
+)
+from tests.engine_benchmark.mocks import LatencyModel
+
+# 기본 스위트: 엔진 코어 경로별 대표 크기
+DEFAULT_SUITE = [
+    lambda kind: graphs.fan_out(50, kind),
+    lambda kind: graphs.chain(50, kind),
+    lambda kind: graphs.nested_loop(5, 10, kind),
+    lambda kind: graphs.sub_workflow(5, kind),
+]
+
+
+def build_suite(args) -> List[graphs.BenchmarkGraph]:
+    if args.scenario is None:
+        return [build(args.kind) for build in DEFAULT_SUITE]
+
+    build = graphs.SCENARIOS[args.scenario]
+    if args.scenario == "nested_loop":
+        return [build(args.size, args.inner, args.kind)]
+    return [build(args.size, args.kind)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WorkflowEngine 오프라인 벤치마크")
+    parser.add_argument(
+        "--scenario",
+        choices=sorted(graphs.SCENARIOS),
+        default=None,
+        help="단일 시나리오만 실행 (기본: 전체 스위트)",
+    )
+    parser.add_argument(
+        "--size", type=int, default=50, help="fan_out 폭 / chain 길이 / 바깥 반복 수 / 중첩 깊이"
+    )
+    parser.add_argument("--inner", type=int, default=10, help="nested_loop 안쪽 반복 수")
+    parser.add_argument(
+        "--kind", choices=graphs.LEAF_KINDS, default="llm", help="말단 노드 종류"
+    )
+    parser.add_argument(
+        "--llm-latency", default="lognormal:50,0.5", help="LLM 지연 분포 (ms)"
+    )
+    parser.add_argument("--sandbox-latency", default="fixed:20", help="샌드박스 지연 분포 (ms)")
+    parser.add_argument("--http-latency", default="uniform:5-30", help="HTTP 지연 분포 (ms)")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--warmup", type=int, default=1, help="예열 실행 횟수")
+    parser.add_argument("--seed", type=int, default=0, help="지연 샘플링 시드")
+    parser.add_argument(
+        "--phases", action="store_true", help="트레이스를 켠 실행으로 단계별 시간 포함"
+    )
+    parser.add_argument("--save", default=None, help="결과 JSON 저장 경로 (기준값으로 사용)")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="회귀 판정 비율 (기본 0.2 = 20%%)"
+    )
+    args = parser.parse_args()
+
+    # 노드 시작/종료 INFO 로그가 측정을 왜곡하지 않도록 경고 이상만 출력
+    logging.basicConfig(level=logging.WARNING)
+
+    latencies = {
+        "llm_latency": LatencyModel.parse(args.llm_latency),
+        "sandbox_latency": LatencyModel.parse(args.sandbox_latency),
+        "http_latency": LatencyModel.parse(args.http_latency),
+    }
+
+    results: List[BenchmarkResult] = []
+    for bench in build_suite(args):
+        print(f"⏱️  {bench.name} 실행 중...")
+        results.append(
+            run_benchmark(
+                bench,
+                repeat=args.repeat,
+                warmup=args.warmup,
+                seed=args.seed,
+                phases=args.phases,
+                **latencies,
+            )
+        )
+
+    print()
+    print(format_results(results))
+    if args.phases:
+        print()
+        for result in results:
+            print(f"{result.scenario} 단계별 합계(ms): {result.phases_ms}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump([r.to_dict() for r in results], f, indent=2, ensure_ascii=False)
+        print(f"\n💾 결과 저장: {args.save} ({datetime.now():%Y-%m-%d %H:%M})")
+
+    if args.baseline:
+        regressions = compare_to_baseline(results, args.baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ 기준 대비 회귀 {len(regressions)}건:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\n✅ 기준 대비 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
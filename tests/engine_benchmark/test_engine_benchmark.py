@@ -0,0 +1,84 @@
+"""
+오프라인 엔진 벤치마크 스모크 테스트
+
+작은 크기, 지연 0으로 모든 시나리오가 모의 백엔드만으로 끝까지 실행되는지 확인합니다.
+(성능 수치 자체는 검증하지 않음 - run_benchmark.py로 측정)
+
+실행 방법:
+    pytest tests/engine_benchmark/test_engine_benchmark.py -v
+"""
+
+import json
+
+import pytest
+
+from tests.engine_benchmark import graphs
+from tests.engine_benchmark.harness import (
+    compare_to_baseline,
+    critical_path_seconds,
+    run_benchmark_async,
+)
+from tests.engine_benchmark.mocks import LatencyModel
+
+
+@pytest.mark.parametrize(
+    "bench, node_runs, calls",
+    [
+        (graphs.fan_out(4, "llm"), 6, {"llm": 4}),
+        (graphs.chain(3, "code"), 5, {"sandbox": 3}),
+        (graphs.fan_out(3, "http"), 5, {"http": 3}),
+        # 시작 + 바깥 반복 + 2 x (시작 + 안쪽 반복) + 2 x 3 x (시작 + 본문 2)
+        (graphs.nested_loop(2, 3, "code"), 24, {"sandbox": 12}),
+        # 최상위 (시작 + 호출) + 단계별 (시작 + 말단 + answer) + 마지막 단계 제외 호출
+        (graphs.sub_workflow(2, "llm"), 9, {"llm": 2}),
+    ],
+    ids=lambda value: getattr(value, "name", None),
+)
+@pytest.mark.asyncio
+async def test_scenarios_run_against_mock_backends(bench, node_runs, calls):
+    result = await run_benchmark_async(bench, repeat=1, warmup=0)
+
+    assert result.node_runs == node_runs
+    assert result.backend_calls == calls
+    assert result.wall_ms > 0
+    assert result.peak_kb > 0
+
+
+def test_latency_model_is_deterministic_per_seed():
+    import random
+
+    model = LatencyModel.parse("lognormal:50,0.5")
+    first = [model.sample(random.Random("0:llm:a")) for _ in range(3)]
+    again = [model.sample(random.Random("0:llm:a")) for _ in range(3)]
+
+    assert first == again
+    assert LatencyModel.parse("uniform:10-20").sample(random.Random(1)) * 1000 == pytest.approx(
+        10 + random.Random(1).random() * 10
+    )
+    assert LatencyModel.parse("25").sample(random.Random()) == 0.025
+
+
+def test_critical_path_uses_longest_branch_and_subgraphs():
+    bench = graphs.fan_out(3, "llm")
+    node_seconds = {"llm-0": 0.1, "llm-1": 0.3, "llm-2": 0.2}
+    assert critical_path_seconds(bench.graph, node_seconds) == pytest.approx(0.3)
+
+    nested = graphs.sub_workflow(2, "llm")
+    node_seconds = {"d1-llm": 0.1, "d2-llm": 0.2}
+    assert critical_path_seconds(
+        nested.graph, node_seconds, nested.subworkflows
+    ) == pytest.approx(0.3)
+
+
+@pytest.mark.asyncio
+async def test_compare_to_baseline_flags_regressions(tmp_path):
+    result = await run_benchmark_async(graphs.chain(2, "template"), repeat=1, warmup=0)
+    baseline = result.to_dict()
+    baseline["nodes_per_sec"] = result.nodes_per_sec * 2
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps([baseline]))
+
+    regressions = compare_to_baseline([result], str(path), threshold=0.2)
+
+    assert len(regressions) == 1
+    assert "nodes_per_sec" in regressions[0]
@@ -8,6 +8,7 @@ RAG 검색 성능 평가 프레임워크
 - 다양한 데이터셋 로딩 (HuggingFace, JSON)
 - 벤치마크 실행 및 결과 집계
 - 결과 리포트 생성 및 저장
+- 검색 지연 시간 측정 (키워드 검색 인덱스 적용 전/후 비교)
 
 Author: Antigravity Team
 Created: 2026-01-13
@@ -15,10 +16,13 @@ Created: 2026-01-13
 
 import json
 import os
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
+from sqlalchemy import text
+
 from tests.evaluation.rag_metrics import (
     AggregatedMetrics,
     EvaluationSample,
@@ -242,12 +246,14 @@ class RAGEvaluator:
         metric_accumulators["mrr"] = []
 
         max_k = max(self.config.top_k_values)
+        latencies_ms = []
 
         for i, sample in enumerate(samples):
             if progress_callback:
                 progress_callback(i + 1, len(samples))
 
             # 검색 수행
+            started = time.perf_counter()
             try:
                 retrieved = retrieval_func(sample.query, max_k)
             except Exception as e:
@@ -255,6 +261,8 @@ class RAGEvaluator:
                     f"[RAGEvaluator] Error retrieving for query '{sample.query[:50]}...': {e}"
                 )
                 retrieved = []
+            latency_ms = (time.perf_counter() - started) * 1000
+            latencies_ms.append(latency_ms)
 
             # 각 지표 계산
             sample_metrics = {}
@@ -299,6 +307,7 @@ class RAGEvaluator:
                     "query": sample.query,
                     "metrics": sample_metrics,
                     "retrieved_count": len(retrieved),
+                    "latency_ms": latency_ms,
                 }
             )
 
@@ -309,6 +318,9 @@ class RAGEvaluator:
                 averaged_metrics[metric_name] = sum(values) / len(values)
             else:
                 averaged_metrics[metric_name] = 0.0
+        averaged_metrics.update(
+            {f"latency_{name}_ms": value for name, value in latency_stats(latencies_ms).items()}
+        )
 
         return AggregatedMetrics(
             dataset_name=self.config.dataset_name,
@@ -420,3 +432,93 @@ class RAGEvaluator:
         )
 
         return "\n".join(lines)
+
+
+def latency_stats(latencies_ms: List[float]) -> Dict[str, float]:
+    """지연 시간 요약 (mean, p50, p95)"""
+    if not latencies_ms:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0}
+    ordered = sorted(latencies_ms)
+
+    def percentile(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * (len(ordered) - 1) + 0.5))]
+
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p50": percentile(0.5),
+        "p95": percentile(0.95),
+    }
+
+
+# 인덱스 적용 전 키워드 검색 (검색할 때마다 모든 청크를 to_tsvector로 다시 토큰화)
+LEGACY_KEYWORD_SEARCH_SQL = text("""
+    SELECT dc.id, dc.content, dc.metadata, dc.document_id, d.filename,
+           ts_rank(
+               to_tsvector('english', dc.content || ' ' || COALESCE(CAST(dc.metadata->'keywords' AS TEXT), '')),
+               websearch_to_tsquery('english', :query)
+           ) as rank
+    FROM document_chunks dc
+    JOIN documents d ON dc.document_id = d.id
+    WHERE dc.knowledge_base_id = :kb_id
+      AND to_tsvector('english', dc.content || ' ' || COALESCE(CAST(dc.metadata->'keywords' AS TEXT), '')) @@ websearch_to_tsquery('english', :query)
+    ORDER BY rank DESC
+    LIMIT :top_k
+""")
+
+
+def compare_keyword_search_latency(
+    session,
+    queries: List[str],
+    knowledge_base_id: str,
+    top_k: int = 50,
+    repeat: int = 3,
+) -> Dict[str, Any]:
+    """
+    하이브리드 검색의 키워드 단계 지연 시간 비교
+
+    before: 쿼리 시점 to_tsvector (기존 방식)
+    after: 저장형 search_vector + GIN 인덱스 (지식 베이스 text_search_config 사용)
+
+    Returns:
+        {"before": {mean, p50, p95}, "after": {...}, "speedup_p50": float, "queries": int}
+    """
+    from apps.shared.services.keyword_search import (
+        get_text_search_config,
+        keyword_search,
+    )
+
+    ts_config = get_text_search_config(session, knowledge_base_id)
+
+    def measure(run) -> List[float]:
+        latencies = []
+        for _ in range(repeat):
+            for query in queries:
+                started = time.perf_counter()
+                run(query)
+                latencies.append((time.perf_counter() - started) * 1000)
+        return latencies
+
+    before = latency_stats(
+        measure(
+            lambda query: session.execute(
+                LEGACY_KEYWORD_SEARCH_SQL,
+                {"query": query, "kb_id": knowledge_base_id, "top_k": top_k},
+            ).fetchall()
+        )
+    )
+    after = latency_stats(
+        measure(
+            lambda query: keyword_search(
+                session, query, knowledge_base_id, top_k, ts_config
+            )
+        )
+    )
+
+    return {
+        "text_search_config": ts_config,
+        "queries": len(queries),
+        "repeat": repeat,
+        "before": before,
+        "after": after,
+        "speedup_p50": before["p50"] / after["p50"] if after["p50"] else 0.0,
+    }
@@ -19,6 +19,7 @@ Created: 2026-01-13
 
 import argparse
 import asyncio
+import json
 import os
 import sys
 from typing import List
@@ -35,7 +36,12 @@ from apps.gateway.services.retrieval import RetrievalService
 from apps.shared.db.models.knowledge import KnowledgeBase
 from apps.shared.db.models.user import User
 from apps.shared.db.session import SessionLocal
-from tests.evaluation.rag_evaluator import DatasetLoader, EvaluationConfig, RAGEvaluator
+from tests.evaluation.rag_evaluator import (
+    DatasetLoader,
+    EvaluationConfig,
+    RAGEvaluator,
+    compare_keyword_search_latency,
+)
 from tests.evaluation.rag_metrics import EvaluationSample, RetrievalResult
 
 
@@ -117,6 +123,38 @@ def run_benchmark(
     return results.to_dict()
 
 
+def run_keyword_latency_comparison(
+    db: Session,
+    kb_id: UUID,
+    samples: List[EvaluationSample],
+    config: EvaluationConfig,
+) -> dict:
+    """키워드 검색 지연 시간 비교 (쿼리 시점 to_tsvector vs 저장형 search_vector + GIN)"""
+    comparison = compare_keyword_search_latency(
+        db, [s.query for s in samples], str(kb_id)
+    )
+
+    print("\n" + "=" * 60)
+    print(f"Keyword Search Latency ({comparison['text_search_config']})")
+    print("-" * 60)
+    for phase in ("before", "after"):
+        stats = comparison[phase]
+        print(
+            f"  {phase:>6}: mean {stats['mean']:.1f}ms, "
+            f"p50 {stats['p50']:.1f}ms, p95 {stats['p95']:.1f}ms"
+        )
+    print(f"  speedup (p50): x{comparison['speedup_p50']:.1f}")
+
+    path = os.path.join(
+        config.report_dir, f"keyword_latency_{config.dataset_name}.json"
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(comparison, f, indent=2, ensure_ascii=False)
+    print(f"  저장됨: {path}")
+
+    return comparison
+
+
 def main():
     parser = argparse.ArgumentParser(description="RAG 벤치마크 실행")
     parser.add_argument(
@@ -163,6 +201,11 @@ def main():
         action="store_true",
         help="Multi-Query Expansion 활성화 (3개 쿼리 변형)",
     )
+    parser.add_argument(
+        "--compare-keyword-latency",
+        action="store_true",
+        help="키워드 검색 지연 시간 비교 (인덱스 적용 전/후)",
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -267,6 +310,9 @@ def main():
             output_filename=args.output,
         )
 
+        if args.compare_keyword_latency:
+            run_keyword_latency_comparison(db, kb.id, samples, config)
+
     finally:
         db.close()
 
@@ -18,7 +18,12 @@ from typing import List
 
 import pytest
 
-from tests.evaluation.rag_evaluator import DatasetLoader, EvaluationConfig, RAGEvaluator
+from tests.evaluation.rag_evaluator import (
+    DatasetLoader,
+    EvaluationConfig,
+    RAGEvaluator,
+    latency_stats,
+)
 from tests.evaluation.rag_metrics import (
     AggregatedMetrics,
     EvaluationSample,
@@ -264,6 +269,17 @@ class TestRAGEvaluator:
         assert results.total_samples == len(custom_samples)
         assert "recall@5" in results.metrics
         assert "mrr" in results.metrics
+        assert "latency_p95_ms" in results.metrics
+        assert all("latency_ms" in r for r in results.per_sample_results)
+
+    def test_latency_stats(self):
+        """지연 시간 요약 (mean, p50, p95)"""
+        stats = latency_stats([float(v) for v in range(1, 101)])
+
+        assert stats["mean"] == 50.5
+        assert stats["p50"] == 51.0
+        assert stats["p95"] == 95.0
+        assert latency_stats([]) == {"mean": 0.0, "p50": 0.0, "p95": 0.0}
 
     def test_save_report(self, sample_config, custom_samples, tmp_path):
         """리포트 저장 테스트"""